@@ -0,0 +1,86 @@
+"""Time how long an autosave holds the game loop, synchronous against the worker.
+
+A semantic-environment game is played for `--decisions` heuristic decisions,
+then autosaved into a temporary directory three ways, timing only the calling
+thread: `save_game` as `main.write_autosave` used to run it inside the frame,
+`AutosaveService.save` after a state change (capture on the caller, validate,
+encode and write on the worker), and `AutosaveService.save` with nothing
+changed, which is skipped on `state_version` alone. The worker's file must
+match the synchronous one byte for byte. `frame_budget_us` is one 60 fps frame.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, median_us  # noqa: E402
+
+from autosave import AutosaveService  # noqa: E402
+from rl.heuristic import choose  # noqa: E402
+from rl.semantic_env import SemanticMetroEnv  # noqa: E402
+from save_game import save_game  # noqa: E402
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", type=int, default=1500)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=9000)
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> dict:
+    env = SemanticMetroEnv()
+    env.reset(seed=args.seed)
+    for _ in range(args.decisions):
+        _, _, terminated, truncated, _ = env.step(choose(env))
+        if terminated or truncated:
+            break
+    mediator = env._mediator
+
+    with tempfile.TemporaryDirectory() as directory:
+        direct = Path(directory) / "direct.json"
+        service = AutosaveService(
+            Path(directory) / "autosave.json",
+            delete=lambda: None,
+            peek=lambda: False,
+            load=lambda: None,
+        )
+
+        def changed() -> None:
+            mediator.state_version += 1
+            service.save(mediator)
+
+        def timed(function) -> float:
+            return round(median_us(function, repeats=args.repeats, number=20), 1)
+
+        caller_us = {
+            "synchronous": timed(lambda: save_game(mediator, direct)),
+            "worker_changed": timed(changed),
+            "worker_unchanged": timed(lambda: service.save(mediator)),
+        }
+        service.close()
+        if (Path(directory) / "autosave.json").read_bytes() != direct.read_bytes():
+            raise SystemExit("the worker wrote a different autosave")
+
+    report = {
+        "benchmark": "autosave",
+        "decisions": args.decisions,
+        "stations": len(mediator.all_stations),
+        "passengers": len(mediator.passengers),
+        "metros": len(mediator.metros),
+        "frame_budget_us": round(1_000_000 / 60, 1),
+        "caller_us": caller_us,
+    }
+    env.close()
+    return report
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
@@ -0,0 +1,117 @@
+"""Bytes per entity with the slotted entity layer, against instance dicts.
+
+Each entity is measured twice with `tracemalloc`: as the slotted object the
+game builds, and as a plain object holding the same attribute values in an
+instance dict, which is the layout the entity layer had before. Values are
+shared between the copies, so the difference is the per-object overhead a
+worker pays for every live entity. Riders are also measured whole, with a
+destination shape of their own and with the shared one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import os
+import sys
+import tracemalloc
+from functools import partial
+from typing import Any, Callable
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, synthetic_network  # noqa: E402
+
+from config import passenger_color, passenger_size  # noqa: E402
+from entity.carriage import Carriage  # noqa: E402
+from entity.metro import Metro  # noqa: E402
+from entity.passenger import Passenger  # noqa: E402
+from geometry.point import Point  # noqa: E402
+from geometry.type import ShapeType  # noqa: E402
+from graph.node import Node  # noqa: E402
+from travel_plan import TravelPlan  # noqa: E402
+from utils import get_shape_from_type, get_shared_shape  # noqa: E402
+
+
+def _bytes_per(make: Callable[[], Any], count: int) -> float:
+    kept: list[Any] = [None] * count
+    tracemalloc.start()
+    started = tracemalloc.get_traced_memory()[0]
+    for index in range(count):
+        kept[index] = make()
+    used = tracemalloc.get_traced_memory()[0] - started
+    tracemalloc.stop()
+    return round(used / count, 1)
+
+
+def _slot_names(instance: Any) -> list[str]:
+    names = []
+    for owner in type(instance).__mro__:
+        for name in getattr(owner, "__slots__", ()):
+            if name not in ("__weakref__", "__dict__") and hasattr(instance, name):
+                names.append(name)
+    return list(dict.fromkeys(names))
+
+
+def _dict_layout(instance: Any) -> Callable[[], Any]:
+    """A factory of plain objects carrying `instance`'s fields in a dict."""
+
+    names = _slot_names(instance)
+    values = [getattr(instance, name) for name in names]
+    body = "".join(f"    self.{name} = values[{i}]\n" for i, name in enumerate(names))
+    namespace: dict[str, Any] = {}
+    exec(f"def __init__(self, values):\n{body or '    pass'}\n", namespace)
+    plain = type(f"{type(instance).__name__}Dict", (), namespace)
+    return lambda: plain(values)
+
+
+def _entities() -> dict[str, Any]:
+    stations, paths = synthetic_network(8, 2, 5)
+    path = paths[0]
+    node = Node(stations[0])
+    return {
+        "Point": Point(3, 4),
+        "Station": stations[0],
+        "Metro": Metro(),
+        "Carriage": Carriage(),
+        "Path": path,
+        "PathSegment": path.path_segments[0],
+        "Node": node,
+        "TravelPlan": TravelPlan([node]),
+        "Passenger": Passenger(
+            get_shared_shape(ShapeType.TRIANGLE, passenger_color, passenger_size)
+        ),
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20_000)
+    return parser.parse_args(argv)
+
+
+def _rider(factory: Callable[..., Any]) -> Callable[[], Passenger]:
+    return lambda: Passenger(
+        factory(ShapeType.TRIANGLE, passenger_color, passenger_size)
+    )
+
+
+def run(args: argparse.Namespace) -> dict:
+    entities = {
+        name: {
+            "dict_bytes": _bytes_per(_dict_layout(instance), args.count),
+            "slotted_bytes": _bytes_per(partial(copy.copy, instance), args.count),
+        }
+        for name, instance in _entities().items()
+    }
+    return {
+        "benchmark": "entity-memory",
+        "count": args.count,
+        "entities": entities,
+        "rider_own_shape_bytes": _bytes_per(_rider(get_shape_from_type), args.count),
+        "rider_shared_shape_bytes": _bytes_per(_rider(get_shared_shape), args.count),
+    }
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
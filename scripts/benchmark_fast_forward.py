@@ -0,0 +1,104 @@
+"""Measure `Mediator.advance_until_event` against ticking every 16 ms.
+
+Both play the same seeded game -- `--lines` lines with their metros, the rest
+of the run unattended -- for `--seconds` of game time or until it ends, and
+must land on the same canonical checkpoint. The report gives the wall time of
+each, the calls `advance_until_event` needed, and the share of ticks it
+coasted. A coasted tick still moves every metro; only its spawn, wait and
+route-search work is batched, so the speedup is bounded by that share.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit  # noqa: E402
+
+from env import MiniMetroEnv  # noqa: E402
+from mediator import Mediator  # noqa: E402
+from recursive_checkpoint import canonical_checkpoint  # noqa: E402
+
+LINES = (([0, 1, 2], False), ([2, 0, 1], True), ([1, 2], False))
+TICK_MS = 16
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--lines", type=int, default=2, choices=range(len(LINES) + 1))
+    parser.add_argument("--seconds", type=int, default=120)
+    parser.add_argument("--chunk-ms", type=int, default=96)
+    return parser.parse_args(argv)
+
+
+def _game(args: argparse.Namespace) -> MiniMetroEnv:
+    env = MiniMetroEnv()
+    env.reset(seed=args.seed)
+    env.mediator.unlocked_num_paths = env.mediator.num_paths
+    for stations, loop in LINES[: args.lines]:
+        action = {"type": "create_path", "stations": stations, "loop": loop}
+        env.step_legacy_auto_assignment(action)
+    return env
+
+
+def _play(env: MiniMetroEnv, args: argparse.Namespace, step) -> float:
+    started = time.perf_counter()
+    elapsed_ms = 0
+    while elapsed_ms < args.seconds * 1000 and not env.mediator.is_game_over:
+        elapsed_ms += step(env.mediator)
+    return time.perf_counter() - started
+
+
+def run(args: argparse.Namespace) -> dict:
+    def tick(mediator: Mediator) -> int:
+        for _ in range(args.chunk_ms // TICK_MS):
+            mediator.increment_time(TICK_MS)
+        return args.chunk_ms // TICK_MS * TICK_MS
+
+    calls = 0
+
+    def advance(mediator: Mediator) -> int:
+        nonlocal calls
+        calls += 1
+        return mediator.advance_until_event(args.chunk_ms, TICK_MS)
+
+    ticked_env, advanced_env = _game(args), _game(args)
+    ticked = _play(ticked_env, args, tick)
+    full_ticks = 0
+    increment_time = Mediator.increment_time
+
+    def counted(mediator: Mediator, dt_ms: int) -> None:
+        nonlocal full_ticks
+        full_ticks += 1
+        increment_time(mediator, dt_ms)
+
+    with patch.object(Mediator, "increment_time", counted):
+        advanced = _play(advanced_env, args, advance)
+    if canonical_checkpoint(ticked_env) != canonical_checkpoint(advanced_env):
+        raise SystemExit("advance_until_event diverged from ticking")
+    ticks = advanced_env.mediator.time_ms // (
+        TICK_MS * advanced_env.mediator.game_speed_multiplier
+    )
+    return {
+        "benchmark": "fast-forward",
+        "seed": args.seed,
+        "lines": args.lines,
+        "chunk_ms": args.chunk_ms,
+        "game_ms": advanced_env.mediator.time_ms,
+        "ticks": ticks,
+        "advance_calls": calls,
+        "coasted_ticks": ticks - full_ticks,
+        "tick_s": round(ticked, 3),
+        "advance_s": round(advanced, 3),
+        "speedup": round(ticked / advanced, 2),
+    }
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
@@ -0,0 +1,86 @@
+"""Time restoring a search snapshot: `Mediator.fork` against a save document.
+
+A semantic-environment game is played for `--decisions` heuristic decisions,
+then restored four ways: `fork()`, `deserialize_game` of a save document, the
+same after the per-future deep copy `search_policy.reseeded` used to make,
+and a full `serialize_game` + `deserialize_game` round trip. The fork is
+required to give the same `canonical_checkpoint` as the loaded game.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, median_us  # noqa: E402
+
+from env import MiniMetroEnv  # noqa: E402
+from recursive_checkpoint import canonical_checkpoint  # noqa: E402
+from rl.heuristic import choose  # noqa: E402
+from rl.semantic_env import SemanticMetroEnv  # noqa: E402
+from save_game import serialize_game  # noqa: E402
+from save_load import deserialize_game  # noqa: E402
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", type=int, default=1500)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=9000)
+    return parser.parse_args(argv)
+
+
+def _checkpoint(mediator) -> dict:
+    env = MiniMetroEnv()
+    env.mediator = mediator
+    return canonical_checkpoint(env)
+
+
+def run(args: argparse.Namespace) -> dict:
+    env = SemanticMetroEnv()
+    env.reset(seed=args.seed)
+    for _ in range(args.decisions):
+        _, _, terminated, truncated, _ = env.step(choose(env))
+        if terminated or truncated:
+            break
+    mediator = env._mediator
+    document = serialize_game(mediator)
+    if _checkpoint(mediator.fork()) != _checkpoint(deserialize_game(document)):
+        raise SystemExit("the fork differs from the loaded game")
+
+    restore_us = {
+        "fork": median_us(mediator.fork, repeats=args.repeats, number=20),
+        "deserialize": median_us(
+            lambda: deserialize_game(document), repeats=args.repeats, number=20
+        ),
+        "deepcopy_deserialize": median_us(
+            lambda: deserialize_game(copy.deepcopy(document)),
+            repeats=args.repeats,
+            number=20,
+        ),
+        "serialize_deserialize": median_us(
+            lambda: deserialize_game(serialize_game(mediator)),
+            repeats=args.repeats,
+            number=20,
+        ),
+    }
+    env.close()
+    return {
+        "benchmark": "fork",
+        "decisions": args.decisions,
+        "stations": len(mediator.stations),
+        "passengers": len(mediator.passengers),
+        "metros": len(mediator.metros),
+        "restore_us": {name: round(value, 1) for name, value in restore_us.items()},
+        "speedup_vs_deserialize": round(
+            restore_us["deserialize"] / restore_us["fork"], 2
+        ),
+    }
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
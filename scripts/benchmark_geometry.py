@@ -0,0 +1,128 @@
+"""Microbenchmarks of the scalar geometry kernel and the `Point` operators.
+
+`distance` and `direction` used to take `np.sqrt` of Python scalars and build
+two intermediate `Point`s; the retired versions are kept here as references
+and checked to agree bit for bit with `geometry.utils`. Each operation is
+timed per call over `--points` random point pairs, and `move_metro` per
+metro-tick on a synthetic fleet, which is the caller the kernel is for.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+from typing import Any, Callable
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, median_us, synthetic_network  # noqa: E402
+
+from entity.metro import Metro  # noqa: E402
+from geometry.point import Point  # noqa: E402
+from geometry.utils import direction, distance, heading  # noqa: E402
+
+
+def numpy_distance(p1: Point, p2: Point) -> float:
+    return np.sqrt((p1.left - p2.left) ** 2 + (p1.top - p2.top) ** 2)
+
+
+def numpy_direction(p1: Point, p2: Point) -> Point:
+    diff = p2 - p1
+    diff_magnitude = numpy_distance(p1, p2)
+    if diff_magnitude == 0:
+        return Point(0, 0)
+    return Point(diff.left / diff_magnitude, diff.top / diff_magnitude)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=1000)
+    parser.add_argument("--stations", type=int, default=60)
+    parser.add_argument("--lines", type=int, default=12)
+    parser.add_argument("--line-length", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def _per_call(
+    operation: Callable[[Point, Point], Any],
+    pairs: list[tuple[Point, Point]],
+    repeats: int,
+) -> float:
+    def batch() -> None:
+        for p1, p2 in pairs:
+            operation(p1, p2)
+
+    return round(median_us(batch, repeats=repeats, number=5) / len(pairs), 3)
+
+
+def _fleet_tick_us(args: argparse.Namespace) -> float:
+    _, paths = synthetic_network(
+        args.stations, args.lines, args.line_length, seed=args.seed
+    )
+    fleet = []
+    for path in paths:
+        metro = Metro()
+        path.add_metro(metro)
+        fleet.append((path, metro))
+
+    def tick() -> None:
+        for path, metro in fleet:
+            path.move_metro(metro, 16)
+
+    return round(median_us(tick, repeats=args.repeats, number=50) / len(fleet), 3)
+
+
+def run(args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    pairs = [
+        (
+            Point(rng.uniform(0, 1920), rng.uniform(0, 1080)),
+            Point(rng.uniform(0, 1920), rng.uniform(0, 1080)),
+        )
+        for _ in range(args.points)
+    ]
+    for p1, p2 in pairs:
+        reference = numpy_direction(p1, p2)
+        if (
+            distance(p1, p2) != numpy_distance(p1, p2)
+            or heading(p1, p2)[1:] != reference.to_tuple()
+            or direction(p1, p2) != reference
+        ):
+            raise SystemExit(f"kernel disagrees with the NumPy formulas: {p1} {p2}")
+
+    operations: dict[str, Callable[[Point, Point], Any]] = {
+        "numpy_distance": numpy_distance,
+        "distance": distance,
+        "numpy_direction": numpy_direction,
+        "direction": direction,
+        "heading": heading,
+        "point_add": lambda p1, p2: p1 + p2,
+        "point_sub": lambda p1, p2: p1 - p2,
+        "point_mul": lambda p1, _: p1 * 0.5,
+        "point_translate": lambda p1, p2: p1.translate(0.0, 0.0),
+        "point_scale": lambda p1, _: p1.scale(1.0),
+    }
+    per_call = {
+        name: _per_call(operation, pairs, args.repeats)
+        for name, operation in operations.items()
+    }
+    return {
+        "benchmark": "geometry",
+        "points": args.points,
+        "us_per_call": per_call,
+        "distance_speedup": round(per_call["numpy_distance"] / per_call["distance"], 1),
+        "direction_speedup": round(
+            per_call["numpy_direction"] / per_call["heading"], 1
+        ),
+        "move_metro_us_per_metro_tick": _fleet_tick_us(args),
+    }
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
@@ -0,0 +1,70 @@
+"""Measure how routing-graph construction scales with station count.
+
+Compares `build_station_nodes_dict` against the retired per-station scan it
+replaced, which visited every connection list once per station and then paid
+a quadratic `list.remove`. The retired builder lives in
+`benchmark_support` as the timing baseline here and as the oracle
+`test_graph` checks the linear builder against.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import (  # noqa: E402
+    emit,
+    legacy_build_station_nodes_dict,
+    median_us,
+    synthetic_network,
+)
+
+from graph.graph_algo import build_station_nodes_dict  # noqa: E402
+
+STATION_COUNTS = (20, 100, 500)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stations", type=int, nargs="+", default=list(STATION_COUNTS))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> dict:
+    results = []
+    for station_count in args.stations:
+        # One line per ten stations, each twelve stops long: total route
+        # length grows linearly with the board, as it does in play.
+        stations, paths = synthetic_network(
+            station_count, max(3, station_count // 10), 12, seed=args.seed
+        )
+        number = max(1, 2_000 // station_count)
+        legacy = median_us(
+            lambda: legacy_build_station_nodes_dict(stations, paths),
+            repeats=args.repeats,
+            number=number,
+        )
+        linear = median_us(
+            lambda: build_station_nodes_dict(stations, paths),
+            repeats=args.repeats,
+            number=number,
+        )
+        results.append(
+            {
+                "stations": station_count,
+                "paths": len(paths),
+                "legacy_us": round(legacy, 1),
+                "linear_us": round(linear, 1),
+                "speedup": round(legacy / linear, 1),
+            }
+        )
+    return {"benchmark": "graph-build", "results": results}
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
@@ -0,0 +1,107 @@
+"""Time simulation start-up: importing `mediator` and building a facade.
+
+Each import is timed in `--imports` fresh interpreters: `mediator` alone,
+which no longer loads pygame or shapely, and `mediator` with those two, as
+every import did before they were deferred. Construction is timed in-process
+for a windowed `Mediator` (controls and layout built) against
+`Mediator(headless=True)`, and for `MiniMetroEnv(headless=True).reset`. The
+report also lists any of pygame and shapely that a headless facade loaded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, median_us  # noqa: E402
+
+from env import MiniMetroEnv  # noqa: E402
+from mediator import Mediator  # noqa: E402
+
+SRC = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "src")
+IMPORTS = {
+    "mediator": "import mediator",
+    "mediator_pygame_shapely": "import pygame, shapely.geometry, mediator",
+}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--imports", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def _import_ms(statement: str, runs: int) -> float:
+    code = (
+        f"import sys, time; sys.path.insert(0, {SRC!r}); "
+        f"start = time.perf_counter(); {statement}; "
+        "print(time.perf_counter() - start)"
+    )
+    environment = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    samples = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=environment,
+            ).stdout.split()[-1]
+        )
+        for _ in range(runs)
+    ]
+    return round(statistics.median(samples) * 1000, 1)
+
+
+def _headless_modules() -> list[str]:
+    code = (
+        f"import sys; sys.path.insert(0, {SRC!r}); import mediator; "
+        "mediator.Mediator(seed=0, headless=True); "
+        "import json; print(json.dumps(sorted("
+        "{m.split('.')[0] for m in sys.modules} & {'pygame', 'shapely'})))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(args: argparse.Namespace) -> dict:
+    import_ms = {
+        name: _import_ms(statement, args.imports) for name, statement in IMPORTS.items()
+    }
+    env = MiniMetroEnv(headless=True)
+    construct_us = {
+        "windowed": median_us(
+            lambda: Mediator(seed=args.seed), repeats=args.repeats, number=20
+        ),
+        "headless": median_us(
+            lambda: Mediator(seed=args.seed, headless=True),
+            repeats=args.repeats,
+            number=20,
+        ),
+        "env_reset": median_us(
+            lambda: env.reset(seed=args.seed), repeats=args.repeats, number=20
+        ),
+    }
+    return {
+        "benchmark": "headless-startup",
+        "import_ms": import_ms,
+        "construct_us": {name: round(value, 1) for name, value in construct_us.items()},
+        "construct_speedup": round(
+            construct_us["windowed"] / construct_us["headless"], 2
+        ),
+        "headless_loaded": _headless_modules(),
+    }
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
@@ -0,0 +1,88 @@
+"""Measure `Path.advance_metro` at large steps against `Path.move_metro`.
+
+Every line of a synthetic network gets a metro that runs through its stations
+for `--seconds`. A stop ends a step in both movers -- the dwell that follows
+is the tick's business -- so the metros here never stop, and the report
+gives how far (in pixels, worst metro) each mover ends from the closed-form
+positions at `--dt-ms`, and the wall time of covering the same time with
+16 ms ticks of `move_metro` versus `--dt-ms` steps of `advance_metro`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, synthetic_network  # noqa: E402
+
+from entity.metro import Metro  # noqa: E402
+from geometry.point import Point  # noqa: E402
+from geometry.utils import distance  # noqa: E402
+
+TICK_MS = 16
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stations", type=int, default=60)
+    parser.add_argument("--lines", type=int, default=12)
+    parser.add_argument("--line-length", type=int, default=8)
+    parser.add_argument("--seconds", type=int, default=300)
+    parser.add_argument("--dt-ms", type=int, default=256)
+    args = parser.parse_args(argv)
+    if args.dt_ms <= 0 or args.dt_ms % TICK_MS:
+        parser.error(f"--dt-ms must be a positive multiple of {TICK_MS}")
+    return args
+
+
+def _drive(
+    args: argparse.Namespace, dt_ms: int, exact: bool
+) -> tuple[float, list[Point]]:
+    _, paths = synthetic_network(args.stations, args.lines, args.line_length)
+    fleet = []
+    for path in paths:
+        metro = Metro()
+        path.add_metro(metro)
+        fleet.append((path, metro))
+    started = time.perf_counter()
+    # Whole `--dt-ms` steps, so every run covers the same game time.
+    game_ms = args.seconds * 1000 // args.dt_ms * args.dt_ms
+    for _ in range(game_ms // dt_ms):
+        for path, metro in fleet:
+            if exact:
+                path.advance_metro(metro, dt_ms)
+            else:
+                path.move_metro(metro, dt_ms)
+    return time.perf_counter() - started, [metro.position for _, metro in fleet]
+
+
+def run(args: argparse.Namespace) -> dict:
+    tick_s, ticked = _drive(args, TICK_MS, exact=False)
+    coarse_s, coarse = _drive(args, args.dt_ms, exact=False)
+    exact_s, exact = _drive(args, args.dt_ms, exact=True)
+    _, exact_ticked = _drive(args, TICK_MS, exact=True)
+
+    def drift(positions: list[Point]) -> float:
+        return round(max(distance(a, b) for a, b in zip(positions, exact)), 3)
+
+    return {
+        "benchmark": "metro-kinematics",
+        "metros": len(exact),
+        "seconds": args.seconds,
+        "dt_ms": args.dt_ms,
+        "move_metro_16ms_drift_px": drift(ticked),
+        "move_metro_dt_drift_px": drift(coarse),
+        "advance_metro_16ms_drift_px": drift(exact_ticked),
+        "move_metro_16ms_s": round(tick_s, 3),
+        "move_metro_dt_s": round(coarse_s, 3),
+        "advance_metro_dt_s": round(exact_s, 3),
+        "speedup": round(tick_s / exact_s, 2),
+    }
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
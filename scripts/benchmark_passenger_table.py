@@ -0,0 +1,115 @@
+"""Measure swap-delete rider removal against `Mediator.passengers` as a list.
+
+Every delivery takes its rider out of `Mediator.passengers` with
+`list.remove`, a scan. A table that indexes rows by rider identity and moves
+the last rider into the freed row removes in constant time, but it pays a
+Python-level call on every append and removal. This plays `--games` seeded
+games with the fast-forward benchmark's lines to record how many riders are
+in play at once, then times a churn -- riders appended, then removed one by
+one in a seeded random order -- through both at that peak and at each of
+`--sizes`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, median_us  # noqa: E402
+
+from entity.passenger import Passenger  # noqa: E402
+from env import MiniMetroEnv  # noqa: E402
+from geometry.circle import Circle  # noqa: E402
+
+LINES = (([0, 1, 2], False), ([2, 0, 1], True), ([1, 2], False))
+
+
+class _SwapDeleteTable(list):
+    """The candidate: rows indexed by rider identity, removal by swap-delete."""
+
+    __slots__ = ("_rows",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._rows: dict[int, int] = {}
+
+    def append(self, passenger: Passenger) -> None:
+        self._rows[id(passenger)] = len(self)
+        list.append(self, passenger)
+
+    def remove(self, passenger: Passenger) -> None:
+        row = self._rows.pop(id(passenger))
+        last = list.pop(self)
+        if last is not passenger:
+            list.__setitem__(self, row, last)
+            self._rows[id(last)] = row
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=4)
+    parser.add_argument("--max-ticks", type=int, default=20_000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 2000])
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def _peak_riders(seed: int, max_ticks: int) -> int:
+    env = MiniMetroEnv()
+    env.reset(seed=seed)
+    mediator = env.mediator
+    mediator.unlocked_num_paths = mediator.num_paths
+    for stations, loop in LINES:
+        action = {"type": "create_path", "stations": stations, "loop": loop}
+        env.step_legacy_auto_assignment(action)
+    peak = 0
+    for _ in range(max_ticks):
+        if mediator.is_game_over:
+            break
+        mediator.increment_time(16)
+        peak = max(peak, len(mediator.passengers))
+    return peak
+
+
+def _churn(riders: int, repeats: int, seed: int) -> dict:
+    shape = Circle((0, 0, 0), 1)
+    passengers = [Passenger(shape) for _ in range(riders)]
+    order = list(passengers)
+    random.Random(seed).shuffle(order)
+
+    def churn(kind: type) -> None:
+        held = kind()
+        for rider in passengers:
+            held.append(rider)
+        for rider in order:
+            held.remove(rider)
+
+    scan = median_us(lambda: churn(list), repeats=repeats, number=20)
+    table = median_us(lambda: churn(_SwapDeleteTable), repeats=repeats, number=20)
+    return {
+        "riders": riders,
+        "list_us_per_rider": round(scan / riders, 3),
+        "table_us_per_rider": round(table / riders, 3),
+        "speedup": round(scan / table, 2),
+    }
+
+
+def run(args: argparse.Namespace) -> dict:
+    peaks = [
+        _peak_riders(args.seed + game, args.max_ticks) for game in range(args.games)
+    ]
+    sizes = sorted({max(peaks), *args.sizes})
+    return {
+        "benchmark": "passenger-table",
+        "peak_riders_per_game": peaks,
+        "churn": [_churn(size, args.repeats, args.seed) for size in sizes],
+    }
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
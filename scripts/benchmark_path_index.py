@@ -0,0 +1,79 @@
+"""Measure `find_shared_path`/`get_path_by_id` lookups against the scans they replaced.
+
+Both run per passenger per service action. The scans walked every path (with
+two `in` checks on each station list for `find_shared_path`); `PathIndex`
+answers from a station -> frozenset index and an id dict, checking per call
+only that the paths and their station lists are the ones it indexed. A
+tick's worth of lookups is `--queries` random station pairs plus one id
+lookup per line, on a network of `--lines` lines over `--stations` stations.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, median_us, synthetic_network  # noqa: E402
+
+from route_indexes import PathIndex  # noqa: E402
+from route_planner import RoutePlanner  # noqa: E402
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stations", type=int, default=30)
+    parser.add_argument("--lines", type=int, default=10)
+    parser.add_argument("--line-length", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> dict:
+    stations, paths = synthetic_network(
+        args.stations, args.lines, args.line_length, seed=args.seed
+    )
+    rng = random.Random(args.seed)
+    pairs = [(rng.choice(stations), rng.choice(stations)) for _ in range(args.queries)]
+    path_ids = [path.id for path in paths]
+    planner = RoutePlanner()
+    index = PathIndex()
+
+    def scan_tick() -> None:
+        for station_a, station_b in pairs:
+            planner.find_shared_path(paths, station_a, station_b)
+        for path_id in path_ids:
+            planner.get_path_by_id(paths, path_id)
+
+    def index_tick() -> None:
+        for station_a, station_b in pairs:
+            index.shared_path(paths, station_a, station_b)
+        for path_id in path_ids:
+            index.path_by_id(paths, path_id)
+
+    for station_a, station_b in pairs:
+        expected = planner.find_shared_path(paths, station_a, station_b)
+        if index.shared_path(paths, station_a, station_b) is not expected:
+            raise SystemExit(f"index disagrees with the scan: {station_a} {station_b}")
+
+    scan = median_us(scan_tick, repeats=args.repeats, number=20)
+    indexed = median_us(index_tick, repeats=args.repeats, number=20)
+    return {
+        "benchmark": "path-index",
+        "stations": args.stations,
+        "lines": args.lines,
+        "lookups_per_tick": len(pairs) + len(path_ids),
+        "scan_us_per_tick": round(scan, 1),
+        "index_us_per_tick": round(indexed, 1),
+        "saved_us_per_tick": round(scan - indexed, 1),
+        "speedup": round(scan / indexed, 1),
+    }
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
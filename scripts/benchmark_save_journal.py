@@ -0,0 +1,87 @@
+"""Size and time a save journal against keeping every save document.
+
+A semantic-environment game is recorded into a `SaveJournal` after each of
+`--decisions` heuristic decisions, beside the canonical bytes of a full save
+at the same point. The report compares the bytes held, the median
+per-decision `record` cost against `serialize_game` plus
+`canonical_save_bytes`, and the cost of rebuilding a document on a keyframe
+and at the far end of a keyframe interval, where the most deltas replay.
+Every rebuilt document must spell its save's bytes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, median_us  # noqa: E402
+
+from rl.heuristic import choose  # noqa: E402
+from rl.semantic_env import SemanticMetroEnv  # noqa: E402
+from save_game import serialize_game  # noqa: E402
+from save_journal import SaveJournal  # noqa: E402
+from save_schema import canonical_save_bytes  # noqa: E402
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", type=int, default=1200)
+    parser.add_argument("--interval", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=9000)
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> dict:
+    env = SemanticMetroEnv()
+    env.reset(seed=args.seed)
+    journal = SaveJournal(keyframe_interval=args.interval)
+    saves = []
+    record_ns, save_ns = [], []
+    for _ in range(args.decisions):
+        _, _, terminated, truncated, _ = env.step(choose(env))
+        started = time.perf_counter_ns()
+        journal.record(env._mediator)
+        record_ns.append(time.perf_counter_ns() - started)
+        started = time.perf_counter_ns()
+        saves.append(canonical_save_bytes(serialize_game(env._mediator)))
+        save_ns.append(time.perf_counter_ns() - started)
+        if terminated or truncated:
+            break
+    for index, payload in enumerate(saves):
+        if canonical_save_bytes(journal.document(index)) != payload:
+            raise SystemExit(f"the journal rebuilt decision {index} differently")
+
+    last_keyframe = (len(journal) - 1) // args.interval * args.interval
+    farthest = last_keyframe - 1 if last_keyframe else len(journal) - 1
+
+    def timed(function, number: int) -> float:
+        return round(median_us(function, repeats=args.repeats, number=number), 1)
+
+    full_bytes = sum(map(len, saves))
+    report = {
+        "benchmark": "save_journal",
+        "decisions": len(journal),
+        "keyframe_interval": args.interval,
+        "bytes": {"full_saves": full_bytes, "journal": journal.nbytes},
+        "ratio": round(journal.nbytes / full_bytes, 4),
+        "median_capture_us": {
+            "full_save": round(statistics.median(save_ns) / 1000, 1),
+            "journal_record": round(statistics.median(record_ns) / 1000, 1),
+        },
+        "rebuild_us": {
+            "keyframe": timed(lambda: journal.document(last_keyframe), 20),
+            "farthest_delta": timed(lambda: journal.document(farthest), 5),
+        },
+    }
+    env.close()
+    return report
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
@@ -0,0 +1,82 @@
+"""Time save validation interpreted, compiled, and trusted by a seal.
+
+A semantic-environment game is played for `--decisions` heuristic decisions
+and serialized once. The document is then validated three ways: by the
+interpreted section validators alone (every call before the compiled path
+existed), by `validate_save` on its compiled fast path, and by `validate_save`
+with the `seal_save` seal, which only digests the document. `deserialize_game`
+is timed untrusted and trusted too, since validation is part of every load.
+Each timed document must be accepted by the compiled path, or the comparison
+would be timing the fallback.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, median_us  # noqa: E402
+
+from rl.heuristic import choose  # noqa: E402
+from rl.semantic_env import SemanticMetroEnv  # noqa: E402
+from save_game import deserialize_game, serialize_game  # noqa: E402
+from save_schema import (  # noqa: E402
+    _compiled_validator,
+    _validate_interpreted,
+    seal_save,
+    validate_save,
+)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", type=int, default=1500)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=9000)
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> dict:
+    env = SemanticMetroEnv()
+    env.reset(seed=args.seed)
+    for _ in range(args.decisions):
+        _, _, terminated, truncated, _ = env.step(choose(env))
+        if terminated or truncated:
+            break
+    mediator = env._mediator
+    document = serialize_game(mediator)
+    if not _compiled_validator(document["schemaVersion"])(document):
+        raise SystemExit("the compiled validator fell back on a valid save")
+    seal = seal_save(document)
+
+    def timed(function, number: int) -> float:
+        return round(median_us(function, repeats=args.repeats, number=number), 1)
+
+    validate_us = {
+        "interpreted": timed(lambda: _validate_interpreted(document), 50),
+        "compiled": timed(lambda: validate_save(document), 50),
+        "trusted": timed(lambda: validate_save(document, trusted=seal), 50),
+    }
+    load_us = {
+        "untrusted": timed(lambda: deserialize_game(document), 10),
+        "trusted": timed(lambda: deserialize_game(document, trusted=seal), 10),
+    }
+    return {
+        "benchmark": "save_validation",
+        "decisions": args.decisions,
+        "stations": len(mediator.all_stations),
+        "passengers": len(mediator.passengers),
+        "metros": len(mediator.metros),
+        "validate_us": validate_us,
+        "compiled_speedup": round(
+            validate_us["interpreted"] / validate_us["compiled"], 1
+        ),
+        "deserialize_us": load_us,
+    }
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
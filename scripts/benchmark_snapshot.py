@@ -0,0 +1,105 @@
+"""Time and size binary save snapshots against the canonical JSON bytes.
+
+A semantic-environment game is played for `--decisions` heuristic decisions
+and its save document is packed both ways: `canonical_save_bytes` against
+`save_snapshot.encode_snapshot`, and back with the strict JSON parse
+`load_game` uses against `decode_snapshot`. Sizes are reported raw and
+zlib-compressed. The end-to-end figures add `serialize_game` on the way in
+and validation plus `deserialize_game` on the way out, which both formats
+share. The unpacked snapshot must spell the same canonical bytes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import zlib
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, median_us  # noqa: E402
+
+from rl.heuristic import choose  # noqa: E402
+from rl.semantic_env import SemanticMetroEnv  # noqa: E402
+from save_game import serialize_game  # noqa: E402
+from save_load import _reject_duplicate_keys, deserialize_game  # noqa: E402
+from save_schema import canonical_save_bytes, validate_save  # noqa: E402
+from save_snapshot import (  # noqa: E402
+    decode_snapshot,
+    encode_snapshot,
+    restore_game,
+    snapshot_game,
+)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", type=int, default=1500)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=9000)
+    return parser.parse_args(argv)
+
+
+def _parse_json(payload: bytes) -> dict:
+    return json.loads(payload, object_pairs_hook=_reject_duplicate_keys)
+
+
+def _load_json(payload: bytes):
+    document = _parse_json(payload)
+    validate_save(document)
+    return deserialize_game(document)
+
+
+def run(args: argparse.Namespace) -> dict:
+    env = SemanticMetroEnv()
+    env.reset(seed=args.seed)
+    for _ in range(args.decisions):
+        _, _, terminated, truncated, _ = env.step(choose(env))
+        if terminated or truncated:
+            break
+    mediator = env._mediator
+    document = serialize_game(mediator)
+    json_bytes = canonical_save_bytes(document)
+    snapshot = encode_snapshot(document)
+    if canonical_save_bytes(decode_snapshot(snapshot)) != json_bytes:
+        raise SystemExit("the snapshot does not unpack to the same document")
+
+    def timed(function) -> float:
+        return round(median_us(function, repeats=args.repeats, number=50), 1)
+
+    report = {
+        "benchmark": "snapshot",
+        "decisions": args.decisions,
+        "stations": len(mediator.all_stations),
+        "passengers": len(mediator.passengers),
+        "metros": len(mediator.metros),
+        "bytes": {"json": len(json_bytes), "snapshot": len(snapshot)},
+        "zlib_bytes": {
+            "json": len(zlib.compress(json_bytes)),
+            "snapshot": len(zlib.compress(snapshot)),
+        },
+        "encode_us": {
+            "json": timed(lambda: canonical_save_bytes(document)),
+            "snapshot": timed(lambda: encode_snapshot(document)),
+        },
+        "decode_us": {
+            "json": timed(lambda: _parse_json(json_bytes)),
+            "snapshot": timed(lambda: decode_snapshot(snapshot)),
+        },
+        "capture_us": {
+            "json": timed(lambda: canonical_save_bytes(serialize_game(mediator))),
+            "snapshot": timed(lambda: snapshot_game(mediator)),
+        },
+        "restore_us": {
+            "json": timed(lambda: _load_json(json_bytes)),
+            "snapshot": timed(lambda: restore_game(snapshot)),
+        },
+    }
+    env.close()
+    return report
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
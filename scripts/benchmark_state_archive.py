@@ -0,0 +1,108 @@
+"""Measure a content-addressed state archive against holding save documents.
+
+A semantic-environment game is played for `--decisions` heuristic decisions,
+keeping the save document at each one, as Go-Explore keeps one per cell.
+Python heap traced with `tracemalloc` is compared for the plain documents and
+for a `StateArchive` holding the same states, in memory with a `--hot-states`
+LRU. The report adds the canonical JSON bytes of the documents, the unique
+compressed chunk bytes, and the time to put a state and to get one back from
+the hot set and from its chunks. Every state must come back with its bytes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, median_us  # noqa: E402
+from state_archive import StateArchive  # noqa: E402
+
+from rl.heuristic import choose  # noqa: E402
+from rl.semantic_env import SemanticMetroEnv  # noqa: E402
+from save_game import serialize_game  # noqa: E402
+from save_schema import canonical_save_bytes  # noqa: E402
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decisions", type=int, default=1000)
+    parser.add_argument("--hot-states", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=9000)
+    return parser.parse_args(argv)
+
+
+def _traced(build):
+    gc.collect()
+    tracemalloc.start()
+    held = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return held, size
+
+
+def run(args: argparse.Namespace) -> dict:
+    env = SemanticMetroEnv()
+    env.reset(seed=args.seed)
+    payloads = []
+    for _ in range(args.decisions):
+        _, _, terminated, truncated, _ = env.step(choose(env))
+        payloads.append(canonical_save_bytes(serialize_game(env._mediator)))
+        if terminated or truncated:
+            break
+    mediator = env._mediator
+
+    # Both sides start from the same bytes so neither pays the other's parse.
+    documents, documents_heap = _traced(lambda: [json.loads(p) for p in payloads])
+
+    def archived():
+        archive = StateArchive(hot_states=args.hot_states)
+        refs = [archive.put(json.loads(payload)) for payload in payloads]
+        return archive, refs
+
+    (archive, refs), archive_heap = _traced(archived)
+    for ref, payload in zip(refs, payloads):
+        if canonical_save_bytes(archive.get(ref)) != payload:
+            raise SystemExit("an archived state came back different")
+
+    document = serialize_game(mediator)
+    hot_ref = archive.put(document)
+    archive.get(hot_ref)
+    cold = StateArchive(hot_states=0)
+    cold_ref = cold.put(document)
+
+    def timed(function) -> float:
+        return round(median_us(function, repeats=args.repeats, number=50), 1)
+
+    report = {
+        "benchmark": "state_archive",
+        "states": len(documents),
+        "unique_chunks": archive.chunk_count,
+        "heap_bytes": {"documents": documents_heap, "archive": archive_heap},
+        "heap_bytes_per_state": {
+            "documents": round(documents_heap / len(documents)),
+            "archive": round(archive_heap / len(documents)),
+        },
+        "stored_bytes": {
+            "canonical_json": sum(map(len, payloads)),
+            "archive_chunks": archive.nbytes,
+        },
+        "put_us": timed(lambda: archive.put(document)),
+        "get_us": {
+            "hot": timed(lambda: archive.get(hot_ref)),
+            "cold": timed(lambda: cold.get(cold_ref)),
+        },
+    }
+    env.close()
+    return report
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
@@ -0,0 +1,124 @@
+"""Shared timing, synthetic-network and baseline helpers for the benchmarks.
+
+Benchmarks here measure one operation in-process with `time.perf_counter_ns`
+and report the median of several repeats, because a single run on a busy
+machine is dominated by scheduler noise. They print JSON so a result can be
+pasted into a devlog or diffed between commits.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from config import station_color, station_size  # noqa: E402
+from entity.path import Path  # noqa: E402
+from entity.station import Station  # noqa: E402
+from geometry.circle import Circle  # noqa: E402
+from geometry.point import Point  # noqa: E402
+from geometry.rect import Rect  # noqa: E402
+from geometry.triangle import Triangle  # noqa: E402
+from graph.node import Node  # noqa: E402
+
+
+def median_us(function: Callable[[], Any], *, repeats: int, number: int) -> float:
+    """Median wall time of one call, in microseconds, over `repeats` batches."""
+
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter_ns()
+        for _ in range(number):
+            function()
+        samples.append((time.perf_counter_ns() - started) / number / 1_000)
+    return statistics.median(samples)
+
+
+def synthetic_network(
+    station_count: int, line_count: int, line_length: int, *, seed: int = 0
+) -> tuple[list[Station], list[Path]]:
+    """Stations on a grid and `line_count` random lines of `line_length` stops.
+
+    Lines share stations freely and every third line is looped, so the graph
+    has the transfers and loop closures a real late-game board has.
+    """
+
+    rng = random.Random(seed)
+    factories = (
+        lambda: Rect(station_color, 2 * station_size, 2 * station_size),
+        lambda: Circle(station_color, station_size),
+        lambda: Triangle(station_color, station_size),
+    )
+    columns = max(1, int(station_count**0.5))
+    stations = [
+        Station(
+            factories[index % len(factories)](),
+            Point(40 * (index % columns), 40 * (index // columns)),
+        )
+        for index in range(station_count)
+    ]
+    paths = []
+    for line in range(line_count):
+        path = Path((line, line, line))
+        for station in rng.sample(stations, min(line_length, station_count)):
+            path.add_station(station)
+        if line % 3 == 2 and len(path.stations) > 2:
+            path.set_loop()
+        paths.append(path)
+    return stations, paths
+
+
+def legacy_build_station_nodes_dict(
+    stations: list[Station], paths: list[Path]
+) -> dict[Station, Node]:
+    """The retired per-station scan, kept as the neighbor-order oracle.
+
+    `benchmark_graph_build` times it as the baseline, and `test_graph`
+    checks the linear builder against it.
+    """
+
+    station_nodes: list[Node] = []
+    connections: list[list[Node]] = []
+    station_nodes_dict: dict[Station, Node] = {}
+
+    for station in stations:
+        node = Node(station)
+        station_nodes.append(node)
+        station_nodes_dict[station] = node
+    for path in paths:
+        if path.is_being_created:
+            continue
+        connection = []
+        for station in path.stations:
+            station_nodes_dict[station].paths.add(path)
+            connection.append(station_nodes_dict[station])
+        if path.is_looped and len(connection) > 1:
+            connection.append(connection[0])
+        connections.append(connection)
+
+    while len(station_nodes) > 0:
+        root = station_nodes[0]
+        for connection in connections:
+            for idx in range(len(connection)):
+                node = connection[idx]
+                if node == root:
+                    if idx - 1 >= 0:
+                        root.neighbors.add(connection[idx - 1])
+                    if idx + 1 <= len(connection) - 1:
+                        root.neighbors.add(connection[idx + 1])
+        station_nodes.remove(root)
+        station_nodes_dict[root.station] = root
+
+    return station_nodes_dict
+
+
+def emit(report: dict[str, Any]) -> None:
+    print(json.dumps(report, indent=2, sort_keys=True), flush=True)
@@ -47,11 +47,14 @@ sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
+from state_archive import StateArchive  # noqa: E402
+
 from game_session import GameSession  # noqa: E402
 from rl.player_env import INITIAL_CURSOR_POSITION, PlayerPixelEnv  # noqa: E402
 from rl.privileged_oracle import capture_privileged_snapshot  # noqa: E402
 from save_game import serialize_game  # noqa: E402
 from save_load import deserialize_game  # noqa: E402
+from save_schema import seal_save  # noqa: E402
 
 # Simulation-time granularity for a cell. Coarse enough that the archive
 # stays small, fine enough that progress registers as a new cell.
@@ -70,10 +73,11 @@ class Cell:
     intermediate worth returning to. So a cell stores the last quiescent state it
     can save, and the action suffix that reaches the real one. Replay is exact
     because the game is deterministic given a state and a sequence of actions,
-    which is the same determinism Go-Explore's first phase relies on.
+    which is the same determinism Go-Explore's first phase relies on. The saved
+    state itself lives in the shared `StateArchive`; the cell holds its reference.
     """
 
-    document: dict
+    state: bytes
     actions: tuple
     deliveries: int
     decisions: int
@@ -84,14 +88,14 @@ def capture(env: PlayerPixelEnv) -> dict:
     return serialize_game(env._require_mediator())
 
 
-def restore(env: PlayerPixelEnv, document: dict) -> None:
+def restore(env: PlayerPixelEnv, document: dict, trusted: bytes | None = None) -> None:
     """Put a saved game back into a live environment.
 
     The session wraps the mediator, so it is rebuilt around the restored one and
     the layout re-prepared; the environment's own per-episode bookkeeping is
     reset to match, or reward deltas would be measured against a stale baseline.
     """
-    mediator = deserialize_game(document)
+    mediator = deserialize_game(document, trusted=trusted)
     env._mediator = mediator
     env._session = GameSession(mediator, step_observer=env._renderer)
     env._session.prepare_layout(env._canonical_surface)
@@ -178,9 +182,19 @@ def explore(env: PlayerPixelEnv, steps: int) -> tuple[bool, list]:
     return False, taken
 
 
-def enter(env: PlayerPixelEnv, cell: Cell) -> None:
-    """Return to a cell: restore its ancestor, then replay to the exact state."""
-    restore(env, cell.document)
+def enter(
+    env: PlayerPixelEnv, states: StateArchive, seals: dict[bytes, bytes], cell: Cell
+) -> None:
+    """Return to a cell: restore its ancestor, then replay to the exact state.
+
+    A state is validated on its first return only: the archive reassembles it
+    with the same content every time, so later returns load it trusted.
+    """
+    document = states.get(cell.state)
+    seal = seals.get(cell.state)
+    if seal is None:
+        seal = seals[cell.state] = seal_save(document)
+    restore(env, document, seal)
     for action in cell.actions:
         env.step(action)
 
@@ -191,9 +205,11 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
     env.reset(seed=args.seed)
     rng = np.random.default_rng(args.seed)
 
+    states = StateArchive(args.archive_file, hot_states=args.hot_states)
     archive: dict[tuple, Cell] = {}
+    seals: dict[bytes, bytes] = {}
     start = cell_key(env)
-    archive[start] = Cell(capture(env), (), 0, 0)
+    archive[start] = Cell(states.put(capture(env)), (), 0, 0)
     best = 0
     iterations = 0
 
@@ -207,7 +223,7 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
         source = archive[chosen]
         source.visits += 1
 
-        enter(env, source)
+        enter(env, states, seals, source)
         ended, taken = explore(env, args.explore_steps)
         decisions = source.decisions + len(taken)
 
@@ -220,11 +236,13 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
             try:
                 # Prefer a fresh save: it keeps replay suffixes from growing
                 # without bound as the frontier advances.
-                archive[key] = Cell(capture(env), (), snapshot.deliveries, decisions)
+                archive[key] = Cell(
+                    states.put(capture(env)), (), snapshot.deliveries, decisions
+                )
             except ValueError:
                 # Mid-gesture, so anchor to this cell's ancestor plus the suffix.
                 archive[key] = Cell(
-                    source.document,
+                    source.state,
                     tuple(source.actions) + tuple(taken),
                     snapshot.deliveries,
                     decisions,
@@ -237,6 +255,7 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
             )
 
     env.close()
+    states.close()
     delivering = [c for c in archive.values() if c.deliveries > 0]
     return {
         "iterations": iterations,
@@ -246,6 +265,12 @@ def run(args: argparse.Namespace) -> dict[str, Any]:
         "cells_with_a_line": len([k for k in archive if k[1]]),
         "cells_with_a_locomotive": len([k for k in archive if k[5]]),
         "cells_with_line_and_locomotive": len([k for k in archive if k[1] and k[5]]),
+        "archived_states": len(states),
+        "archive_chunks": states.chunk_count,
+        "archive_bytes": states.nbytes,
+        "archive_logical_bytes": states.logical_bytes,
+        "hot_set_hits": states.hits,
+        "hot_set_misses": states.misses,
     }
 
 
@@ -254,6 +279,12 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--iterations", type=int, default=400)
     parser.add_argument("--explore-steps", type=int, default=60)
     parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--archive-file",
+        default=None,
+        help="keep archived state chunks in this file instead of in memory",
+    )
+    parser.add_argument("--hot-states", type=int, default=64)
     args = parser.parse_args(argv)
 
     print(
@@ -43,9 +43,9 @@ sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
+from mediator import Mediator  # noqa: E402
 from rl.heuristic import choose  # noqa: E402
 from rl.semantic_env import ACTION_TABLE, ActionKind, SemanticMetroEnv  # noqa: E402
-from save_game import serialize_game  # noqa: E402
 from save_load import deserialize_game  # noqa: E402
 
 # Kinds worth spending a search on. WAIT is always included as the baseline
@@ -60,14 +60,20 @@ STRUCTURAL = (
 )
 
 
-def _restore(env, document, decision: int) -> None:
+def _restore(env, snapshot, decision: int) -> None:
     """Rebuild the env's game from a snapshot, at the same decision count.
 
+    A snapshot is a game put aside with `Mediator.fork`, forked again here so
+    it can be restored any number of times, or a save document.
     `_decision` is restored rather than reset because the difficulty ramp and
     several observation features read it -- a rollout that believed it was at
     decision 0 would be simulating an easier game than the real one.
     """
-    env._mediator = deserialize_game(document)
+    env._mediator = (
+        snapshot.fork()
+        if isinstance(snapshot, Mediator)
+        else deserialize_game(snapshot)
+    )
     env._decision = decision
     env._last_deliveries = env._mediator.deliveries
     env._line_born = {}
@@ -76,9 +82,9 @@ def _restore(env, document, decision: int) -> None:
     env._mask_cache = None
 
 
-def _rollout(env, document, decision: int, action: int, cap: int) -> float:
+def _rollout(env, snapshot, decision: int, action: int, cap: int) -> float:
     """Apply one candidate, then let the default policy play to the end."""
-    _restore(env, document, decision)
+    _restore(env, snapshot, decision)
     total = 0.0
     _, reward, terminated, truncated, _ = env.step(action)
     total += float(reward)
@@ -92,7 +98,7 @@ def _rollout(env, document, decision: int, action: int, cap: int) -> float:
     return total
 
 
-def reseeded(document, key: int):
+def reseeded(snapshot, key: int):
     """The same board, a different future.
 
     Rollouts are deterministic given the serialised state, and that state
@@ -100,15 +106,19 @@ def reseeded(document, key: int):
     the future that will happen. Replacing the RNG lets a candidate be measured
     against futures the agent could not have known about.
     """
-    variant = copy.deepcopy(document)
-    variant["rng"] = {
-        "python": random.Random(key).getstate(),
-        "numpy": np.random.default_rng(key).bit_generator.state,
-    }
+    python_state = random.Random(key).getstate()
+    numpy_state = np.random.default_rng(key).bit_generator.state
+    if isinstance(snapshot, Mediator):
+        variant = snapshot.fork()
+        variant.context.python_random.setstate(python_state)
+        variant.context.numpy_random.bit_generator.state = numpy_state
+        return variant
+    variant = copy.deepcopy(snapshot)
+    variant["rng"] = {"python": python_state, "numpy": numpy_state}
     return variant
 
 
-def expected_value(env, document, decision: int, action: int, cap: int, futures):
+def expected_value(env, snapshot, decision: int, action: int, cap: int, futures):
     """Mean return of one candidate across a fixed set of sampled futures.
 
     A single rollout is a one-sample estimate, and taking the max over noisy
@@ -123,10 +133,10 @@ def expected_value(env, document, decision: int, action: int, cap: int, futures)
     cost.
     """
     if not futures:
-        return _rollout(env, document, decision, action, cap)
+        return _rollout(env, snapshot, decision, action, cap)
     total = 0.0
     for key in futures:
-        total += _rollout(env, reseeded(document, key), decision, action, cap)
+        total += _rollout(env, reseeded(snapshot, key), decision, action, cap)
     return total / len(futures)
 
 
@@ -204,7 +214,9 @@ def play(seed: int, candidates: int, cap: int, futures: int) -> dict:
             last_signature = signature
             shortlist = shortlist_for(rng, structural, preferred, candidates)
 
-            document = serialize_game(env._mediator)
+            # A fork rather than a save document: restoring it skips the
+            # schema validation and id lookups of a load.
+            snapshot = env._mediator.fork()
             at = env._decision
             # One draw of future keys, shared by every candidate here.
             keys = (
@@ -214,12 +226,12 @@ def play(seed: int, candidates: int, cap: int, futures: int) -> dict:
             )
             scored = [
                 (
-                    expected_value(env, document, at, candidate, cap, keys),
+                    expected_value(env, snapshot, at, candidate, cap, keys),
                     candidate,
                 )
                 for candidate in shortlist
             ]
-            _restore(env, document, at)
+            _restore(env, snapshot, at)
             searches += 1
             best = max(scored)[1]
             overrides += int(best != preferred)
@@ -0,0 +1,183 @@
+"""A content-addressed store of save documents for large Go-Explore archives.
+
+Go-Explore keeps one saved state per cell, and most of what those states hold
+is shared: every cell carries the same map identity and milestones, cells on
+one branch share their lines and station pool, and a cell anchored mid-gesture
+reuses its ancestor outright. Holding a `serialize_game` dict per cell costs
+that sharing back in full, so a 10^5-cell archive runs a box out of memory.
+
+`StateArchive.put` splits a document into chunks by key -- the map identity
+and rules, stations, paths, passengers, metros, RNG, and the scalars that
+change every tick -- encodes each as canonical JSON, compresses it, and keys
+it by its BLAKE2b digest, so an identical chunk is stored once however many
+states hold it. A state is the tuple of its chunk digests, and its reference
+is the digest of that tuple, so an identical state is stored once too. Chunks
+live in memory or are appended to a file read back through `mmap`.
+
+`get` reassembles a document from its chunks, and keeps the `hot_states` most
+recently used documents materialised in an LRU so that returning to a busy
+cell costs no decoding. A returned document is shared with that hot set and
+must be treated as read-only; `deserialize_game` only reads it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import zlib
+from collections import OrderedDict
+from typing import Any
+
+# Keys grouped by how often they change together. Anything not named here
+# lands in the per-tick chunk, so a new save key still round-trips.
+CHUNKS = (
+    (
+        "map",
+        (
+            "schemaVersion",
+            "stateContract",
+            "rulesVersion",
+            "mapId",
+            "mapDefinitionVersion",
+            "numPaths",
+            "initialNumStations",
+            "pathPurchasePrices",
+            "pathUnlockMilestones",
+            "stationUnlockMilestones",
+            "passengerMaxWaitTimeMs",
+            "overduePassengerThreshold",
+        ),
+    ),
+    ("stations", ("stations", "spawnTimers")),
+    ("paths", ("paths", "pathColors", "pathToColor", "pathButtons")),
+    ("passengers", ("passengers", "travelPlans")),
+    ("metros", ("metros",)),
+    ("rng", ("rng",)),
+)
+_CHUNKED = frozenset(key for _, keys in CHUNKS for key in keys)
+_DIGEST_SIZE = 16
+
+
+def _digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=_DIGEST_SIZE).digest()
+
+
+def _encode(part: dict[str, Any]) -> bytes:
+    return json.dumps(
+        part, allow_nan=False, ensure_ascii=True, separators=(",", ":"), sort_keys=True
+    ).encode("ascii")
+
+
+class StateArchive:
+    """Save documents stored once per distinct chunk, with an LRU hot set."""
+
+    def __init__(self, path: str | os.PathLike | None = None, *, hot_states: int = 64):
+        if type(hot_states) is not int or hot_states < 0:
+            raise ValueError("hot_states must be a non-negative int")
+        self.hot_states = hot_states
+        self.hits = 0
+        self.misses = 0
+        self._states: dict[bytes, tuple[bytes, ...]] = {}
+        self._hot: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+        self._logical_bytes = 0
+        # In memory a chunk is its compressed bytes; on disk, its span.
+        self._chunks: dict[bytes, Any] = {}
+        self._file = None
+        self._map: mmap.mmap | None = None
+        self._size = 0
+        if path is not None:
+            self._file = open(path, "w+b")
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, ref: bytes) -> bool:
+        return ref in self._states
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._chunks)
+
+    @property
+    def nbytes(self) -> int:
+        """Compressed bytes of the unique chunks."""
+
+        return self._size
+
+    @property
+    def logical_bytes(self) -> int:
+        """Uncompressed chunk bytes over every distinct state, before sharing."""
+
+        return self._logical_bytes
+
+    def put(self, document: dict[str, Any]) -> bytes:
+        """Store a save document and return its reference."""
+
+        parts = [
+            {key: document[key] for key in keys if key in document}
+            for _, keys in CHUNKS
+        ]
+        parts.append(
+            {key: value for key, value in document.items() if key not in _CHUNKED}
+        )
+        payloads = [_encode(part) for part in parts]
+        manifest = tuple(self._store(payload) for payload in payloads)
+        ref = _digest(b"".join(manifest))
+        if ref not in self._states:
+            self._states[ref] = manifest
+            self._logical_bytes += sum(map(len, payloads))
+        return ref
+
+    def get(self, ref: bytes) -> dict[str, Any]:
+        """The document stored under `ref`; read-only, see the module notes."""
+
+        document = self._hot.get(ref)
+        if document is not None:
+            self.hits += 1
+            self._hot.move_to_end(ref)
+            return document
+        self.misses += 1
+        document = {}
+        for digest in self._states[ref]:
+            document.update(json.loads(zlib.decompress(self._load(digest))))
+        if self.hot_states:
+            self._hot[ref] = document
+            if len(self._hot) > self.hot_states:
+                self._hot.popitem(last=False)
+        return document
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _store(self, payload: bytes) -> bytes:
+        digest = _digest(payload)
+        if digest in self._chunks:
+            return digest
+        compressed = zlib.compress(payload, 1)
+        if self._file is None:
+            self._chunks[digest] = compressed
+        else:
+            self._file.seek(self._size)
+            self._file.write(compressed)
+            self._chunks[digest] = (self._size, len(compressed))
+        self._size += len(compressed)
+        return digest
+
+    def _load(self, digest: bytes) -> bytes:
+        if self._file is None:
+            return self._chunks[digest]
+        offset, length = self._chunks[digest]
+        if self._map is None or len(self._map) < offset + length:
+            # The file has grown past the mapping since it was last read.
+            if self._map is not None:
+                self._map.close()
+            self._file.flush()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset : offset + length]
@@ -0,0 +1,171 @@
+"""Check the transfer-aware route search against the search it replaced.
+
+Planning used to find a route with `bfs` and then compress it with
+`RoutePlanner.skip_stations_on_same_path`; it now reads both off one
+`RouteTable` tree. Both pipelines are still in the tree, so this runs them
+side by side in-process rather than against an archived baseline:
+
+- every (origin, destination) pair of seeded synthetic networks must get the
+  same node path and the same transfer plan;
+- every (origin, destination shape) query must pick the same winner through
+  `RoutePlanner.find_best_node_path`;
+- seeded games played with each pipeline must produce identical canonical
+  checkpoints after every step.
+
+The opt-in least-transfer search (`RouteTable.least_transfer`) is checked on
+the same pairs: its route must be exactly as many hops as the BFS one and its
+transfer plan no longer than the compressed BFS route's.
+
+It prints a JSON summary with a digest of the candidate records and exits
+non-zero on the first disagreement.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from typing import Any
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+
+from benchmark_support import emit, synthetic_network  # noqa: E402
+
+from env import MiniMetroEnv  # noqa: E402
+from graph.graph_algo import bfs, build_station_nodes_dict  # noqa: E402
+from graph.route_table import RouteTable  # noqa: E402
+from graph.station_graph import StationGraph  # noqa: E402
+from recursive_checkpoint import canonical_checkpoint  # noqa: E402
+from route_planner import RoutePlanner  # noqa: E402
+
+NETWORKS = ((12, 3, 6), (40, 6, 9), (120, 12, 14))
+PLANNER = RoutePlanner()
+
+
+def _legacy_reduce(node_path: list[Any]) -> list[Any]:
+    return PLANNER.skip_stations_on_same_path(node_path)
+
+
+def _ids(stations: list[Any], node_path: list[Any] | None) -> list[int] | None:
+    if node_path is None:
+        return None
+    index = {station: idx for idx, station in enumerate(stations)}
+    return [index[node.station] for node in node_path]
+
+
+def _network_records(seed: int) -> list[dict[str, Any]]:
+    records = []
+    for station_count, line_count, line_length in NETWORKS:
+        stations, paths = synthetic_network(
+            station_count, line_count, line_length, seed=seed
+        )
+        graph = StationGraph(lambda: build_station_nodes_dict)
+        nodes = graph.view(stations, paths)
+        table = RouteTable(graph)
+        fewest = RouteTable(graph)
+        fewest.least_transfer = True
+        for start in nodes.values():
+            for end in nodes.values():
+                legacy = bfs(start, end)
+                candidate = table.node_path(start, end)
+                if _ids(stations, legacy) != _ids(stations, candidate):
+                    raise SystemExit(f"node paths differ: {start} -> {end}")
+                route = fewest.node_path(start, end)
+                if len(route) != len(legacy):
+                    raise SystemExit(f"least-transfer hops differ: {start} -> {end}")
+                if len(legacy) > 1:
+                    legacy = _legacy_reduce(list(legacy))
+                    candidate = table.transfer_stops(list(candidate))
+                    if _ids(stations, legacy) != _ids(stations, candidate):
+                        raise SystemExit(f"transfer plans differ: {start} -> {end}")
+                    route = fewest.transfer_stops(route)
+                    if len(route) > len(legacy):
+                        raise SystemExit(f"least-transfer adds stops: {start} -> {end}")
+                records.append(
+                    {
+                        "network": station_count,
+                        "pair": _ids(stations, [start, end]),
+                        "stops": _ids(stations, candidate),
+                        "fewest": _ids(stations, route),
+                    }
+                )
+            for shape_type in dict.fromkeys(s.shape.type for s in stations):
+                destinations = [s for s in stations if s.shape.type == shape_type]
+                winners = [
+                    PLANNER.find_best_node_path(
+                        start.station,
+                        destinations,
+                        nodes,
+                        find_node_path=find_node_path,
+                        get_reduce_node_path=lambda reduce=reduce: reduce,
+                    )
+                    for find_node_path, reduce in (
+                        (bfs, _legacy_reduce),
+                        (table.node_path, table.transfer_stops),
+                    )
+                ]
+                if _ids(stations, winners[0]) != _ids(stations, winners[1]):
+                    raise SystemExit(f"winners differ: {start} -> {shape_type}")
+    return records
+
+
+def _play(seed: int, steps: int) -> list[dict[str, Any]]:
+    env = MiniMetroEnv()
+    env.reset(seed=seed)
+    env.mediator.unlocked_num_paths = env.mediator.num_paths
+    for stations, loop in (([0, 1, 2], False), ([2, 0, 1], True)):
+        action = {"type": "create_path", "stations": stations, "loop": loop}
+        env.step_legacy_auto_assignment(action)
+    checkpoints = []
+    for _ in range(steps):
+        env.step(None, dt_ms=250)
+        checkpoints.append(canonical_checkpoint(env))
+    return checkpoints
+
+
+def _game_records(seed: int, steps: int) -> list[dict[str, Any]]:
+    candidate = _play(seed, steps)
+    with (
+        patch.object(RouteTable, "node_path", staticmethod(bfs)),
+        patch.object(RouteTable, "transfer_stops", staticmethod(_legacy_reduce)),
+    ):
+        legacy = _play(seed, steps)
+    for step, (expected, actual) in enumerate(zip(legacy, candidate)):
+        if expected != actual:
+            raise SystemExit(f"seed {seed} diverges at step {step}")
+    return candidate
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--steps", type=int, default=400)
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> dict:
+    records = {
+        "networks": [_network_records(seed) for seed in args.seeds],
+        "games": [_game_records(seed, args.steps) for seed in args.seeds],
+    }
+    encoded = json.dumps(records, sort_keys=True, default=repr).encode()
+    return {
+        "verifier": "route-search-differential",
+        "seeds": args.seeds,
+        "steps": args.steps,
+        "pairs": sum(len(network) for network in records["networks"]),
+        "fewer_transfer_pairs": sum(
+            len(record["fewest"]) < len(record["stops"])
+            for network in records["networks"]
+            for record in network
+        ),
+        "sha256": hashlib.sha256(encoded).hexdigest(),
+        "equal": True,
+    }
+
+
+if __name__ == "__main__":
+    emit(run(parse_args()))
@@ -140,7 +140,8 @@ class AppController:
 
     def _autosave_save(self) -> None:
         # Persistence is best-effort: the seam swallows its own failures, so a
-        # save that cannot run still lets play or exit proceed (D-027/F3).
+        # save that cannot run still lets play or exit proceed (D-027/F3). main's
+        # seam only captures here and writes on a worker thread.
         if self._autosave is not None:
             self._autosave.save(self.mediator)
 
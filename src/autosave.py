@@ -0,0 +1,144 @@
+"""Autosave off the game loop: capture on the caller, write on one worker.
+
+`main.write_autosave` used to serialize, validate, encode and fsync the whole
+game inside the frame that asked for it. `AutosaveService` keeps only the
+detached `capture_game` copy on the calling (UI) thread and hands the document
+to a single daemon worker, which validates and writes it through
+`save_document`'s atomic writer. Jobs coalesce: a newer save or delete replaces
+one still waiting, and the worker runs them in request order, so a delete can
+never be overtaken by an older write. A save of the same mediator at an
+unchanged `state_version` is skipped before anything is captured.
+
+Failures stay best-effort exactly as before: a capture that raises (a
+mid-gesture boundary) is dropped on the caller, and a failed write leaves the
+previous autosave intact and forgets the skip key so the next save retries.
+`peek` and `load` answer for work still in flight, and `close` drains the
+worker so the synchronous window-close save lands after it.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from pathlib import Path as FilesystemPath
+from typing import Any, Callable
+
+from save_game import capture_game, save_document
+
+__all__ = ["AutosaveService"]
+
+_SAVE = "save"
+_DELETE = "delete"
+
+
+class AutosaveService:
+    """The controller's autosave seam (save/delete/peek/load) over a worker."""
+
+    def __init__(
+        self,
+        path: Any,
+        *,
+        delete: Callable[[], None],
+        peek: Callable[[], bool],
+        load: Callable[[], Any],
+    ) -> None:
+        self._path = FilesystemPath(path)
+        self._delete = delete
+        self._peek = peek
+        self._load = load
+        self._condition = threading.Condition()
+        self._pending: tuple[str, dict[str, Any] | None, int] | None = None
+        self._running: tuple[str, dict[str, Any] | None, int] | None = None
+        self._sequence = 0
+        # (id, weak reference, state_version) of the last saved mediator: the
+        # reference tells a reused id apart without keeping a finished game alive.
+        self._saved: tuple[int, weakref.ref, int] | None = None
+        self._thread: threading.Thread | None = None
+        self._closing = False
+
+    def save(self, mediator: Any) -> None:
+        version = getattr(mediator, "state_version", None)
+        saved = self._saved
+        if version is not None and saved is not None:
+            if saved[0] == id(mediator) and saved[2] == version:
+                if saved[1]() is mediator:
+                    return
+        try:
+            document = capture_game(mediator)
+        except Exception:
+            return
+        with self._condition:
+            self._saved = None
+            if version is not None:
+                self._saved = (id(mediator), weakref.ref(mediator), version)
+            self._submit(_SAVE, document)
+
+    def delete(self) -> None:
+        with self._condition:
+            self._saved = None
+            self._submit(_DELETE, None)
+
+    def peek(self) -> bool:
+        with self._condition:
+            job = self._pending or self._running
+        if job is not None:
+            return job[0] == _SAVE
+        return self._peek()
+
+    def load(self) -> Any:
+        self.flush()
+        return self._load()
+
+    def flush(self) -> None:
+        """Block until every requested save and delete has run."""
+
+        with self._condition:
+            while self._pending is not None or self._running is not None:
+                self._condition.wait()
+
+    def close(self) -> None:
+        """Drain and stop the worker; a later save starts a fresh one."""
+
+        with self._condition:
+            thread = self._thread
+            self._closing = True
+            self._condition.notify_all()
+        if thread is not None:
+            thread.join()
+        with self._condition:
+            self._thread = None
+            self._closing = False
+
+    def _submit(self, kind: str, document: dict[str, Any] | None) -> None:
+        # Called with the condition held.
+        self._sequence += 1
+        self._pending = (kind, document, self._sequence)
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._work, name="autosave", daemon=True
+            )
+            self._thread.start()
+        self._condition.notify_all()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closing:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                job = self._running = self._pending
+                self._pending = None
+            kind, document, sequence = job
+            try:
+                if kind == _SAVE:
+                    save_document(document, self._path)
+                else:
+                    self._delete()
+            except Exception:
+                with self._condition:
+                    if sequence == self._sequence:
+                        self._saved = None
+            with self._condition:
+                self._running = None
+                self._condition.notify_all()
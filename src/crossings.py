@@ -100,6 +100,18 @@ def path_crossings(
     return tuple(crossings)
 
 
+def committed_crossings(
+    paths: Sequence, rivers: Sequence[Band], *, exclude: object = None
+) -> int:
+    """River crossings over every committed line except ``exclude``; drafts
+    (``is_being_created``) are not counted."""
+    return sum(
+        len(path_crossings([s.position for s in path.stations], path.is_looped, rivers))
+        for path in paths
+        if path is not exclude and not getattr(path, "is_being_created", False)
+    )
+
+
 def within_tunnel_budget(
     host: object, stations: Sequence, is_looped: bool, *, exclude: object = None
 ) -> bool:
@@ -131,9 +143,5 @@ def within_tunnel_budget(
     if not rivers:
         return True
     candidate = len(path_crossings([s.position for s in stations], is_looped, rivers))
-    others = sum(
-        len(path_crossings([s.position for s in path.stations], path.is_looped, rivers))
-        for path in getattr(host, "paths", ())
-        if path is not exclude and not getattr(path, "is_being_created", False)
-    )
+    others = committed_crossings(getattr(host, "paths", ()), rivers, exclude=exclude)
     return candidate + others <= num_tunnels
@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 from math import ceil, cos, radians, sin
-from typing import Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable
 
-import pygame
 from shortuuid import uuid  # type: ignore
 
 from config import (
@@ -22,10 +21,15 @@ from config import (
 from geometry.point import Point
 from geometry.rect import Rect
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Carriage:
     """One live attached carriage; unassigned inventory has no entity object."""
 
+    __slots__ = ("id", "size", "_capacity", "shape", "position", "passengers_per_row")
+
     def __init__(self) -> None:
         self.id = f"Carriage-{uuid()}"
         self.size = carriage_size
@@ -57,6 +61,8 @@ class Carriage:
         is_unassignment_queued: bool = False,
         reduced_motion: bool = False,
     ) -> None:
+        import pygame
+
         draw_position = self.position if display_position is None else display_position
         center_x, center_y = (
             draw_position
@@ -148,6 +148,28 @@ def get_random_stations(
     return stations
 
 
+def get_initial_station_pool(
+    num: int,
+    initial_num: int,
+    context: SimulationContext | None,
+    map_definition,
+) -> List[Station]:
+    # Keep initial gameplay valid by guaranteeing at least two shape types.
+    while True:
+        stations = get_random_stations(
+            num,
+            context=context,
+            shape_types=map_definition.shape_types,
+            unique_shape_types=map_definition.unique_shape_types,
+            unique_spawn_start_index=map_definition.unique_spawn_start_index,
+            unique_spawn_chance=map_definition.unique_spawn_chance,
+            spawn_regions=map_definition.spawn_regions,
+        )
+        initial_shapes = {station.shape.type for station in stations[:initial_num]}
+        if len(initial_shapes) >= 2:
+            return stations
+
+
 def get_metros(num: int) -> List[Metro]:
     metros: List[Metro] = []
     for _ in range(num):
@@ -1,23 +1,123 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import List
-
-import pygame
+from typing import TYPE_CHECKING, Any, Iterable, List
 
 from config import passenger_display_buffer, passenger_size
 from entity.passenger import Passenger
 from geometry.point import Point
 from geometry.shape import Shape
 
+if TYPE_CHECKING:
+    import pygame
+
+
+class HolderPassengers(list):
+    """A holder's passenger list that reports every change to its holder."""
+
+    __slots__ = ("_holder",)
+
+    def __init__(self, values: Iterable[Passenger] = (), holder: Holder | None = None):
+        super().__init__(values)
+        self._holder = holder
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Copies and pickles are plain lists, detached from the holder.
+        return list, (list(self),)
+
+    def _changed(self) -> None:
+        if self._holder is not None:
+            self._holder._passengers_changed()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, values: Any) -> HolderPassengers:
+        super().__iadd__(values)
+        self._changed()
+        return self
+
+    def __imul__(self, count: Any) -> HolderPassengers:
+        super().__imul__(count)
+        self._changed()
+        return self
+
+    def append(self, passenger: Passenger) -> None:
+        super().append(passenger)
+        self._changed()
+
+    def extend(self, passengers: Iterable[Passenger]) -> None:
+        super().extend(passengers)
+        self._changed()
+
+    def insert(self, index: Any, passenger: Passenger) -> None:
+        super().insert(index, passenger)
+        self._changed()
+
+    def remove(self, passenger: Passenger) -> None:
+        super().remove(passenger)
+        self._changed()
+
+    def pop(self, *args: Any) -> Passenger:
+        passenger = super().pop(*args)
+        self._changed()
+        return passenger
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+
+class HolderPassengersField:
+    """A holder's `passengers`, reporting reassignment as a change."""
+
+    __slots__ = ()
+
+    def __get__(self, holder: Any, owner: type | None = None) -> Any:
+        if holder is None:
+            return self
+        return holder._passengers
+
+    def __set__(self, holder: Any, value: Any) -> None:
+        holder._passengers = value
+        holder._passengers_changed()
+
 
 class Holder(ABC):
+    __slots__ = (
+        "shape",
+        "capacity",
+        "id",
+        "position",
+        "version",
+        "_passengers",
+        "passengers_per_row",
+        "size",
+    )
+    # `version` counts the changes to the passenger list, which is a
+    # `HolderPassengers` unless something assigns a list of its own.
+    passengers = HolderPassengersField()
+
     def __init__(self, shape: Shape, capacity: int, id: str) -> None:
         self.shape = shape
         self.capacity = capacity
         self.id = id
         self.position: Point
-        self.passengers: List[Passenger] = []
+        self.version = 0
+        self.passengers: List[Passenger] = HolderPassengers(holder=self)
         self.passengers_per_row: int
         self.size: int
 
@@ -62,6 +162,15 @@ class Holder(ABC):
                 row += 1
                 col = 0
 
+    def _passengers_changed(self) -> None:
+        self.version += 1
+
+    def owns_passenger_list(self) -> bool:
+        """Whether every change to `passengers` shows in `version`."""
+
+        passengers = self.passengers
+        return type(passengers) is HolderPassengers and passengers._holder is self
+
     def contains(self, point: Point):
         return self.shape.contains(point)
 
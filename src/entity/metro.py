@@ -1,7 +1,8 @@
+from __future__ import annotations
+
 from math import ceil, cos, radians, sin
-from typing import Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable
 
-import pygame
 from shortuuid import uuid  # type: ignore
 
 from config import (
@@ -25,8 +26,31 @@ from entity.station import Station
 from geometry.point import Point
 from geometry.rect import Rect
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Metro(Holder):
+    __slots__ = (
+        "carriages",
+        "_base_capacity",
+        "current_station",
+        "current_segment",
+        "current_segment_idx",
+        "path_id",
+        "max_speed",
+        "speed",
+        "acceleration_per_ms",
+        "deceleration_per_ms",
+        "is_forward",
+        "stop_time_remaining_ms",
+        "boarding_progress_ms",
+        "boarding_time_per_passenger_ms",
+        "just_arrived_and_stopped",
+        "is_unassignment_queued",
+        "_station_service_action",
+    )
+
     def __init__(self) -> None:
         self.size = metro_size
         self.carriages: list[Any] = []
@@ -84,6 +108,8 @@ class Metro(Holder):
         is_unassignment_queued: bool | None = None,
         reduced_motion: bool = False,
     ) -> None:
+        import pygame
+
         draw_position = self.position if display_position is None else display_position
         center_x, center_y = (
             draw_position
@@ -8,6 +8,8 @@ from type import Color
 
 
 class PaddingSegment(Segment):
+    __slots__ = ()
+
     def __init__(self, color: Color, start_point: Point, end_point: Point) -> None:
         super().__init__(color)
         self.id = f"PathSegment-{uuid()}"
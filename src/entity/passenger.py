@@ -1,17 +1,40 @@
-import pygame
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from shortuuid import uuid  # type: ignore
 
 from config import passenger_blink_interval_ms, passenger_blink_warning_time_ms
 from geometry.point import Point
 from geometry.shape import Shape
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Passenger:
+    # Riders are the most numerous entity, so their fields are slotted.
+    __slots__ = (
+        "id",
+        "position",
+        "destination_shape",
+        "is_at_destination",
+        "_wait_clock",
+        "_wait_station",
+        "_wait_origin_ms",
+        "_wait_ms",
+    )
+
     def __init__(self, destination_shape: Shape) -> None:
         self.id = f"Passenger-{uuid()}"
         self.position = Point(0, 0)
         self.destination_shape = destination_shape
         self.is_at_destination = False
+        # Set while the wait runs on a station's `WaitClock`, which then holds
+        # the wait as the clock reading it started at.
+        self._wait_clock = None
+        self._wait_station = None
+        self._wait_origin_ms = 0
         self.wait_ms = 0
 
     def __repr__(self) -> str:
@@ -20,6 +43,19 @@ class Passenger:
     def __hash__(self) -> int:
         return hash(self.id)
 
+    @property
+    def wait_ms(self):
+        if self._wait_clock is None:
+            return self._wait_ms
+        return self._wait_clock.now_ms - self._wait_origin_ms
+
+    @wait_ms.setter
+    def wait_ms(self, value) -> None:
+        if self._wait_clock is None:
+            self._wait_ms = value
+        else:
+            self._wait_clock.restart(self, value)
+
     def is_in_warning_window(self, max_wait_time_ms: int) -> bool:
         return (
             self.wait_ms < max_wait_time_ms
@@ -1,7 +1,8 @@
+from __future__ import annotations
+
 import math
-from typing import List
+from typing import TYPE_CHECKING, Callable, List
 
-import pygame
 from shortuuid import uuid  # type: ignore
 
 from config import path_order_shift, path_width
@@ -11,11 +12,39 @@ from entity.path_segment import PathSegment
 from entity.segment import Segment
 from entity.station import Station
 from geometry.point import Point
-from geometry.utils import direction, distance
+from geometry.utils import heading
+from metro_kinematics import (
+    ARRIVAL_SLACK_MS,
+    profile_duration,
+    profile_state,
+    segment_profile,
+)
 from type import Color
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Path:
+    __slots__ = (
+        "id",
+        "color",
+        "stations",
+        "metros",
+        "is_looped",
+        "is_being_created",
+        "temp_point",
+        "segments",
+        "path_segments",
+        "padding_segments",
+        "path_order",
+        "_creation_snap_blips",
+        # Hosts and tests rebind methods on a single path; the dict is only
+        # allocated for the paths that get one.
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(self, color: Color) -> None:
         self.id = f"Path-{uuid()}"
         self.color = color
@@ -118,6 +147,8 @@ class Path:
 
     def draw(self, surface: pygame.surface.Surface, path_order: int) -> None:
         # Legacy direct drawing stays observational while honoring its lane.
+        import pygame
+
         from rendering.layout import build_visual_path
 
         layout = build_visual_path(self, float(path_order), path_order_shift)
@@ -180,13 +211,8 @@ class Path:
             dst_station = metro.current_segment.start_station
             dst_position = metro.current_segment.segment_start
 
-        start_point = metro.position
-        end_point = dst_position
-        dist = distance(start_point, end_point)
-        direct = direction(start_point, end_point)
-        radians = math.atan2(direct.top, direct.left)
-        degrees = math.degrees(radians)
-        metro.shape.set_degrees(degrees)
+        dist, unit_left, unit_top = heading(metro.position, dst_position)
+        metro.shape.set_degrees(math.degrees(math.atan2(unit_top, unit_left)))
         if should_stop_at_next_station:
             if metro.deceleration_per_ms > 0:
                 stopping_distance = (metro.speed * metro.speed) / (
@@ -213,7 +239,11 @@ class Path:
         # metro is not at one end of segment
         if dist > travel_dist_in_dt:
             metro.current_station = None
-            metro.position += direct * travel_dist_in_dt
+            position = metro.position
+            metro.position = Point(
+                position.left + travel_dist_in_dt * unit_left,
+                position.top + travel_dist_in_dt * unit_top,
+            )
         # metro is at one end of segment
         else:
             metro.current_station = dst_station
@@ -221,28 +251,106 @@ class Path:
             if should_stop_at_next_station:
                 metro.speed = 0
                 metro.just_arrived_and_stopped = True
-            if len(self.segments) == 1:
-                metro.is_forward = not metro.is_forward
-            elif metro.current_segment_idx == len(self.segments) - 1:
-                if self.is_looped:
-                    metro.current_segment_idx = 0
-                else:
-                    if metro.is_forward:
-                        metro.is_forward = False
-                    else:
-                        metro.current_segment_idx -= 1
-            elif metro.current_segment_idx == 0:
-                if metro.is_forward:
-                    metro.current_segment_idx += 1
-                else:
-                    if self.is_looped:
-                        metro.current_segment_idx = len(self.segments) - 1
-                    else:
-                        metro.is_forward = True
+            self._enter_next_segment(metro)
+
+    def advance_metro(
+        self,
+        metro: Metro,
+        dt_ms: float,
+        should_stop_at_next_station: Callable[[Metro], bool] = lambda metro: False,
+    ) -> None:
+        """Move `metro` exactly `dt_ms` along its closed-form speed profile.
+
+        Unlike `move_metro`, time left over on reaching a segment's end is
+        spent on the segments after it, so the result does not depend on how
+        `dt_ms` is split. Arrival, turnaround and stop semantics are those of
+        `move_metro`; `should_stop_at_next_station` is asked again for every
+        segment the metro enters, and a stop ends the move for its dwell.
+        """
+
+        assert metro.current_segment is not None
+        metro.just_arrived_and_stopped = False
+        if metro.current_station is not None and metro.stop_time_remaining_ms > 0:
+            return
+
+        remaining_ms = float(dt_ms)
+        empty_segments = 0
+        while True:
+            if metro.is_forward:
+                dst_station = metro.current_segment.end_station
+                dst_position = metro.current_segment.segment_end
+            else:
+                dst_station = metro.current_segment.start_station
+                dst_position = metro.current_segment.segment_start
+
+            dist, unit_left, unit_top = heading(metro.position, dst_position)
+            metro.shape.set_degrees(math.degrees(math.atan2(unit_top, unit_left)))
+            should_stop = should_stop_at_next_station(metro)
+            phases = segment_profile(
+                metro.speed,
+                metro.max_speed,
+                metro.acceleration_per_ms,
+                metro.deceleration_per_ms,
+                dist,
+                should_stop,
+            )
+            if phases is None:
+                if dist > 0:
+                    metro.current_station = None
+                return
+            duration_ms = profile_duration(phases)
+            if remaining_ms < duration_ms - ARRIVAL_SLACK_MS:
+                covered, metro.speed = profile_state(phases, remaining_ms)
+                metro.current_station = None
+                position = metro.position
+                metro.position = Point(
+                    position.left + covered * unit_left,
+                    position.top + covered * unit_top,
+                )
+                return
+
+            remaining_ms = max(0.0, remaining_ms - duration_ms)
+            if phases:
+                metro.speed = profile_state(phases, duration_ms)[1]
+            metro.current_station = dst_station
+            metro.position = dst_position
+            if should_stop:
+                metro.speed = 0
+                metro.just_arrived_and_stopped = True
+            self._enter_next_segment(metro)
+            if should_stop or remaining_ms <= ARRIVAL_SLACK_MS:
+                return
+            # Zero-length segments take no time; a path made only of them
+            # must not spin forever.
+            empty_segments = empty_segments + 1 if duration_ms == 0 else 0
+            if empty_segments > len(self.segments):
+                return
+
+    def _enter_next_segment(self, metro: Metro) -> None:
+        """Turn `metro` onto the segment after the end it has just reached."""
+
+        if len(self.segments) == 1:
+            metro.is_forward = not metro.is_forward
+        elif metro.current_segment_idx == len(self.segments) - 1:
+            if self.is_looped:
+                metro.current_segment_idx = 0
             else:
                 if metro.is_forward:
-                    metro.current_segment_idx += 1
+                    metro.is_forward = False
                 else:
                     metro.current_segment_idx -= 1
+        elif metro.current_segment_idx == 0:
+            if metro.is_forward:
+                metro.current_segment_idx += 1
+            else:
+                if self.is_looped:
+                    metro.current_segment_idx = len(self.segments) - 1
+                else:
+                    metro.is_forward = True
+        else:
+            if metro.is_forward:
+                metro.current_segment_idx += 1
+            else:
+                metro.current_segment_idx -= 1
 
-            metro.current_segment = self.segments[metro.current_segment_idx]
+        metro.current_segment = self.segments[metro.current_segment_idx]
@@ -12,6 +12,8 @@ from type import Color
 
 
 class PathSegment(Segment):
+    __slots__ = ("path_order",)
+
     @staticmethod
     def _canonical_pair_direction(
         start_station: Station, end_station: Station
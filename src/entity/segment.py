@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC
+from typing import TYPE_CHECKING
 
-import pygame
 from shortuuid import uuid  # type: ignore
 
 from entity.station import Station
@@ -10,8 +10,22 @@ from geometry.line import Line
 from geometry.point import Point
 from type import Color
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Segment(ABC):
+    __slots__ = (
+        "id",
+        "color",
+        "start_station",
+        "end_station",
+        "segment_start",
+        "segment_end",
+        "line",
+        "__weakref__",
+    )
+
     def __init__(self, color: Color) -> None:
         self.id = f"Segment-{uuid()}"
         self.color = color
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import pygame
+from typing import TYPE_CHECKING
+
 from shortuuid import uuid  # type: ignore
 
 from config import (
@@ -18,9 +19,17 @@ from geometry.point import Point
 from geometry.shape import Shape
 from type import Color
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Station(Holder):
+    __slots__ = ("unlock_blink_start_time_ms", "snap_blips", "_waiting_clock")
+
     def __init__(self, shape: Shape, position: Point) -> None:
+        # Waits at a live station run on the mediator's `WaitClock`, which the
+        # passenger list keeps informed of who is waiting.
+        self._waiting_clock = None
         super().__init__(
             shape=shape,
             capacity=station_capacity,
@@ -33,6 +42,11 @@ class Station(Holder):
         self.unlock_blink_start_time_ms: int | None = None
         self.snap_blips: list[tuple[int, Color]] = []
 
+    def _passengers_changed(self) -> None:
+        super()._passengers_changed()
+        if self._waiting_clock is not None:
+            self._waiting_clock.touch(self)
+
     def __eq__(self, other: Station) -> bool:
         return self.id == other.id
 
@@ -73,6 +87,8 @@ class Station(Holder):
     def draw_snap_blips(
         self, surface: pygame.surface.Surface, current_time_ms: int
     ) -> None:
+        import pygame
+
         for start_time_ms, color in self.get_active_snap_blips(current_time_ms):
             elapsed_ms = current_time_ms - start_time_ms
             progress = elapsed_ms / station_snap_blip_duration_ms
@@ -15,10 +15,14 @@ class MiniMetroEnv:
         dt_ms: int | None = None,
         *,
         reward_mode: str = DELIVERIES_REWARD_MODE,
+        headless: bool = False,
     ) -> None:
         self.dt_ms_default = dt_ms
         self.reward_mode = reward_mode
-        self.mediator = Mediator()
+        # Headless mediators skip the click-only controls and the layout; leave
+        # it off when the mediator is driven through mouse input or rendered.
+        self.headless = headless
+        self.mediator = Mediator(headless=headless)
         self.last_deliveries = self.mediator.deliveries
         self.last_line_credits = self.mediator.line_credits
 
@@ -59,7 +63,7 @@ class MiniMetroEnv:
             metro._station_service_action = None
             metro.stop_time_remaining_ms = 0
             metro.boarding_progress_ms = 0
-        self.mediator = Mediator(seed=seed)
+        self.mediator = Mediator(seed=seed, headless=self.headless)
         self.last_deliveries = self.mediator.deliveries
         self.last_line_credits = self.mediator.line_credits
         return self.observe()
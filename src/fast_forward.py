@@ -0,0 +1,266 @@
+"""Advance the simulation to its next event, batching the quiet ticks' bookkeeping."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+Resolver = Callable[[], Any]
+
+_NEVER = float("inf")
+
+
+def _ceil_div(numerator: int, denominator: int) -> int:
+    return -(-numerator // denominator)
+
+
+class FastForward:
+    """Tick-exact fast-forward over canonical facade state.
+
+    A tick in which no metro reaches or stands at a station, no passenger
+    spawns, no week boundary is crossed and the game cannot end changes only
+    clocks, counters, waits and metro positions -- and draws the destination
+    shuffles of passengers that still have no route, which must keep coming
+    out of the game RNG in the same order. Such "quiet" ticks are coasted:
+    metros still move through `Path.move_metro` (or `Path.advance_metro`)
+    every tick, so positions are bit-identical, but spawn counters, waits
+    and snap-blip pruning are applied in one step and the route searches,
+    whose result is already known to be the fallback, are reduced to their
+    shuffles. That batching is the whole saving: a coasted tick still moves
+    every metro once.
+
+    Spawns, week boundaries and the game-over tick are found in closed form
+    from the counters; a metro reaching a station is seen as it happens and
+    finishes its tick through the ordinary facade calls. Ticks that are not
+    provably quiet -- including the first of every call, which settles any
+    edit made since the last tick -- run through `host.increment_time`.
+    """
+
+    __slots__ = ()
+
+    def advance_until_event(
+        self,
+        host: Any,
+        max_ms: int,
+        dt_ms: int,
+        *,
+        week_length_steps: int,
+        get_graph_builder: Resolver,
+        get_wait_clock: Resolver | None = None,
+        get_spawn_schedule: Resolver | None = None,
+    ) -> int:
+        if dt_ms <= 0:
+            raise ValueError("dt_ms must be positive")
+        budget = max_ms // dt_ms
+        if budget <= 0:
+            return 0
+        before = self._event_marks(host)
+        host.increment_time(dt_ms)
+        ticks = 1
+        if ticks == budget or self._event_marks(host) != before:
+            return ticks * dt_ms
+        # A spawn resets its station's counter after the tick's increment, so
+        # a zero counter marks a spawn in the tick just run.
+        since = host.station_steps_since_last_spawn
+        if any(since.get(station) == 0 for station in host.stations):
+            return ticks * dt_ms
+        replay = self._quiet_replay(host)
+        if replay is None:
+            return ticks * dt_ms
+        horizon = self._event_horizon(host, dt_ms, week_length_steps)
+        coast = int(min(budget - ticks, horizon - 1))
+        clock = None if get_wait_clock is None else get_wait_clock()
+        schedule = None if get_spawn_schedule is None else get_spawn_schedule()
+        coasted, arrived = self._coast(
+            host, coast, dt_ms, replay, get_graph_builder, clock, schedule
+        )
+        ticks += coasted
+        if not arrived and ticks < budget:
+            host.increment_time(dt_ms)
+            ticks += 1
+        return ticks * dt_ms
+
+    def _event_marks(self, host: Any) -> tuple[Any, ...]:
+        return (
+            host.is_paused,
+            host.is_game_over,
+            host.deliveries,
+            len(host.passengers),
+            len(host.stations),
+        )
+
+    def _quiet_replay(self, host: Any) -> list[Any] | None:
+        """Destination shapes the next quiet tick shuffles, or None if not quiet."""
+
+        if host.is_paused or host.is_game_over or host.game_speed_multiplier <= 0:
+            return None
+        fleet = host.metros
+        for metro in fleet:
+            if metro.current_station is not None or metro.is_unassignment_queued:
+                return None
+        for path in host.paths:
+            for metro in path.metros:
+                if not any(metro is known for known in fleet):
+                    return None
+        intervals = host.station_spawn_interval_steps
+        since = host.station_steps_since_last_spawn
+        replay = []
+        for station in host.stations:
+            if station not in intervals or station not in since:
+                return None
+            for passenger in station.passengers:
+                if host.passenger_has_travel_plan(passenger):
+                    continue
+                # Only a fallback plan is known to stay one until the next
+                # event; any other plan-less rider is planned for real.
+                plan = host.travel_plans.get(passenger)
+                if plan is None or plan.node_path:
+                    return None
+                replay.append(passenger.destination_shape.type)
+        return replay
+
+    def _event_horizon(self, host: Any, dt_ms: int, week_length_steps: int) -> float:
+        """Ticks from now to the first one that spawns, holds a week or ends."""
+
+        speed = host.game_speed_multiplier
+        horizon = _NEVER
+        since = host.station_steps_since_last_spawn
+        intervals = host.station_spawn_interval_steps
+        for station in host.stations:
+            due = intervals[station] - since[station]
+            horizon = min(horizon, max(1, _ceil_div(due, speed)))
+        first_spawn = host.passenger_spawning_step - host.steps
+        if first_spawn > 0 and first_spawn % speed == 0:
+            horizon = min(horizon, first_spawn // speed)
+        if host.week_calendar:
+            boundary = (host.steps // week_length_steps + 1) * week_length_steps
+            horizon = min(horizon, _ceil_div(boundary - host.steps, speed))
+        threshold = host.overdue_passenger_threshold
+        scaled_dt_ms = dt_ms * speed
+        max_wait_ms = host.passenger_max_wait_time_ms
+        overdue = sorted(
+            max(1, _ceil_div(max_wait_ms - passenger.wait_ms, scaled_dt_ms))
+            for station in host.stations
+            for passenger in station.passengers
+        )
+        if threshold <= 0:
+            horizon = 1
+        elif len(overdue) >= threshold:
+            horizon = min(horizon, overdue[threshold - 1])
+        return horizon
+
+    def _coast(
+        self,
+        host: Any,
+        ticks: int,
+        dt_ms: int,
+        replay: list[Any],
+        get_graph_builder: Resolver,
+        clock: Any | None,
+        schedule: Any | None,
+    ) -> tuple[int, bool]:
+        speed = host.game_speed_multiplier
+        scaled_dt_ms = dt_ms * speed
+        station_nodes_dict = get_graph_builder()(host.stations, host.paths)
+        stops: dict[Any, tuple[Any, bool, bool]] = {}
+        counted = waited = 0
+        for tick in range(ticks):
+            host.time_ms += scaled_dt_ms
+            host.steps += speed
+            counted += 1
+            arrived = False
+            for path in host.paths:
+                for metro in path.metros:
+                    if arrived:
+                        should_stop = partial(
+                            host.should_stop_at_next_station,
+                            station_nodes_dict=station_nodes_dict,
+                        )
+                    else:
+                        should_stop = partial(
+                            self._should_stop,
+                            host,
+                            station_nodes_dict=station_nodes_dict,
+                            stops=stops,
+                        )
+                    if host.exact_metro_kinematics:
+                        path.advance_metro(
+                            metro,
+                            scaled_dt_ms,
+                            should_stop_at_next_station=should_stop,
+                        )
+                    else:
+                        path.move_metro(
+                            metro,
+                            scaled_dt_ms,
+                            should_stop_at_next_station=should_stop(metro),
+                        )
+                    if metro.current_station is None:
+                        continue
+                    # Everything after this is the ordinary tick: a stop may
+                    # change what later metros decide, so they decide live.
+                    arrived = True
+                    if metro.just_arrived_and_stopped:
+                        host.start_station_stop_if_needed(
+                            metro, metro.current_station, station_nodes_dict
+                        )
+            if arrived:
+                self._settle(host, counted, waited, scaled_dt_ms, clock, schedule)
+                if host.is_passenger_spawn_time():
+                    host.spawn_passengers()
+                host.find_travel_plan_for_passengers()
+                host.move_passengers(scaled_dt_ms)
+                host.update_waiting_and_game_over(scaled_dt_ms)
+                return tick + 1, True
+            for shape_type in replay:
+                host.get_stations_for_shape_type(shape_type)
+            waited += 1
+        self._settle(host, counted, waited, scaled_dt_ms, clock, schedule)
+        return ticks, False
+
+    def _should_stop(
+        self,
+        host: Any,
+        metro: Any,
+        station_nodes_dict: dict[Any, Any],
+        stops: dict[Any, tuple[Any, bool, bool]],
+    ) -> bool:
+        # The answer is fixed for as long as the metro heads for the same stop:
+        # nothing it reads changes between events.
+        known = stops.get(metro)
+        segment, forward = metro.current_segment, metro.is_forward
+        if known is not None and known[0] is segment and known[1] == forward:
+            return known[2]
+        should_stop = host.should_stop_at_next_station(metro, station_nodes_dict)
+        stops[metro] = (segment, forward, should_stop)
+        return should_stop
+
+    def _settle(
+        self,
+        host: Any,
+        counted: int,
+        waited: int,
+        scaled_dt_ms: int,
+        clock: Any | None,
+        schedule: Any | None,
+    ) -> None:
+        since = host.station_steps_since_last_spawn
+        steps = counted * host.game_speed_multiplier
+        for station in host.stations:
+            if schedule is None:
+                since[station] += steps
+            station.prune_visual_effects(host.time_ms)
+        if schedule is not None:
+            schedule.advance(steps)
+        # No wait crosses the limit in a quiet tick, so the count is moot.
+        if clock is not None and (
+            clock.advance(
+                host.stations, waited * scaled_dt_ms, host.passenger_max_wait_time_ms
+            )
+            is not None
+        ):
+            return
+        for station in host.stations:
+            for passenger in station.passengers:
+                passenger.wait_ms += waited * scaled_dt_ms
@@ -1,4 +1,7 @@
-import pygame
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from shortuuid import uuid  # type: ignore
 
 from geometry.point import Point
@@ -6,6 +9,9 @@ from geometry.shape import Shape
 from geometry.type import ShapeType
 from type import Color
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Circle(Shape):
     def __init__(self, color: Color, radius: int) -> None:
@@ -19,6 +25,8 @@ class Circle(Shape):
         position: Point | tuple[float, float],
         rotation_degrees: float | None = None,
     ):
+        import pygame
+
         del rotation_degrees
         center = (
             position if isinstance(position, tuple) else (position.left, position.top)
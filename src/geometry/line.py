@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import pygame
+from typing import TYPE_CHECKING
+
 from shortuuid import uuid  # type: ignore
 
 from geometry.point import Point
 from type import Color
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Line:
     def __init__(self, color: Color, start: Point, end: Point, width: int) -> None:
@@ -19,6 +23,8 @@ class Line:
         return self.id == other.id
 
     def draw(self, surface: pygame.surface.Surface):
+        import pygame
+
         return pygame.draw.line(
             surface, self.color, self.start.to_tuple(), self.end.to_tuple(), self.width
         )
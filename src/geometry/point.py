@@ -5,6 +5,8 @@ from copy import deepcopy
 
 
 class Point:
+    __slots__ = ("left", "top")
+
     def __init__(self, left: int | float, top: int | float) -> None:
         self.left = left
         self.top = top
@@ -40,6 +42,19 @@ class Point:
     def __rmul__(self, other: int | float) -> Point:
         return self.__mul__(other)
 
+    # In-place counterparts of `+` and `*` for hot loops. Points are shared
+    # freely (a parked metro holds its station's position), which is why `+=`
+    # still rebinds; only move a point in place that the caller built itself.
+    def translate(self, left: int | float, top: int | float) -> Point:
+        self.left += left
+        self.top += top
+        return self
+
+    def scale(self, factor: int | float) -> Point:
+        self.left = factor * self.left
+        self.top = factor * self.top
+        return self
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Point):
             return NotImplemented
@@ -62,8 +77,8 @@ class Point:
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            setattr(result, k, deepcopy(v, memo))
+        result.left = deepcopy(self.left, memo)
+        result.top = deepcopy(self.top, memo)
         return result
 
     def to_tuple(self):
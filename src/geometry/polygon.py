@@ -1,9 +1,8 @@
+from __future__ import annotations
+
 import math
-from typing import List
+from typing import TYPE_CHECKING, List
 
-import pygame
-from shapely.geometry import Point as ShapelyPoint
-from shapely.geometry.polygon import Polygon as ShapelyPolygon
 from shortuuid import uuid  # type: ignore
 
 from geometry.point import Point
@@ -11,6 +10,9 @@ from geometry.shape import Shape
 from geometry.type import ShapeType
 from type import Color
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Polygon(Shape):
     def __init__(
@@ -27,6 +29,8 @@ class Polygon(Shape):
         position: Point | tuple[float, float],
         rotation_degrees: float | None = None,
     ) -> None:
+        import pygame
+
         center_x, center_y = (
             position if isinstance(position, tuple) else position.to_tuple()
         )
@@ -42,6 +46,9 @@ class Polygon(Shape):
         pygame.draw.polygon(surface, self.color, tuples)
 
     def contains(self, point: Point) -> bool:
+        from shapely.geometry import Point as ShapelyPoint
+        from shapely.geometry.polygon import Polygon as ShapelyPolygon
+
         shapely_point = ShapelyPoint(point.left, point.top)
         tuples = [(x + self.position).to_tuple() for x in self.points]
         polygon = ShapelyPolygon(tuples)
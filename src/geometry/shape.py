@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-import pygame
 from shortuuid import uuid  # type: ignore
 
 from geometry.point import Point
 from geometry.type import ShapeType
 from type import Color
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Shape(ABC):
     def __init__(self, type: ShapeType, color: Color):
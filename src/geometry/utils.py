@@ -1,15 +1,37 @@
-import numpy as np
+"""Scalar vector math on `Point`s, in plain Python floats.
+
+Metro motion calls these for every metro on every tick, so they avoid NumPy
+scalar dispatch and intermediate `Point`s. The arithmetic is kept exactly as
+it was (`sqrt` of the summed squares, components divided by the distance),
+so seeded games and recorded replays do not move by a bit.
+"""
+
+from __future__ import annotations
+
+import math
 
 from geometry.point import Point
 
 
 def distance(p1: Point, p2: Point) -> float:
-    return np.sqrt((p1.left - p2.left) ** 2 + (p1.top - p2.top) ** 2)
+    return math.sqrt((p1.left - p2.left) ** 2 + (p1.top - p2.top) ** 2)
+
+
+def heading(p1: Point, p2: Point) -> tuple[float, float, float]:
+    """The distance from `p1` to `p2` and the unit vector along it.
+
+    `(distance, left, top)`; the unit vector is `(0, 0)` when the points
+    coincide, as for `direction`.
+    """
+
+    left = p2.left - p1.left
+    top = p2.top - p1.top
+    magnitude = math.sqrt(left**2 + top**2)
+    if magnitude == 0:
+        return magnitude, 0, 0
+    return magnitude, left / magnitude, top / magnitude
 
 
 def direction(p1: Point, p2: Point) -> Point:
-    diff = p2 - p1
-    diff_magnitude = distance(p1, p2)
-    if diff_magnitude == 0:
-        return Point(0, 0)
-    return Point(diff.left / diff_magnitude, diff.top / diff_magnitude)
+    _, left, top = heading(p1, p2)
+    return Point(left, top)
@@ -7,37 +7,32 @@ from graph.node import Node
 
 
 def build_station_nodes_dict(stations: List[Station], paths: List[Path]):
-    station_nodes: List[Node] = []
-    connections: List[List[Node]] = []
+    """Build the routing graph in one walk over every path's station sequence.
+
+    Each node's neighbors are inserted in (path order, position on the path,
+    previous before next) order -- the same order the old per-station scan
+    over every connection produced -- so BFS tie-breaking is unchanged.
+    """
     station_nodes_dict: Dict[Station, Node] = {}
 
     for station in stations:
-        node = Node(station)
-        station_nodes.append(node)
-        station_nodes_dict[station] = node
+        station_nodes_dict[station] = Node(station)
     for path in paths:
         if path.is_being_created:
             continue
         connection = []
         for station in path.stations:
-            station_nodes_dict[station].paths.add(path)
-            connection.append(station_nodes_dict[station])
+            node = station_nodes_dict[station]
+            node.paths.add(path)
+            connection.append(node)
         if path.is_looped and len(connection) > 1:
             connection.append(connection[0])
-        connections.append(connection)
-
-    while len(station_nodes) > 0:
-        root = station_nodes[0]
-        for connection in connections:
-            for idx in range(len(connection)):
-                node = connection[idx]
-                if node == root:
-                    if idx - 1 >= 0:
-                        root.neighbors.add(connection[idx - 1])
-                    if idx + 1 <= len(connection) - 1:
-                        root.neighbors.add(connection[idx + 1])
-        station_nodes.remove(root)
-        station_nodes_dict[root.station] = root
+        last = len(connection) - 1
+        for idx, node in enumerate(connection):
+            if idx - 1 >= 0:
+                node.neighbors.add(connection[idx - 1])
+            if idx + 1 <= last:
+                node.neighbors.add(connection[idx + 1])
 
     return station_nodes_dict
 
@@ -58,3 +53,154 @@ def bfs(start: Node, end: Node) -> List[Node]:
                 queue.append((neighbor, path + [neighbor]))
 
     return []
+
+
+def route_tree(start: Node) -> Dict[Node, tuple[Node | None, Node]]:
+    """The BFS tree rooted at `start`, with the stop each node is ridden from.
+
+    Each entry is (parent, boarded_at). Parents follow `bfs` exactly --
+    neighbors in the same order, marked visited on enqueue -- so the tree path
+    to any node is what `bfs(start, node)` returns. `boarded_at` carries the
+    transfer state of that path: the last stop kept by `transfer_stops`
+    before the node, advanced in the same walk instead of a second pass over
+    every finished path.
+    """
+    tree: Dict[Node, tuple[Node | None, Node]] = {start: (None, start)}
+    queue = deque([start])
+
+    while queue:
+        node = queue.popleft()
+        boarded_at = tree[node][1]
+        for neighbor in node.neighbors:
+            if neighbor not in tree:
+                if boarded_at.paths.isdisjoint(neighbor.paths):
+                    tree[neighbor] = (node, node)
+                else:
+                    tree[neighbor] = (node, boarded_at)
+                queue.append(neighbor)
+
+    return tree
+
+
+def tree_path(tree: Dict[Node, tuple[Node | None, Node]], end: Node) -> List[Node]:
+    if end not in tree:
+        return []
+    path = []
+    node: Node | None = end
+    while node is not None:
+        path.append(node)
+        node = tree[node][0]
+    path.reverse()
+    return path
+
+
+def tree_stops(tree: Dict[Node, tuple[Node | None, Node]], end: Node) -> List[Node]:
+    """`transfer_stops(tree_path(tree, end))`, read off the boarding links."""
+    if end not in tree:
+        return []
+    stops = [end]
+    node = end
+    while True:
+        parent, boarded_at = tree[node]
+        if parent is None:
+            break
+        stops.append(boarded_at)
+        node = boarded_at
+    stops.reverse()
+    return stops
+
+
+def transfer_stops(node_path: List[Node]) -> List[Node]:
+    """The stops of `node_path` a rider has to get off or transfer at.
+
+    A stop is kept when the node after it shares no path with the stop the
+    rider last boarded at; the origin and destination are always kept. This
+    is the plan `RoutePlanner.skip_stations_on_same_path` compresses to, built
+    forward into a new list instead of removing from the old one.
+    """
+    if len(node_path) <= 2:
+        return list(node_path)
+    stops = [node_path[0]]
+    boarded_at = 0
+    for idx in range(1, len(node_path)):
+        if idx - 1 != boarded_at and node_path[boarded_at].paths.isdisjoint(
+            node_path[idx].paths
+        ):
+            boarded_at = idx - 1
+            stops.append(node_path[boarded_at])
+    stops.append(node_path[-1])
+    return stops
+
+
+TransferState = tuple[Node, Node]
+TransferTree = tuple[
+    Dict[TransferState, tuple[TransferState | None, int]], Dict[Node, TransferState]
+]
+
+
+def least_transfer_tree(start: Node) -> TransferTree:
+    """The fewest-transfer route among the fewest-hop ones, from `start` to each node.
+
+    A lexicographic (hops, transfers) search over (station, boarded-at stop)
+    states, with the boarding rule of `route_tree`: a rider stays aboard while
+    the next station shares a path with the stop it boarded at, and otherwise
+    transfers at the current station. Hops are the levels, so every state of a
+    level is final before the next is expanded, and only a station's first
+    level is kept, since a fewest-hop route reaches every stop on it as early
+    as possible. Ties keep the state found first, which follows neighbor order.
+
+    Returns every kept state's (parent state, transfers) and each node's best
+    state; `least_transfer_route` reads a route and its stops off them.
+    """
+    origin = (start, start)
+    states: Dict[TransferState, tuple[TransferState | None, int]] = {origin: (None, 0)}
+    best: Dict[Node, TransferState] = {start: origin}
+    frontier = [origin]
+
+    while frontier:
+        level: Dict[TransferState, tuple[TransferState, int]] = {}
+        for state in frontier:
+            node, boarded_at = state
+            transfers = states[state][1]
+            for neighbor in node.neighbors:
+                if neighbor in best and best[neighbor] not in level:
+                    continue
+                if boarded_at.paths.isdisjoint(neighbor.paths):
+                    key, cost = (neighbor, node), transfers + 1
+                else:
+                    key, cost = (neighbor, boarded_at), transfers
+                found = level.get(key)
+                if found is None or cost < found[1]:
+                    level[key] = (state, cost)
+                kept = best.get(neighbor)
+                if kept is None or cost < level[kept][1]:
+                    best[neighbor] = key
+        states.update(level)
+        frontier = list(level)
+
+    return states, best
+
+
+def least_transfer_route(
+    tree: TransferTree, end: Node
+) -> tuple[List[Node], List[Node]]:
+    """The node path to `end` and the stops a rider gets off or transfers at."""
+    states, best = tree
+    state = best.get(end)
+    if state is None:
+        return [], []
+    path = [end]
+    stops = [end]
+    while True:
+        parent = states[state][0]
+        if parent is None:
+            break
+        if parent[1] is not state[1]:
+            stops.append(state[1])
+        path.append(parent[0])
+        state = parent
+    if len(path) > 1:
+        stops.append(path[-1])
+    path.reverse()
+    stops.reverse()
+    return path, stops
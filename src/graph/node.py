@@ -9,6 +9,8 @@ from entity.station import Station
 
 
 class Node:
+    __slots__ = ("station", "neighbors", "paths", "_id")
+
     def __init__(self, station: Station) -> None:
         self.station = station
         self.neighbors: MutableSet[Node] = _OrderedNodeSet()
@@ -19,11 +21,13 @@ class Node:
     def id(self) -> str:
         """Generated on first read, because almost nothing ever reads it.
 
-        The routing graph is rebuilt from scratch about 24 times per simulation
-        step, so at ten stations this was ~240 uuid generations per step --
-        measured at 1.98 of 25.6 seconds in a profiled episode, near 8% of the
-        whole simulation. Nothing on that path needs it: equality and hashing
-        use `station`, and so does the repr.
+        The routing graph used to be rebuilt from scratch about 24 times per
+        simulation step, so at ten stations this was ~240 uuid generations per
+        step -- measured at 1.98 of 25.6 seconds in a profiled episode, near 8%
+        of the whole simulation. `StationGraph` now relinks one live graph in
+        place, but test and validation code still builds fresh graphs, and
+        nothing on that path needs it: equality and hashing use `station`, and
+        so does the repr.
         """
         if self._id is None:
             self._id = f"Node-{uuid()}"
@@ -49,6 +53,8 @@ class Node:
 
 
 class _OrderedNodeSet(MutableSet[Node]):
+    __slots__ = ("_nodes",)
+
     def __init__(self) -> None:
         self._nodes: dict[Node, None] = {}
 
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List
+
+from graph.graph_algo import (
+    TransferTree,
+    bfs,
+    least_transfer_route,
+    least_transfer_tree,
+    route_tree,
+    transfer_stops,
+    tree_path,
+    tree_stops,
+)
+from graph.node import Node
+from graph.station_graph import StationGraph
+
+RouteTree = Dict[Node, tuple[Node | None, Node]]
+Search = Callable[[Node, Node], List[Node]]
+
+
+class RouteTable:
+    """BFS trees of the live graph, computed once per origin per topology.
+
+    Planning used to run a separate `bfs(start, end)` for every (waiting
+    passenger, candidate destination) pair, every tick. A BFS tree rooted at
+    the origin gives every one of those answers at once, and it stays valid
+    until the graph's `version` moves, so a whole planning sweep costs one
+    traversal per origin station instead of one per pair.
+
+    The per-shape reverse search this was first sketched as cannot reproduce
+    today's plans: the route to each destination is whatever forward BFS from
+    the origin reaches first under neighbor order, and ties between equally
+    short destinations fall to the RNG-shuffled destination order of each
+    query. Forward trees keep both, so `node_path` is a drop-in for `bfs`.
+
+    The same trees carry each node's boarding stop, so `transfer_stops`
+    reads a route's reduced transfer plan off the tree rather than making a
+    second pass over the node list. That is exactly the plan
+    `skip_stations_on_same_path` compresses the tree path to, so the (hops,
+    stops) comparison planners rank candidates by picks the same winner.
+
+    Nodes that are not the live graph's own (a caller-built graph, or a
+    graph the live one has since replaced) are answered with a fresh,
+    uncached tree, never a cached one keyed on an equal-hashing node.
+
+    `get_search` is resolved on every query, like `StationGraph`'s builder:
+    while it returns anything but the stock `bfs` (a host's patched
+    module-level `bfs`), `node_path` calls that search instead of a tree.
+
+    With `least_transfer` set, routes between the live graph's nodes come from
+    `least_transfer_tree` instead: the same hop count, and the fewest transfers
+    among the routes of that length. Planners still rank by (hops, stops), so
+    a destination is never won by a longer route. The flag is off by default
+    because equal-hop routes can differ from the BFS ones, and seeded games
+    must replay as they were recorded.
+    """
+
+    __slots__ = (
+        "_graph",
+        "_get_search",
+        "_version",
+        "_trees",
+        "_transfer_trees",
+        "least_transfer",
+        "hits",
+        "misses",
+    )
+
+    def __init__(
+        self, graph: StationGraph, get_search: Callable[[], Search] = lambda: bfs
+    ) -> None:
+        self._graph = graph
+        self._get_search = get_search
+        self._version = -1
+        self._trees: Dict[int, tuple[Node, RouteTree]] = {}
+        self._transfer_trees: Dict[int, tuple[Node, TransferTree]] = {}
+        self.least_transfer = False
+        self.hits = 0
+        self.misses = 0
+
+    def node_path(self, start: Node, end: Node) -> List[Node]:
+        search = self._get_search()
+        if search is not bfs:
+            return search(start, end)
+        if self.least_transfer and self._graph.owns(start):
+            return least_transfer_route(self._transfer_tree(start), end)[0]
+        return tree_path(self._tree(start), end)
+
+    def transfer_stops(self, node_path: List[Node]) -> List[Node]:
+        """The stops of `node_path` a rider gets off or transfers at.
+
+        Read off the cached tree when `node_path` is that tree's own path to
+        its last node -- always the case for routes `node_path` returned --
+        and computed from the list otherwise.
+        """
+        if self.least_transfer:
+            return self._least_transfer_stops(node_path)
+        if len(node_path) > 2 and self._graph.owns(node_path[-1]):
+            cached = self._trees.get(id(node_path[0]))
+            if (
+                cached is not None
+                and cached[0] is node_path[0]
+                and self._version == self._graph.version
+            ):
+                tree = cached[1]
+                for idx in range(len(node_path) - 1, 0, -1):
+                    entry = tree.get(node_path[idx])
+                    if entry is None or entry[0] is not node_path[idx - 1]:
+                        break
+                else:
+                    return tree_stops(tree, node_path[-1])
+        return transfer_stops(node_path)
+
+    def _least_transfer_stops(self, node_path: List[Node]) -> List[Node]:
+        if len(node_path) > 2 and self._graph.owns(node_path[0]):
+            route, stops = least_transfer_route(
+                self._transfer_tree(node_path[0]), node_path[-1]
+            )
+            if len(route) == len(node_path) and all(
+                ours is theirs for ours, theirs in zip(route, node_path)
+            ):
+                return stops
+        return transfer_stops(node_path)
+
+    def _sync(self) -> None:
+        if self._version != self._graph.version:
+            self._trees.clear()
+            self._transfer_trees.clear()
+            self._version = self._graph.version
+
+    def _transfer_tree(self, start: Node) -> TransferTree:
+        self._sync()
+        cached = self._transfer_trees.get(id(start))
+        if cached is not None and cached[0] is start:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        tree = least_transfer_tree(start)
+        self._transfer_trees[id(start)] = (start, tree)
+        return tree
+
+    def _tree(self, start: Node) -> RouteTree:
+        if not self._graph.owns(start):
+            return route_tree(start)
+        self._sync()
+        cached = self._trees.get(id(start))
+        if cached is not None and cached[0] is start:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        tree = route_tree(start)
+        self._trees[id(start)] = (start, tree)
+        return tree
+
+
+class LeastTransferField:
+    """The facade's switch for `RouteTable.least_transfer` on `_route_table`.
+
+    A change drops the live graph, so route outcomes and service decisions
+    cached against its `version` are planned again under the new search.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, host: Any, owner: type | None = None) -> Any:
+        if host is None:
+            return self
+        return host._route_table.least_transfer
+
+    def __set__(self, host: Any, value: bool) -> None:
+        table = host._route_table
+        if table.least_transfer != bool(value):
+            table.least_transfer = bool(value)
+            host._station_graph.invalidate()
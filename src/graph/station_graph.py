@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Dict, List
+
+from entity.path import Path
+from entity.station import Station
+from graph.node import Node, _OrderedNodeSet
+
+GraphBuilder = Callable[[List[Station], List[Path]], Dict[Station, Node]]
+PathKey = tuple[Path, bool, bool, tuple[Station, ...]]
+
+
+def _path_key(path: Path) -> PathKey:
+    return (
+        path,
+        bool(getattr(path, "is_looped", False)),
+        bool(getattr(path, "is_being_created", False)),
+        tuple(getattr(path, "stations", ())),
+    )
+
+
+class StationGraph:
+    """The one live routing graph a Mediator shares across every query.
+
+    `view` answers with the same node dict for as long as the topology is
+    unchanged. Each call compares a compact key of the station list and every
+    path's (identity, loop flag, draft flag, station sequence) against the
+    key the graph was last synced to; that is a handful of identity
+    comparisons, against the Node and set allocations of a full rebuild.
+
+    A path create, replace or remove, a station unlock, and every rollback of
+    those edits shows up as a changed key. When the station list only grew
+    and the path list kept its order, the affected stations get fresh nodes
+    linked into the same dict; anything else (a reordered or rebound list, a
+    dropped station) rebuilds through `get_builder`, which is resolved at
+    rebuild time so a patched module-level builder is honoured.
+
+    `version` increases on every change the graph observes, so anything keyed
+    on topology can compare one int.
+    """
+
+    __slots__ = ("_get_builder", "_nodes", "_station_keys", "_path_keys", "version")
+
+    def __init__(self, get_builder: Callable[[], GraphBuilder]) -> None:
+        self._get_builder = get_builder
+        self._nodes: Dict[Station, Node] | None = None
+        self._station_keys: tuple[Station, ...] = ()
+        self._path_keys: list[PathKey] = []
+        self.version = 0
+
+    def view(self, stations: List[Station], paths: List[Path]) -> Dict[Station, Node]:
+        station_keys = tuple(stations)
+        path_keys = [_path_key(path) for path in paths]
+        nodes = self._nodes
+        if nodes is not None:
+            if station_keys == self._station_keys and path_keys == self._path_keys:
+                return nodes
+            if self._relink(nodes, station_keys, path_keys):
+                self._sync(nodes, station_keys, path_keys)
+                return nodes
+        nodes = self._get_builder()(stations, paths)
+        self._sync(nodes, station_keys, path_keys)
+        return nodes
+
+    def owns(self, node: Node) -> bool:
+        """Whether `node` is this graph's live node for its station."""
+
+        nodes = self._nodes
+        station = getattr(node, "station", None)
+        return type(nodes) is dict and nodes.get(station) is node
+
+    def serves(self, nodes: object) -> bool:
+        """Whether `nodes` is the live node dict, as of `version`."""
+
+        return type(nodes) is dict and nodes is self._nodes
+
+    def invalidate(self) -> None:
+        """Drop the live graph so the next `view` rebuilds it from scratch."""
+
+        self._nodes = None
+        self.version += 1
+
+    def _sync(
+        self,
+        nodes: Dict[Station, Node],
+        station_keys: tuple[Station, ...],
+        path_keys: list[PathKey],
+    ) -> None:
+        self._nodes = nodes
+        self._station_keys = station_keys
+        self._path_keys = path_keys
+        self.version += 1
+
+    def _relink(
+        self,
+        nodes: Dict[Station, Node],
+        station_keys: tuple[Station, ...],
+        path_keys: list[PathKey],
+    ) -> bool:
+        previous_stations = self._station_keys
+        if (
+            type(nodes) is not dict
+            or len(station_keys) < len(previous_stations)
+            or station_keys[: len(previous_stations)] != previous_stations
+        ):
+            return False
+        previous_paths = {key[0]: key for key in self._path_keys}
+        current_paths = {key[0]: key for key in path_keys}
+        if len(previous_paths) != len(self._path_keys) or len(current_paths) != len(
+            path_keys
+        ):
+            return False
+        # Surviving paths must keep their relative order, because neighbor
+        # insertion order follows path order and decides BFS tie-breaks.
+        survivors = [key[0] for key in self._path_keys if key[0] in current_paths]
+        if survivors != [key[0] for key in path_keys if key[0] in previous_paths]:
+            return False
+
+        touched: dict[Station, None] = {}
+        for path, key in previous_paths.items():
+            if current_paths.get(path) != key and not key[2]:
+                touched.update(dict.fromkeys(key[3]))
+        for path, key in current_paths.items():
+            if previous_paths.get(path) != key and not key[2]:
+                touched.update(dict.fromkeys(key[3]))
+        added = station_keys[len(previous_stations) :]
+        known = set(previous_stations).union(added)
+        if not known.issuperset(touched):
+            return False
+        # Touched stations get fresh nodes rather than being reset in place:
+        # travel plans hold the nodes they were computed on, and saves read
+        # their paths, so a later edit must not reach back into those plans.
+        for station in {*added, *touched}:
+            nodes[station] = Node(station)
+
+        for path, is_looped, is_being_created, path_stations in path_keys:
+            if is_being_created:
+                continue
+            connection = [nodes[station] for station in path_stations]
+            if is_looped and len(connection) > 1:
+                connection.append(connection[0])
+            last = len(connection) - 1
+            for idx, node in enumerate(connection):
+                if node.station not in touched:
+                    continue
+                node.paths.add(path)
+                if idx - 1 >= 0:
+                    node.neighbors.add(connection[idx - 1])
+                if idx + 1 <= last:
+                    node.neighbors.add(connection[idx + 1])
+        # An untouched neighbor still links the replaced node object; swap the
+        # live one in, keeping its neighbor order. Its stations and paths are
+        # unchanged, so plans holding it see the same route.
+        for station in touched:
+            for neighbor in nodes[station].neighbors:
+                if neighbor.station in touched:
+                    continue
+                relinked = _OrderedNodeSet()
+                for other in neighbor.neighbors:
+                    relinked.add(nodes.get(other.station, other))
+                neighbor.neighbors = relinked
+        return True
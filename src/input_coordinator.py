@@ -5,12 +5,14 @@ from typing import Any
 
 from fleet_input import FleetInput
 from input_coordinator_host import InputCoordinatorHost
+from path_action_input import PathActionInput
 from path_handle_input import PathHandleInput
 from path_handles import build_path_handles_for_state
 
 Resolver = Callable[[], Any]
 _PATH_HANDLE_INPUT = PathHandleInput()
 _FLEET_INPUT = FleetInput()
+_PATH_ACTION_INPUT = PathActionInput()
 
 
 class InputCoordinator:
@@ -249,6 +251,11 @@ class InputCoordinator:
 
         elif event.event_type == event_type.MOUSE_UP:
             host.is_mouse_down = False
+            # Every edit commits on a release over a gesture or a control; a
+            # press or motion only moves a draft, which capture refuses anyway.
+            gesture = creating or creation_path is not None or redraw is not None
+            if gesture or entity:
+                host.state_version += 1
             station_type = get_station_type()
             station = entity if entity and isinstance(entity, station_type) else None
             if redraw is not None and _PATH_HANDLE_INPUT.finish(host, redraw, station):
@@ -399,7 +406,9 @@ class InputCoordinator:
         host.is_paused = paused
 
     def set_game_speed(self, host: InputCoordinatorHost, speed_multiplier: int) -> None:
-        host.game_speed_multiplier = speed_multiplier
+        if host.game_speed_multiplier != speed_multiplier:
+            host.game_speed_multiplier = speed_multiplier
+            host.state_version += 1
 
     def apply_speed_action(self, host: InputCoordinatorHost, action: Any) -> None:
         if action == "pause":
@@ -427,66 +436,19 @@ class InputCoordinator:
         return False
 
     def apply_action(self, host: InputCoordinatorHost, action: object) -> bool:
-        if host.is_game_over:
-            return False
-        if not isinstance(action, dict):
+        if host.is_game_over or not isinstance(action, dict):
             return False
         action_type = action.get("type")
         if not isinstance(action_type, str):
             return False
-        fleet_result = _FLEET_INPUT.apply_action(host, action, action_type)
-        if fleet_result is not None:
-            return fleet_result
-        if action_type == "create_path":
-            stations = action.get("stations", [])
-            loop = action.get("loop", False)
-            if type(loop) is not bool:
-                return False
-            return host.create_path_from_station_indices(stations, loop) is not None
-        if action_type == "buy_line":
-            button_idx = action.get("path_index")
-            if button_idx is not None and type(button_idx) is not int:
-                return False
-            return host.try_purchase_path_button_by_index(button_idx)
-        if action_type == "remove_path":
-            if "path_id" in action:
-                return host.remove_path_by_id(action["path_id"])
-            if "path_index" in action:
-                return host.remove_path_by_index(action["path_index"])
-            return False
-        if action_type == "replace_path":
-            has_path_id = "path_id" in action
-            has_path_index = "path_index" in action
-            if has_path_id == has_path_index:
-                return False
-
-            stations = action.get("stations")
-            if (
-                type(stations) is not list
-                or len(stations) < 2
-                or any(
-                    type(station_index) is not int
-                    or station_index < 0
-                    or station_index >= len(host.stations)
-                    for station_index in stations
-                )
-            ):
-                return False
-
-            loop = action.get("loop", False)
-            if type(loop) is not bool:
-                return False
-
-            if has_path_id:
-                path_id = action["path_id"]
-                if type(path_id) is not str or not path_id:
-                    return False
-                return host.replace_path_by_id(path_id, stations, loop)
-
-            path_index = action["path_index"]
-            if type(path_index) is not int:
-                return False
-            return host.replace_path_by_index(path_index, stations, loop)
+        result = _FLEET_INPUT.apply_action(host, action, action_type)
+        if result is None:
+            result = _PATH_ACTION_INPUT.apply_action(host, action, action_type)
+        if result is not None:
+            # Only an applied edit moves the version; pause and resume move it
+            # themselves when the pause actually changes, and noop never does.
+            host.state_version += result
+            return result
         if action_type == "pause":
             host.set_paused(True)
             return True
@@ -28,6 +28,7 @@ class InputCoordinatorHost(Protocol):
     path_edit_selection: Any | None
     is_paused: bool
     game_speed_multiplier: int
+    state_version: int
 
     def get_unlocked_num_paths(self) -> int: ...
 
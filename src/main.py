@@ -6,6 +6,7 @@ import pygame
 
 from app_controller import AppController, AppScreen
 from audio import NullAudio, create_audio, diff_and_play, snapshot_of
+from autosave import AutosaveService
 from config import (
     framerate,
     game_over_button_border_color,
@@ -255,8 +256,11 @@ def run_game(
         session.prepare_layout(game_surface)
         return mediator, renderer, session
 
-    autosave = SimpleNamespace(
-        save=write_autosave,
+    # In-run autosaves (the pause menu, exit to title) capture on this thread and
+    # write on the service's worker so the frame never waits on the disk; deletes
+    # and peeks go through the same queue so they see writes still in flight.
+    autosave = AutosaveService(
+        AUTOSAVE_PATH,
         delete=delete_autosave,
         peek=peek_autosave,
         load=load_autosave,
@@ -327,7 +331,9 @@ def run_game(
             if pygame_event.type == pygame.QUIT:
                 # State-gated window-close autosave (D-027/F1): persist a mid-run
                 # boundary, drop a finished run's save, and touch nothing on the
-                # title screen (nor for a non-game controller).
+                # title screen (nor for a non-game controller). The worker drains
+                # first so no queued in-run write can land after this one.
+                autosave.close()
                 if controller.state is AppScreen.OFFER:
                     # Closing mid-offer (GM-10i, D-047): PERSIST the pending boundary (the
                     # "week" pause + the shown offers via save-schema v4) WITHOUT resolving,
@@ -400,7 +406,7 @@ def run_game(
         game_surface.fill(screen_color)
         if state == AppScreen.TITLE:
             draw_title_screen(game_surface, current_map_id=controller.current_map_id)
-            if peek_autosave():
+            if autosave.peek():
                 _draw_title_continue_button(game_surface)
             if controller.notice:
                 draw_notice(game_surface, controller.notice)
@@ -461,6 +467,9 @@ def run_game(
             if frames >= max_frames:
                 break
 
+    # A bounded run returns only once its last in-run autosave is on disk.
+    autosave.close()
+
 
 if __name__ == "__main__":
     max_frames_env = os.getenv("PYTHON_MINI_METRO_MAX_FRAMES")
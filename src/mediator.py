@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import random
-from typing import Dict, List
-
-import pygame
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Dict, List
 
 from carriage_management import CarriageManagement
 from config import (
@@ -30,9 +29,9 @@ from config import (
     screen_width,
     station_unlock_milestones,
 )
-from crossings import path_crossings
+from crossings import committed_crossings
 from entity.carriage import Carriage
-from entity.get_entity import get_random_stations
+from entity.get_entity import get_initial_station_pool
 from entity.metro import Metro
 from entity.passenger import Passenger
 from entity.path import Path
@@ -41,22 +40,30 @@ from event.event import Event
 from event.keyboard import KeyboardEvent
 from event.mouse import MouseEvent
 from event.type import KeyboardEventType, MouseEventType
+from fast_forward import FastForward
 from fleet_management import FleetManagement
 from geometry.point import Point
 from geometry.type import ShapeType
 from graph.graph_algo import bfs, build_station_nodes_dict
 from graph.node import Node
+from graph.route_table import LeastTransferField, RouteTable
+from graph.station_graph import StationGraph
 from input_coordinator import InputCoordinator
 from maps import CLASSIC, MapDefinition
+from mediator_fork import fork_mediator
 from offers import Offer
+from passenger_capacity import PEEKED_HOOKS, ServiceDecisions, hooks_are_default
 from passenger_flow import PassengerFlow
+from passenger_spawning import PassengerSpawning
 from path_handles import PathEditSelection
 from path_lifecycle import PathLifecycle
 from path_redraw import PathRedrawGesture
-from progression import NetworkProgression
+from progression import NetworkProgression, ProgressionField
+from route_indexes import PathIndex, RouteMemo, RouteOutcomes, StationShapeIndex
 from route_planner import RoutePlanner
 from simulation_context import SimulationContext
-from travel_plan import TravelPlan
+from spawn_schedule import SpawnCounterField, SpawnSchedule, SpawnTimerField
+from travel_plan import TravelPlan, TravelPlanMap, TravelPlanMapField
 from type import Color
 from ui.button import Button
 from ui.carriage_button import (
@@ -72,9 +79,22 @@ from ui.speed_button import (
     get_speed_buttons,
     update_speed_button_positions,
 )
-from utils import get_shape_from_type, hue_to_rgb, pick_distinct_hue
+from utils import (
+    Alias,
+    LazyModule,
+    distinct_path_colors,
+    get_shape_from_type,
+    hue_to_rgb,
+    shared_shapes,
+)
+from wait_clock import WaitClock
 from weekly_offers import WEEK_REASON, WeeklyOffers
 
+if TYPE_CHECKING:
+    import pygame
+else:
+    pygame = LazyModule("pygame")
+
 TravelPlans = Dict[Passenger, TravelPlan]
 
 # "week" (GM-10a / D-041) is the calendar's boundary pause -- held only by the
@@ -90,16 +110,43 @@ def _get_game_renderer_factory():
 
 
 class Mediator:
+    # Progression state lives on `_progression`; these read and write through.
+    num_paths = ProgressionField[int]()
+    path_unlock_milestones = ProgressionField[List[int]]()
+    path_purchase_prices = ProgressionField[List[int]]()
+    num_stations = ProgressionField[int]()
+    initial_num_stations = ProgressionField[int]()
+    station_unlock_milestones = ProgressionField[List[int]]()
+    deliveries = ProgressionField[int]()
+    line_credits = ProgressionField[int]()
+    purchased_num_paths = ProgressionField[int]()
+    unlocked_num_paths = ProgressionField[int]()
+    unlocked_num_stations = ProgressionField[int]()
+    # Spawn counters live on `_spawn_schedule`; intervals report their writes.
+    station_steps_since_last_spawn = SpawnCounterField()
+    station_spawn_interval_steps = SpawnTimerField()
+    travel_plans = TravelPlanMapField()
+    # Off by default so seeded games replay; see RouteTable.least_transfer.
+    least_transfer_routes = LeastTransferField()
+    # Deprecated writable aliases: deliveries, credits and the overdue threshold.
+    total_travels_handled = Alias("deliveries")
+    score = Alias("line_credits")
+    max_waiting_passengers = Alias("overdue_passenger_threshold")
+
     def __init__(
         self,
         *,
         seed: int | None = None,
         context: SimulationContext | None = None,
         map_definition: MapDefinition | None = None,
+        headless: bool = False,
+        station_pool: List[Station] | None = None,
     ) -> None:
         if seed is not None and context is not None:
             raise ValueError("seed and context are mutually exclusive")
         self.context = context if context is not None else SimulationContext(seed)
+        # Advances when play, input or an action changes state (autosave skips).
+        self.state_version = 0
         # The map definition supplies the station-shape palette one-way; the
         # default Classic map reproduces current behavior byte-for-byte.
         self.map_definition = map_definition if map_definition is not None else CLASSIC
@@ -107,8 +154,15 @@ class Mediator:
         self._fleet = FleetManagement()
         self._carriage_fleet = CarriageManagement()
         self._passenger_flow = PassengerFlow()
+        self._spawning = PassengerSpawning()
+        self._fast_forward = FastForward()
         self._path_lifecycle = PathLifecycle()
         self._router = RoutePlanner()
+        self._station_graph = StationGraph(lambda: build_station_nodes_dict)
+        self._route_table = RouteTable(self._station_graph, lambda: bfs)
+        self._route_memo = RouteMemo()
+        self._path_index = PathIndex()
+        self._shape_index = StationShapeIndex()
 
         # configs
         self.passenger_spawning_step = passenger_spawning_start_step
@@ -124,11 +178,15 @@ class Mediator:
         self.num_metros = num_metros
         self.num_carriages = num_carriages
 
-        # UI
+        # UI. Path buttons carry line unlock and purchase state, so a headless
+        # facade keeps them; it builds no other control and lays nothing out.
+        self.headless = headless
         self.path_buttons = get_path_buttons(self.num_paths)
-        self.fleet_buttons = get_fleet_buttons(self.path_buttons)
-        self.carriage_buttons = get_carriage_buttons(self.path_buttons)
-        self.speed_buttons = get_speed_buttons()
+        self.fleet_buttons = [] if headless else get_fleet_buttons(self.path_buttons)
+        self.carriage_buttons = (
+            [] if headless else get_carriage_buttons(self.path_buttons)
+        )
+        self.speed_buttons = [] if headless else get_speed_buttons()
         self.path_to_button: Dict[Path, PathButton] = {}
         self.buttons = [
             *self.path_buttons,
@@ -141,8 +199,8 @@ class Mediator:
         self._layout_size: tuple[int, int] | None = None
         self._compat_renderer: object | None = None
 
-        # entities
-        self.all_stations = self.get_initial_station_pool()
+        # entities; a fork or a load brings its own station pool instead of a draw
+        self.all_stations = station_pool or self.get_initial_station_pool()
         self.stations = self.all_stations[: self.initial_num_stations]
         self.metros: List[Metro] = []
         self.paths: List[Path] = []
@@ -153,15 +211,18 @@ class Mediator:
         # status
         self.time_ms = 0
         self.steps = 0
+        self._spawn_schedule = SpawnSchedule(self)
         self.station_steps_since_last_spawn: Dict[Station, int] = {}
         self.station_spawn_interval_steps: Dict[Station, int] = {}
         self.initialize_station_spawning_state(self.all_stations)
+        self._wait_clock = WaitClock()
         self.is_mouse_down = False
         self.is_creating_path = False
         self.path_being_created: Path | None = None
         self.path_redraw: PathRedrawGesture | None = None
         self.path_edit_selection: PathEditSelection | None = None
-        self.travel_plans: TravelPlans = {}
+        self.travel_plans: TravelPlans = TravelPlanMap()
+        self._service_decisions = ServiceDecisions()
         self.is_paused = False
         # GM-10a (D-041): the weekly calendar is OPT-IN and OFF by default, so
         # RL/headless envs, the tutorial, and tests never pause for a week boundary
@@ -182,77 +243,31 @@ class Mediator:
         # GM-10a-d: the week-boundary hold + offer generate/apply logic (D-023 facade).
         self._weekly = WeeklyOffers()
         self.game_speed_multiplier = 1
+        # Opt-in for headless runs stepping in large dt: metros follow their
+        # closed-form speed profile (Path.advance_metro), so where they end up
+        # no longer depends on the step. Off by default to keep pinned runs.
+        self.exact_metro_kinematics = False
         self.unlocked_num_paths = self.get_unlocked_num_paths()
         self.unlocked_num_stations = self.get_unlocked_num_stations()
         self.update_path_button_lock_states()
         self.is_game_over = False
         self.passenger_max_wait_time_ms = passenger_max_wait_time_ms
         self.overdue_passenger_threshold = overdue_passenger_threshold
-        self.prepare_layout(screen_width, screen_height)
-
-    @property
-    def num_paths(self) -> int:
-        return self._progression.num_paths
-
-    @num_paths.setter
-    def num_paths(self, value: int) -> None:
-        self._progression.num_paths = value
+        if not headless:
+            self.prepare_layout(screen_width, screen_height)
 
-    @property
-    def path_unlock_milestones(self) -> List[int]:
-        return self._progression.path_unlock_milestones
+    def fork(self) -> Mediator:
+        """An independent copy of this game that plays on identically."""
 
-    @path_unlock_milestones.setter
-    def path_unlock_milestones(self, value: List[int]) -> None:
-        self._progression.path_unlock_milestones = value
+        return fork_mediator(self)
 
     @property
-    def path_purchase_prices(self) -> List[int]:
-        return self._progression.path_purchase_prices
-
-    @path_purchase_prices.setter
-    def path_purchase_prices(self, value: List[int]) -> None:
-        self._progression.path_purchase_prices = value
+    def route_memo_hits(self) -> int:
+        return self._route_memo.hits
 
     @property
-    def num_stations(self) -> int:
-        return self._progression.num_stations
-
-    @num_stations.setter
-    def num_stations(self, value: int) -> None:
-        self._progression.num_stations = value
-
-    @property
-    def initial_num_stations(self) -> int:
-        return self._progression.initial_num_stations
-
-    @initial_num_stations.setter
-    def initial_num_stations(self, value: int) -> None:
-        self._progression.initial_num_stations = value
-
-    @property
-    def station_unlock_milestones(self) -> List[int]:
-        return self._progression.station_unlock_milestones
-
-    @station_unlock_milestones.setter
-    def station_unlock_milestones(self, value: List[int]) -> None:
-        self._progression.station_unlock_milestones = value
-
-    @property
-    def deliveries(self) -> int:
-        return self._progression.deliveries
-
-    @deliveries.setter
-    def deliveries(self, value: int) -> None:
-        self._progression.deliveries = value
-
-    @property
-    def line_credits(self) -> int:
-        return self._progression.line_credits
-
-    @line_credits.setter
-    def line_credits(self, value: int) -> None:
-        self._progression.line_credits = value
+    def route_memo_misses(self) -> int:
+        return self._route_memo.misses
 
     @property
     def available_locomotives(self) -> int:
@@ -299,19 +314,7 @@ class Mediator:
         """
 
         rivers = self.map_definition.rivers
-        if not rivers:
-            return 0
-        return sum(
-            len(
-                path_crossings(
-                    [station.position for station in path.stations],
-                    path.is_looped,
-                    rivers,
-                )
-            )
-            for path in self.paths
-            if not getattr(path, "is_being_created", False)
-        )
+        return committed_crossings(self.paths, rivers) if rivers else 0
 
     @property
     def available_tunnels(self) -> int | None:
@@ -321,60 +324,6 @@ class Mediator:
             return None
         return max(0, self.num_tunnels - self.consumed_tunnels)
 
-    @property
-    def purchased_num_paths(self) -> int:
-        return self._progression.purchased_num_paths
-
-    @purchased_num_paths.setter
-    def purchased_num_paths(self, value: int) -> None:
-        self._progression.purchased_num_paths = value
-
-    @property
-    def unlocked_num_paths(self) -> int:
-        return self._progression.unlocked_num_paths
-
-    @unlocked_num_paths.setter
-    def unlocked_num_paths(self, value: int) -> None:
-        self._progression.unlocked_num_paths = value
-
-    @property
-    def unlocked_num_stations(self) -> int:
-        return self._progression.unlocked_num_stations
-
-    @unlocked_num_stations.setter
-    def unlocked_num_stations(self, value: int) -> None:
-        self._progression.unlocked_num_stations = value
-
-    @property
-    def total_travels_handled(self) -> int:
-        """Deprecated writable alias for cumulative passenger deliveries."""
-
-        return self.deliveries
-
-    @total_travels_handled.setter
-    def total_travels_handled(self, value: int) -> None:
-        self.deliveries = value
-
-    @property
-    def score(self) -> int:
-        """Deprecated writable alias for spendable line credits."""
-
-        return self.line_credits
-
-    @score.setter
-    def score(self, value: int) -> None:
-        self.line_credits = value
-
-    @property
-    def max_waiting_passengers(self) -> int:
-        """Deprecated writable alias for the overdue-passenger threshold."""
-
-        return self.overdue_passenger_threshold
-
-    @max_waiting_passengers.setter
-    def max_waiting_passengers(self, value: int) -> None:
-        self.overdue_passenger_threshold = value
-
     def prepare_layout(self, width: int, height: int) -> None:
         """Prepare every interactive hitbox before input is dispatched."""
 
@@ -399,44 +348,19 @@ class Mediator:
         )
 
     def generate_distinct_path_colors(self, path_count: int) -> Dict[Color, bool]:
-        if path_count <= 0:
-            return {}
-        selected_hues: List[float] = [self.context.python_random.random()]
-        candidate_count = 24
-        while len(selected_hues) < path_count:
-            candidate_hues = [
-                self.context.python_random.random() for _ in range(candidate_count)
-            ]
-            candidate_hues.append(self.context.python_random.random())
-            selected_hues.append(pick_distinct_hue(selected_hues, candidate_hues))
-        path_colors: Dict[Color, bool] = {}
-        for hue in selected_hues:
-            path_colors[hue_to_rgb(hue, saturation=0.6, value=0.9)] = False
-        while len(path_colors) < path_count:
-            hue = self.context.python_random.random()
-            path_colors[hue_to_rgb(hue, saturation=0.6, value=0.9)] = False
-        return path_colors
+        rng = self.context.python_random
+        return distinct_path_colors(rng, path_count, to_rgb=hue_to_rgb)
 
     def get_path_purchase_prices(self) -> List[int]:
         return self._progression.get_path_purchase_prices()
 
     def get_initial_station_pool(self) -> List[Station]:
-        # Keep initial gameplay valid by guaranteeing at least two shape types.
-        while True:
-            stations = get_random_stations(
-                self.num_stations,
-                context=self.context,
-                shape_types=self.map_definition.shape_types,
-                unique_shape_types=self.map_definition.unique_shape_types,
-                unique_spawn_start_index=self.map_definition.unique_spawn_start_index,
-                unique_spawn_chance=self.map_definition.unique_spawn_chance,
-                spawn_regions=self.map_definition.spawn_regions,
-            )
-            initial_shapes = {
-                station.shape.type for station in stations[: self.initial_num_stations]
-            }
-            if len(initial_shapes) >= 2:
-                return stations
+        return get_initial_station_pool(
+            self.num_stations,
+            self.initial_num_stations,
+            self.context,
+            self.map_definition,
+        )
 
     def get_unlocked_num_stations(self) -> int:
         return self._progression.get_unlocked_num_stations()
@@ -453,6 +377,7 @@ class Mediator:
                 len(self.stations) : self.unlocked_num_stations
             ]
             self.stations = self.all_stations[: self.unlocked_num_stations]
+            self._shape_index.rebuild(self.stations)
             if self.unlocked_num_stations > previous_unlocked_num_stations:
                 for station in newly_unlocked_stations:
                     station.start_unlock_blink(self.time_ms)
@@ -554,6 +479,7 @@ class Mediator:
             path,
             get_reconcile_station_service=lambda: self._reconcile_station_service,
         )
+        self._path_index.rebuild(self.paths)
 
     def invalidate_travel_plans_for_path(self, path: Path) -> None:
         self._path_lifecycle.invalidate_travel_plans_for_path(self, path)
@@ -568,6 +494,7 @@ class Mediator:
         self._path_lifecycle.start_path_on_station(
             self, station, get_path_factory=lambda: Path
         )
+        self._path_index.rebuild(self.paths)
 
     def create_path_from_station_indices(
         self, station_indices: List[int], loop: bool = False
@@ -579,16 +506,28 @@ class Mediator:
     def replace_path(
         self, path: Path, station_indices: List[int], loop: bool = False
     ) -> bool:
-        return self._path_lifecycle.replace_path(
-            self,
-            path,
-            station_indices,
-            loop,
-            get_path_factory=lambda: Path,
-            get_geometry_style=lambda: (path_order_shift, path_width),
-            get_graph_builder=lambda: build_station_nodes_dict,
-            get_scoped_replanner=lambda: self._replan_passenger_at_station,
-        )
+        try:
+            return self._path_lifecycle.replace_path(
+                self,
+                path,
+                station_indices,
+                loop,
+                get_path_factory=lambda: Path,
+                get_geometry_style=lambda: (path_order_shift, path_width),
+                get_graph_builder=lambda: self._replaced_graph_view,
+                get_scoped_replanner=lambda: self._replan_passenger_at_station,
+            )
+        finally:
+            # A rollback restores the station list in place, length and all.
+            self._path_index.rebuild(self.paths)
+
+    def _replaced_graph_view(
+        self, stations: List[Station], paths: List[Path]
+    ) -> Dict[Station, Node]:
+        # Read right after the station list is rewritten in place, before the
+        # replans that look up shared paths.
+        self._path_index.rebuild(paths)
+        return self._station_graph.view(stations, paths)
 
     def replace_path_by_id(
         self, path_id: str, station_indices: List[int], loop: bool = False
@@ -606,15 +545,18 @@ class Mediator:
 
     def add_station_to_path(self, station: Station) -> None:
         self._path_lifecycle.add_station_to_path(self, station)
+        self._path_index.rebuild(self.paths)
 
     def abort_path_creation(self) -> None:
         self._path_lifecycle.abort_path_creation(self)
+        self._path_index.rebuild(self.paths)
 
     def release_color_for_path(self, path: Path) -> None:
         self._path_lifecycle.release_color_for_path(self, path)
 
     def finish_path_creation(self) -> None:
         self._path_lifecycle.finish_path_creation(self)
+        self._path_index.rebuild(self.paths)
 
     def can_assign_locomotive(self, path: Path) -> bool:
         return self._fleet.can_assign(self, path)
@@ -666,7 +608,7 @@ class Mediator:
         self._passenger_flow.reconcile_station_service(
             self,
             metro,
-            get_graph_builder=lambda: build_station_nodes_dict,
+            get_graph_builder=lambda: self._station_graph.view,
         )
 
     @property
@@ -689,12 +631,16 @@ class Mediator:
     def hold_pause_reason(self, reason: str) -> None:
         """Hold one validated pause reason; repeated holds are idempotent."""
 
-        self._pause_reason_store(reason).add(reason)
+        store = self._pause_reason_store(reason)
+        self.state_version += reason not in store
+        store.add(reason)
 
     def release_pause_reason(self, reason: str) -> None:
         """Release one validated pause reason; a non-held reason is a no-op."""
 
-        self._pause_reason_store(reason).discard(reason)
+        store = self._pause_reason_store(reason)
+        self.state_version += reason in store
+        store.discard(reason)
 
     def _pause_reason_store(self, reason: str) -> set[str]:
         # The store is created lazily per instance so bare hosts stay safe and
@@ -753,29 +699,38 @@ class Mediator:
         self._path_lifecycle.end_path_on_station(self, station)
 
     def get_station_shape_types(self) -> List[ShapeType]:
-        return self._passenger_flow.get_station_shape_types(self)
+        return self._spawning.get_station_shape_types(self)
 
     def is_passenger_spawn_time(self) -> bool:
-        return self._passenger_flow.is_passenger_spawn_time(self)
+        return self._spawning.is_passenger_spawn_time(
+            self, self._default_spawn_schedule()
+        )
 
     def initialize_station_spawning_state(self, stations: List[Station]) -> None:
-        self._passenger_flow.initialize_station_spawning_state(self, stations)
+        self._spawning.initialize_station_spawning_state(self, stations)
 
     def get_station_spawn_interval_step(self) -> int:
-        return self._passenger_flow.get_station_spawn_interval_step(self)
+        return self._spawning.get_station_spawn_interval_step(self)
 
     def should_spawn_passenger_at_station(self, station: Station) -> bool:
-        return self._passenger_flow.should_spawn_passenger_at_station(self, station)
+        return self._spawning.should_spawn_passenger_at_station(self, station)
 
     def spawn_passengers(self) -> None:
-        self._passenger_flow.spawn_passengers(
+        self._spawning.spawn_passengers(
             self,
             get_passenger_factory=lambda: Passenger,
-            get_shape_factory=lambda: get_shape_from_type,
+            get_shape_factory=lambda: shared_shapes(get_shape_from_type),
             get_passenger_color=lambda: passenger_color,
             get_passenger_size=lambda: passenger_size,
+            schedule=self._default_spawn_schedule(),
         )
 
+    def _default_spawn_schedule(self) -> SpawnSchedule | None:
+        # A rebound due hook is authoritative, so it is asked station by station.
+        if "should_spawn_passenger_at_station" in vars(self):
+            return None
+        return self._spawn_schedule
+
     def increment_time(self, dt_ms: int) -> None:
         old_steps = self.steps
         transition_active = not self.is_paused and not self.is_game_over
@@ -783,16 +738,36 @@ class Mediator:
         # terminal states — so a repairable shape never survives a tick.
         self._fleet.reconcile(self)
         if transition_active:
+            self.state_version += 1
             self._drain_and_settle_queued_returns()
         self._passenger_flow.increment_time(
             self,
             dt_ms,
-            get_graph_builder=lambda: build_station_nodes_dict,
+            get_graph_builder=lambda: self._station_graph.view,
+            schedule=self._spawn_schedule,
         )
         if transition_active:
             self._drain_and_settle_queued_returns()
         self._maybe_hold_week_boundary(old_steps)
 
+    def advance_until_event(self, max_ms: int, dt_ms: int = 16) -> int:
+        """Tick `dt_ms` at a time up to the next event or `max_ms`; return ms run.
+
+        The state it stops in is the one the same number of `increment_time`
+        calls would reach; ticks in which nothing can happen are coasted,
+        moving every metro but batching spawn, wait and route-search work.
+        """
+
+        return self._fast_forward.advance_until_event(
+            self,
+            max_ms,
+            dt_ms,
+            week_length_steps=WEEK_LENGTH_STEPS,
+            get_graph_builder=lambda: self._station_graph.view,
+            get_wait_clock=lambda: self._wait_clock,
+            get_spawn_schedule=lambda: self._spawn_schedule,
+        )
+
     def _maybe_hold_week_boundary(self, old_steps: int) -> None:
         self._weekly.maybe_hold_boundary(self, old_steps)
 
@@ -807,7 +782,7 @@ class Mediator:
         if not self.is_game_over:
             self._passenger_flow.drain_queued_returns(
                 self,
-                get_graph_builder=lambda: build_station_nodes_dict,
+                get_graph_builder=lambda: self._station_graph.view,
             )
         self._fleet.settle(self)
 
@@ -867,24 +842,24 @@ class Mediator:
         self._passenger_flow.move_passengers(
             self,
             dt_ms,
-            get_graph_builder=lambda: build_station_nodes_dict,
+            get_graph_builder=lambda: self._station_graph.view,
             get_record_delivery=lambda: self._progression.record_delivery,
             get_scoped_replanner=lambda: self._replan_passenger_at_station,
         )
 
     def update_waiting_and_game_over(self, dt_ms: int) -> None:
         was_game_over = self.is_game_over
-        self._passenger_flow.update_waiting_and_game_over(self, dt_ms)
+        self._spawning.update_waiting_and_game_over(self, dt_ms, clock=self._wait_clock)
         if not was_game_over and self.is_game_over:
             self._input.clear_transient_input(self)
 
     def get_stations_for_shape_type(self, shape_type: ShapeType) -> List[Station]:
-        stations = self._router.get_stations_for_shape_type(self.stations, shape_type)
+        stations = self._shape_index.stations_for(self.stations, shape_type)
         self.context.python_random.shuffle(stations)
         return stations
 
     def find_shared_path(self, station_a: Station, station_b: Station) -> Path | None:
-        return self._router.find_shared_path(self.paths, station_a, station_b)
+        return self._path_index.shared_path(self.paths, station_a, station_b)
 
     def passenger_has_travel_plan(self, passenger: Passenger) -> bool:
         return self._router.passenger_has_travel_plan(
@@ -902,7 +877,7 @@ class Mediator:
         )
 
     def get_path_by_id(self, path_id: str) -> Path | None:
-        return self._router.get_path_by_id(self.paths, path_id)
+        return self._path_index.path_by_id(self.paths, path_id)
 
     def get_travel_plan_starting_with_path(
         self,
@@ -916,15 +891,65 @@ class Mediator:
             self.get_stations_for_shape_type(passenger.destination_shape.type),
             station_nodes_dict,
             get_required_first_path_id=lambda: required_first_path.id,
-            find_node_path=lambda start, end: bfs(start, end),
-            get_reduce_node_path=lambda: self.skip_stations_on_same_path,
+            find_node_path=lambda start, end: self._route_table.node_path(start, end),
+            get_reduce_node_path=self._reducer,
             get_find_shared_path=lambda: self.find_shared_path,
             get_plan_factory=lambda: TravelPlan,
+            outcomes=self._route_outcomes(
+                station, passenger.destination_shape.type, station_nodes_dict
+            ),
+        )
+
+    def _has_travel_plan_starting_with_path(
+        self,
+        passenger: Passenger,
+        station: Station,
+        required_first_path: Path,
+        station_nodes_dict: Dict[Station, Node],
+    ) -> bool:
+        shape_type = passenger.destination_shape.type
+        return self._router.has_travel_plan_starting_with_path(
+            station,
+            self._shape_index.stations_for(self.stations, shape_type),
+            station_nodes_dict,
+            get_required_first_path_id=lambda: required_first_path.id,
+            find_node_path=lambda start, end: self._route_table.node_path(start, end),
+            get_reduce_node_path=self._reducer,
+            get_find_shared_path=lambda: self.find_shared_path,
+            outcomes=self._route_outcomes(station, shape_type, station_nodes_dict),
         )
 
+    def service_action_peek(self) -> Callable[..., tuple[str, Passenger] | None] | None:
+        # A customised hook the peek reads past sends queries to the snapshot.
+        if not hooks_are_default(self, _PEEKED_HOOKS):
+            return None
+        return self._service_decisions.oracle(
+            self, self._station_graph, self._has_travel_plan_starting_with_path
+        )
+
+    def _route_outcomes(
+        self,
+        station: Station,
+        shape_type: ShapeType,
+        station_nodes_dict: Dict[Station, Node],
+    ) -> RouteOutcomes | None:
+        graph = self._station_graph
+        if not graph.serves(station_nodes_dict):
+            return None
+        # Outcomes hold reduced routes, so a different reducer starts afresh.
+        reducer = self._reducer()
+        version = (graph.version, getattr(reducer, "__func__", reducer))
+        return self._route_memo.outcomes(station, shape_type, version)
+
     def skip_stations_on_same_path(self, node_path: List[Node]):
         return self._router.skip_stations_on_same_path(node_path)
 
+    def _reducer(self) -> Callable[[List[Node]], List[Node]]:
+        # A rebound compression hook still reduces every planned route.
+        if hooks_are_default(self, _REDUCE_HOOK):
+            return self._route_table.transfer_stops
+        return self.skip_stations_on_same_path
+
     def _replan_passenger_at_station(
         self,
         passenger: Passenger,
@@ -937,15 +962,23 @@ class Mediator:
             station,
             station_nodes_dict,
             get_best_path_finder=lambda: self._router.find_best_node_path,
-            get_search=lambda: bfs,
+            get_search=lambda: self._route_table.node_path,
             get_plan_factory=lambda: TravelPlan,
+            get_reducer=self._reducer,
+            get_route_outcomes=lambda: self._route_outcomes,
         )
 
     def find_travel_plan_for_passengers(self) -> None:
         self._passenger_flow.find_travel_plan_for_passengers(
             self,
-            get_graph_builder=lambda: build_station_nodes_dict,
+            get_graph_builder=lambda: self._station_graph.view,
             get_bulk_iterator=lambda: self._router.iter_bulk_route_proposals,
-            get_search=lambda: bfs,
+            get_search=lambda: self._route_table.node_path,
             get_plan_factory=lambda: TravelPlan,
+            get_reducer=self._reducer,
+            get_route_outcomes=lambda: self._route_outcomes,
         )
+
+
+_PEEKED_HOOKS = {name: vars(Mediator)[name] for name in PEEKED_HOOKS}
+_REDUCE_HOOK = {"skip_stations_on_same_path": Mediator.skip_stations_on_same_path}
@@ -0,0 +1,229 @@
+"""In-memory copies of a running game, for search rollouts.
+
+`Mediator.fork` builds the same game `save_load.deserialize_game` would
+rebuild from `serialize_game` of it, without the document in between: no
+schema validation, no id lookups, no fresh shapes. A fork shares what play
+never changes -- the map definition, station shapes and positions, passenger
+destination shapes -- and copies what it does change: stations and their
+queues, passengers, lines, metros and carriages, travel plans, spawn timers,
+line colours, path button state and both random streams. Routing caches,
+the wait clock and the other collaborators start empty, as after a load, and
+fill in on the next tick.
+
+Slotted entities are copied slot by slot, so a field added to one is carried
+over without being listed here; the references between them are then pointed
+at the copies. Lines are rebuilt through `Path.update_segments`, as the loader
+rebuilds them, so their segments never point at the source's stations.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from entity.holder import HolderPassengers
+from entity.path import Path
+from geometry.point import Point
+from graph.node import Node
+from travel_plan import TravelPlan
+
+# Mediator state a fork takes over as it is, in `save_load` restore order;
+# the lists among it are copied.
+_SCALARS = (
+    "num_paths",
+    "path_unlock_milestones",
+    "path_purchase_prices",
+    "num_stations",
+    "initial_num_stations",
+    "station_unlock_milestones",
+    "deliveries",
+    "line_credits",
+    "purchased_num_paths",
+    "unlocked_num_paths",
+    "unlocked_num_stations",
+    "num_metros",
+    "num_carriages",
+    "tunnel_bonus",
+    "time_ms",
+    "steps",
+    "game_speed_multiplier",
+    "is_game_over",
+    "passenger_spawning_step",
+    "passenger_spawning_interval_step",
+    "passenger_max_wait_time_ms",
+    "overdue_passenger_threshold",
+    "week_calendar",
+    "exact_metro_kinematics",
+    "least_transfer_routes",
+    "current_offers",
+)
+
+_SLOTS: dict[type, tuple[Any, ...]] = {}
+
+
+def _slots(cls: type) -> tuple[Any, ...]:
+    # The slot descriptors themselves: Metro's `capacity` property shadows
+    # the Holder slot of that name, and must not be called to copy it.
+    descriptors = _SLOTS.get(cls)
+    if descriptors is None:
+        descriptors = _SLOTS[cls] = tuple(
+            klass.__dict__[name]
+            for klass in cls.__mro__
+            for name in klass.__dict__.get("__slots__", ())
+            if name not in ("__dict__", "__weakref__")
+        )
+    return descriptors
+
+
+def _copy_slots(entity: Any) -> Any:
+    clone = object.__new__(type(entity))
+    for slot in _slots(type(entity)):
+        try:
+            slot.__set__(clone, slot.__get__(entity))
+        except AttributeError:
+            pass
+    return clone
+
+
+def _require_quiescent(mediator: Any) -> None:
+    # The boundary `serialize_game` also requires: a gesture in progress
+    # holds drafts and snapshots a fork has no way to carry over.
+    if (
+        mediator.is_creating_path
+        or mediator.path_being_created is not None
+        or mediator.path_redraw is not None
+        or mediator.path_edit_selection is not None
+    ):
+        raise ValueError("cannot fork a game during a path gesture")
+
+
+class _Fork:
+    """One fork in progress: each source entity maps to its single copy."""
+
+    __slots__ = ("_copies",)
+
+    def __init__(self) -> None:
+        self._copies: dict[int, Any] = {}
+
+    def station(self, station: Any) -> Any:
+        clone = self._copies.get(id(station))
+        if clone is None:
+            clone = self._copies[id(station)] = _copy_slots(station)
+            clone._waiting_clock = None
+            clone.snap_blips = list(station.snap_blips)
+            clone._passengers = self._riders(station.passengers, clone)
+        return clone
+
+    def passenger(self, passenger: Any) -> Any:
+        clone = self._copies.get(id(passenger))
+        if clone is None:
+            clone = self._copies[id(passenger)] = _copy_slots(passenger)
+            clone.position = Point(passenger.position.left, passenger.position.top)
+            # The copy's wait restarts on the fork's own clock once its
+            # station list is bound there.
+            clone._wait_clock = clone._wait_station = None
+            clone._wait_origin_ms = 0
+            clone._wait_ms = passenger.wait_ms
+        return clone
+
+    def path(self, path: Any) -> Any:
+        clone = self._copies.get(id(path))
+        if clone is None:
+            clone = self._copies[id(path)] = Path(path.color)
+            clone.id = path.id
+            clone.is_looped = path.is_looped
+            clone.path_order = path.path_order
+            clone.stations = [self.station(station) for station in path.stations]
+            # Segments are built before metros join, as in `save_load`.
+            clone.update_segments()
+            clone.metros.extend(self.metro(metro) for metro in path.metros)
+            for metro in path.metros:
+                self.metro(metro).current_segment = clone.segments[
+                    metro.current_segment_idx
+                ]
+        return clone
+
+    def metro(self, metro: Any) -> Any:
+        clone = self._copies.get(id(metro))
+        if clone is None:
+            clone = self._copies[id(metro)] = _copy_slots(metro)
+            clone.shape = copy.copy(metro.shape)
+            clone.position = Point(metro.position.left, metro.position.top)
+            clone.carriages = [self._carriage(item) for item in metro.carriages]
+            clone._passengers = self._riders(metro.passengers, clone)
+            if metro.current_station is not None:
+                clone.current_station = self.station(metro.current_station)
+            clone.current_segment = None
+            action = metro._station_service_action
+            if action is not None and action[1] is not None:
+                clone._station_service_action = (action[0], self.passenger(action[1]))
+        return clone
+
+    def travel_plan(self, plan: TravelPlan) -> TravelPlan:
+        nodes = []
+        for node in plan.node_path:
+            clone = Node(self.station(node.station))
+            clone.paths = {self.path(path) for path in node.paths}
+            nodes.append(clone)
+        forked = TravelPlan(nodes)
+        if plan.next_path is not None:
+            forked.next_path = self.path(plan.next_path)
+        if plan.next_station is not None:
+            forked.next_station = self.station(plan.next_station)
+        forked.next_station_idx = plan.next_station_idx
+        return forked
+
+    def _carriage(self, carriage: Any) -> Any:
+        clone = _copy_slots(carriage)
+        clone.shape = copy.copy(carriage.shape)
+        clone.position = Point(carriage.position.left, carriage.position.top)
+        return clone
+
+    def _riders(self, passengers: Any, holder: Any) -> HolderPassengers:
+        return HolderPassengers(map(self.passenger, passengers), holder=holder)
+
+
+def fork_mediator(source: Any) -> Any:
+    """Copy `source` into a new mediator of the same type; see the module doc."""
+
+    _require_quiescent(source)
+    fork = _Fork()
+    clone = type(source)(
+        seed=0,
+        map_definition=source.map_definition,
+        headless=source.headless,
+        station_pool=[fork.station(station) for station in source.all_stations],
+    )
+    clone.stations = [fork.station(station) for station in source.stations]
+    clone.station_steps_since_last_spawn = {
+        fork.station(station): steps
+        for station, steps in source.station_steps_since_last_spawn.items()
+    }
+    clone.station_spawn_interval_steps = {
+        fork.station(station): steps
+        for station, steps in source.station_spawn_interval_steps.items()
+    }
+    for name in _SCALARS:
+        value = getattr(source, name)
+        setattr(clone, name, list(value) if isinstance(value, list) else value)
+    clone._pause_reasons = set(source._pause_reasons)
+    clone.passengers = [fork.passenger(passenger) for passenger in source.passengers]
+    clone.paths = [fork.path(path) for path in source.paths]
+    clone.metros = [fork.metro(metro) for metro in source.metros]
+    clone.path_colors = dict(source.path_colors)
+    clone.path_to_color = {
+        fork.path(path): color for path, color in source.path_to_color.items()
+    }
+    for passenger, plan in source.travel_plans.items():
+        clone.travel_plans[fork.passenger(passenger)] = fork.travel_plan(plan)
+    clone.assign_paths_to_buttons()
+    for button, original in zip(clone.path_buttons, source.path_buttons):
+        button.unlock_blink_start_time_ms = original.unlock_blink_start_time_ms
+    if source._layout_size not in (None, clone._layout_size):
+        clone.prepare_layout(*source._layout_size)
+    context = source.context
+    clone.context.python_random.setstate(context.python_random.getstate())
+    clone.context.numpy_random.bit_generator.state = (
+        context.numpy_random.bit_generator.state
+    )
+    return clone
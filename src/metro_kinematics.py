@@ -0,0 +1,116 @@
+"""Closed-form metro motion along one segment.
+
+A metro covers a segment in at most three phases of constant acceleration:
+it ramps toward its cruising speed, cruises, and -- when it stops at the
+segment's end -- brakes so that it comes to rest exactly there. Each phase is
+a `(duration_ms, start_speed, acceleration)` triple, so the time needed to
+reach the end and the position and speed at any earlier instant are exact for
+any `dt`, unlike a per-tick integration.
+"""
+
+from __future__ import annotations
+
+import math
+
+Phase = tuple[float, float, float]
+
+# A metro this close to the end of its profile has arrived; the rest is the
+# rounding of however many steps brought it there.
+ARRIVAL_SLACK_MS = 1e-6
+
+
+def braking_distance(speed: float, deceleration: float) -> float:
+    return speed * speed / (2 * deceleration)
+
+
+def _time_to_cover(speed: float, acceleration: float, length: float) -> float:
+    """Time for `speed * t + acceleration * t**2 / 2` to reach `length`."""
+
+    if acceleration == 0:
+        return length / speed
+    discriminant = max(0.0, speed * speed + 2 * acceleration * length)
+    return (math.sqrt(discriminant) - speed) / acceleration
+
+
+def _ramp(
+    speed: float, max_speed: float, acceleration: float, deceleration: float
+) -> float:
+    """Acceleration that moves `speed` toward `max_speed`, 0 if it cannot."""
+
+    if speed < max_speed:
+        return acceleration if acceleration > 0 else 0
+    if speed > max_speed:
+        return -deceleration if deceleration > 0 else 0
+    return 0
+
+
+def segment_profile(
+    speed: float,
+    max_speed: float,
+    acceleration: float,
+    deceleration: float,
+    length: float,
+    stop: bool,
+) -> list[Phase] | None:
+    """Phases that carry a metro `length` pixels, or None if it never gets there.
+
+    Without a stop the metro ramps to `max_speed` and holds it. With one it
+    brakes at `deceleration` from the last point at which it still can come to
+    rest by the end -- or at once, reaching the end still moving, when it is
+    already too fast, as the per-tick integration does before it snaps to 0.
+    """
+
+    if length <= 0:
+        return []
+    braking = stop and deceleration > 0
+    if braking and braking_distance(speed, deceleration) >= length:
+        return [(_time_to_cover(speed, -deceleration, length), speed, -deceleration)]
+
+    phases: list[Phase] = []
+    rate = _ramp(speed, max_speed, acceleration, deceleration)
+    reserve = braking_distance(max_speed, deceleration) if braking else 0.0
+    if rate != 0:
+        ramp_ms = (max_speed - speed) / rate
+        ramp_length = (speed + max_speed) / 2 * ramp_ms
+        if ramp_length + reserve > length:
+            if not braking:
+                return [(_time_to_cover(speed, rate, length), speed, rate)]
+            # Accelerates toward the cruise speed and brakes before reaching it.
+            peak = math.sqrt(
+                (length + speed * speed / (2 * rate))
+                / (1 / (2 * rate) + 1 / (2 * deceleration))
+            )
+            return [
+                ((peak - speed) / rate, speed, rate),
+                (peak / deceleration, peak, -deceleration),
+            ]
+        phases.append((ramp_ms, speed, rate))
+        length -= ramp_length
+        speed = max_speed
+    if speed <= 0:
+        return None
+    if braking:
+        reserve = braking_distance(speed, deceleration)
+    phases.append(((length - reserve) / speed, speed, 0.0))
+    if braking:
+        phases.append((speed / deceleration, speed, -deceleration))
+    return phases
+
+
+def profile_duration(phases: list[Phase]) -> float:
+    return sum(duration for duration, _, _ in phases)
+
+
+def profile_state(phases: list[Phase], elapsed_ms: float) -> tuple[float, float]:
+    """Distance covered and speed `elapsed_ms` into the profile."""
+
+    covered = 0.0
+    speed = 0.0
+    for duration, speed, acceleration in phases:
+        if elapsed_ms < duration:
+            covered += speed * elapsed_ms + acceleration * elapsed_ms**2 / 2
+            return covered, speed + acceleration * elapsed_ms
+        covered += speed * duration + acceleration * duration**2 / 2
+        elapsed_ms -= duration
+        speed += acceleration * duration
+    return covered, speed
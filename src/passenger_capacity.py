@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 DESTINATION = "destination"
@@ -10,6 +12,14 @@ BOARD = "board"
 
 _MISSING = object()
 _PLAN_FIELDS = ("next_path", "next_station", "next_station_idx")
+# The facade hooks `peek_service_action` answers for without calling them.
+PEEKED_HOOKS = (
+    "can_board_at_station",
+    "get_boarding_candidates_for_metro",
+    "get_stations_for_shape_type",
+    "get_travel_plan_starting_with_path",
+    "get_unloading_candidates_for_metro",
+)
 
 
 def same_service_action(left: Any, right: Any) -> bool:
@@ -146,11 +156,193 @@ def _restore_query(host: Any, snapshot: dict[str, Any]) -> None:
         snapshot["bit_generator"].state = snapshot["numpy_state"]
 
 
+def _plan_next_station(plan: Any) -> Any | None:
+    """`TravelPlan.get_next_station` without its write to `next_station`."""
+
+    node_path = plan.node_path
+    if node_path is not None and len(node_path) > 0:
+        return node_path[plan.next_station_idx].station
+    return None
+
+
+def hooks_are_default(host: Any, defaults: dict[str, Any]) -> bool:
+    """Whether no hook in `defaults` is rebound on `host` or its class."""
+
+    return vars(host).keys().isdisjoint(defaults) and all(
+        getattr(type(host), name) is hook for name, hook in defaults.items()
+    )
+
+
+def peek_service_action(
+    host: Any,
+    metro: Any,
+    station: Any,
+    station_nodes_dict: dict[Any, Any],
+    *,
+    has_constrained_plan: Callable[[Any, Any, Any, dict[Any, Any]], bool],
+) -> tuple[str, Any] | None:
+    """`next_service_action` over the facade's own hooks, reading state only.
+
+    Destination and transfer candidates are read off the metro as the hooks
+    read them; a rider boards if its plan already takes this line or if
+    `has_constrained_plan(rider, station, path, station_nodes_dict)` says the
+    constrained route lookup would give it one. No plan, holder, or RNG is
+    touched, so nothing needs restoring.
+    """
+
+    travel_plans = host.travel_plans
+    destination: list[Any] = []
+    transfer: list[Any] = []
+    for passenger in metro.passengers:
+        if station.shape.type == passenger.destination_shape.type:
+            destination.append(passenger)
+            continue
+        travel_plan = travel_plans.get(passenger)
+        if travel_plan is not None and _plan_next_station(travel_plan) == station:
+            transfer.append(passenger)
+    if destination:
+        return (DESTINATION, destination[0])
+    if transfer and station.has_room():
+        return (TRANSFER, transfer[0])
+    # Boarding needs room, and room alone already satisfies
+    # `can_board_at_station`; a queued return boards nobody.
+    if getattr(metro, "is_unassignment_queued", False) or not metro.has_room():
+        return None
+    metro_path = host.get_path_by_id(metro.path_id)
+    if metro_path is None:
+        return None
+    for passenger in station.passengers:
+        current_plan = travel_plans.get(passenger)
+        if (
+            current_plan
+            and current_plan.next_path
+            and current_plan.next_path.id == metro.path_id
+        ) or has_constrained_plan(passenger, station, metro_path, station_nodes_dict):
+            return (BOARD, passenger)
+    return None
+
+
+class ServiceDecisions:
+    """The peeked next service action of each metro, kept until its inputs move.
+
+    A metro dwelling at a station asks for its next action every tick, and
+    the answer only changes when something the peek reads does: either
+    holder's passengers (`Holder.version`), any travel plan (the plan map's
+    `revision`), the live graph (`version`), the metro's line, queue flag or
+    carriages, or the station's capacity. Those are the key; a hit skips the
+    route lookups. Holders whose list does not report its edits, plan maps
+    without a revision, and caller-built graphs are answered uncached.
+    """
+
+    __slots__ = ("_entries", "hits", "misses")
+
+    def __init__(self) -> None:
+        # id(metro) -> (metro, station, key, action).
+        self._entries: dict[int, tuple[Any, Any, tuple[Any, ...], Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def oracle(
+        self,
+        host: Any,
+        graph: Any,
+        has_constrained_plan: Callable[[Any, Any, Any, dict[Any, Any]], bool],
+    ) -> Callable[[Any, Any, dict[Any, Any]], tuple[str, Any] | None]:
+        """`peek` bound to `host`, its live graph, and its route lookup."""
+
+        return partial(
+            self.peek, host, graph=graph, has_constrained_plan=has_constrained_plan
+        )
+
+    def peek(
+        self,
+        host: Any,
+        metro: Any,
+        station: Any,
+        station_nodes_dict: dict[Any, Any],
+        *,
+        graph: Any,
+        has_constrained_plan: Callable[[Any, Any, Any, dict[Any, Any]], bool],
+    ) -> tuple[str, Any] | None:
+        key = self._key(host, metro, station, station_nodes_dict, graph)
+        entry = None if key is None else self._entries.get(id(metro))
+        if (
+            entry is not None
+            and entry[0] is metro
+            and entry[1] is station
+            and entry[2] == key
+        ):
+            self.hits += 1
+            return entry[3]
+        action = peek_service_action(
+            host,
+            metro,
+            station,
+            station_nodes_dict,
+            has_constrained_plan=has_constrained_plan,
+        )
+        if key is not None:
+            self.misses += 1
+            if len(self._entries) > 2 * len(host.metros) + 8:
+                self._entries.clear()
+            self._entries[id(metro)] = (metro, station, key, action)
+        return action
+
+    @staticmethod
+    def _key(
+        host: Any,
+        metro: Any,
+        station: Any,
+        station_nodes_dict: dict[Any, Any],
+        graph: Any,
+    ) -> tuple[Any, ...] | None:
+        revision = getattr(host.travel_plans, "revision", None)
+        if (
+            revision is None
+            or getattr(metro.passengers, "_holder", None) is not metro
+            or getattr(station.passengers, "_holder", None) is not station
+            or not graph.serves(station_nodes_dict)
+        ):
+            return None
+        # The line is found by id under the graph's topology.
+        return (
+            metro.version,
+            station.version,
+            revision,
+            graph.version,
+            len(host.stations),
+            metro.path_id,
+            getattr(metro, "is_unassignment_queued", False),
+            metro.has_room(),
+            station.capacity,
+        )
+
+
 def pure_service_action(
     host: Any,
     metro: Any,
     station: Any,
     station_nodes_dict: dict[Any, Any],
+) -> tuple[str, Any] | None:
+    """The live oracle's answer, leaving every plan, holder, and RNG as it was.
+
+    A host whose `service_action_peek()` offers a read-only oracle is asked
+    through it; otherwise the live oracle runs between a snapshot and its
+    restore.
+    """
+
+    get_peek = getattr(type(host), "service_action_peek", None)
+    peek = None if get_peek is None else get_peek(host)
+    if peek is not None:
+        return peek(metro, station, station_nodes_dict)
+    return snapshot_service_action(host, metro, station, station_nodes_dict)
+
+
+def snapshot_service_action(
+    host: Any,
+    metro: Any,
+    station: Any,
+    station_nodes_dict: dict[Any, Any],
 ) -> tuple[str, Any] | None:
     """Run the live oracle and restore every plan, holder, and seeded RNG effect."""
 
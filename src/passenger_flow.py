@@ -13,9 +13,12 @@ from passenger_capacity import (
     reconcile_service_action,
     same_service_action,
 )
+from passenger_spawning import PassengerSpawning
 
 Resolver = Callable[[], Any]
 
+_SPAWNING = PassengerSpawning()
+
 
 class PassengerFlowHost(Protocol):
     """Mutable facade surface used only for one passenger-flow transition."""
@@ -37,6 +40,7 @@ class PassengerFlowHost(Protocol):
     is_paused: bool
     is_game_over: bool
     game_speed_multiplier: int
+    exact_metro_kinematics: bool
 
     get_station_shape_types: Callable[[], list[Any]]
     is_passenger_spawn_time: Callable[[], bool]
@@ -68,82 +72,13 @@ class PassengerFlow:
 
     __slots__ = ()
 
-    def get_station_shape_types(self, host: PassengerFlowHost) -> list[Any]:
-        return list(dict.fromkeys(station.shape.type for station in host.stations))
-
-    def is_passenger_spawn_time(self, host: PassengerFlowHost) -> bool:
-        return any(
-            host.should_spawn_passenger_at_station(station) for station in host.stations
-        )
-
-    def initialize_station_spawning_state(
-        self, host: PassengerFlowHost, stations: list[Any]
-    ) -> None:
-        for station in stations:
-            if station not in host.station_spawn_interval_steps:
-                host.station_spawn_interval_steps[station] = (
-                    host.get_station_spawn_interval_step()
-                )
-            if station not in host.station_steps_since_last_spawn:
-                host.station_steps_since_last_spawn[station] = (
-                    host.station_spawn_interval_steps[station]
-                )
-
-    def get_station_spawn_interval_step(self, host: PassengerFlowHost) -> int:
-        min_interval = max(1, int(host.passenger_spawning_interval_step * 0.7))
-        max_interval = max(
-            min_interval, int(host.passenger_spawning_interval_step * 1.3)
-        )
-        return host.context.python_random.randint(min_interval, max_interval)
-
-    def should_spawn_passenger_at_station(
-        self, host: PassengerFlowHost, station: Any
-    ) -> bool:
-        host.initialize_station_spawning_state([station])
-        return (
-            host.steps == host.passenger_spawning_step
-            or host.station_steps_since_last_spawn[station]
-            >= host.station_spawn_interval_steps[station]
-        )
-
-    def spawn_passengers(
-        self,
-        host: PassengerFlowHost,
-        *,
-        get_passenger_factory: Resolver,
-        get_shape_factory: Resolver,
-        get_passenger_color: Resolver,
-        get_passenger_size: Resolver,
-    ) -> None:
-        station_types = host.get_station_shape_types()
-        for station in host.stations:
-            if not host.should_spawn_passenger_at_station(station):
-                continue
-            other_station_shape_types = [
-                shape_type
-                for shape_type in station_types
-                if shape_type != station.shape.type
-            ]
-            destination_shape_type = host.context.python_random.choice(
-                other_station_shape_types
-            )
-            destination_shape = get_shape_factory()(
-                destination_shape_type,
-                get_passenger_color(),
-                get_passenger_size(),
-            )
-            passenger = get_passenger_factory()(destination_shape)
-            if station.has_room():
-                station.add_passenger(passenger)
-                host.passengers.append(passenger)
-            host.station_steps_since_last_spawn[station] = 0
-
     def increment_time(
         self,
         host: PassengerFlowHost,
         dt_ms: int,
         *,
         get_graph_builder: Resolver,
+        schedule: Any | None = None,
     ) -> None:
         if host.is_paused or host.is_game_over:
             return
@@ -153,10 +88,7 @@ class PassengerFlow:
 
         host.time_ms += scaled_dt_ms
         host.steps += speed_multiplier
-        host.initialize_station_spawning_state(host.stations)
-        for station in host.stations:
-            host.station_steps_since_last_spawn[station] += speed_multiplier
-            station.prune_visual_effects(host.time_ms)
+        _SPAWNING.tick_stations(host, speed_multiplier, schedule)
 
         station_nodes_dict = get_graph_builder()(host.stations, host.paths)
         for path in host.paths:
@@ -170,14 +102,23 @@ class PassengerFlow:
                         metro.current_station,
                         station_nodes_dict,
                     )
-                should_stop_at_next_station = host.should_stop_at_next_station(
-                    metro, station_nodes_dict
-                )
-                path.move_metro(
-                    metro,
-                    scaled_dt_ms,
-                    should_stop_at_next_station=should_stop_at_next_station,
-                )
+                if host.exact_metro_kinematics:
+                    path.advance_metro(
+                        metro,
+                        scaled_dt_ms,
+                        should_stop_at_next_station=lambda item: (
+                            host.should_stop_at_next_station(item, station_nodes_dict)
+                        ),
+                    )
+                else:
+                    should_stop_at_next_station = host.should_stop_at_next_station(
+                        metro, station_nodes_dict
+                    )
+                    path.move_metro(
+                        metro,
+                        scaled_dt_ms,
+                        should_stop_at_next_station=should_stop_at_next_station,
+                    )
                 if metro.just_arrived_and_stopped and metro.current_station is not None:
                     host.start_station_stop_if_needed(
                         metro,
@@ -429,13 +370,20 @@ class PassengerFlow:
         get_best_path_finder: Resolver,
         get_search: Resolver,
         get_plan_factory: Resolver,
+        get_reducer: Resolver | None = None,
+        get_route_outcomes: Resolver | None = None,
     ) -> None:
+        shape_type = passenger.destination_shape.type
         node_path = get_best_path_finder()(
             station,
-            host.get_stations_for_shape_type(passenger.destination_shape.type),
+            host.get_stations_for_shape_type(shape_type),
             station_nodes_dict,
             find_node_path=lambda start, end: get_search()(start, end),
-            get_reduce_node_path=lambda: host.skip_stations_on_same_path,
+            get_reduce_node_path=get_reducer
+            or (lambda: host.skip_stations_on_same_path),
+            outcomes=None
+            if get_route_outcomes is None
+            else get_route_outcomes()(station, shape_type, station_nodes_dict),
         )
         if node_path is not None and len(node_path) == 1:
             station.remove_passenger(passenger)
@@ -448,20 +396,6 @@ class PassengerFlow:
         else:
             host.travel_plans[passenger] = get_plan_factory()([])
 
-    def update_waiting_and_game_over(self, host: PassengerFlowHost, dt_ms: int) -> None:
-        if host.is_game_over:
-            return
-
-        waiting_over_limit = 0
-        for station in host.stations:
-            for passenger in station.passengers:
-                passenger.wait_ms += dt_ms
-                if passenger.wait_ms >= host.passenger_max_wait_time_ms:
-                    waiting_over_limit += 1
-
-        if waiting_over_limit >= host.overdue_passenger_threshold:
-            host.is_game_over = True
-
     def find_travel_plan_for_passengers(
         self,
         host: PassengerFlowHost,
@@ -470,6 +404,8 @@ class PassengerFlow:
         get_bulk_iterator: Resolver,
         get_search: Resolver,
         get_plan_factory: Resolver,
+        get_reducer: Resolver | None = None,
+        get_route_outcomes: Resolver | None = None,
     ) -> None:
         station_nodes_dict = get_graph_builder()(host.stations, host.paths)
         for station, rider, route, kind in get_bulk_iterator()(
@@ -480,7 +416,13 @@ class PassengerFlow:
             ),
             node_map=station_nodes_dict,
             find_node_path=lambda start, end: get_search()(start, end),
-            get_reduce_node_path=lambda: host.skip_stations_on_same_path,
+            get_reduce_node_path=get_reducer
+            or (lambda: host.skip_stations_on_same_path),
+            get_route_outcomes=None
+            if get_route_outcomes is None
+            else lambda item_station, item: get_route_outcomes()(
+                item_station, item.destination_shape.type, station_nodes_dict
+            ),
         ):
             if kind == "arrival":
                 station.remove_passenger(rider)
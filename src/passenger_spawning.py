@@ -0,0 +1,141 @@
+"""Passenger spawning and the per-tick station and wait clocks around it."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from passenger_flow import PassengerFlowHost
+
+Resolver = Callable[[], Any]
+
+# A station's blips are pruned only while it holds some.
+_HOLDS_SNAP_BLIPS = attrgetter("snap_blips")
+
+
+class PassengerSpawning:
+    """Stateless spawn timing, spawning and clock upkeep over facade state."""
+
+    __slots__ = ()
+
+    def get_station_shape_types(self, host: PassengerFlowHost) -> list[Any]:
+        return list(dict.fromkeys(station.shape.type for station in host.stations))
+
+    def is_passenger_spawn_time(
+        self, host: PassengerFlowHost, schedule: Any | None = None
+    ) -> bool:
+        due = None if schedule is None else schedule.is_spawn_time()
+        if due is not None:
+            return due
+        return any(
+            host.should_spawn_passenger_at_station(station) for station in host.stations
+        )
+
+    def initialize_station_spawning_state(
+        self, host: PassengerFlowHost, stations: list[Any]
+    ) -> None:
+        for station in stations:
+            if station not in host.station_spawn_interval_steps:
+                host.station_spawn_interval_steps[station] = (
+                    host.get_station_spawn_interval_step()
+                )
+            if station not in host.station_steps_since_last_spawn:
+                host.station_steps_since_last_spawn[station] = (
+                    host.station_spawn_interval_steps[station]
+                )
+
+    def get_station_spawn_interval_step(self, host: PassengerFlowHost) -> int:
+        min_interval = max(1, int(host.passenger_spawning_interval_step * 0.7))
+        max_interval = max(
+            min_interval, int(host.passenger_spawning_interval_step * 1.3)
+        )
+        return host.context.python_random.randint(min_interval, max_interval)
+
+    def should_spawn_passenger_at_station(
+        self, host: PassengerFlowHost, station: Any
+    ) -> bool:
+        host.initialize_station_spawning_state([station])
+        return (
+            host.steps == host.passenger_spawning_step
+            or host.station_steps_since_last_spawn[station]
+            >= host.station_spawn_interval_steps[station]
+        )
+
+    def spawn_passengers(
+        self,
+        host: PassengerFlowHost,
+        *,
+        get_passenger_factory: Resolver,
+        get_shape_factory: Resolver,
+        get_passenger_color: Resolver,
+        get_passenger_size: Resolver,
+        schedule: Any | None = None,
+    ) -> None:
+        # The schedule narrows the stations asked to the due ones, in the same
+        # order, so the destination draws come out of the RNG unchanged.
+        due = None if schedule is None else schedule.due_stations()
+        station_types = host.get_station_shape_types()
+        for station in host.stations if due is None else due:
+            if not host.should_spawn_passenger_at_station(station):
+                continue
+            other_station_shape_types = [
+                shape_type
+                for shape_type in station_types
+                if shape_type != station.shape.type
+            ]
+            destination_shape_type = host.context.python_random.choice(
+                other_station_shape_types
+            )
+            destination_shape = get_shape_factory()(
+                destination_shape_type,
+                get_passenger_color(),
+                get_passenger_size(),
+            )
+            passenger = get_passenger_factory()(destination_shape)
+            if station.has_room():
+                station.add_passenger(passenger)
+                host.passengers.append(passenger)
+            host.station_steps_since_last_spawn[station] = 0
+
+    def tick_stations(
+        self, host: PassengerFlowHost, steps: int, schedule: Any | None = None
+    ) -> None:
+        """Count the live stations `steps` on and prune their expired blips."""
+
+        if schedule is None:
+            host.initialize_station_spawning_state(host.stations)
+            for station in host.stations:
+                host.station_steps_since_last_spawn[station] += steps
+                station.prune_visual_effects(host.time_ms)
+            return
+        # A ready schedule already holds every live station's spawn state, and
+        # counts them all up by moving its one clock.
+        if not schedule.is_ready():
+            host.initialize_station_spawning_state(host.stations)
+        for station in filter(_HOLDS_SNAP_BLIPS, host.stations):
+            station.prune_visual_effects(host.time_ms)
+        schedule.advance(steps)
+
+    def update_waiting_and_game_over(
+        self, host: PassengerFlowHost, dt_ms: int, clock: Any | None = None
+    ) -> None:
+        if host.is_game_over:
+            return
+
+        waiting_over_limit = (
+            None
+            if clock is None
+            else clock.advance(host.stations, dt_ms, host.passenger_max_wait_time_ms)
+        )
+        if waiting_over_limit is None:
+            waiting_over_limit = 0
+            for station in host.stations:
+                for passenger in station.passengers:
+                    passenger.wait_ms += dt_ms
+                    if passenger.wait_ms >= host.passenger_max_wait_time_ms:
+                        waiting_over_limit += 1
+
+        if waiting_over_limit >= host.overdue_passenger_threshold:
+            host.is_game_over = True
@@ -0,0 +1,69 @@
+"""Dependency-light validation and dispatch for line player actions."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class PathActionInput:
+    """Stateless create, buy, remove and replace line action dispatch."""
+
+    __slots__ = ()
+
+    def apply_action(
+        self,
+        host: Any,
+        action: dict[str, Any],
+        action_type: str,
+    ) -> bool | None:
+        if action_type == "create_path":
+            stations = action.get("stations", [])
+            loop = action.get("loop", False)
+            if type(loop) is not bool:
+                return False
+            return host.create_path_from_station_indices(stations, loop) is not None
+        if action_type == "buy_line":
+            button_idx = action.get("path_index")
+            if button_idx is not None and type(button_idx) is not int:
+                return False
+            return host.try_purchase_path_button_by_index(button_idx)
+        if action_type == "remove_path":
+            if "path_id" in action:
+                return host.remove_path_by_id(action["path_id"])
+            if "path_index" in action:
+                return host.remove_path_by_index(action["path_index"])
+            return False
+        if action_type == "replace_path":
+            has_path_id = "path_id" in action
+            has_path_index = "path_index" in action
+            if has_path_id == has_path_index:
+                return False
+
+            stations = action.get("stations")
+            if (
+                type(stations) is not list
+                or len(stations) < 2
+                or any(
+                    type(station_index) is not int
+                    or station_index < 0
+                    or station_index >= len(host.stations)
+                    for station_index in stations
+                )
+            ):
+                return False
+
+            loop = action.get("loop", False)
+            if type(loop) is not bool:
+                return False
+
+            if has_path_id:
+                path_id = action["path_id"]
+                if type(path_id) is not str or not path_id:
+                    return False
+                return host.replace_path_by_id(path_id, stations, loop)
+
+            path_index = action["path_index"]
+            if type(path_index) is not int:
+                return False
+            return host.replace_path_by_index(path_index, stations, loop)
+        return None
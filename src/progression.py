@@ -1,6 +1,26 @@
 """Line, station, and economy progression state and pure policy."""
 
 from collections.abc import Sequence
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class ProgressionField(Generic[T]):
+    """A facade attribute read from and written to the host's `_progression`."""
+
+    __slots__ = ("name",)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, host: Any, owner: type | None = None) -> Any:
+        if host is None:
+            return self
+        return getattr(host._progression, self.name)
+
+    def __set__(self, host: Any, value: T) -> None:
+        setattr(host._progression, self.name, value)
 
 
 class NetworkProgression:
@@ -592,7 +592,7 @@ class SemanticMetroEnv(gym.Env):
             seed = self._default_seed
         if seed is None:
             seed = int(self.np_random.integers(0, 2**31 - 1))
-        self._mediator = Mediator(seed=seed)
+        self._mediator = Mediator(seed=seed, headless=True)
         self._seed = seed
         self._decision = 0
         self._last_deliveries = 0
@@ -630,8 +630,12 @@ class SemanticMetroEnv(gym.Env):
         chosen = int(np.asarray(action).ravel()[0])
         kind = ACTION_TABLE[chosen][0]
         applied = self._apply(chosen)
-        for _ in range(TICKS_PER_DECISION):
-            mediator.increment_time(16)
+        # Tick-exact, but the ticks in which nothing can happen are coasted.
+        elapsed_ms = 0
+        while elapsed_ms < TICKS_PER_DECISION * 16:
+            elapsed_ms += mediator.advance_until_event(
+                TICKS_PER_DECISION * 16 - elapsed_ms
+            )
         self._decision += 1
         # Record when each line came into being, so the age gate has something
         # to measure. Keyed by object identity because indices shift on removal.
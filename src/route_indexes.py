@@ -0,0 +1,214 @@
+"""Caches and indexes the route planner reads through, kept per topology.
+
+`RouteMemo` holds the route outcomes of each (origin, destination shape)
+query, `PathIndex` the paths serving each station and each path by id, and
+`StationShapeIndex` the live stations of each shape type. Each is rebuilt
+or dropped when what it was built from changes, so a query answered through
+one gets the answer the plain scan would give.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from operator import attrgetter
+from typing import Any
+
+# (hops, route, stops): `route` is the found node path when it has at most one
+# node and its reduced transfer plan otherwise, with `stops` its length. The
+# memo stores `route` as a tuple.
+RouteOutcome = tuple[int, Any, int]
+RouteOutcomes = MutableMapping[Any, RouteOutcome]
+
+
+class RouteMemo:
+    """Route outcomes per (origin, destination shape), for one topology version.
+
+    Most ticks change no topology, so the same origins keep asking for the
+    same destination shapes. The winner cannot be cached outright: the
+    destination list is reshuffled by the game RNG on every query and ties
+    fall to that order. What is cached instead is each destination's outcome
+    under the (origin, shape) entry, and the planners re-pick the winner over
+    the live order from those -- no search or reduction, same answer.
+
+    Entries are keyed with the topology version they were found under and
+    all of them are dropped when it moves. At most `capacity` (origin,
+    shape) entries are kept, least recently used evicted first. `hits` and
+    `misses` count destination outcomes served and computed.
+    """
+
+    __slots__ = ("capacity", "hits", "misses", "_version", "_entries")
+
+    def __init__(self, capacity: int = 512) -> None:
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._version: object = None
+        self._entries: OrderedDict[tuple[Any, Any, object], RouteOutcomes] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def outcomes(self, origin: Any, shape_type: Any, version: object) -> RouteOutcomes:
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+        key = (origin, shape_type, version)
+        entries = self._entries
+        outcomes = entries.get(key)
+        if outcomes is None:
+            outcomes = entries[key] = _CountingOutcomes(self)
+            if len(entries) > self.capacity:
+                entries.popitem(last=False)
+        else:
+            entries.move_to_end(key)
+        return outcomes
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class _CountingOutcomes(dict[Any, RouteOutcome]):
+    __slots__ = ("_memo",)
+
+    def __init__(self, memo: RouteMemo) -> None:
+        super().__init__()
+        self._memo = memo
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        outcome = super().get(key)
+        if outcome is None:
+            self._memo.misses += 1
+            return default
+        self._memo.hits += 1
+        return outcome
+
+
+class PathIndex:
+    """Which paths serve each station, and each path by id, over the live list.
+
+    `find_shared_path` and `get_path_by_id` run per passenger per service
+    action, and both used to scan every path (the former with two `in`
+    checks on each station list). The index answers the first with a
+    frozenset intersection, ranked by list position so the earliest shared
+    path still wins, and the second with a dict lookup.
+
+    The Mediator rebuilds it after every edit that can touch a path or its
+    station list: line create, draft extension, finish and abort, replace
+    and remove, each rollback included. Queries also compare, like
+    `StationGraph`'s path keys, the list and each path's station list by
+    identity and length against what the index was built from, so a list
+    rebound by a load or fork and a line edited in place (`add_station`)
+    are caught without walking any station list.
+    """
+
+    __slots__ = ("_paths", "_length", "_keys", "_by_station", "_by_id", "_position")
+
+    def __init__(self) -> None:
+        self._paths: list[Any] | None = None
+        self._length = 0
+        # (paths, their station lists, those lists' lengths) as last indexed.
+        self._keys: tuple[tuple[Any, ...], ...] = ((), (), ())
+        self._by_station: dict[Any, frozenset[Any]] = {}
+        self._by_id: dict[Any, Any] = {}
+        self._position: dict[Any, int] = {}
+
+    def _sync(self, paths: list[Any]) -> None:
+        # Tuple comparison tries identity first, so an unchanged list costs
+        # three short C-level passes.
+        keys = self._keys
+        if paths is not self._paths or len(paths) != self._length:
+            self.rebuild(paths)
+            return
+        station_lists = tuple(map(_STATIONS, paths))
+        if (
+            tuple(paths) != keys[0]
+            or station_lists != keys[1]
+            or tuple(map(len, station_lists)) != keys[2]
+        ):
+            self.rebuild(paths)
+
+    def shared_path(
+        self, paths: list[Any], station_a: Any, station_b: Any
+    ) -> Any | None:
+        self._sync(paths)
+        by_station = self._by_station
+        shared = by_station.get(station_a, _NO_PATHS) & by_station.get(
+            station_b, _NO_PATHS
+        )
+        if not shared:
+            return None
+        if len(shared) == 1:
+            return next(iter(shared))
+        return min(shared, key=self._position.__getitem__)
+
+    def path_by_id(self, paths: list[Any], path_id: str) -> Any | None:
+        self._sync(paths)
+        path = self._by_id.get(path_id)
+        if path is not None and path.id == path_id:
+            return path
+        # Ids are writable, so a renamed path is found by the scan it replaced.
+        for path in paths:
+            if path.id == path_id:
+                return path
+        return None
+
+    def rebuild(self, paths: list[Any]) -> None:
+        by_station: dict[Any, list[Any]] = {}
+        by_id: dict[Any, Any] = {}
+        position: dict[Any, int] = {}
+        for idx, path in enumerate(paths):
+            position.setdefault(path, idx)
+            by_id.setdefault(path.id, path)
+            for station in path.stations:
+                by_station.setdefault(station, []).append(path)
+        self._by_station = {
+            station: frozenset(served) for station, served in by_station.items()
+        }
+        self._by_id = by_id
+        self._position = position
+        self._paths = paths
+        self._length = len(paths)
+        station_lists = tuple(map(_STATIONS, paths))
+        self._keys = (tuple(paths), station_lists, tuple(map(len, station_lists)))
+
+
+_NO_PATHS: frozenset[Any] = frozenset()
+_STATIONS = attrgetter("stations")
+
+
+class StationShapeIndex:
+    """Live stations grouped by shape type, each group in station-list order.
+
+    Every plan query asks for the stations of one destination shape, which
+    used to filter the whole station list. A group copy holds the same
+    stations in the same order as that filter, so shuffling it draws the
+    same random numbers and lands on the same order.
+
+    The groups are rebuilt on unlock, and whenever the list they were built
+    from is rebound or changes length; the station list is otherwise only
+    grown or replaced wholesale, never edited in place.
+    """
+
+    __slots__ = ("_stations", "_length", "_by_shape")
+
+    def __init__(self) -> None:
+        self._stations: list[Any] | None = None
+        self._length = 0
+        self._by_shape: dict[Any, list[Any]] = {}
+
+    def stations_for(self, stations: list[Any], shape_type: object) -> list[Any]:
+        if stations is not self._stations or len(stations) != self._length:
+            self.rebuild(stations)
+        group = self._by_shape.get(shape_type)
+        return [] if group is None else group.copy()
+
+    def rebuild(self, stations: list[Any]) -> None:
+        by_shape: dict[Any, list[Any]] = {}
+        for station in stations:
+            by_shape.setdefault(station.shape.type, []).append(station)
+        self._by_shape = by_shape
+        self._stations = stations
+        self._length = len(stations)
@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections.abc import Callable, Iterable, Iterator, Mapping, MutableSequence
 from typing import Any, Literal
 
+from route_indexes import RouteOutcome, RouteOutcomes
+
 RouteProposalKind = Literal["arrival", "route", "fallback"]
 
 
@@ -65,6 +67,33 @@ class RoutePlanner:
             node_path.remove(node)
         return node_path
 
+    def _route_outcome(
+        self,
+        start: Any,
+        end: Any,
+        destination_station: Any,
+        outcomes: RouteOutcomes | None,
+        find_node_path: Callable[[Any, Any], list[Any]],
+        get_reduce_node_path: Callable[[], Callable[[list[Any]], list[Any]]],
+    ) -> RouteOutcome:
+        if outcomes is not None:
+            cached = outcomes.get(destination_station)
+            if cached is not None:
+                return cached[0], list(cached[1]), cached[2]
+        node_path = find_node_path(start, end)
+        hops = len(node_path)
+        if hops <= 1:
+            route, stops = node_path, hops
+        else:
+            route = get_reduce_node_path()(list(node_path))
+            stops = len(route)
+        if outcomes is not None:
+            # A slice copy, so callers own every list they are handed, a cached
+            # route never outlives the query that found it, and the route is
+            # not measured again (`tuple` and `list` read its length).
+            outcomes[destination_station] = (hops, route[:], stops)
+        return hops, route, stops
+
     def find_best_node_path(
         self,
         start_station: Any,
@@ -73,6 +102,7 @@ class RoutePlanner:
         *,
         find_node_path: Callable[[Any, Any], list[Any]],
         get_reduce_node_path: Callable[[], Callable[[list[Any]], list[Any]]],
+        outcomes: RouteOutcomes | None = None,
     ) -> list[Any] | None:
         selections = self._iter_best_node_path_selections(
             start_station,
@@ -80,6 +110,7 @@ class RoutePlanner:
             node_map,
             find_node_path=find_node_path,
             get_reduce_node_path=get_reduce_node_path,
+            outcomes=outcomes,
         )
         try:
             node_path, _arrived = next(selections)
@@ -95,6 +126,7 @@ class RoutePlanner:
         *,
         find_node_path: Callable[[Any, Any], list[Any]],
         get_reduce_node_path: Callable[[], Callable[[list[Any]], list[Any]]],
+        outcomes: RouteOutcomes | None = None,
     ) -> Iterator[tuple[list[Any] | None, bool]]:
         best_node_path: list[Any] | None = None
         best_path_cost: tuple[int, int] | None = None
@@ -115,13 +147,20 @@ class RoutePlanner:
                 end = node_map[destination_station]
             except KeyError:
                 continue
-            node_path = find_node_path(start, end)
-            if len(node_path) == 1:
-                yield node_path, True
+            hops, found, stops = self._route_outcome(
+                start,
+                end,
+                destination_station,
+                outcomes,
+                find_node_path,
+                get_reduce_node_path,
+            )
+            if hops == 1:
+                yield found, True
                 return
-            if len(node_path) > 1:
-                reduced_node_path = get_reduce_node_path()(list(node_path))
-                candidate_cost = (len(node_path), len(reduced_node_path))
+            if hops > 1:
+                reduced_node_path = found
+                candidate_cost = (hops, stops)
                 if best_path_cost is None or candidate_cost < best_path_cost:
                     best_path_cost = candidate_cost
                     best_node_path = reduced_node_path
@@ -138,9 +177,76 @@ class RoutePlanner:
         get_reduce_node_path: Callable[[], Callable[[list[Any]], list[Any]]],
         get_find_shared_path: Callable[[], Callable[[Any, Any], Any | None]],
         get_plan_factory: Callable[[], Callable[[list[Any]], Any]],
+        outcomes: RouteOutcomes | None = None,
     ) -> Any | None:
         best_node_path: list[Any] | None = None
         best_path_cost: tuple[int, int] | None = None
+        for candidate_cost, reduced_node_path in self._iter_first_path_routes(
+            start_station,
+            destination_stations,
+            node_map,
+            get_required_first_path_id=get_required_first_path_id,
+            find_node_path=find_node_path,
+            get_reduce_node_path=get_reduce_node_path,
+            get_find_shared_path=get_find_shared_path,
+            outcomes=outcomes,
+        ):
+            if best_path_cost is None or candidate_cost < best_path_cost:
+                best_path_cost = candidate_cost
+                best_node_path = reduced_node_path
+
+        if best_node_path is None:
+            return None
+        travel_plan = get_plan_factory()(best_node_path[1:])
+        next_station = travel_plan.get_next_station()
+        if next_station is None:
+            return None
+        travel_plan.next_path = get_find_shared_path()(start_station, next_station)
+        return travel_plan
+
+    def has_travel_plan_starting_with_path(
+        self,
+        start_station: Any,
+        destination_stations: Iterable[Any],
+        node_map: Mapping[Any, Any],
+        *,
+        get_required_first_path_id: Callable[[], str],
+        find_node_path: Callable[[Any, Any], list[Any]],
+        get_reduce_node_path: Callable[[], Callable[[list[Any]], list[Any]]],
+        get_find_shared_path: Callable[[], Callable[[Any, Any], Any | None]],
+        outcomes: RouteOutcomes | None = None,
+    ) -> bool:
+        """Whether `get_travel_plan_starting_with_path` would find a plan.
+
+        Any route it accepts makes one, so the destinations may come in any
+        order and no plan is built.
+        """
+
+        for _ in self._iter_first_path_routes(
+            start_station,
+            destination_stations,
+            node_map,
+            get_required_first_path_id=get_required_first_path_id,
+            find_node_path=find_node_path,
+            get_reduce_node_path=get_reduce_node_path,
+            get_find_shared_path=get_find_shared_path,
+            outcomes=outcomes,
+        ):
+            return True
+        return False
+
+    def _iter_first_path_routes(
+        self,
+        start_station: Any,
+        destination_stations: Iterable[Any],
+        node_map: Mapping[Any, Any],
+        *,
+        get_required_first_path_id: Callable[[], str],
+        find_node_path: Callable[[Any, Any], list[Any]],
+        get_reduce_node_path: Callable[[], Callable[[list[Any]], list[Any]]],
+        get_find_shared_path: Callable[[], Callable[[Any, Any], Any | None]],
+        outcomes: RouteOutcomes | None,
+    ) -> Iterator[tuple[tuple[int, int], list[Any]]]:
         # Deliberately unguarded. A review measured zero origin misses across
         # 24 instrumented episodes -- the origin is always a metro's current
         # station and the station list only grows -- and an absent origin is a
@@ -154,11 +260,15 @@ class RoutePlanner:
                 end = node_map[destination_station]
             except KeyError:
                 continue
-            node_path = find_node_path(start, end)
-            if len(node_path) <= 1:
-                continue
-            reduced_node_path = get_reduce_node_path()(list(node_path))
-            if len(reduced_node_path) <= 1:
+            hops, reduced_node_path, stops = self._route_outcome(
+                start,
+                end,
+                destination_station,
+                outcomes,
+                find_node_path,
+                get_reduce_node_path,
+            )
+            if hops <= 1 or stops <= 1:
                 continue
             first_hop_path = get_find_shared_path()(
                 start_station, reduced_node_path[1].station
@@ -168,19 +278,7 @@ class RoutePlanner:
                 or first_hop_path.id != get_required_first_path_id()
             ):
                 continue
-            candidate_cost = (len(node_path), len(reduced_node_path))
-            if best_path_cost is None or candidate_cost < best_path_cost:
-                best_path_cost = candidate_cost
-                best_node_path = reduced_node_path
-
-        if best_node_path is None:
-            return None
-        travel_plan = get_plan_factory()(best_node_path[1:])
-        next_station = travel_plan.get_next_station()
-        if next_station is None:
-            return None
-        travel_plan.next_path = get_find_shared_path()(start_station, next_station)
-        return travel_plan
+            yield (hops, stops), reduced_node_path
 
     def update_next_path_for_plan(
         self,
@@ -226,12 +324,18 @@ class RoutePlanner:
         node_map: Mapping[Any, Any],
         find_node_path: Callable[[Any, Any], list[Any]],
         get_reduce_node_path: Callable[[], Callable[[list[Any]], list[Any]]],
+        get_route_outcomes: Callable[[Any, Any], RouteOutcomes | None] | None = None,
     ) -> Iterator[tuple[Any, Any, list[Any] | None, RouteProposalKind]]:
         for station in stations:
             for passenger in station.passengers:
                 if has_travel_plan(passenger):
                     continue
                 destination_stations = get_destination_stations(passenger)
+                outcomes = (
+                    None
+                    if get_route_outcomes is None
+                    else get_route_outcomes(station, passenger)
+                )
                 best_node_path: list[Any] | None = None
                 best_path_cost: tuple[int, int] | None = None
                 for destination_station in destination_stations:
@@ -245,14 +349,21 @@ class RoutePlanner:
                         end = node_map[destination_station]
                     except KeyError:
                         continue
-                    node_path = find_node_path(start, end)
-                    if len(node_path) == 1:
-                        yield station, passenger, node_path, "arrival"
+                    hops, found, stops = self._route_outcome(
+                        start,
+                        end,
+                        destination_station,
+                        outcomes,
+                        find_node_path,
+                        get_reduce_node_path,
+                    )
+                    if hops == 1:
+                        yield station, passenger, found, "arrival"
                         best_node_path = None
                         break
-                    elif len(node_path) > 1:
-                        reduced_node_path = get_reduce_node_path()(list(node_path))
-                        candidate_cost = (len(node_path), len(reduced_node_path))
+                    elif hops > 1:
+                        reduced_node_path = found
+                        candidate_cost = (hops, stops)
                         if best_path_cost is None or candidate_cost < best_path_cost:
                             best_path_cost = candidate_cost
                             best_node_path = reduced_node_path
@@ -7,6 +7,9 @@ v3 the tunnel-upgrade bonus, GM-10h; v4 a held week boundary's pendingOffers,
 GM-10i); save_game writes its canonical ASCII
 bytes through a save-local mkstemp -> fsync -> os.replace atomic writer, so a
 failed save leaves the destination untouched and no temporary file behind.
+capture_game and save_document split that same save at the document, so the
+cheap detached capture can stay on the game thread while validation, encoding
+and the write happen elsewhere (the autosave worker).
 """
 
 from __future__ import annotations
@@ -29,7 +32,14 @@ from save_schema import (
     validate_save,
 )
 
-__all__ = ["serialize_game", "save_game", "deserialize_game", "load_game"]
+__all__ = [
+    "capture_game",
+    "serialize_game",
+    "save_document",
+    "save_game",
+    "deserialize_game",
+    "load_game",
+]
 
 
 def _require_serializable_map(mediator: Any) -> tuple[str, int]:
@@ -296,11 +306,13 @@ def _spawn_timer_records(mediator: Any) -> list[list[Any]]:
     return records
 
 
-def serialize_game(mediator: Any) -> dict[str, Any]:
-    """Capture one strict v4 save document (map identity + tunnel-upgrade bonus + a held
-    week boundary's pendingOffers) without mutating the Mediator; rejects a below-config
-    fleet, an unreachable tunnel bonus, or a pool-illegal/malformed pending offer BEFORE
-    the atomic write (GM-10h/GM-10i)."""
+def capture_game(mediator: Any) -> dict[str, Any]:
+    """Copy the boundary-checked save fields into a detached plain document.
+
+    Every guard of serialize_game runs here, but schema validation does not:
+    the result shares nothing with the live Mediator, so it can be validated
+    and written later on another thread while the game keeps playing.
+    """
 
     _require_valid_upgrade_state(mediator)
     _require_valid_pending_offers(mediator)
@@ -363,7 +375,16 @@ def serialize_game(mediator: Any) -> dict[str, Any]:
             "numpy": mediator.context.numpy_random.bit_generator.state,
         },
     }
-    document = safe_checkpoint_value(raw)
+    return safe_checkpoint_value(raw)
+
+
+def serialize_game(mediator: Any) -> dict[str, Any]:
+    """Capture one strict v4 save document (map identity + tunnel-upgrade bonus + a held
+    week boundary's pendingOffers) without mutating the Mediator; rejects a below-config
+    fleet, an unreachable tunnel bonus, or a pool-illegal/malformed pending offer BEFORE
+    the atomic write (GM-10h/GM-10i)."""
+
+    document = capture_game(mediator)
     validate_save(document)
     return document
 
@@ -371,7 +392,14 @@ def serialize_game(mediator: Any) -> dict[str, Any]:
 def save_game(mediator: Any, path: Any) -> FilesystemPath:
     """Serialize and atomically write canonical save bytes to ``path``."""
 
-    payload = canonical_save_bytes(serialize_game(mediator))
+    return save_document(capture_game(mediator), path)
+
+
+def save_document(document: dict[str, Any], path: Any) -> FilesystemPath:
+    """Validate a captured document and atomically write its canonical bytes."""
+
+    validate_save(document)
+    payload = canonical_save_bytes(document)
     destination = FilesystemPath(path)
     destination.parent.mkdir(parents=True, exist_ok=True)
     descriptor, temporary_name = tempfile.mkstemp(
@@ -36,7 +36,7 @@ from save_schema import (
     validate_save,
 )
 from travel_plan import TravelPlan
-from utils import get_shape_from_type
+from utils import get_shape_from_type, get_shared_shape
 
 __all__ = ["deserialize_game", "load_game"]
 
@@ -91,10 +91,7 @@ def _restore_rng(mediator: Mediator, rng: dict[str, Any]) -> None:
         raise ValueError(f"save load rng state is not restorable: {error}") from error
 
 
-def _restore_stations(
-    mediator: Mediator, document: dict[str, Any]
-) -> dict[str, Station]:
-    stations_by_id: dict[str, Station] = {}
+def _station_pool(document: dict[str, Any]) -> list[Station]:
     pool: list[Station] = []
     for record in document["stations"]:
         shape = get_shape_from_type(
@@ -109,8 +106,14 @@ def _restore_stations(
             (time_ms, tuple(color)) for time_ms, color in record["snapBlips"]
         ]
         pool.append(station)
-        stations_by_id[station.id] = station
-    mediator.all_stations = pool
+    return pool
+
+
+def _restore_stations(
+    mediator: Mediator, document: dict[str, Any]
+) -> dict[str, Station]:
+    pool = mediator.all_stations
+    stations_by_id = {station.id: station for station in pool}
     mediator.stations = pool[: document["unlockedNumStations"]]
     steps_since: dict[Station, int] = {}
     intervals: dict[Station, int] = {}
@@ -163,7 +166,7 @@ def _restore_passengers(
     passengers_by_id: dict[str, Passenger] = {}
     riders: list[Passenger] = []
     for record in document["passengers"]:
-        shape = get_shape_from_type(
+        shape = get_shared_shape(
             ShapeType(record["destinationShapeType"]), passenger_color, passenger_size
         )
         passenger = Passenger(shape)
@@ -365,17 +368,18 @@ def _require_legal_map_state(mediator: Any, map_def: Any) -> None:
         )
 
 
-def deserialize_game(document: Any) -> Mediator:
+def deserialize_game(document: Any, *, trusted: bytes | None = None) -> Mediator:
     """Reconstruct one Mediator from a validated v1/v2/v3/v4 save document.
 
     v2 adds the map identity (GM-09f), v3 the fleet/tunnel upgrade totals (GM-10h), and
     v4 a HELD week-boundary offer (GM-10i) -- restored so a mid-offer Continue re-enters
     the modal. Older shapes load unchanged (synthesizing classic@1 / a 0 bonus / no
-    pending boundary), so the byte-frozen fixtures stay valid."""
+    pending boundary), so the byte-frozen fixtures stay valid. A `trusted` seal from
+    `seal_save` skips re-validating a document this process already validated."""
 
     from maps import resolve_map
 
-    validate_save(document)
+    validate_save(document, trusted=trusted)
     coerced = safe_checkpoint_value(document)
     _require_running_config(coerced)
     # v2 records the map identity; a v1 doc (no map keys) synthesizes classic@1, so the
@@ -384,7 +388,11 @@ def deserialize_game(document: Any) -> Mediator:
     map_definition = resolve_map(
         coerced.get("mapId", "classic"), coerced.get("mapDefinitionVersion", 1)
     )
-    mediator = Mediator(seed=0, map_definition=map_definition)
+    # The pool goes in through the constructor, which would otherwise draw a
+    # random one only for this loader to replace it.
+    mediator = Mediator(
+        seed=0, map_definition=map_definition, station_pool=_station_pool(coerced)
+    )
     # Every construction-time draw precedes this overwrite.
     _restore_rng(mediator, coerced["rng"])
     stations_by_id = _restore_stations(mediator, coerced)
@@ -450,5 +458,4 @@ def load_game(path: Any) -> Mediator:
         document = json.loads(payload, object_pairs_hook=_reject_duplicate_keys)
     except json.JSONDecodeError as error:
         raise ValueError(f"save file is not valid JSON: {error}") from error
-    validate_save(document)
     return deserialize_game(document)
@@ -9,8 +9,11 @@ Record-section and reference validation lives in ``save_schema_records``.
 
 from __future__ import annotations
 
+import hashlib
 import json
-from typing import Any
+import marshal
+import os
+from typing import Any, Callable
 
 from offers import OfferKind
 from recursive_checkpoint_schema import safe_checkpoint_value
@@ -353,9 +356,73 @@ def _validate_rng(document: dict[str, Any]) -> None:
         _fail("rng.numpy.uinteger", "is outside the 32-bit cache domain")
 
 
-def validate_save(document: Any) -> None:
-    """Strictly validate one save document; any rejection raises ValueError."""
+def validate_save(document: Any, *, trusted: bytes | None = None) -> None:
+    """Strictly validate one save document; any rejection raises ValueError.
 
+    A well-formed document is accepted by the validator compiled once for its
+    schema version (``save_schema_compiled``); anything that validator doubts
+    is re-checked by the interpreted section validators, which own every
+    rejection message. ``trusted`` opts an internal round trip out of
+    validation: a ``seal_save`` seal that still matches the document's exact
+    content skips it, and any other value validates in full.
+    """
+
+    if trusted is not None and _seal_of(document) == trusted:
+        return
+    if type(document) is dict:
+        version = document.get("schemaVersion")
+        if (
+            type(version) is int
+            and version in SUPPORTED_SAVE_SCHEMA_VERSIONS
+            and _compiled_validator(version)(document)
+        ):
+            return
+    _validate_interpreted(document)
+
+
+def seal_save(document: Any) -> bytes:
+    """Validate one save document and return its seal for ``trusted`` loads.
+
+    The seal is a BLAKE2b digest of the document's exact marshalled content,
+    keyed per process, so it vouches only for documents this process
+    validated and cannot be forged or carried over from a file.
+    """
+
+    validate_save(document)
+    seal = _seal_of(document)
+    if seal is None:
+        raise ValueError("save document holds values that cannot be sealed")
+    return seal
+
+
+# Fresh per process (a forked child inherits its parent's, with its seals).
+_SEAL_KEY = os.urandom(32)
+
+
+def _seal_of(document: Any) -> bytes | None:
+    # marshal format 2 spells every exact type and value, containers in
+    # order, and never back-references by object identity.
+    try:
+        payload = marshal.dumps(document, 2)
+    except ValueError:
+        return None
+    return hashlib.blake2b(payload, key=_SEAL_KEY, digest_size=16).digest()
+
+
+_COMPILED_VALIDATORS: dict[int, Callable[[Any], bool]] = {}
+
+
+def _compiled_validator(version: int) -> Callable[[Any], bool]:
+    validator = _COMPILED_VALIDATORS.get(version)
+    if validator is None:
+        # Deferred: the compiled module reads this module's schema tables.
+        from save_schema_compiled import compile_save_validator
+
+        validator = _COMPILED_VALIDATORS[version] = compile_save_validator(version)
+    return validator
+
+
+def _validate_interpreted(document: Any) -> None:
     if type(document) is not dict:
         raise ValueError("save document must be an object")
     try:
@@ -0,0 +1,412 @@
+"""Compiled fast path for ``save_schema.validate_save``.
+
+The interpreted validators build a coerced copy of the document, call a
+helper per field, and format a label for every value they check, valid or
+not. ``compile_save_validator(version)`` resolves everything that depends
+only on the schema version once -- the exact key sets, the pause and offer
+vocabularies, which additive sections apply -- and returns a predicate that
+walks a document in one flattened pass with plain type tests, building no
+labels and no copy.
+
+The predicate only ever says "valid". On any doubt -- a failed check, an
+exception, or a value the coercion would have rewritten, such as a tuple, a
+NumPy scalar or a non-finite float -- it returns False and ``validate_save``
+runs the interpreted validators, which accept what they always accepted and
+raise exactly the message they always raised. The fast path can therefore
+make validation cheaper but can never change its outcome; every check here
+mirrors one in ``save_schema`` or ``save_schema_records``. The entity
+record sections live in ``save_schema_compiled_records``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from save_schema import (
+    _GAME_SPEED_MULTIPLIERS,
+    _NUMPY_BIT_GENERATOR,
+    _NUMPY_RNG_KEYS,
+    _NUMPY_RNG_STATE_KEYS,
+    _OFFER_KIND_VALUES,
+    _PATH_BUTTON_KEYS,
+    _PCG64_STATE_BOUND,
+    _PYTHON_RNG_INDEX_MAX,
+    _PYTHON_RNG_VERSION,
+    _PYTHON_RNG_WORD_BOUND,
+    _PYTHON_RNG_WORDS,
+    _RNG_KEYS,
+    _UINT32_BOUND,
+    SAVE_RULES_VERSION,
+    SAVE_SCHEMA_VERSION_V2,
+    SAVE_SCHEMA_VERSION_V3,
+    SAVE_SCHEMA_VERSION_V4,
+    SAVE_STATE_CONTRACT,
+    _pause_reason_vocabulary_for,
+    _top_level_keys_for,
+)
+from save_schema_compiled_records import (
+    _color,
+    _nonnegative,
+    _number,
+    _plain_id,
+    _positive,
+    _strings,
+    accepts_metro_records,
+    accepts_passenger_records,
+    accepts_path_records,
+    accepts_station_records,
+)
+from save_schema_records import _NODE_KEYS, _TRAVEL_PLAN_KEYS
+
+
+def _sorted(values: list) -> bool:
+    return all(a <= b for a, b in zip(values, values[1:]))
+
+
+def compile_save_validator(version: int) -> Callable[[Any], bool]:
+    """Build the one-pass acceptance test for documents of one schema version."""
+
+    keys = _top_level_keys_for(version)
+    vocabulary = _pause_reason_vocabulary_for(version)
+    map_identity = version in (
+        SAVE_SCHEMA_VERSION_V2,
+        SAVE_SCHEMA_VERSION_V3,
+        SAVE_SCHEMA_VERSION_V4,
+    )
+    tunnel_bonus = version in (SAVE_SCHEMA_VERSION_V3, SAVE_SCHEMA_VERSION_V4)
+    pending_offers = version == SAVE_SCHEMA_VERSION_V4
+
+    def header(document: dict[str, Any]) -> bool:
+        contract = document["stateContract"]
+        rules = document["rulesVersion"]
+        if type(contract) is not str or contract != SAVE_STATE_CONTRACT:
+            return False
+        if type(rules) is not str or rules != SAVE_RULES_VERSION:
+            return False
+        if map_identity:
+            map_id = document["mapId"]
+            if type(map_id) is not str or not map_id or not map_id.isascii():
+                return False
+            if any(character.isspace() for character in map_id):
+                return False
+            if not _positive(document["mapDefinitionVersion"]):
+                return False
+        return not tunnel_bonus or _nonnegative(document["tunnelBonus"])
+
+    def scalars(document: dict[str, Any]) -> bool:
+        for key in (
+            "timeMs",
+            "steps",
+            "passengerSpawningStep",
+            "passengerSpawningIntervalStep",
+            "passengerMaxWaitTimeMs",
+            "overduePassengerThreshold",
+            "numMetros",
+            "numCarriages",
+            "deliveries",
+            "lineCredits",
+        ):
+            if not _nonnegative(document[key]):
+                return False
+        speed = document["gameSpeedMultiplier"]
+        if type(speed) is not int or speed not in _GAME_SPEED_MULTIPLIERS:
+            return False
+        if type(document["isGameOver"]) is not bool:
+            return False
+        reasons = document["pauseReasons"]
+        if not _strings(reasons) or not set(reasons) <= vocabulary:
+            return False
+        if any(left >= right for left, right in zip(reasons, reasons[1:])):
+            return False
+        if not pending_offers:
+            return True
+        kinds = document["pendingOffers"]
+        if not _strings(kinds) or not set(kinds) <= _OFFER_KIND_VALUES:
+            return False
+        week_held = "week" in reasons
+        if len(set(kinds)) != len(kinds) or bool(kinds) != week_held:
+            return False
+        return not (week_held and document["isGameOver"] is True)
+
+    def progression(document: dict[str, Any]) -> bool:
+        num_paths = document["numPaths"]
+        num_stations = document["numStations"]
+        initial = document["initialNumStations"]
+        purchased = document["purchasedNumPaths"]
+        unlocked_paths = document["unlockedNumPaths"]
+        unlocked_stations = document["unlockedNumStations"]
+        if not (
+            _positive(num_paths)
+            and _positive(num_stations)
+            and _positive(initial)
+            and _positive(purchased)
+            and _positive(unlocked_paths)
+            and _positive(unlocked_stations)
+        ):
+            return False
+        if initial > num_stations:
+            return False
+        if unlocked_paths != min(max(1, purchased), num_paths):
+            return False
+        path_milestones = document["pathUnlockMilestones"]
+        if type(path_milestones) is not list or len(path_milestones) != num_paths:
+            return False
+        if not all(map(_nonnegative, path_milestones)) or not _sorted(path_milestones):
+            return False
+        prices = document["pathPurchasePrices"]
+        if type(prices) is not list or not all(type(p) is int for p in prices):
+            return False
+        if prices != [
+            path_milestones[index] - path_milestones[index - 1]
+            for index in range(1, num_paths)
+        ]:
+            return False
+        milestones = document["stationUnlockMilestones"]
+        if type(milestones) is not list or len(milestones) != num_stations - initial:
+            return False
+        if not all(map(_nonnegative, milestones)) or not _sorted(milestones):
+            return False
+        deliveries = document["deliveries"]
+        reached = sum(1 for milestone in milestones if deliveries >= milestone)
+        return unlocked_stations == min(initial + reached, num_stations)
+
+    def references(
+        document: dict[str, Any],
+        station_ids: list[str],
+        passenger_ids: list[str],
+        path_ids: list[str],
+        metro_ids: list[str],
+    ) -> bool:
+        station_pool = set(station_ids)
+        active_pool = set(station_ids[: document["unlockedNumStations"]])
+        passenger_pool = set(passenger_ids)
+        path_pool = set(path_ids)
+        metro_pool = set(metro_ids)
+        owner_by_metro: dict[str, str] = {}
+        stations_by_path: dict[str, set[str]] = {}
+        for record in document["paths"]:
+            route = record["stationIds"]
+            if not active_pool.issuperset(route):
+                return False
+            stations_by_path[record["id"]] = set(route)
+            for metro in record["metroIds"]:
+                if metro not in metro_pool or metro in owner_by_metro:
+                    return False
+                owner_by_metro[metro] = record["id"]
+        riders: list[str] = []
+        for record in document["stations"]:
+            riders.extend(record["waitingPassengerIds"])
+        for record in document["metros"]:
+            path_id = record["pathId"]
+            if path_id not in path_pool or owner_by_metro.get(record["id"]) != path_id:
+                return False
+            current = record["currentStationId"]
+            if current is not None and (
+                current not in active_pool or current not in stations_by_path[path_id]
+            ):
+                return False
+            action = record["serviceAction"]
+            if action is not None and action["passengerId"] is not None:
+                if action["passengerId"] not in passenger_pool:
+                    return False
+            riders.extend(record["onboardPassengerIds"])
+        # Every live passenger is located exactly once, and nobody else is.
+        if len(riders) != len(passenger_pool) or set(riders) != passenger_pool:
+            return False
+        plans = document["travelPlans"]
+        if type(plans) is not dict:
+            return False
+        for key, plan in plans.items():
+            if not _plain_id(key, "Passenger-") or key not in passenger_pool:
+                return False
+            if type(plan) is not dict or plan.keys() != _TRAVEL_PLAN_KEYS:
+                return False
+            next_path = plan["nextPathId"]
+            if next_path is not None and (
+                type(next_path) is not str or next_path not in path_pool
+            ):
+                return False
+            next_station = plan["nextStationId"]
+            if next_station is not None and (
+                type(next_station) is not str or next_station not in station_pool
+            ):
+                return False
+            nodes = plan["nodePath"]
+            cursor = plan["nextStationIdx"]
+            if type(nodes) is not list or not _nonnegative(cursor):
+                return False
+            if (nodes and cursor >= len(nodes)) or (not nodes and cursor != 0):
+                return False
+            for node in nodes:
+                if type(node) is not dict or node.keys() != _NODE_KEYS:
+                    return False
+                station = node["stationId"]
+                if type(station) is not str or station not in station_pool:
+                    return False
+                node_paths = node["pathIds"]
+                if not _strings(node_paths) or not path_pool.issuperset(node_paths):
+                    return False
+                if len(set(node_paths)) != len(node_paths):
+                    return False
+        return True
+
+    def colors(document: dict[str, Any]) -> bool:
+        pairs = document["pathColors"]
+        if type(pairs) is not list or len(pairs) != document["numPaths"]:
+            return False
+        flags: dict[tuple[float, ...], bool] = {}
+        for pair in pairs:
+            if type(pair) is not list or len(pair) != 2 or not _color(pair[0]):
+                return False
+            color = tuple(map(float, pair[0]))
+            if color in flags or type(pair[1]) is not bool:
+                return False
+            flags[color] = pair[1]
+        path_colors = {
+            record["id"]: tuple(map(float, record["color"]))
+            for record in document["paths"]
+        }
+        assigned: dict[str, tuple[float, ...]] = {}
+        entries = document["pathToColor"]
+        if type(entries) is not list:
+            return False
+        for pair in entries:
+            if type(pair) is not list or len(pair) != 2:
+                return False
+            identifier = pair[0]
+            if type(identifier) is not str or identifier not in path_colors:
+                return False
+            if identifier in assigned or not _color(pair[1]):
+                return False
+            color = tuple(map(float, pair[1]))
+            if color != path_colors[identifier] or not flags.get(color, False):
+                return False
+            assigned[identifier] = color
+        values = list(assigned.values())
+        taken = {color for color, flag in flags.items() if flag}
+        return (
+            set(assigned) == set(path_colors)
+            and len(set(values)) == len(values)
+            and taken == set(values)
+        )
+
+    def spawn_timers(document: dict[str, Any], station_ids: list[str]) -> bool:
+        entries = document["spawnTimers"]
+        if type(entries) is not list:
+            return False
+        pool = set(station_ids)
+        seen: set[str] = set()
+        for entry in entries:
+            if type(entry) is not list or len(entry) != 3:
+                return False
+            identifier = entry[0]
+            if type(identifier) is not str or identifier not in pool:
+                return False
+            if identifier in seen:
+                return False
+            seen.add(identifier)
+            if not _nonnegative(entry[1]) or not _positive(entry[2]):
+                return False
+        return seen == pool
+
+    def buttons(document: dict[str, Any]) -> bool:
+        records = document["pathButtons"]
+        if type(records) is not list or len(records) != document["numPaths"]:
+            return False
+        unlocked = document["unlockedNumPaths"]
+        for index, record in enumerate(records):
+            if type(record) is not dict or record.keys() != _PATH_BUTTON_KEYS:
+                return False
+            locked = record["isLocked"]
+            if type(locked) is not bool or locked != (index >= unlocked):
+                return False
+            blink = record["unlockBlinkStartTimeMs"]
+            if blink is not None and not _nonnegative(blink):
+                return False
+        return True
+
+    def rng(document: dict[str, Any]) -> bool:
+        state = document["rng"]
+        if type(state) is not dict or state.keys() != _RNG_KEYS:
+            return False
+        python_state = state["python"]
+        if type(python_state) is not list or len(python_state) != 3:
+            return False
+        rng_version, words, gauss = python_state
+        if type(rng_version) is not int or rng_version != _PYTHON_RNG_VERSION:
+            return False
+        if type(words) is not list or len(words) != _PYTHON_RNG_WORDS:
+            return False
+        if set(map(type, words)) != {int}:
+            return False
+        body = words[:-1]
+        if min(body) < 0 or max(body) >= _PYTHON_RNG_WORD_BOUND:
+            return False
+        if not 0 <= words[-1] <= _PYTHON_RNG_INDEX_MAX:
+            return False
+        if gauss is not None and not _number(gauss):
+            return False
+        numpy_state = state["numpy"]
+        if type(numpy_state) is not dict or numpy_state.keys() != _NUMPY_RNG_KEYS:
+            return False
+        generator = numpy_state["bit_generator"]
+        if type(generator) is not str or generator != _NUMPY_BIT_GENERATOR:
+            return False
+        inner = numpy_state["state"]
+        if type(inner) is not dict or inner.keys() != _NUMPY_RNG_STATE_KEYS:
+            return False
+        for key in ("state", "inc"):
+            value = inner[key]
+            if type(value) is not int or not 0 <= value < _PCG64_STATE_BOUND:
+                return False
+        has_uint32 = numpy_state["has_uint32"]
+        if type(has_uint32) is not int or has_uint32 not in (0, 1):
+            return False
+        cached = numpy_state["uinteger"]
+        return type(cached) is int and 0 <= cached < _UINT32_BOUND
+
+    def accepts(document: Any) -> bool:
+        if type(document) is not dict or document.keys() != keys:
+            return False
+        schema_version = document["schemaVersion"]
+        if type(schema_version) is not int or schema_version != version:
+            return False
+        if not (
+            header(document)
+            and scalars(document)
+            and progression(document)
+            and rng(document)
+        ):
+            return False
+        station_ids: list[str] = []
+        passenger_ids: list[str] = []
+        path_ids: list[str] = []
+        metro_ids: list[str] = []
+        carriage_ids: list[str] = []
+        if not (
+            accepts_station_records(document, station_ids)
+            and accepts_passenger_records(document, passenger_ids)
+            and accepts_path_records(document, path_ids)
+            and accepts_metro_records(document, metro_ids, carriage_ids)
+        ):
+            return False
+        # One registry spans every entity ID, carriages included.
+        registry = station_ids + passenger_ids + path_ids + metro_ids + carriage_ids
+        if len(set(registry)) != len(registry):
+            return False
+        return (
+            references(document, station_ids, passenger_ids, path_ids, metro_ids)
+            and colors(document)
+            and spawn_timers(document, station_ids)
+            and buttons(document)
+        )
+
+    def accepts_or_doubts(document: Any) -> bool:
+        try:
+            return accepts(document)
+        except Exception:
+            # A shape the checks above did not anticipate: let the
+            # interpreted validators decide and word the rejection.
+            return False
+
+    return accepts_or_doubts
@@ -0,0 +1,249 @@
+"""Compiled fast-path checks for the station, passenger, path and metro records.
+
+Split out of ``save_schema_compiled`` to keep both modules under the size
+budget. Each check mirrors one in ``save_schema_records`` and only ever
+says "valid"; ``compile_save_validator`` composes them with the header, RNG
+and cross-reference checks, and anything they doubt goes to the interpreted
+validators.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from save_schema_records import (
+    _CARRIAGE_KEYS,
+    _METRO_KEYS,
+    _PASSENGER_KEYS,
+    _PATH_KEYS,
+    _PATH_ORDER_BOUND,
+    _SERVICE_ACTION_KEYS,
+    _SERVICE_ACTION_KINDS,
+    _SHAPE_TYPE_VALUES,
+    _SHORTUUID_ALPHABET,
+    _SHORTUUID_LENGTH,
+    _STATION_KEYS,
+    _STATION_SHAPE_BY_LITERAL,
+)
+
+_STATION_PREFIX = "Station-"
+
+
+def _nonnegative(value: Any) -> bool:
+    return type(value) is int and value >= 0
+
+
+def _positive(value: Any) -> bool:
+    return type(value) is int and value > 0
+
+
+def _number(value: Any) -> bool:
+    # Exact int or finite float: a bool is not a number, and a non-finite
+    # float is what the coercion would have turned into an object.
+    kind = type(value)
+    return kind is int or (kind is float and value - value == 0.0)
+
+
+def _point(value: Any) -> bool:
+    return (
+        type(value) is list
+        and len(value) == 2
+        and _number(value[0])
+        and _number(value[1])
+    )
+
+
+def _color(value: Any) -> bool:
+    return (
+        type(value) is list
+        and len(value) == 3
+        and _number(value[0])
+        and _number(value[1])
+        and _number(value[2])
+    )
+
+
+def _strings(value: Any) -> bool:
+    return type(value) is list and all(type(item) is str for item in value)
+
+
+def _token(token: str) -> bool:
+    return len(token) == _SHORTUUID_LENGTH and set(token) <= _SHORTUUID_ALPHABET
+
+
+def _plain_id(value: Any, prefix: str) -> bool:
+    return (
+        type(value) is str and value.startswith(prefix) and _token(value[len(prefix) :])
+    )
+
+
+def _station_shape(value: Any) -> str | None:
+    if type(value) is not str or not value.startswith(_STATION_PREFIX):
+        return None
+    remainder = value[len(_STATION_PREFIX) :]
+    literal = remainder[_SHORTUUID_LENGTH:]
+    if not _token(remainder[:_SHORTUUID_LENGTH]) or not literal.startswith("-"):
+        return None
+    return _STATION_SHAPE_BY_LITERAL.get(literal[1:])
+
+
+def accepts_station_records(document: dict[str, Any], identifiers: list[str]) -> bool:
+    records = document["stations"]
+    if type(records) is not list or len(records) != document["numStations"]:
+        return False
+    unlocked = document["unlockedNumStations"]
+    for index, record in enumerate(records):
+        if type(record) is not dict or record.keys() != _STATION_KEYS:
+            return False
+        identifier = record["id"]
+        shape = _station_shape(identifier)
+        declared = record["shapeType"]
+        if shape is None or type(declared) is not str or declared != shape:
+            return False
+        identifiers.append(identifier)
+        active = record["active"]
+        if type(active) is not bool or active != (index < unlocked):
+            return False
+        if not (
+            _point(record["position"])
+            and _positive(record["capacity"])
+            and _strings(record["waitingPassengerIds"])
+        ):
+            return False
+        blink = record["unlockBlinkStartTimeMs"]
+        if blink is not None and not _nonnegative(blink):
+            return False
+        blips = record["snapBlips"]
+        if type(blips) is not list:
+            return False
+        for blip in blips:
+            if type(blip) is not list or len(blip) != 2:
+                return False
+            if not _nonnegative(blip[0]) or not _color(blip[1]):
+                return False
+    return True
+
+
+def accepts_passenger_records(document: dict[str, Any], identifiers: list[str]) -> bool:
+    records = document["passengers"]
+    if type(records) is not list:
+        return False
+    for record in records:
+        if type(record) is not dict or record.keys() != _PASSENGER_KEYS:
+            return False
+        identifier = record["id"]
+        if not _plain_id(identifier, "Passenger-"):
+            return False
+        identifiers.append(identifier)
+        shape = record["destinationShapeType"]
+        if type(shape) is not str or shape not in _SHAPE_TYPE_VALUES:
+            return False
+        if type(record["isAtDestination"]) is not bool:
+            return False
+        if not _nonnegative(record["waitMs"]):
+            return False
+    return True
+
+
+def accepts_path_records(document: dict[str, Any], identifiers: list[str]) -> bool:
+    records = document["paths"]
+    if type(records) is not list or len(records) > document["unlockedNumPaths"]:
+        return False
+    for record in records:
+        if type(record) is not dict or record.keys() != _PATH_KEYS:
+            return False
+        identifier = record["id"]
+        if not _plain_id(identifier, "Path-") or not _color(record["color"]):
+            return False
+        identifiers.append(identifier)
+        route = record["stationIds"]
+        if not _strings(route) or len(route) < 2:
+            return False
+        if any(left == right for left, right in zip(route, route[1:])):
+            return False
+        if not _strings(record["metroIds"]):
+            return False
+        looped = record["isLooped"]
+        if type(looped) is not bool or (looped and route[0] == route[-1]):
+            return False
+        order = record["pathOrder"]
+        if type(order) is not int or abs(order) > _PATH_ORDER_BOUND:
+            return False
+    return True
+
+
+def accepts_metro_records(
+    document: dict[str, Any], identifiers: list[str], carriage_ids: list[str]
+) -> bool:
+    records = document["metros"]
+    if type(records) is not list:
+        return False
+    for record in records:
+        if type(record) is not dict or record.keys() != _METRO_KEYS:
+            return False
+        identifier = record["id"]
+        if not _plain_id(identifier, "Metro-"):
+            return False
+        identifiers.append(identifier)
+        station = record["currentStationId"]
+        speed = record["speed"]
+        stop_time = record["stopTimeRemainingMs"]
+        progress = record["boardingProgressMs"]
+        interval = record["boardingTimePerPassengerMs"]
+        if not (
+            type(record["pathId"]) is str
+            and _point(record["position"])
+            and _nonnegative(record["currentSegmentIdx"])
+            and (station is None or type(station) is str)
+            and type(record["isForward"]) is bool
+            and _number(speed)
+            and speed >= 0
+            and _number(record["maxSpeed"])
+            and record["maxSpeed"] > 0
+            and _number(record["accelerationPerMs"])
+            and record["accelerationPerMs"] > 0
+            and _number(record["decelerationPerMs"])
+            and record["decelerationPerMs"] > 0
+            and _nonnegative(stop_time)
+            and _nonnegative(progress)
+            and _positive(interval)
+            and type(record["justArrivedAndStopped"]) is bool
+            and type(record["isUnassignmentQueued"]) is bool
+        ):
+            return False
+        action = record["serviceAction"]
+        if action is None:
+            if stop_time != 0 or progress != 0:
+                return False
+        else:
+            if type(action) is not dict or action.keys() != _SERVICE_ACTION_KEYS:
+                return False
+            kind = action["kind"]
+            rider = action["passengerId"]
+            if type(kind) is not str or kind not in _SERVICE_ACTION_KINDS:
+                return False
+            if rider is not None and type(rider) is not str:
+                return False
+            if station is None or speed != 0:
+                return False
+            if not 0 <= progress < interval or stop_time != interval - progress:
+                return False
+        capacity = record["baseCapacity"]
+        if not _nonnegative(capacity):
+            return False
+        carriages = record["carriages"]
+        if type(carriages) is not list:
+            return False
+        for carriage in carriages:
+            if type(carriage) is not dict or carriage.keys() != _CARRIAGE_KEYS:
+                return False
+            if not _plain_id(carriage["id"], "Carriage-"):
+                return False
+            carriage_ids.append(carriage["id"])
+            if not _positive(carriage["capacity"]):
+                return False
+            capacity += carriage["capacity"]
+        onboard = record["onboardPassengerIds"]
+        if not _strings(onboard) or len(onboard) > capacity:
+            return False
+    return True
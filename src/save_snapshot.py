@@ -0,0 +1,353 @@
+"""Compact binary snapshots of save documents.
+
+`canonical_save_bytes` spells a save document as sorted ASCII JSON -- about
+17 KB mid-game, most of it the Mersenne Twister state in decimal -- and
+reading it back is a JSON parse with a duplicate-key hook. A snapshot packs
+the same document into typed columns instead: int64 for counts, timers and
+milestones, float64 for positions, speeds and colors, uint32 for string
+references, lengths and RNG words, and a byte per flag, with every string
+stored once in an interned table. Fields go on the wire in one fixed order
+per record, mirroring the record builders in `save_game`, so no keys do.
+
+A number the schema lets be an int or a float carries a flag saying which,
+so `decode_snapshot(encode_snapshot(document))` equals the document and
+spells the same canonical bytes. The format is pinned to the current save
+schema version; a new save schema needs a new `SNAPSHOT_FORMAT_VERSION`.
+
+`snapshot_game` captures through `serialize_game` and `restore_game`
+rebuilds through `deserialize_game`, so a snapshot is validated exactly as a
+save is, and a malformed payload fails closed with ValueError.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from itertools import islice
+from typing import Any
+
+from mediator import Mediator
+from save_game import deserialize_game, serialize_game
+from save_schema import SAVE_SCHEMA_VERSION
+from save_snapshot_records import (
+    read_metro,
+    read_passenger,
+    read_path,
+    read_rng,
+    read_station,
+    read_travel_plan,
+    write_metro,
+    write_passenger,
+    write_path,
+    write_rng,
+    write_station,
+    write_travel_plan,
+)
+
+__all__ = [
+    "SNAPSHOT_FORMAT_VERSION",
+    "encode_snapshot",
+    "decode_snapshot",
+    "snapshot_game",
+    "restore_game",
+]
+
+SNAPSHOT_FORMAT_VERSION = 1
+_MAGIC = b"MMSS"
+# Magic, format version, save schema version, then the byte length of the
+# string table and the item counts of the int, float, word and flag columns.
+_HEADER = struct.Struct("<4sHHIIIII")
+_BIG_ENDIAN = sys.byteorder != "little"
+_STRING_SEPARATOR = "\x00"
+_WORD_MASK = 0xFFFFFFFF
+
+_SCALAR_STRINGS = ("stateContract", "rulesVersion", "mapId")
+_SCALAR_INTS = (
+    "mapDefinitionVersion",
+    "timeMs",
+    "steps",
+    "gameSpeedMultiplier",
+    "passengerSpawningStep",
+    "passengerSpawningIntervalStep",
+    "passengerMaxWaitTimeMs",
+    "overduePassengerThreshold",
+    "deliveries",
+    "lineCredits",
+    "purchasedNumPaths",
+    "unlockedNumPaths",
+    "unlockedNumStations",
+    "numPaths",
+    "numStations",
+    "initialNumStations",
+    "numMetros",
+    "numCarriages",
+    "tunnelBonus",
+)
+_INT_LISTS = ("pathPurchasePrices", "pathUnlockMilestones", "stationUnlockMilestones")
+_STRING_LISTS = ("pauseReasons", "pendingOffers")
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.table: dict[str, int] = {}
+        self.ints = array("q")
+        self.floats = array("d")
+        self.words = array("I")
+        self.flags = bytearray()
+
+    def string(self, value: str) -> None:
+        self.words.append(self.table.setdefault(value, len(self.table)))
+
+    def optional_string(self, value: str | None) -> None:
+        self.flags.append(value is not None)
+        if value is not None:
+            self.string(value)
+
+    def strings(self, values: list[str]) -> None:
+        self.words.append(len(values))
+        for value in values:
+            self.string(value)
+
+    def optional_int(self, value: int | None) -> None:
+        self.flags.append(value is not None)
+        if value is not None:
+            self.ints.append(value)
+
+    def ints_list(self, values: list[int]) -> None:
+        self.words.append(len(values))
+        self.ints.extend(values)
+
+    def number(self, value: int | float) -> None:
+        if type(value) is int:
+            self.flags.append(1)
+            self.ints.append(value)
+        else:
+            self.flags.append(0)
+            self.floats.append(value)
+
+    def numbers(self, values: list[int | float]) -> None:
+        for value in values:
+            self.number(value)
+
+    def wide(self, value: int) -> None:
+        # A 128-bit PCG64 word, least significant 32 bits first.
+        self.words.extend((value >> shift) & _WORD_MASK for shift in (0, 32, 64, 96))
+
+    def payload(self, schema_version: int) -> bytes:
+        strings = list(self.table)
+        if any(_STRING_SEPARATOR in value for value in strings):
+            raise ValueError("snapshot strings must not contain NUL")
+        table = _STRING_SEPARATOR.join(strings).encode("utf-8")
+        columns = [self.ints, self.floats, self.words]
+        if _BIG_ENDIAN:
+            for column in columns:
+                column.byteswap()
+        header = _HEADER.pack(
+            _MAGIC,
+            SNAPSHOT_FORMAT_VERSION,
+            schema_version,
+            len(table),
+            len(self.ints),
+            len(self.floats),
+            len(self.words),
+            len(self.flags),
+        )
+        return b"".join(
+            [header, table, *(column.tobytes() for column in columns), self.flags]
+        )
+
+
+class _Reader:
+    def __init__(self, payload: bytes) -> None:
+        if len(payload) < _HEADER.size:
+            raise ValueError("snapshot is truncated")
+        magic, version, schema, table, ints, floats, words, flags = _HEADER.unpack_from(
+            payload
+        )
+        if magic != _MAGIC:
+            raise ValueError("snapshot does not start with the snapshot magic")
+        if version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"snapshot format version {version} is unsupported")
+        if schema != SAVE_SCHEMA_VERSION:
+            raise ValueError(f"snapshot of save schema v{schema} is unsupported")
+        self.schema_version = schema
+        sizes = (table, ints * 8, floats * 8, words * 4, flags)
+        if len(payload) != _HEADER.size + sum(sizes):
+            raise ValueError("snapshot length disagrees with its header")
+        offset = _HEADER.size
+        spans = []
+        for size in sizes:
+            spans.append(payload[offset : offset + size])
+            offset += size
+        self.table = spans[0].decode("utf-8").split(_STRING_SEPARATOR)
+        columns = [array(code, span) for code, span in zip("qdI", spans[1:4])]
+        if _BIG_ENDIAN:
+            for column in columns:
+                column.byteswap()
+        self._iterators = [iter(column) for column in (*columns, spans[4])]
+        self.int, self.float, self.word, self.flag = (
+            iterator.__next__ for iterator in self._iterators
+        )
+
+    def string(self) -> str:
+        return self.table[self.word()]
+
+    def optional_string(self) -> str | None:
+        return self.table[self.word()] if self.flag() else None
+
+    def strings(self) -> list[str]:
+        table, word = self.table, self.word
+        return [table[word()] for _ in range(word())]
+
+    def optional_int(self) -> int | None:
+        return self.int() if self.flag() else None
+
+    def ints_list(self) -> list[int]:
+        return _take(self._iterators[0], self.word())
+
+    def words_list(self) -> list[int]:
+        return _take(self._iterators[2], self.word())
+
+    def number(self) -> int | float:
+        return self.int() if self.flag() else self.float()
+
+    def numbers(self, count: int) -> list[int | float]:
+        return [self.int() if self.flag() else self.float() for _ in range(count)]
+
+    def wide(self) -> int:
+        word = self.word
+        return word() | word() << 32 | word() << 64 | word() << 96
+
+    def bool(self) -> bool:
+        return self.flag() == 1
+
+    def require_consumed(self) -> None:
+        if any(next(iterator, None) is not None for iterator in self._iterators):
+            raise ValueError("snapshot holds more values than its document")
+
+
+def _take(iterator: Any, count: int) -> list[int]:
+    values = list(islice(iterator, count))
+    if len(values) != count:
+        raise ValueError("snapshot is truncated")
+    return values
+
+
+def _write_records(out: _Writer, writer: Any, records: list[Any]) -> None:
+    out.words.append(len(records))
+    for record in records:
+        writer(out, record)
+
+
+def _read_records(inp: _Reader, reader: Any) -> list[Any]:
+    return [reader(inp) for _ in range(inp.word())]
+
+
+def encode_snapshot(document: dict[str, Any]) -> bytes:
+    """Pack one valid save document, as `serialize_game` returns, into bytes.
+
+    Only the current save schema version is packed. The document is not
+    revalidated here; `restore_game` validates what it rebuilds."""
+
+    if document.get("schemaVersion") != SAVE_SCHEMA_VERSION:
+        raise ValueError(
+            f"snapshots pack save schema v{SAVE_SCHEMA_VERSION} documents only"
+        )
+    out = _Writer()
+    try:
+        for key in _SCALAR_STRINGS:
+            out.string(document[key])
+        for key in _SCALAR_INTS:
+            out.ints.append(document[key])
+        out.flags.append(document["isGameOver"])
+        for key in _INT_LISTS:
+            out.ints_list(document[key])
+        for key in _STRING_LISTS:
+            out.strings(document[key])
+        _write_records(out, write_station, document["stations"])
+        _write_records(out, write_passenger, document["passengers"])
+        _write_records(out, write_path, document["paths"])
+        _write_records(out, write_metro, document["metros"])
+        plans = document["travelPlans"]
+        out.words.append(len(plans))
+        for passenger_id, plan in plans.items():
+            out.string(passenger_id)
+            write_travel_plan(out, plan)
+        out.words.append(len(document["pathColors"]))
+        for color, taken in document["pathColors"]:
+            out.numbers(color)
+            out.flags.append(taken)
+        out.words.append(len(document["pathToColor"]))
+        for path_id, color in document["pathToColor"]:
+            out.string(path_id)
+            out.numbers(color)
+        out.words.append(len(document["spawnTimers"]))
+        for station_id, since, interval in document["spawnTimers"]:
+            out.string(station_id)
+            out.ints.append(since)
+            out.ints.append(interval)
+        out.words.append(len(document["pathButtons"]))
+        for button in document["pathButtons"]:
+            out.flags.append(button["isLocked"])
+            out.optional_int(button["unlockBlinkStartTimeMs"])
+        write_rng(out, document["rng"])
+    except (KeyError, TypeError, ValueError, OverflowError) as error:
+        raise ValueError(f"save document cannot be packed: {error!r}") from error
+    return out.payload(SAVE_SCHEMA_VERSION)
+
+
+def decode_snapshot(payload: bytes) -> dict[str, Any]:
+    """Unpack snapshot bytes back into the save document they were packed from."""
+
+    inp = _Reader(payload)
+    try:
+        document: dict[str, Any] = {"schemaVersion": inp.schema_version}
+        for key in _SCALAR_STRINGS:
+            document[key] = inp.string()
+        for key in _SCALAR_INTS:
+            document[key] = inp.int()
+        document["isGameOver"] = inp.bool()
+        for key in _INT_LISTS:
+            document[key] = inp.ints_list()
+        for key in _STRING_LISTS:
+            document[key] = inp.strings()
+        document["stations"] = _read_records(inp, read_station)
+        document["passengers"] = _read_records(inp, read_passenger)
+        document["paths"] = _read_records(inp, read_path)
+        document["metros"] = _read_records(inp, read_metro)
+        document["travelPlans"] = {
+            inp.string(): read_travel_plan(inp) for _ in range(inp.word())
+        }
+        document["pathColors"] = [
+            [inp.numbers(3), inp.bool()] for _ in range(inp.word())
+        ]
+        document["pathToColor"] = [
+            [inp.string(), inp.numbers(3)] for _ in range(inp.word())
+        ]
+        document["spawnTimers"] = [
+            [inp.string(), inp.int(), inp.int()] for _ in range(inp.word())
+        ]
+        document["pathButtons"] = [
+            {"isLocked": inp.bool(), "unlockBlinkStartTimeMs": inp.optional_int()}
+            for _ in range(inp.word())
+        ]
+        document["rng"] = read_rng(inp)
+    except (StopIteration, IndexError) as error:
+        raise ValueError("snapshot is truncated or references a missing string") from (
+            error
+        )
+    inp.require_consumed()
+    return document
+
+
+def snapshot_game(mediator: Any) -> bytes:
+    """Capture a quiescent game as snapshot bytes (`serialize_game` + pack)."""
+
+    return encode_snapshot(serialize_game(mediator))
+
+
+def restore_game(payload: bytes) -> Mediator:
+    """Rebuild a game from snapshot bytes (unpack + `deserialize_game`)."""
+
+    return deserialize_game(decode_snapshot(payload))
@@ -0,0 +1,189 @@
+"""Per-record field orders of the binary save snapshot.
+
+Split out of ``save_snapshot`` to keep both modules under the size budget.
+Each ``write_*`` puts one save record's fields on the columns of a
+``save_snapshot`` writer in a fixed order, mirroring the record builders in
+``save_game``, and its ``read_*`` takes them back off in the same order.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from save_snapshot import _Reader, _Writer
+
+
+def write_station(out: _Writer, record: dict[str, Any]) -> None:
+    out.string(record["id"])
+    out.numbers(record["position"])
+    out.string(record["shapeType"])
+    out.flags.append(record["active"])
+    out.ints.append(record["capacity"])
+    out.strings(record["waitingPassengerIds"])
+    out.optional_int(record["unlockBlinkStartTimeMs"])
+    out.words.append(len(record["snapBlips"]))
+    for time_ms, color in record["snapBlips"]:
+        out.ints.append(time_ms)
+        out.numbers(color)
+
+
+def read_station(inp: _Reader) -> dict[str, Any]:
+    return {
+        "id": inp.string(),
+        "position": inp.numbers(2),
+        "shapeType": inp.string(),
+        "active": inp.bool(),
+        "capacity": inp.int(),
+        "waitingPassengerIds": inp.strings(),
+        "unlockBlinkStartTimeMs": inp.optional_int(),
+        "snapBlips": [[inp.int(), inp.numbers(3)] for _ in range(inp.word())],
+    }
+
+
+def write_passenger(out: _Writer, record: dict[str, Any]) -> None:
+    out.string(record["id"])
+    out.string(record["destinationShapeType"])
+    out.flags.append(record["isAtDestination"])
+    out.ints.append(record["waitMs"])
+
+
+def read_passenger(inp: _Reader) -> dict[str, Any]:
+    return {
+        "id": inp.string(),
+        "destinationShapeType": inp.string(),
+        "isAtDestination": inp.bool(),
+        "waitMs": inp.int(),
+    }
+
+
+def write_path(out: _Writer, record: dict[str, Any]) -> None:
+    out.string(record["id"])
+    out.numbers(record["color"])
+    out.strings(record["stationIds"])
+    out.strings(record["metroIds"])
+    out.flags.append(record["isLooped"])
+    out.ints.append(record["pathOrder"])
+
+
+def read_path(inp: _Reader) -> dict[str, Any]:
+    return {
+        "id": inp.string(),
+        "color": inp.numbers(3),
+        "stationIds": inp.strings(),
+        "metroIds": inp.strings(),
+        "isLooped": inp.bool(),
+        "pathOrder": inp.int(),
+    }
+
+
+def write_metro(out: _Writer, record: dict[str, Any]) -> None:
+    out.string(record["id"])
+    out.string(record["pathId"])
+    out.numbers(record["position"])
+    out.ints.append(record["currentSegmentIdx"])
+    out.optional_string(record["currentStationId"])
+    out.flags.append(record["isForward"])
+    out.number(record["speed"])
+    out.number(record["maxSpeed"])
+    out.number(record["accelerationPerMs"])
+    out.number(record["decelerationPerMs"])
+    out.ints.append(record["stopTimeRemainingMs"])
+    out.ints.append(record["boardingProgressMs"])
+    out.ints.append(record["boardingTimePerPassengerMs"])
+    out.flags.append(record["justArrivedAndStopped"])
+    out.flags.append(record["isUnassignmentQueued"])
+    action = record["serviceAction"]
+    out.flags.append(action is not None)
+    if action is not None:
+        out.string(action["kind"])
+        out.optional_string(action["passengerId"])
+    out.ints.append(record["baseCapacity"])
+    out.words.append(len(record["carriages"]))
+    for carriage in record["carriages"]:
+        out.string(carriage["id"])
+        out.ints.append(carriage["capacity"])
+    out.strings(record["onboardPassengerIds"])
+
+
+def read_metro(inp: _Reader) -> dict[str, Any]:
+    return {
+        "id": inp.string(),
+        "pathId": inp.string(),
+        "position": inp.numbers(2),
+        "currentSegmentIdx": inp.int(),
+        "currentStationId": inp.optional_string(),
+        "isForward": inp.bool(),
+        "speed": inp.number(),
+        "maxSpeed": inp.number(),
+        "accelerationPerMs": inp.number(),
+        "decelerationPerMs": inp.number(),
+        "stopTimeRemainingMs": inp.int(),
+        "boardingProgressMs": inp.int(),
+        "boardingTimePerPassengerMs": inp.int(),
+        "justArrivedAndStopped": inp.bool(),
+        "isUnassignmentQueued": inp.bool(),
+        "serviceAction": (
+            {"kind": inp.string(), "passengerId": inp.optional_string()}
+            if inp.flag()
+            else None
+        ),
+        "baseCapacity": inp.int(),
+        "carriages": [
+            {"id": inp.string(), "capacity": inp.int()} for _ in range(inp.word())
+        ],
+        "onboardPassengerIds": inp.strings(),
+    }
+
+
+def write_travel_plan(out: _Writer, record: dict[str, Any]) -> None:
+    out.optional_string(record["nextPathId"])
+    out.optional_string(record["nextStationId"])
+    out.ints.append(record["nextStationIdx"])
+    out.words.append(len(record["nodePath"]))
+    for node in record["nodePath"]:
+        out.string(node["stationId"])
+        out.strings(node["pathIds"])
+
+
+def read_travel_plan(inp: _Reader) -> dict[str, Any]:
+    return {
+        "nextPathId": inp.optional_string(),
+        "nextStationId": inp.optional_string(),
+        "nextStationIdx": inp.int(),
+        "nodePath": [
+            {"stationId": inp.string(), "pathIds": inp.strings()}
+            for _ in range(inp.word())
+        ],
+    }
+
+
+def write_rng(out: _Writer, rng: dict[str, Any]) -> None:
+    version, words, gauss = rng["python"]
+    out.ints.append(version)
+    out.words.append(len(words))
+    out.words.extend(words)
+    out.flags.append(gauss is not None)
+    if gauss is not None:
+        out.number(gauss)
+    numpy_state = rng["numpy"]
+    out.string(numpy_state["bit_generator"])
+    out.wide(numpy_state["state"]["state"])
+    out.wide(numpy_state["state"]["inc"])
+    out.ints.append(numpy_state["has_uint32"])
+    out.ints.append(numpy_state["uinteger"])
+
+
+def read_rng(inp: _Reader) -> dict[str, Any]:
+    version = inp.int()
+    words = inp.words_list()
+    gauss = inp.number() if inp.flag() else None
+    return {
+        "python": [version, words, gauss],
+        "numpy": {
+            "bit_generator": inp.string(),
+            "state": {"state": inp.wide(), "inc": inp.wide()},
+            "has_uint32": inp.int(),
+            "uinteger": inp.int(),
+        },
+    }
@@ -0,0 +1,308 @@
+"""Passenger spawn timing as absolute steps on a clock that only ticks move.
+
+A live station spawns once the steps since its last spawn reach its sampled
+interval. Rather than count every live station up each tick, `SpawnSchedule`
+keeps one clock of ticked steps and, per live station, the clock reading of its
+last spawn; that reading plus the interval is the absolute step of its next
+spawn, and those steps sit in a heap. A tick moves the clock and nothing else.
+The steps since the last spawn, which the save, the checkpoints and the fork
+read, are derived on demand as `clock - (next step - interval)`.
+
+The clock is the schedule's own, not `steps`: a restored or edited `steps`
+leaves the counters alone, as it always did. A station outside `host.stations`
+is not counted up, so its counter is held as a plain count until it is live.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import MutableMapping
+from typing import Any, Iterator
+
+# Entries whose step is out of date stay in the heap until they reach the top
+# or until they outnumber the live ones this many times over.
+_COMPACT_RATIO = 2
+
+
+class SpawnTimers(dict):
+    """A station -> interval map that tells its schedule about every write."""
+
+    __slots__ = ("_schedule",)
+
+    def __init__(self, values: Any = (), schedule: SpawnSchedule | None = None):
+        super().__init__(values)
+        self._schedule = schedule
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Copies and pickles are plain maps, detached from the schedule.
+        return dict, (dict(self),)
+
+    def __setitem__(self, station: Any, steps: int) -> None:
+        super().__setitem__(station, steps)
+        if self._schedule is not None:
+            self._schedule.refresh(station)
+
+    def _changed(self) -> None:
+        if self._schedule is not None:
+            self._schedule.invalidate()
+
+    def __delitem__(self, station: Any) -> None:
+        super().__delitem__(station)
+        self._changed()
+
+    def __ior__(self, other: Any) -> SpawnTimers:
+        super().__ior__(other)
+        self._changed()
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self) -> tuple[Any, int]:
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, station: Any, default: Any = None) -> Any:
+        value = super().setdefault(station, default)
+        self._changed()
+        return value
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+
+class SpawnCounters(MutableMapping):
+    """The station -> steps since its last spawn map, read off its schedule."""
+
+    __slots__ = ("_schedule",)
+
+    def __init__(self, schedule: SpawnSchedule) -> None:
+        self._schedule = schedule
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return dict, (dict(self),)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def __getitem__(self, station: Any) -> int:
+        return self._schedule.since(station)
+
+    def __setitem__(self, station: Any, steps: int) -> None:
+        self._schedule.set_since(station, steps)
+
+    def __delitem__(self, station: Any) -> None:
+        self._schedule.drop_since(station)
+
+    def __contains__(self, station: object) -> bool:
+        return station in self._schedule.marks
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._schedule.marks)
+
+    def __len__(self) -> int:
+        return len(self._schedule.marks)
+
+
+class SpawnTimerField:
+    """A facade interval map, stored as `SpawnTimers` bound to `_spawn_schedule`."""
+
+    __slots__ = ("name",)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = f"_{name}"
+
+    def __get__(self, host: Any, owner: type | None = None) -> Any:
+        if host is None:
+            return self
+        return getattr(host, self.name)
+
+    def __set__(self, host: Any, value: Any) -> None:
+        schedule = host._spawn_schedule
+        setattr(host, self.name, SpawnTimers(value, schedule))
+        schedule.invalidate()
+
+
+class SpawnCounterField:
+    """The facade's steps-since-last-spawn map: `_spawn_schedule.counters`."""
+
+    __slots__ = ()
+
+    def __get__(self, host: Any, owner: type | None = None) -> Any:
+        if host is None:
+            return self
+        return host._spawn_schedule.counters
+
+    def __set__(self, host: Any, value: Any) -> None:
+        host._spawn_schedule.reset_counters(value)
+
+
+class SpawnSchedule:
+    """Heap of `(next spawn step, station order, station)` over the live stations.
+
+    Answers are None, leaving the caller to ask every station, whenever a live
+    station has no spawn state yet: asking is what samples its interval.
+    """
+
+    __slots__ = (
+        "_host",
+        "clock",
+        "marks",
+        "counters",
+        "_live",
+        "_stations",
+        "_length",
+        "_heap",
+        "_entries",
+        "_stale",
+    )
+
+    def __init__(self, host: Any) -> None:
+        self._host = host
+        self.clock = 0
+        # Station -> clock reading of its last spawn while live, otherwise the
+        # steps since that spawn.
+        self.marks: dict[Any, int] = {}
+        self.counters = SpawnCounters(self)
+        self._live: set[Any] = set()
+        self._stations: list[Any] | None = None
+        self._length = -1
+        self._heap: list[tuple[int, int, Any]] = []
+        # Live station -> [next spawn step, station order]; a heap entry is
+        # current while its step matches.
+        self._entries: dict[Any, list[int]] = {}
+        self._stale = True
+
+    def since(self, station: Any) -> int:
+        mark = self.marks[station]
+        return self.clock - mark if station in self._live else mark
+
+    def set_since(self, station: Any, steps: int) -> None:
+        self.marks[station] = self.clock - steps if station in self._live else steps
+        self.refresh(station)
+
+    def drop_since(self, station: Any) -> None:
+        del self.marks[station]
+        self.invalidate()
+
+    def reset_counters(self, values: Any) -> None:
+        values = dict(values)
+        self.marks.clear()
+        for station, steps in values.items():
+            self.marks[station] = self.clock - steps if station in self._live else steps
+        self.invalidate()
+
+    def advance(self, steps: int) -> None:
+        """Count every live station `steps` further from its last spawn."""
+
+        self._track()
+        self.clock += steps
+
+    def invalidate(self) -> None:
+        self._stale = True
+
+    def refresh(self, station: Any) -> None:
+        if self._stale:
+            return
+        entry = self._entries.get(station)
+        if entry is None:
+            # A station the heap left out may be live by now.
+            self._stale = station in self._live
+            return
+        mark = self.marks.get(station)
+        interval = self._host.station_spawn_interval_steps.get(station)
+        if mark is None or interval is None:
+            self._stale = True
+            return
+        step = mark + interval
+        if entry[0] != step:
+            entry[0] = step
+            heapq.heappush(self._heap, (step, entry[1], station))
+
+    def is_spawn_time(self) -> bool | None:
+        host = self._host
+        if not self.is_ready():
+            return None
+        if not host.stations:
+            return False
+        if host.steps == host.passenger_spawning_step:
+            return True
+        self._drop_stale_top()
+        return bool(self._heap) and self._heap[0][0] <= self.clock
+
+    def due_stations(self) -> list[Any] | None:
+        """The live stations due to spawn now, in station order."""
+
+        host = self._host
+        if not self.is_ready():
+            return None
+        if host.steps == host.passenger_spawning_step:
+            return list(host.stations)
+        self._drop_stale_top()
+        heap, entries, clock = self._heap, self._entries, self.clock
+        # Keyed by order: a station whose step left and came back has two
+        # current entries, and is still due only once.
+        found = {}
+        pending = [0] if heap else []
+        while pending:
+            index = pending.pop()
+            if index >= len(heap) or heap[index][0] > clock:
+                continue
+            step, order, station = heap[index]
+            if entries[station][0] == step:
+                found[order] = station
+            pending.extend((2 * index + 1, 2 * index + 2))
+        return [found[order] for order in sorted(found)]
+
+    def _track(self) -> None:
+        # Stations joining or leaving the live set swap the representation of
+        # their mark; the counter it stands for is unchanged.
+        stations = self._host.stations
+        if stations is self._stations and len(stations) == self._length:
+            return
+        live = set(stations)
+        marks, clock = self.marks, self.clock
+        for station in live.symmetric_difference(self._live):
+            if station in marks:
+                marks[station] = clock - marks[station]
+        self._live = live
+        self._stations = stations
+        self._length = len(stations)
+        self._stale = True
+
+    def is_ready(self) -> bool:
+        """Whether every live station has its spawn state, so answers exist."""
+
+        self._track()
+        if self._stale or len(self._heap) > _COMPACT_RATIO * len(self._entries) + 8:
+            return self._rebuild()
+        return True
+
+    def _rebuild(self) -> bool:
+        marks = self.marks
+        intervals = self._host.station_spawn_interval_steps
+        heap = []
+        for order, station in enumerate(self._host.stations):
+            mark = marks.get(station)
+            interval = intervals.get(station)
+            if mark is None or interval is None:
+                return False
+            heap.append((mark + interval, order, station))
+        heapq.heapify(heap)
+        self._heap = heap
+        self._entries = {station: [step, order] for step, order, station in heap}
+        self._stale = False
+        return True
+
+    def _drop_stale_top(self) -> None:
+        heap, entries = self._heap, self._entries
+        while heap and entries[heap[0][2]][0] != heap[0][0]:
+            heapq.heappop(heap)
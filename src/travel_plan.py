@@ -1,17 +1,49 @@
 from __future__ import annotations
 
-from typing import List
+from itertools import count
+from typing import Any, List
 
 from entity.path import Path
 from entity.station import Station
 from graph.node import Node
 
+# Revisions are drawn from one process-wide sequence, so two maps never share
+# a value and swapping one facade map for another always reads as a change.
+_revisions = count(1)
+
+
+class _Revision:
+    """One plan map's revision; the plans stored in the map hold it too."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = next(_revisions)
+
+    def bump(self) -> None:
+        self.value = next(_revisions)
+
 
 class TravelPlan:
+    __slots__ = ("next_path", "next_station", "node_path", "next_station_idx", "_maps")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        for revision in getattr(self, "_maps", ()):
+            revision.bump()
+
+    def __delattr__(self, name: str) -> None:
+        object.__delattr__(self, name)
+        for revision in getattr(self, "_maps", ()):
+            revision.bump()
+
     def __init__(
         self,
         node_path: List[Node],
     ) -> None:
+        # The revisions of the maps this plan was stored in: a write to the plan
+        # moves theirs and no other game's.
+        self._maps: tuple[_Revision, ...] = ()
         self.next_path: Path | None = None
         self.next_station: Station | None = None
         self.node_path = node_path
@@ -33,3 +65,98 @@ class TravelPlan:
         return (
             f"TravelPlan = get on {self.next_path}, then get off at {self.next_station}"
         )
+
+
+class TravelPlanMap(dict):
+    """A passenger -> plan map with a revision its own writes move.
+
+    A stored `TravelPlan` keeps a back-reference to the map's revision, so
+    writes to the plan move it too, and only it: one game's plan edits never
+    invalidate a decision cached over another game's map. `revision` is None
+    once anything but a `TravelPlan` was stored, since other plan objects
+    change unseen.
+    """
+
+    __slots__ = ("_opaque", "_revision")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._revision = _Revision()
+        self._opaque = False
+        for plan in self.values():
+            self._track(plan)
+
+    @property
+    def revision(self) -> int | None:
+        return None if self._opaque else self._revision.value
+
+    def touch(self) -> None:
+        """Move the revision after edits made around the map's own methods."""
+
+        self._revision.bump()
+
+    def _track(self, plan: Any) -> None:
+        if type(plan) is not TravelPlan:
+            self._opaque = True
+        elif self._revision not in plan._maps:
+            object.__setattr__(plan, "_maps", (*plan._maps, self._revision))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Copies and pickles are plain maps.
+        return dict, (dict(self),)
+
+    def __setitem__(self, passenger: Any, plan: Any) -> None:
+        super().__setitem__(passenger, plan)
+        self._track(plan)
+        self._revision.bump()
+
+    def __delitem__(self, passenger: Any) -> None:
+        super().__delitem__(passenger)
+        self._revision.bump()
+
+    def __ior__(self, other: Any) -> TravelPlanMap:
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._revision.bump()
+
+    def pop(self, *args: Any) -> Any:
+        plan = super().pop(*args)
+        self._revision.bump()
+        return plan
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = super().popitem()
+        self._revision.bump()
+        return item
+
+    def setdefault(self, passenger: Any, default: Any = None) -> Any:
+        if passenger not in self:
+            self[passenger] = default
+        return self[passenger]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for passenger, plan in dict(*args, **kwargs).items():
+            self[passenger] = plan
+
+
+class TravelPlanMapField:
+    """A facade's `travel_plans`, whose reassignment moves the map's revision.
+
+    Snapshot restores reassign the map and then refill it through `dict`
+    methods that bypass its own, so the reassignment is what marks it changed.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, host: Any, owner: type | None = None) -> Any:
+        if host is None:
+            return self
+        return host._travel_plans
+
+    def __set__(self, host: Any, value: Any) -> None:
+        host._travel_plans = value
+        if isinstance(value, TravelPlanMap):
+            value.touch()
@@ -1,10 +1,14 @@
-from abc import ABC, abstractmethod
+from __future__ import annotations
 
-import pygame
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from geometry.point import Point
 from geometry.shape import Shape
 
+if TYPE_CHECKING:
+    import pygame
+
 
 class Button(ABC):
     def __init__(self, shape: Shape) -> None:
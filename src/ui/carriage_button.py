@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Literal
-
-import pygame
+from typing import TYPE_CHECKING, Any, Literal
 
 from config import (
     button_size,
@@ -36,6 +34,9 @@ from geometry.point import Point
 from ui.button import Button
 from ui.path_button import PathButton
 
+if TYPE_CHECKING:
+    import pygame
+
 CarriageOperation = Literal["attach", "detach"]
 
 
@@ -95,6 +96,8 @@ class CarriageButton(Button):
         state: Any | None = None,
         resources: Any | None = None,
     ) -> None:
+        import pygame
+
         del current_time_ms, resources
         path = self._active_path(state) if state is not None else None
         enabled = self._is_enabled(state, path) if state is not None else False
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Literal
-
-import pygame
+from typing import TYPE_CHECKING, Any, Literal
 
 from config import (
     fleet_button_badge_color,
@@ -26,6 +24,9 @@ from geometry.point import Point
 from ui.button import Button
 from ui.path_button import PathButton
 
+if TYPE_CHECKING:
+    import pygame
+
 FleetOperation = Literal["assign", "unassign"]
 
 
@@ -94,6 +95,8 @@ class FleetButton(Button):
         state: Any | None = None,
         resources: Any | None = None,
     ) -> None:
+        import pygame
+
         del current_time_ms
         path = self._active_path(state) if state is not None else None
         enabled = self._is_enabled(state, path) if state is not None else False
@@ -1,6 +1,6 @@
-from typing import List
+from __future__ import annotations
 
-import pygame
+from typing import TYPE_CHECKING, List
 
 from config import (
     button_color,
@@ -24,6 +24,9 @@ from geometry.point import Point
 from geometry.shape import Shape
 from ui.button import Button
 
+if TYPE_CHECKING:
+    import pygame
+
 SELECTED_OUTLINE_COLOR = (25, 25, 25)
 INVALID_OUTLINE_COLOR = (215, 45, 45)
 SELECTION_OUTLINE_GAP = 5
@@ -105,6 +108,8 @@ class PathButton(Button):
     ) -> None:
         # reduced_motion (D-029) holds the unlock blink visible; default False
         # keeps the historical skip byte-exact.
+        import pygame
+
         if (
             not is_selected
             and current_time_ms is not None
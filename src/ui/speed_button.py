@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Literal
-
-import pygame
+from typing import TYPE_CHECKING, List, Literal
 
 from config import (
     speed_button_active_color,
@@ -18,6 +16,9 @@ from geometry.point import Point
 from geometry.rect import Rect
 from ui.button import Button
 
+if TYPE_CHECKING:
+    import pygame
+
 SpeedAction = Literal["pause", "speed_1", "speed_2", "speed_4"]
 
 
@@ -42,6 +43,8 @@ class SpeedButton(Button):
     def draw_pause_icon(
         self, surface: pygame.surface.Surface, rect: pygame.Rect
     ) -> None:
+        import pygame
+
         bar_width = 6
         bar_height = 18
         gap = 6
@@ -56,6 +59,8 @@ class SpeedButton(Button):
     def draw_play_icon(
         self, surface: pygame.surface.Surface, center_x: int, center_y: int
     ) -> None:
+        import pygame
+
         half_width = 5
         half_height = 7
         left = center_x - half_width
@@ -81,6 +86,8 @@ class SpeedButton(Button):
         current_time_ms: int | None = None,
         is_active: bool = False,
     ) -> None:
+        import pygame
+
         del current_time_ms  # Unused, kept for Button compatibility.
         left = int(self.position.left - speed_button_width / 2)
         top = int(self.position.top - speed_button_height / 2)
@@ -1,6 +1,7 @@
 import colorsys
+import importlib
 import random
-from typing import List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 import numpy as np
 
@@ -60,6 +61,30 @@ def pick_distinct_hue(existing_hues: List[float], candidate_hues: List[float]) -
     )
 
 
+def distinct_path_colors(
+    random_source: random.Random,
+    path_count: int,
+    to_rgb: Callable[..., Color] = hue_to_rgb,
+) -> Dict[Color, bool]:
+    """`path_count` line colors, each hue the farthest of 25 random draws."""
+
+    if path_count <= 0:
+        return {}
+    selected_hues: List[float] = [random_source.random()]
+    candidate_count = 24
+    while len(selected_hues) < path_count:
+        candidate_hues = [random_source.random() for _ in range(candidate_count)]
+        candidate_hues.append(random_source.random())
+        selected_hues.append(pick_distinct_hue(selected_hues, candidate_hues))
+    path_colors: Dict[Color, bool] = {}
+    for hue in selected_hues:
+        path_colors[to_rgb(hue, saturation=0.6, value=0.9)] = False
+    while len(path_colors) < path_count:
+        hue = random_source.random()
+        path_colors[to_rgb(hue, saturation=0.6, value=0.9)] = False
+    return path_colors
+
+
 def get_random_shape(
     shape_type_list: List[ShapeType],
     color: Color,
@@ -108,5 +133,58 @@ def get_shape_from_type(shape_type: ShapeType, color: Color, size: int) -> Shape
     raise ValueError(f"Unsupported shape type: {shape_type}")
 
 
+# Rider destination shapes, one per (type, color, size). Nothing moves, turns
+# or recolors a rider's shape, so every rider of a type can share one.
+_SHARED_SHAPES: dict[tuple[ShapeType, Color, int], Shape] = {}
+
+
+def get_shared_shape(shape_type: ShapeType, color: Color, size: int) -> Shape:
+    key = (shape_type, tuple(color), size)
+    shape = _SHARED_SHAPES.get(key)
+    if shape is None:
+        shape = get_shape_from_type(shape_type, color, size)
+        if isinstance(getattr(shape, "points", None), list):
+            shape.points = tuple(shape.points)
+        _SHARED_SHAPES[key] = shape
+    return shape
+
+
+def shared_shapes(factory: Callable[..., Shape]) -> Callable[..., Shape]:
+    """`get_shared_shape` in place of the stock shape factory, others as given."""
+
+    return get_shared_shape if factory is get_shape_from_type else factory
+
+
 def within_time_window(game_time_ms: int, time_mark_ms: int, window_ms: int) -> bool:
     return window_ms <= game_time_ms - time_mark_ms < (2 * window_ms)
+
+
+class LazyModule:
+    """Stands in for a module, importing it on the first attribute read.
+
+    Lets a module name a heavy dependency at top level, as a seam callers can
+    patch, without loading it until something is actually drawn or laid out.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(importlib.import_module(self._name), attribute)
+
+
+class Alias:
+    """A writable attribute that reads and writes another one on the same host."""
+
+    __slots__ = ("target",)
+
+    def __init__(self, target: str) -> None:
+        self.target = target
+
+    def __get__(self, host: Any, owner: type | None = None) -> Any:
+        if host is None:
+            return self
+        return getattr(host, self.target)
+
+    def __set__(self, host: Any, value: Any) -> None:
+        setattr(host, self.target, value)
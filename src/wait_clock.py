@@ -0,0 +1,205 @@
+"""Passenger waits measured against one clock instead of counted per tick.
+
+A passenger waiting at a live station stores the clock reading its wait
+started at, so its `wait_ms` is `now_ms - origin` and advancing every wait is
+one addition to `now_ms`. Those origins also order the waits: the passengers
+past `passenger_max_wait_time_ms` are the ones whose origin is at most
+`now_ms - max_wait`, found by popping a min-heap of origins as the clock moves.
+
+Station passenger lists are `HolderPassengers`, which report their changes;
+the clock reconciles the reported stations before it next moves, so anything
+that edits a list -- including the snapshot restores that write through
+`list` itself after reassigning it -- is seen before the waits it affects
+change. A station given a plain list is reconciled on every move instead.
+Stations or passengers of other types leave the clock unable to answer; the
+caller then counts the waits one by one, which the setter keeps consistent.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any
+
+# Entries whose origin is out of date stay in the heap until they reach the
+# top or until they outnumber the waiting passengers this many times over.
+_COMPACT_RATIO = 2
+
+
+class WaitClock:
+    """Wait origins of the passengers at the live stations, and their deadlines."""
+
+    __slots__ = (
+        "now_ms",
+        "_stations",
+        "_length",
+        "_capable",
+        "_bound",
+        "_members",
+        "_touched",
+        "_unwatched",
+        "_foreign",
+        "_heap",
+        "_pushes",
+        "_waiting",
+        "_overdue",
+        "_max_wait_ms",
+    )
+
+    def __init__(self) -> None:
+        self.now_ms = 0
+        self._stations: list[Any] | None = None
+        self._length = -1
+        self._capable = True
+        # id(station) -> station for the live stations the clock runs for.
+        self._bound: dict[int, Any] = {}
+        # id(station) -> the passengers last seen waiting there.
+        self._members: dict[int, list[Any]] = {}
+        self._touched: dict[int, Any] = {}
+        # Stations reconciled on every move: plain lists, foreign passengers.
+        self._unwatched: dict[int, Any] = {}
+        self._foreign: dict[int, Any] = {}
+        self._heap: list[tuple[Any, int, Any]] = []
+        self._pushes = 0
+        self._waiting = 0
+        # id(passenger) -> passenger for the waits known to be overdue.
+        self._overdue: dict[int, Any] = {}
+        self._max_wait_ms: Any = None
+
+    def touch(self, station: Any) -> None:
+        self._touched[id(station)] = station
+
+    def advance(self, stations: list[Any], dt_ms: Any, max_wait_ms: Any) -> int | None:
+        """Add `dt_ms` to every wait at `stations`; the number then overdue.
+
+        None, with nothing advanced, if the clock cannot run these stations.
+        """
+
+        if not self.sync(stations):
+            return None
+        self.now_ms += dt_ms
+        return self.overdue_count(max_wait_ms)
+
+    def sync(self, stations: list[Any]) -> bool:
+        """Start and stop the waits changed since the clock last moved."""
+
+        if stations is not self._stations or len(stations) != self._length:
+            self._bind(stations)
+        if self._touched:
+            touched, self._touched = self._touched, {}
+            for station in touched.values():
+                self._reconcile(station)
+        for station in list(self._unwatched.values()):
+            self._reconcile(station)
+        return self._capable and not self._foreign
+
+    def overdue_count(self, max_wait_ms: Any) -> int:
+        if max_wait_ms != self._max_wait_ms or len(self._heap) > (
+            _COMPACT_RATIO * self._waiting + 8
+        ):
+            self._rebuild_heap(max_wait_ms)
+        heap, overdue = self._heap, self._overdue
+        limit = self.now_ms - max_wait_ms
+        while heap and heap[0][0] <= limit:
+            origin, _, passenger = heapq.heappop(heap)
+            if passenger._wait_clock is self and passenger._wait_origin_ms == origin:
+                overdue[id(passenger)] = passenger
+        return len(overdue)
+
+    def restart(self, passenger: Any, wait_ms: Any) -> None:
+        """Set the wait of a passenger this clock runs for."""
+
+        self._overdue.pop(id(passenger), None)
+        self._push(passenger, self.now_ms - wait_ms)
+
+    def _bind(self, stations: list[Any]) -> None:
+        live = {
+            id(station): station
+            for station in stations
+            if hasattr(station, "_waiting_clock")
+        }
+        self._capable = all(hasattr(station, "_waiting_clock") for station in stations)
+        for key, station in self._bound.items():
+            if key not in live:
+                self._release(station)
+        for key, station in live.items():
+            if key not in self._bound:
+                station._waiting_clock = self
+                self._touched[key] = station
+        self._bound = live
+        self._stations = stations
+        self._length = len(stations)
+
+    def _release(self, station: Any) -> None:
+        for passenger in self._members.pop(id(station), ()):
+            if passenger._wait_station is station:
+                self._stop(passenger)
+        self._touched.pop(id(station), None)
+        self._unwatched.pop(id(station), None)
+        self._foreign.pop(id(station), None)
+        if station._waiting_clock is self:
+            station._waiting_clock = None
+
+    def _reconcile(self, station: Any) -> None:
+        key = id(station)
+        if key not in self._bound:
+            return
+        passengers = station.passengers
+        present = {id(passenger) for passenger in passengers}
+        for passenger in self._members.get(key, ()):
+            if id(passenger) not in present and passenger._wait_station is station:
+                self._stop(passenger)
+        members = []
+        for passenger in passengers:
+            if not hasattr(passenger, "_wait_clock"):
+                continue
+            if passenger._wait_clock is not self:
+                self._start(passenger)
+            passenger._wait_station = station
+            members.append(passenger)
+        self._members[key] = members
+        if len(members) != len(passengers):
+            self._foreign[key] = station
+        else:
+            self._foreign.pop(key, None)
+        if station.owns_passenger_list() and key not in self._foreign:
+            self._unwatched.pop(key, None)
+        else:
+            self._unwatched[key] = station
+
+    def _start(self, passenger: Any) -> None:
+        other = passenger._wait_clock
+        if other is not None:
+            other._stop(passenger)
+        wait_ms = passenger.wait_ms
+        passenger._wait_clock = self
+        self._waiting += 1
+        self._push(passenger, self.now_ms - wait_ms)
+
+    def _stop(self, passenger: Any) -> None:
+        wait_ms = passenger.wait_ms
+        passenger._wait_clock = None
+        passenger._wait_station = None
+        passenger.wait_ms = wait_ms
+        self._waiting -= 1
+        self._overdue.pop(id(passenger), None)
+
+    def _push(self, passenger: Any, origin: Any) -> None:
+        passenger._wait_origin_ms = origin
+        self._pushes += 1
+        heapq.heappush(self._heap, (origin, self._pushes, passenger))
+
+    def _rebuild_heap(self, max_wait_ms: Any) -> None:
+        self._max_wait_ms = max_wait_ms
+        self._overdue = {}
+        waiting = {
+            id(passenger): passenger
+            for members in self._members.values()
+            for passenger in members
+            if passenger._wait_clock is self
+        }
+        self._heap = [
+            (passenger._wait_origin_ms, order, passenger)
+            for order, passenger in enumerate(waiting.values())
+        ]
+        heapq.heapify(self._heap)
+        self._pushes = self._waiting = len(self._heap)
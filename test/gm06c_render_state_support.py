@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 _MISSING = ("<missing>",)
@@ -8,7 +9,7 @@ _MISSING = ("<missing>",)
 def _freeze(value: Any):
     if value is None or isinstance(value, (bool, int, float, str, bytes)):
         return value
-    if isinstance(value, dict):
+    if isinstance(value, Mapping):
         return tuple((_freeze(key), _freeze(item)) for key, item in value.items())
     if isinstance(value, (list, tuple)):
         return tuple(_freeze(item) for item in value)
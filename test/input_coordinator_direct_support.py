@@ -137,6 +137,7 @@ class Host:
         self.path_being_created = None
         self.is_paused = False
         self.game_speed_multiplier = 1
+        self.state_version = 0
 
     @property
     def unlocked_num_paths(self):
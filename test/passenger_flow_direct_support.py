@@ -229,8 +229,9 @@ def iter_boarding_candidates(
 
 
 class FakeHost:
-    def __init__(self, flow):
+    def __init__(self, flow, spawning):
         self.flow = flow
+        self.spawning = spawning
         self.events = []
         self.context = FakeContext(self.events)
         self.stations = []
@@ -247,6 +248,7 @@ class FakeHost:
         self.is_paused = False
         self.is_game_over = False
         self.game_speed_multiplier = 1
+        self.exact_metro_kinematics = False
         self.passenger_max_wait_time_ms = 100
         self.overdue_passenger_threshold = 2
         self.graph_builder = lambda stations, paths: object()
@@ -263,22 +265,22 @@ class FakeHost:
         self.record_delivery = lambda: self.events.append(("delivery",))
 
     def get_station_shape_types(self):
-        return self.flow.get_station_shape_types(self)
+        return self.spawning.get_station_shape_types(self)
 
     def get_station_spawn_interval_step(self):
-        return self.flow.get_station_spawn_interval_step(self)
+        return self.spawning.get_station_spawn_interval_step(self)
 
     def initialize_station_spawning_state(self, stations):
-        return self.flow.initialize_station_spawning_state(self, stations)
+        return self.spawning.initialize_station_spawning_state(self, stations)
 
     def should_spawn_passenger_at_station(self, station):
-        return self.flow.should_spawn_passenger_at_station(self, station)
+        return self.spawning.should_spawn_passenger_at_station(self, station)
 
     def is_passenger_spawn_time(self):
-        return self.flow.is_passenger_spawn_time(self)
+        return self.spawning.is_passenger_spawn_time(self)
 
     def spawn_passengers(self):
-        return self.flow.spawn_passengers(
+        return self.spawning.spawn_passengers(
             self,
             get_passenger_factory=lambda: self.passenger_factory,
             get_shape_factory=lambda: self.shape_factory,
@@ -349,7 +351,7 @@ class FakeHost:
         )
 
     def update_waiting_and_game_over(self, dt_ms):
-        return self.flow.update_waiting_and_game_over(self, dt_ms)
+        return self.spawning.update_waiting_and_game_over(self, dt_ms)
 
 
 def assert_component_boundary(test_case, flow, component_type):
@@ -358,7 +360,7 @@ def assert_component_boundary(test_case, flow, component_type):
     with test_case.assertRaises(AttributeError):
         flow.host = object()
 
-    host = FakeHost(flow)
+    host = FakeHost(flow, None)
     station = FakeStation("station", "circle", host.events)
     metro = FakeMetro("metro", host.events)
     host.paths = [FakePath("path", host.events)]
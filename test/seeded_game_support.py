@@ -0,0 +1,109 @@
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from env import MiniMetroEnv
+from save_game import save_game
+from save_load import load_game
+
+LINES = (([0, 1, 2], False), ([2, 0, 1], True))
+# Two lines meeting at station 1, so riders transfer there.
+CROSSING_LINES = (([0, 1], False), ([1, 2], False))
+# Unlock milestones low enough that stations open within a short run.
+EARLY_UNLOCKS = (1, 3, 5)
+
+
+def seeded_game(seed, lines=LINES, *, milestones=None, env=None):
+    """Reset `env` (a fresh `MiniMetroEnv` by default) and draw `lines` on it.
+
+    Every line is unlocked first, and `milestones`, when given, replaces the
+    station unlock milestones so new stations open early in the run.
+    """
+
+    env = MiniMetroEnv() if env is None else env
+    env.reset(seed=seed)
+    mediator = env.mediator
+    mediator.unlocked_num_paths = mediator.num_paths
+    if milestones is not None:
+        mediator.station_unlock_milestones = list(milestones)
+    for stations, loop in lines:
+        action = {"type": "create_path", "stations": stations, "loop": loop}
+        if not env.step_legacy_auto_assignment(action)[3]["action_ok"]:
+            raise AssertionError(f"line through {stations!r} was rejected")
+    return env
+
+
+def service_queries(mediator):
+    """Each metro on a line with the station it stands at or heads for."""
+
+    for path in mediator.paths:
+        for metro in path.metros:
+            if metro.current_station is not None:
+                yield metro, metro.current_station
+            elif metro.current_segment is not None:
+                yield metro, mediator.get_next_station_for_metro(metro)
+
+
+def canonical_bytes(value):
+    return json.dumps(
+        value,
+        allow_nan=False,
+        ensure_ascii=True,
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode("ascii")
+
+
+def apply_action(env, action):
+    _, _, _, info = env.step(action, dt_ms=0)
+    if not info["action_ok"]:
+        raise AssertionError(f"scenario action was rejected: {action!r}")
+
+
+def unlock_second_path(mediator):
+    mediator.purchased_num_paths = 2
+    mediator.update_unlocked_num_paths()
+
+
+def line_env(seed, dt_ms=250):
+    env = MiniMetroEnv(dt_ms=dt_ms)
+    env.reset(seed=seed)
+    apply_action(env, {"type": "create_path", "stations": [0, 1, 2], "loop": False})
+    apply_action(env, {"type": "assign_locomotive", "path_index": 0})
+    return env
+
+
+def played_env(seed):
+    """A two-line game with a carriage attached, played for 30 decisions."""
+
+    env = line_env(seed)
+    unlock_second_path(env.mediator)
+    apply_action(env, {"type": "create_path", "stations": [2, 0], "loop": False})
+    apply_action(env, {"type": "assign_locomotive", "path_index": 1})
+    apply_action(env, {"type": "attach_carriage", "path_index": 0})
+    for _ in range(30):
+        env.step({"type": "noop"})
+    return env
+
+
+def rewrapped(env, mediator):
+    """An env around `mediator` that carries on `env`'s reward bookkeeping."""
+
+    wrapped = MiniMetroEnv(dt_ms=env.dt_ms_default, reward_mode=env.reward_mode)
+    wrapped.mediator = mediator
+    wrapped.last_deliveries = env.last_deliveries
+    wrapped.last_line_credits = env.last_line_credits
+    wrapped.last_score = env.last_score
+    return wrapped
+
+
+def saved_then_loaded(env):
+    with tempfile.TemporaryDirectory() as directory:
+        target = Path(directory) / "game.save.json"
+        save_game(env.mediator, target)
+        loaded = load_game(target)
+    return rewrapped(env, loaded)
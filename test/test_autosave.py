@@ -0,0 +1,168 @@
+import gc
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import weakref
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+import autosave
+from autosave import AutosaveService
+from save_game import capture_game, save_game, serialize_game
+from test.seeded_game_support import played_env
+
+
+class _Seams:
+    def __init__(self, path):
+        self.path = path
+        self.deletes = 0
+
+    def delete(self):
+        self.deletes += 1
+        self.path.unlink(missing_ok=True)
+
+    def peek(self):
+        return self.path.exists()
+
+    def load(self):
+        return self.path.read_bytes()
+
+
+class TestAutosaveService(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.path = self.directory / "autosave.json"
+        self.seams = _Seams(self.path)
+        self.service = AutosaveService(
+            self.path,
+            delete=self.seams.delete,
+            peek=self.seams.peek,
+            load=self.seams.load,
+        )
+        self.addCleanup(self.service.close)
+
+    def _blocked_writes(self):
+        release = threading.Event()
+        started = threading.Event()
+        save_document = autosave.save_document
+
+        def blocked(document, path):
+            started.set()
+            release.wait(10)
+            return save_document(document, path)
+
+        patcher = patch.object(autosave, "save_document", blocked)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(release.set)
+        return started, release
+
+    def test_state_version_advances_on_play_and_not_on_reads(self):
+        mediator = played_env(7401).mediator
+        for change in (
+            lambda: mediator.increment_time(16),
+            lambda: mediator.set_paused(True),
+            lambda: mediator.set_paused(False),
+            lambda: mediator.set_game_speed(2),
+            lambda: mediator.hold_pause_reason("menu"),
+            lambda: mediator.release_pause_reason("menu"),
+            lambda: mediator.apply_action({"type": "remove_path", "path_index": 1}),
+        ):
+            before = mediator.state_version
+            change()
+            self.assertGreater(mediator.state_version, before)
+        before = mediator.state_version
+        serialize_game(mediator)
+        mediator.fork()
+        self.assertEqual(mediator.state_version, before)
+
+    def test_state_version_holds_when_nothing_changes(self):
+        mediator = played_env(7404).mediator
+        mediator.set_game_speed(2)
+        mediator.hold_pause_reason("menu")
+        for no_op in (
+            lambda: mediator.increment_time(16),
+            lambda: mediator.hold_pause_reason("menu"),
+            lambda: mediator.release_pause_reason("user"),
+            lambda: mediator.set_game_speed(2),
+            lambda: mediator.apply_action({"type": "noop"}),
+            lambda: mediator.apply_action({"type": "remove_path", "path_index": 9}),
+            lambda: mediator.apply_action({"type": "unknown"}),
+        ):
+            before = mediator.state_version
+            no_op()
+            self.assertEqual(mediator.state_version, before)
+
+    def test_a_worker_save_writes_what_save_game_writes(self):
+        mediator = played_env(7402).mediator
+        self.service.save(mediator)
+        self.assertTrue(self.service.peek())
+        self.assertEqual(
+            self.service.load(),
+            save_game(mediator, self.directory / "direct.json").read_bytes(),
+        )
+
+    def test_an_unchanged_state_is_not_captured_again(self):
+        mediator = played_env(7403).mediator
+        with patch.object(autosave, "capture_game", wraps=capture_game) as capture:
+            self.service.save(mediator)
+            self.service.save(mediator)
+            self.assertEqual(capture.call_count, 1)
+            mediator.increment_time(16)
+            self.service.save(mediator)
+            self.service.save(mediator.fork())
+            self.assertEqual(capture.call_count, 3)
+            self.service.delete()
+            self.service.save(mediator)
+            self.assertEqual(capture.call_count, 4)
+
+    def test_the_skip_key_does_not_keep_a_saved_game_alive(self):
+        env = played_env(7406)
+        mediator = env.mediator
+        self.service.save(mediator)
+        self.service.flush()
+        collected = weakref.ref(mediator)
+        del env, mediator
+        gc.collect()
+        self.assertIsNone(collected())
+
+    def test_the_caller_never_waits_for_the_write(self):
+        started, release = self._blocked_writes()
+        mediator = played_env(7404).mediator
+        self.service.save(mediator)
+        self.assertTrue(started.wait(10))
+        # Queued behind the blocked write, the delete must still win.
+        mediator.increment_time(16)
+        self.service.save(mediator)
+        self.service.delete()
+        self.assertFalse(self.path.exists())
+        self.assertFalse(self.service.peek())
+        release.set()
+        self.service.flush()
+        self.assertFalse(self.path.exists())
+        self.assertEqual(self.seams.deletes, 1)
+
+    def test_failures_are_swallowed_and_the_next_save_retries(self):
+        self.service.save(object())
+        self.assertFalse(self.service.peek())
+        mediator = played_env(7405).mediator
+        with patch.object(autosave, "save_document", side_effect=OSError("full")):
+            self.service.save(mediator)
+            self.service.flush()
+        self.assertFalse(self.path.exists())
+        self.service.save(mediator)
+        self.service.close()
+        self.assertEqual(
+            self.path.read_bytes(),
+            save_game(mediator, self.directory / "direct.json").read_bytes(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from entity.carriage import Carriage
+from entity.metro import Metro
+from entity.passenger import Passenger
+from geometry.point import Point
+from graph.node import Node
+from save_game import serialize_game
+from save_load import deserialize_game
+from test.seeded_game_support import (
+    CROSSING_LINES,
+    EARLY_UNLOCKS,
+    line_env,
+    seeded_game,
+)
+from travel_plan import TravelPlan
+
+
+def _riders(mediator):
+    for station in mediator.stations:
+        yield from station.passengers
+    for metro in mediator.metros:
+        yield from metro.passengers
+
+
+class TestEntitySlots(unittest.TestCase):
+    def test_entities_carry_no_instance_dict(self):
+        mediator = seeded_game(0, CROSSING_LINES, milestones=EARLY_UNLOCKS).mediator
+        path = mediator.paths[0]
+        station = mediator.stations[0]
+        node = Node(station)
+        for entity in (
+            station,
+            Passenger(station.shape),
+            Point(1, 2),
+            Metro(),
+            Carriage(),
+            node,
+            TravelPlan([node]),
+            path.path_segments[0],
+        ):
+            with self.subTest(entity=type(entity).__name__):
+                self.assertFalse(hasattr(entity, "__dict__"))
+
+        # Paths allow rebinding a method on one instance, and only allocate a
+        # dict once something is rebound.
+        self.assertEqual(vars(path), {})
+        path.add_station = lambda *args: None
+        self.assertEqual(list(vars(path)), ["add_station"])
+
+    def test_riders_of_a_shape_share_one_shape_across_play_and_load(self):
+        env = line_env(7101)
+        while len(list(_riders(env.mediator))) < 3:
+            env.step({"type": "noop"})
+        loaded = deserialize_game(serialize_game(env.mediator))
+
+        for mediator in (env.mediator, loaded):
+            shapes = {}
+            riders = list(_riders(mediator))
+            for rider in riders:
+                shape = rider.destination_shape
+                self.assertIs(shapes.setdefault(shape.type, shape), shape)
+            self.assertLess(len(shapes), len(riders))
+
+
+if __name__ == "__main__":
+    unittest.main()
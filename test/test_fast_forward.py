@@ -0,0 +1,99 @@
+import os
+import random
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from mediator import Mediator
+from recursive_checkpoint import canonical_checkpoint
+from test.seeded_game_support import LINES, seeded_game
+
+
+def _game(seed, lines=LINES, *, speed=1, week_calendar=False, exact=False):
+    env = seeded_game(seed, lines)
+    mediator = env.mediator
+    mediator.game_speed_multiplier = speed
+    mediator.week_calendar = week_calendar
+    mediator.exact_metro_kinematics = exact
+    return env
+
+
+class TestAdvanceUntilEvent(unittest.TestCase):
+    def assert_matches_ticking(self, seed, game_ms, **game):
+        advanced, ticked = _game(seed, **game), _game(seed, **game)
+        chunks = random.Random(seed)
+        elapsed_ms = 0
+        while elapsed_ms < game_ms and not advanced.mediator.is_game_over:
+            ran = advanced.mediator.advance_until_event(
+                chunks.choice([16, 96, 1000, 20_000])
+            )
+            for _ in range(ran // 16):
+                ticked.mediator.increment_time(16)
+            elapsed_ms += ran
+            for env in (advanced, ticked):
+                if env.mediator.is_week_boundary_pending:
+                    env.mediator.resolve_week_boundary(None)
+            self.assertEqual(
+                canonical_checkpoint(advanced), canonical_checkpoint(ticked)
+            )
+            self.assertEqual(
+                advanced.mediator.context.python_random.getstate(),
+                ticked.mediator.context.python_random.getstate(),
+            )
+        return advanced.mediator
+
+    def test_seeded_games_land_on_the_ticked_state_at_every_return(self):
+        for seed in (0, 1):
+            with self.subTest(seed=seed):
+                mediator = self.assert_matches_ticking(seed, 60_000)
+                self.assertGreater(mediator.deliveries, 0)
+
+    def test_speed_multiplier_and_week_boundaries_match_ticking(self):
+        self.assert_matches_ticking(2, 40_000, speed=2, week_calendar=True)
+
+    def test_exact_metro_kinematics_coast_like_they_tick(self):
+        for seed, speed in ((5, 1), (4, 1), (6, 2)):
+            with self.subTest(seed=seed, speed=speed):
+                mediator = self.assert_matches_ticking(
+                    seed, 60_000, exact=True, speed=speed
+                )
+                self.assertGreater(mediator.deliveries, 0)
+
+    def test_a_network_without_lines_coasts_to_the_same_game_over(self):
+        mediator = self.assert_matches_ticking(7, 60_000, lines=())
+        self.assertTrue(mediator.is_game_over)
+
+    def test_quiet_ticks_are_coasted_and_events_end_the_call(self):
+        mediator = _game(3, lines=()).mediator
+        # The opening tick spawns at every station, which is itself an event.
+        self.assertEqual(mediator.advance_until_event(60_000), 16)
+        full_ticks = []
+        increment_time = Mediator.increment_time
+
+        def counted(host, dt_ms):
+            full_ticks.append(dt_ms)
+            increment_time(host, dt_ms)
+
+        with patch.object(Mediator, "increment_time", counted):
+            ran = mediator.advance_until_event(60_000)
+
+        self.assertLess(ran, 60_000)
+        self.assertEqual(ran % 16, 0)
+        self.assertLess(len(full_ticks), ran // 16)
+        self.assertIn(0, mediator.station_steps_since_last_spawn.values())
+
+    def test_budget_is_whole_ticks(self):
+        mediator = Mediator(seed=4)
+
+        self.assertEqual(mediator.advance_until_event(15), 0)
+        self.assertEqual(mediator.time_ms, 0)
+        self.assertEqual(mediator.advance_until_event(40), 16)
+        self.assertEqual(mediator.advance_until_event(40), 32)
+        with self.assertRaises(ValueError):
+            mediator.advance_until_event(100, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
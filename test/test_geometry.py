@@ -1,4 +1,5 @@
 import os
+import random
 import sys
 import unittest
 from unittest.mock import create_autospec, patch
@@ -15,7 +16,7 @@ from geometry.line import Line
 from geometry.point import Point
 from geometry.rect import Rect
 from geometry.triangle import Triangle
-from geometry.utils import direction
+from geometry.utils import direction, distance, heading
 from utils import get_random_color, get_random_position
 
 
@@ -160,6 +161,34 @@ class TestGeometry(unittest.TestCase):
         point = Point(10, 20)
         self.assertEqual(direction(point, point), Point(0, 0))
 
+    def test_scalar_kernel_matches_the_numpy_formulas_bit_for_bit(self):
+        import numpy as np
+
+        rng = random.Random(7)
+        for _ in range(2000):
+            p1 = Point(rng.uniform(-900, 900), rng.randint(-900, 900))
+            p2 = Point(rng.uniform(-900, 900), rng.uniform(-900, 900))
+            expected = np.sqrt((p1.left - p2.left) ** 2 + (p1.top - p2.top) ** 2)
+            dist, left, top = heading(p1, p2)
+            self.assertIs(type(dist), float)
+            self.assertEqual(distance(p1, p2), expected)
+            self.assertEqual(dist, expected)
+            diff = p2 - p1
+            self.assertEqual((left, top), (diff.left / expected, diff.top / expected))
+            self.assertEqual(direction(p1, p2), Point(left, top))
+
+    def test_in_place_arithmetic_moves_only_the_point_itself(self):
+        point = Point(1.5, -2)
+        alias = point
+        self.assertIs(point.translate(0.5, 3), point)
+        self.assertIs(point.scale(2), point)
+        self.assertEqual(alias, Point(4.0, 2))
+
+        shared = Point(1, 1)
+        moved = shared
+        moved += Point(1, 1)
+        self.assertEqual((shared, moved), (Point(1, 1), Point(2, 2)))
+
 
 if __name__ == "__main__":
     unittest.main()
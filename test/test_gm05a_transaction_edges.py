@@ -375,7 +375,10 @@ class TestGM05aTransactionEdges(unittest.TestCase):
                 else:
                     original = metros[0]
                     failing_metro = _FailingMetro()
-                    failing_metro.__dict__.update(original.__dict__)
+                    for owner in Metro.__mro__:
+                        for name in getattr(owner, "__slots__", ()):
+                            if hasattr(original, name):
+                                setattr(failing_metro, name, getattr(original, name))
                     path.metros[:] = [failing_metro]
                     mediator.metros[:] = [failing_metro]
                     metros[:] = [failing_metro]
@@ -223,6 +223,7 @@ class TestGM06bQueuedMarkerAndPurity(unittest.TestCase):
         below_500 = (
             source / "fleet_input.py",
             source / "input_coordinator.py",
+            source / "path_action_input.py",
             source / "rendering" / "game_renderer.py",
             source / "ui" / "fleet_button.py",
             source / "entity" / "metro.py",
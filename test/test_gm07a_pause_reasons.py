@@ -48,6 +48,13 @@ def _read_paused(testcase: unittest.TestCase, host: object) -> bool:
     return value
 
 
+def _bare() -> Mediator:
+    # No reason store, only the version counter every pause change advances.
+    bare = Mediator.__new__(Mediator)
+    bare.state_version = 0
+    return bare
+
+
 def _space(mediator: Mediator) -> None:
     mediator.react_keyboard_event(
         KeyboardEvent(KeyboardEventType.KEY_UP, pygame.K_SPACE)
@@ -92,7 +99,7 @@ class TestGM07aPauseReasonModel(unittest.TestCase):
         self.assertIs(_read_paused(self, bare), False)
 
     def test_bare_mediator_setter_creates_a_per_instance_store(self):
-        bare = Mediator.__new__(Mediator)
+        bare = _bare()
         bare.is_paused = True
         self.assertIs(_read_paused(self, bare), True)
         hold, release = _reason_api(self, bare)
@@ -107,8 +114,8 @@ class TestGM07aPauseReasonModel(unittest.TestCase):
         self.assertIs(_read_paused(self, bare), False)
 
     def test_bare_mediators_share_no_class_level_reason_state(self):
-        first = Mediator.__new__(Mediator)
-        second = Mediator.__new__(Mediator)
+        first = _bare()
+        second = _bare()
         hold_first, release_first = _reason_api(self, first)
         hold_first(MENU)
         self.assertIs(_read_paused(self, first), True)
@@ -3,8 +3,10 @@ import sys
 import unittest
 
 sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../scripts")
 
 import pygame
+from benchmark_support import legacy_build_station_nodes_dict, synthetic_network
 
 from config import screen_height, screen_width, station_color, station_size
 from entity.get_entity import get_random_stations
@@ -254,6 +256,25 @@ class TestGraph(unittest.TestCase):
             [station_nodes[station_a], station_nodes[station_c]],
         )
 
+    def test_linear_builder_matches_the_retired_scan_neighbor_for_neighbor(self):
+        """Neighbor insertion order decides BFS tie-breaks, so it must not move."""
+
+        for seed in range(8):
+            stations, paths = synthetic_network(30, 6, 9, seed=seed)
+            paths[1].is_being_created = seed % 2 == 0
+            paths.append(paths[0])
+
+            linear = build_station_nodes_dict(stations, paths)
+            legacy = legacy_build_station_nodes_dict(stations, paths)
+
+            self.assertEqual(list(linear), list(legacy))
+            for station, node in linear.items():
+                self.assertEqual(
+                    [neighbor.station for neighbor in node.neighbors],
+                    [neighbor.station for neighbor in legacy[station].neighbors],
+                )
+                self.assertEqual(node.paths, legacy[station].paths)
+
     def test_equal_nodes_have_same_hash(self):
         station = Station(
             Rect(station_color, 2 * station_size, 2 * station_size), Point(0, 0)
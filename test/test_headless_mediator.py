@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from config import screen_height, screen_width
+from env import MiniMetroEnv
+from mediator import Mediator
+from recursive_checkpoint import canonical_checkpoint
+from rl.semantic_env import SemanticMetroEnv
+from save_game import serialize_game
+
+REPO_ROOT = os.path.dirname(os.path.realpath(__file__)) + "/.."
+
+
+def _play(seed, headless):
+    env = MiniMetroEnv()
+    env.mediator = Mediator(seed=seed, headless=headless)
+    action = {"type": "create_path", "stations": [0, 1, 2], "loop": False}
+    assert env.step_legacy_auto_assignment(action)[3]["action_ok"]
+    checkpoints = []
+    for tick in range(900):
+        env.step({"type": "noop"}, dt_ms=16 * (1 + tick % 3))
+        if tick % 30 == 0:
+            checkpoints.append(canonical_checkpoint(env))
+    return env, checkpoints
+
+
+class TestHeadlessMediator(unittest.TestCase):
+    def test_simulation_imports_and_plays_without_pygame_or_shapely(self):
+        code = (
+            "import sys; sys.path.insert(0, 'src'); "
+            "from env import MiniMetroEnv; "
+            "env = MiniMetroEnv(headless=True); env.reset(seed=4); "
+            "env.step({'type': 'create_path', 'stations': [0, 1], 'loop': False}); "
+            "[env.step(None) for _ in range(300)]; "
+            "bad = sorted({m.split('.')[0] for m in sys.modules} & {'pygame', 'shapely'}); "
+            "print('LEAK' if bad else 'CLEAN', bad)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, cwd=REPO_ROOT
+        )
+        self.assertIn("CLEAN", result.stdout, result.stdout + result.stderr)
+
+    def test_headless_games_match_windowed_games(self):
+        windowed, expected = _play(11, headless=False)
+        headless, checkpoints = _play(11, headless=True)
+        self.assertGreater(headless.mediator.deliveries, 0)
+        self.assertEqual(checkpoints, expected)
+        document = serialize_game(headless.mediator)
+        self.assertEqual(
+            document["pathColors"], serialize_game(windowed.mediator)["pathColors"]
+        )
+
+    def test_headless_facade_keeps_path_buttons_and_lays_out_on_demand(self):
+        windowed = Mediator(seed=2)
+        mediator = Mediator(seed=2, headless=True)
+        self.assertTrue(mediator.headless)
+        self.assertFalse(windowed.headless)
+        self.assertEqual(len(mediator.path_buttons), len(windowed.path_buttons))
+        self.assertEqual(mediator.buttons, mediator.path_buttons)
+        self.assertEqual(
+            (mediator.fleet_buttons, mediator.carriage_buttons, mediator.speed_buttons),
+            ([], [], []),
+        )
+        self.assertIsNone(mediator._layout_size)
+        self.assertIsNone(mediator.game_over_restart_rect)
+        self.assertEqual(mediator.path_colors, windowed.path_colors)
+
+        mediator.prepare_layout(screen_width, screen_height)
+        self.assertEqual(mediator._layout_size, (screen_width, screen_height))
+        self.assertIsNotNone(mediator.game_over_restart_rect)
+
+    def test_environments_build_headless_mediators_where_asked(self):
+        self.assertFalse(MiniMetroEnv().mediator.headless)
+        env = MiniMetroEnv(headless=True)
+        self.assertTrue(env.mediator.headless)
+        env.reset(seed=3)
+        self.assertTrue(env.mediator.headless)
+        semantic = SemanticMetroEnv()
+        semantic.reset(seed=3)
+        self.assertTrue(semantic._mediator.headless)
+
+
+if __name__ == "__main__":
+    unittest.main()
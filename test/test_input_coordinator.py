@@ -52,6 +52,7 @@ class TestInputCoordinator(support.MediatorTestCase):
                 "collections.abc",
                 "fleet_input",
                 "input_coordinator_host",
+                "path_action_input",
                 "path_handle_input",
                 "path_handles",
                 "typing",
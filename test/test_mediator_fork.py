@@ -0,0 +1,94 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from env import MiniMetroEnv
+from recursive_checkpoint import canonical_checkpoint
+from test.seeded_game_support import (
+    apply_action,
+    canonical_bytes,
+    line_env,
+    played_env,
+    rewrapped,
+    saved_then_loaded,
+    unlock_second_path,
+)
+
+
+def _checkpoint(env):
+    return canonical_bytes(canonical_checkpoint(env))
+
+
+def _entities(mediator):
+    stations = [*mediator.all_stations, *mediator.stations]
+    metros = [*mediator.metros]
+    return [
+        *stations,
+        *(station.passengers for station in stations),
+        *mediator.passengers,
+        *mediator.paths,
+        *(segment for path in mediator.paths for segment in path.segments),
+        *metros,
+        *(metro.passengers for metro in metros),
+        *(metro.shape for metro in metros),
+        *(carriage for metro in metros for carriage in metro.carriages),
+        *mediator.travel_plans.values(),
+        *mediator.path_buttons,
+        mediator.context.python_random,
+        mediator.context.numpy_random,
+    ]
+
+
+class TestMediatorFork(unittest.TestCase):
+    def test_fork_matches_a_save_load_roundtrip(self):
+        env = played_env(7301)
+        mediator = env.mediator
+        self.assertTrue(mediator.travel_plans)
+        self.assertTrue(any(metro.passengers for metro in mediator.metros))
+        self.assertTrue(any(metro.carriages for metro in mediator.metros))
+        forked = rewrapped(env, mediator.fork())
+        loaded = saved_then_loaded(env)
+        self.assertEqual(_checkpoint(forked), _checkpoint(loaded))
+        self.assertEqual(_checkpoint(forked), _checkpoint(env))
+
+        for _ in range(240):
+            for game in (env, forked, loaded):
+                game.step({"type": "noop"})
+        self.assertGreater(env.mediator.deliveries, 0)
+        self.assertEqual(_checkpoint(forked), _checkpoint(loaded))
+        self.assertEqual(_checkpoint(forked), _checkpoint(env))
+
+    def test_fork_shares_no_mutable_state_with_its_source(self):
+        env = played_env(7302)
+        mediator = env.mediator
+        fork = mediator.fork()
+        shared = {id(item) for item in _entities(mediator)}
+        self.assertFalse(shared & {id(item) for item in _entities(fork)})
+        self.assertIs(fork.map_definition, mediator.map_definition)
+        for station, copy in zip(mediator.all_stations, fork.all_stations):
+            self.assertIs(copy.shape, station.shape)
+        self.assertEqual(fork.headless, mediator.headless)
+        self.assertEqual(len(fork.fleet_buttons), len(mediator.fleet_buttons))
+
+        before = _checkpoint(env)
+        forked = MiniMetroEnv(dt_ms=env.dt_ms_default)
+        forked.mediator = fork
+        apply_action(forked, {"type": "remove_path", "path_index": 1})
+        for _ in range(200):
+            forked.step({"type": "noop"})
+        self.assertEqual(_checkpoint(env), before)
+        self.assertNotEqual(_checkpoint(forked), before)
+
+    def test_fork_refuses_a_path_gesture_in_progress(self):
+        env = line_env(7303)
+        mediator = env.mediator
+        unlock_second_path(mediator)
+        mediator.start_path_on_station(mediator.stations[0])
+        with self.assertRaisesRegex(ValueError, "path gesture"):
+            mediator.fork()
+
+
+if __name__ == "__main__":
+    unittest.main()
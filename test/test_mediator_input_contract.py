@@ -15,6 +15,7 @@ from mediator import Mediator
 
 def bare_mediator():
     mediator = Mediator.__new__(Mediator)
+    mediator.state_version = 0
     coordinator = getattr(mediator_module, "InputCoordinator", None)
     if coordinator is not None:
         mediator._input = coordinator()
@@ -315,17 +315,19 @@ class TestPassengerFlowFacadeContract(support.MediatorTestCase):
             ],
         )
 
-    def test_active_tick_builds_three_fresh_graphs_and_uses_live_collections(
+    def test_active_tick_shares_one_live_graph_until_topology_changes(
         self,
     ) -> None:
         mediator = Mediator()
         events: list[object] = []
-        graphs = [object(), object(), object()]
+        graphs = [object(), object()]
 
         class Station:
             def __init__(self, name: str) -> None:
                 self.name = name
                 self.passengers: list[object] = []
+                # A tick only prunes stations that hold blips.
+                self.snap_blips = [(0, (0, 0, 0))]
 
             def prune_visual_effects(self, now: int) -> None:
                 events.append(("prune", self.name, now))
@@ -455,14 +457,6 @@ class TestPassengerFlowFacadeContract(support.MediatorTestCase):
                     ("first", "second"),
                 ),
                 ("exchange", 14),
-                (
-                    "build",
-                    2,
-                    True,
-                    True,
-                    ("first", "second"),
-                    ("first", "second"),
-                ),
                 ("waiting", 14),
             ],
         )
@@ -1,5 +1,5 @@
 import inspect
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from test import mediator_test_support as support
 from test.path_lifecycle_test_support import (
@@ -346,20 +346,28 @@ class TestMediatorPathContract(support.MediatorTestCase):
         )
         equal_first.id = first.id
         snapshots = []
-        equal_first.start_snap_blip = lambda *_args: snapshots.append(
-            (path.is_looped, tuple(path.stations), loop_mediator.path_being_created)
-        )
-        loop_mediator.add_station_to_path(equal_first)
-        later.start_snap_blip = lambda *_args: snapshots.append(
-            (path.is_looped, tuple(path.stations), loop_mediator.path_being_created)
-        )
-        loop_mediator.add_station_to_path(later)
+
+        def record_snap(station, *_args):
+            snapshots.append(
+                (
+                    station,
+                    path.is_looped,
+                    tuple(path.stations),
+                    loop_mediator.path_being_created,
+                )
+            )
+
+        with patch.object(
+            Station, "start_snap_blip", autospec=True, side_effect=record_snap
+        ):
+            loop_mediator.add_station_to_path(equal_first)
+            loop_mediator.add_station_to_path(later)
 
         self.assertEqual(
             snapshots,
             [
-                (True, (first, middle), path),
-                (False, (first, middle, later), path),
+                (equal_first, True, (first, middle), path),
+                (later, False, (first, middle, later), path),
             ],
         )
 
@@ -376,10 +384,11 @@ class TestMediatorPathContract(support.MediatorTestCase):
             events.append("finish")
             original_finish()
 
-        def snap(*_args):
+        def snap(station, *_args):
             events.append(
                 (
                     "snap",
+                    station,
                     mediator.is_creating_path,
                     path.is_being_created,
                     mediator.path_being_created is path,
@@ -389,12 +398,12 @@ class TestMediatorPathContract(support.MediatorTestCase):
             )
             mediator.finish_path_creation = late_finish
 
-        second.start_snap_blip = snap
-        mediator.end_path_on_station(second)
+        with patch.object(Station, "start_snap_blip", autospec=True, side_effect=snap):
+            mediator.end_path_on_station(second)
 
         self.assertEqual(
             events,
-            [("snap", True, True, True, (first, second), ()), "finish"],
+            [("snap", second, True, True, True, (first, second), ()), "finish"],
         )
         self.assertFalse(path.is_being_created)
         self.assertIsNone(mediator.path_being_created)
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import patch
 
 from test import mediator_test_support as support
 
@@ -130,13 +130,13 @@ class TestMediatorPaths(support.MediatorTestCase):
         station_b = mediator.stations[1]
         path = Path((12, 34, 56))
         path.add_station(station_a)
-        station_b.start_snap_blip = MagicMock()
         mediator.path_being_created = path
         mediator.is_creating_path = True
 
-        mediator.add_station_to_path(station_b)
+        with patch.object(Station, "start_snap_blip", autospec=True) as snap:
+            mediator.add_station_to_path(station_b)
 
-        station_b.start_snap_blip.assert_called_once_with(mediator.time_ms, path.color)
+        snap.assert_called_once_with(station_b, mediator.time_ms, path.color)
 
     def test_end_path_on_station_aborts(self):
         mediator = Mediator()
@@ -154,8 +154,8 @@ class TestMediatorPaths(support.MediatorTestCase):
         mediator.start_path_on_station(station_a)
         assert mediator.path_being_created is not None
         path_color = mediator.path_being_created.color
-        station_b.start_snap_blip = MagicMock()
 
-        mediator.end_path_on_station(station_b)
+        with patch.object(Station, "start_snap_blip", autospec=True) as snap:
+            mediator.end_path_on_station(station_b)
 
-        station_b.start_snap_blip.assert_called_once_with(mediator.time_ms, path_color)
+        snap.assert_called_once_with(station_b, mediator.time_ms, path_color)
@@ -0,0 +1,134 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from config import station_color, station_size
+from entity.metro import Metro
+from entity.path import Path
+from entity.station import Station
+from geometry.circle import Circle
+from geometry.point import Point
+from metro_kinematics import profile_duration, profile_state, segment_profile
+
+CORNERS = ((0, 0), (300, 0), (300, 220), (40, 260))
+
+
+def _line(*, loop=False):
+    path = Path((10, 10, 10))
+    for left, top in CORNERS:
+        path.add_station(Station(Circle(station_color, station_size), Point(left, top)))
+    if loop:
+        path.set_loop()
+    metro = Metro()
+    metro.speed = 0
+    path.add_metro(metro)
+    return path, metro
+
+
+def _motion(metro):
+    return (
+        metro.position.left,
+        metro.position.top,
+        metro.speed,
+        metro.current_segment_idx,
+        metro.is_forward,
+    )
+
+
+class TestSegmentProfile(unittest.TestCase):
+    def test_a_stop_ramps_cruises_and_brakes_to_rest_at_the_end(self):
+        phases = segment_profile(0.0, 0.15, 0.0003, 0.0003, 300.0, stop=True)
+
+        self.assertEqual(
+            [acceleration for _, _, acceleration in phases], [3e-4, 0, -3e-4]
+        )
+        self.assertAlmostEqual(profile_duration(phases), 500 + 1500 + 500)
+        covered, speed = profile_state(phases, profile_duration(phases))
+        self.assertAlmostEqual(covered, 300.0)
+        self.assertAlmostEqual(speed, 0.0)
+
+    def test_a_short_stop_brakes_before_reaching_cruise_speed(self):
+        phases = segment_profile(0.0, 0.15, 0.0003, 0.0003, 30.0, stop=True)
+
+        self.assertEqual(len(phases), 2)
+        self.assertLess(phases[1][1], 0.15)
+        self.assertAlmostEqual(profile_state(phases, profile_duration(phases))[0], 30.0)
+
+    def test_a_metro_too_fast_to_stop_arrives_still_braking(self):
+        phases = segment_profile(0.15, 0.15, 0.0003, 0.0003, 10.0, stop=True)
+
+        self.assertEqual(len(phases), 1)
+        covered, speed = profile_state(phases, profile_duration(phases))
+        self.assertAlmostEqual(covered, 10.0)
+        self.assertGreater(speed, 0.0)
+
+    def test_a_stalled_metro_never_arrives(self):
+        self.assertIsNone(segment_profile(0.0, 0.15, 0.0, 0.0003, 10.0, stop=False))
+        self.assertEqual(segment_profile(0.0, 0.15, 0.0, 0.0003, 0.0, stop=True), [])
+
+
+class TestAdvanceMetro(unittest.TestCase):
+    def test_any_split_of_the_same_time_lands_in_the_same_place(self):
+        for loop in (False, True):
+            with self.subTest(loop=loop):
+                (ticked_path, ticked), (split_path, split) = (
+                    _line(loop=loop),
+                    _line(loop=loop),
+                )
+                (whole_path, whole) = _line(loop=loop)
+                chunks = random.Random(loop)
+                for _ in range(40):
+                    dt_ms = chunks.choice([16, 100, 250, 1000, 4000])
+                    whole_path.advance_metro(whole, dt_ms)
+                    for _ in range(dt_ms // 2):
+                        ticked_path.advance_metro(ticked, 2)
+                    half = dt_ms // 2
+                    split_path.advance_metro(split, half)
+                    split_path.advance_metro(split, dt_ms - half)
+                    for metro in (ticked, split):
+                        expected, actual = _motion(whole), _motion(metro)
+                        self.assertEqual(expected[3:], actual[3:])
+                        for value, other in zip(expected[:3], actual[:3]):
+                            self.assertAlmostEqual(value, other, places=6)
+
+    def test_a_large_step_stops_at_the_first_station_it_should_serve(self):
+        path, metro = _line()
+        asked = []
+
+        def should_stop(item):
+            asked.append(item.current_segment_idx)
+            return item.current_segment.end_station is path.stations[2]
+
+        path.advance_metro(metro, 60_000, should_stop_at_next_station=should_stop)
+
+        self.assertIs(metro.current_station, path.stations[2])
+        self.assertTrue(metro.just_arrived_and_stopped)
+        self.assertEqual(metro.speed, 0)
+        self.assertEqual(metro.position, path.stations[2].position)
+        # Passes station 1 and its padding segment, then turns onto the next.
+        self.assertEqual(asked, [0, 1, 2])
+        self.assertEqual(metro.current_segment_idx, 3)
+
+    def test_a_large_step_turns_around_at_the_end_of_the_line(self):
+        path, metro = _line()
+        path.advance_metro(metro, 6_000)
+
+        self.assertFalse(metro.is_forward)
+        self.assertIsNone(metro.current_station)
+
+    def test_a_dwelling_metro_does_not_move(self):
+        path, metro = _line()
+        metro.current_station = path.stations[0]
+        metro.stop_time_remaining_ms = 100
+        before = _motion(metro)
+
+        path.advance_metro(metro, 1_000)
+
+        self.assertEqual(_motion(metro), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,10 +10,7 @@ from test.passenger_flow_direct_support import (
     FakePath,
     FakePlan,
     FakeSegment,
-    FakeShape,
     FakeStation,
-    RaisingAppendList,
-    RaisingCounterMap,
     assert_component_boundary,
     assert_station_service_action,
 )
@@ -23,156 +20,19 @@ sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 # isort: split
 
 from passenger_flow import PassengerFlow
+from passenger_spawning import PassengerSpawning
 
 
 class TestPassengerFlow(unittest.TestCase):
     def setUp(self):
         self.flow = PassengerFlow()
+        self.spawning = PassengerSpawning()
 
     def test_component_is_stateless_non_retaining_and_import_isolated(self):
         assert_component_boundary(self, self.flow, PassengerFlow)
 
-    def test_shape_types_and_spawn_probe_are_live_call_scoped_and_short_circuit(self):
-        first = FakeHost(self.flow)
-        first.stations = [
-            FakeStation("a", "circle", first.events),
-            FakeStation("b", "triangle", first.events),
-            FakeStation("c", "circle", first.events),
-        ]
-        second = FakeHost(self.flow)
-        second.stations = [FakeStation("x", "cross", second.events)]
-        self.assertEqual(
-            self.flow.get_station_shape_types(first), ["circle", "triangle"]
-        )
-        self.assertEqual(self.flow.get_station_shape_types(second), ["cross"])
-
-        calls = []
-
-        def due(station):
-            calls.append(station.name)
-            return station.name == "a"
-
-        first.should_spawn_passenger_at_station = due
-        self.assertTrue(self.flow.is_passenger_spawn_time(first))
-        self.assertEqual(calls, ["a"])
-
-    def test_spawn_state_samples_once_and_preserves_existing_entries(self):
-        host = FakeHost(self.flow)
-        a = FakeStation("a", "a", host.events)
-        b = FakeStation("b", "b", host.events)
-        c = FakeStation("c", "c", host.events)
-        host.context.python_random.randint_values = [70, 130]
-        host.station_spawn_interval_steps = {a: 99}
-        host.station_steps_since_last_spawn = {c: 5}
-
-        self.flow.initialize_station_spawning_state(host, [a, b, c])
-
-        self.assertEqual(host.station_spawn_interval_steps, {a: 99, b: 70, c: 130})
-        self.assertEqual(host.station_steps_since_last_spawn, {a: 99, b: 70, c: 5})
-        self.assertEqual(
-            [event for event in host.events if event[0] == "randint"],
-            [("randint", 70, 130), ("randint", 70, 130)],
-        )
-        host.steps = host.passenger_spawning_step
-        self.assertTrue(self.flow.should_spawn_passenger_at_station(host, b))
-        host.steps = 0
-        host.station_steps_since_last_spawn[b] = 69
-        self.assertFalse(self.flow.should_spawn_passenger_at_station(host, b))
-
-    def test_spawn_resolves_factories_and_values_per_due_station_and_resets_full(self):
-        host = FakeHost(self.flow)
-        a = FakeStation("a", "a", host.events)
-        b = FakeStation("b", "b", host.events, capacity=0)
-        c = FakeStation("c", "c", host.events)
-        host.stations = [a, b, c]
-        host.station_steps_since_last_spawn = {a: 10, b: 11, c: 12}
-        host.should_spawn_passenger_at_station = lambda station: station is not c
-        host.context.python_random.choice_values = ["b", "a"]
-        resolution = []
-        produced = []
-
-        def shape_factory(label):
-            def build(shape_type, color, size):
-                resolution.append(("shape", label, shape_type, color, size))
-                return FakeShape(shape_type)
-
-            return build
-
-        def passenger_factory(label):
-            def build(shape):
-                resolution.append(("passenger", label, shape.type))
-                passenger = FakePassenger(label, shape.type, host.events)
-                produced.append(passenger)
-                return passenger
-
-            return build
-
-        shape_factories = iter([shape_factory("one"), shape_factory("two")])
-        passenger_factories = iter([passenger_factory("one"), passenger_factory("two")])
-        colors = iter(["red", "blue"])
-        sizes = iter([1, 2])
-
-        def resolve(label, values):
-            resolution.append(("get", label))
-            return next(values)
-
-        self.flow.spawn_passengers(
-            host,
-            get_shape_factory=lambda: resolve("shape", shape_factories),
-            get_passenger_factory=lambda: resolve("passenger", passenger_factories),
-            get_passenger_color=lambda: resolve("color", colors),
-            get_passenger_size=lambda: resolve("size", sizes),
-        )
-
-        self.assertEqual(
-            [item[:2] for item in resolution],
-            [
-                ("get", "shape"),
-                ("get", "color"),
-                ("get", "size"),
-                ("shape", "one"),
-                ("get", "passenger"),
-                ("passenger", "one"),
-                ("get", "shape"),
-                ("get", "color"),
-                ("get", "size"),
-                ("shape", "two"),
-                ("get", "passenger"),
-                ("passenger", "two"),
-            ],
-        )
-        self.assertEqual(a.passengers, [produced[0]])
-        self.assertEqual(host.passengers, [produced[0]])
-        self.assertEqual(b.passengers, [])
-        self.assertEqual(host.station_steps_since_last_spawn, {a: 0, b: 0, c: 12})
-
-    def test_spawn_failures_preserve_exact_partial_state_and_due_counter(self):
-        for failure in ("append", "counter"):
-            with self.subTest(failure=failure):
-                host = FakeHost(self.flow)
-                a = FakeStation("a", "a", host.events)
-                b = FakeStation("b", "b", host.events)
-                host.stations = [a, b]
-                host.should_spawn_passenger_at_station = lambda station: station is a
-                if failure == "append":
-                    host.passengers = RaisingAppendList()
-                    host.station_steps_since_last_spawn = {a: 10, b: 0}
-                    message = "append failed"
-                else:
-                    host.station_steps_since_last_spawn = RaisingCounterMap(
-                        {a: 10, b: 1}
-                    )
-                    message = "counter reset failed"
-
-                with self.assertRaisesRegex(RuntimeError, message):
-                    host.spawn_passengers()
-
-                self.assertEqual(len(a.passengers), 1)
-                self.assertEqual(host.station_steps_since_last_spawn[a], 10)
-                self.assertEqual(len(host.passengers), 0 if failure == "append" else 1)
-
     def test_increment_time_uses_three_fresh_ordered_graph_phases(self):
-        host = FakeHost(self.flow)
+        host = FakeHost(self.flow, self.spawning)
         station = FakeStation("station", "a", host.events)
         metro = FakeMetro("metro", host.events)
         metro.current_segment = FakeSegment(station, station)
@@ -219,7 +79,7 @@ class TestPassengerFlow(unittest.TestCase):
         self.assertIn(("stop?", "move"), host.events)
         self.assertIn(("path:move", "path", "metro", 200, False), host.events)
 
-        paused = FakeHost(self.flow)
+        paused = FakeHost(self.flow, self.spawning)
         paused.is_paused = True
         self.flow.increment_time(
             paused,
@@ -230,7 +90,7 @@ class TestPassengerFlow(unittest.TestCase):
         )
 
     def test_boarding_resolves_router_late_once_and_applies_before_resume(self):
-        host = FakeHost(self.flow)
+        host = FakeHost(self.flow, self.spawning)
         station = FakeStation("station", "a", host.events)
         metro = FakeMetro("metro", host.events)
         self.assertEqual(
@@ -293,7 +153,7 @@ class TestPassengerFlow(unittest.TestCase):
         self.assertEqual(host.events[-1], ("iterator:end", "rebound"))
 
     def test_navigation_unloading_capacity_and_stop_setup_semantics(self):
-        host = FakeHost(self.flow)
+        host = FakeHost(self.flow, self.spawning)
         here = FakeStation("here", "a", host.events)
         there = FakeStation("there", "b", host.events)
         metro = FakeMetro("metro", host.events, capacity=2)
@@ -323,7 +183,7 @@ class TestPassengerFlow(unittest.TestCase):
         self.assertEqual(metro.speed, 0)
 
     def test_move_prioritizes_delivery_transfer_then_board_and_reresolves_award(self):
-        host = FakeHost(self.flow)
+        host = FakeHost(self.flow, self.spawning)
         here = FakeStation("here", "a", host.events)
         there = FakeStation("there", "b", host.events)
         path = FakePath("path", host.events)
@@ -387,7 +247,7 @@ class TestPassengerFlow(unittest.TestCase):
         )
 
     def test_blocked_transfer_clears_unused_dwell_without_moving_rider(self):
-        host = FakeHost(self.flow)
+        host = FakeHost(self.flow, self.spawning)
         station = FakeStation("full", "a", host.events, capacity=0)
         metro = FakeMetro("metro", host.events, capacity=1)
         passenger = FakePassenger("transfer", "b", host.events)
@@ -409,27 +269,8 @@ class TestPassengerFlow(unittest.TestCase):
             (metro.stop_time_remaining_ms, metro.boarding_progress_ms), (0, 0)
         )
 
-    def test_waiting_uses_inclusive_limit_finishes_live_scan_and_then_short_circuits(
-        self,
-    ):
-        host = FakeHost(self.flow)
-        station = FakeStation("station", "a", host.events)
-        one = FakePassenger("one", "b", host.events)
-        two = FakePassenger("two", "b", host.events)
-        later = FakePassenger("later", "b", host.events)
-        one.wait_ms, two.wait_ms, later.wait_ms = 90, 99, 0
-        station.passengers = [one, two, later]
-        host.stations = [station]
-
-        self.flow.update_waiting_and_game_over(host, 10)
-
-        self.assertEqual((one.wait_ms, two.wait_ms, later.wait_ms), (100, 109, 10))
-        self.assertTrue(host.is_game_over)
-        self.flow.update_waiting_and_game_over(host, 10)
-        self.assertEqual((one.wait_ms, two.wait_ms, later.wait_ms), (100, 109, 10))
-
     def test_bulk_proposals_apply_lazily_with_late_search_and_plan_factories(self):
-        host = FakeHost(self.flow)
+        host = FakeHost(self.flow, self.spawning)
         old_station = FakeStation("old", "a", host.events)
         station = FakeStation("live", "a", host.events)
         arrival = FakePassenger("arrival", "a", host.events)
@@ -0,0 +1,228 @@
+import sys
+import unittest
+from pathlib import Path
+
+from test.passenger_flow_direct_support import (
+    FakeHost,
+    FakePassenger,
+    FakeShape,
+    FakeStation,
+    RaisingAppendList,
+    RaisingCounterMap,
+)
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+# isort: split
+
+from passenger_flow import PassengerFlow
+from passenger_spawning import PassengerSpawning
+
+
+class _Schedule:
+    def __init__(self, ready):
+        self.ready = ready
+        self.advanced = []
+
+    def is_ready(self):
+        return self.ready
+
+    def advance(self, steps):
+        self.advanced.append(steps)
+
+
+class TestPassengerSpawning(unittest.TestCase):
+    def setUp(self):
+        self.flow = PassengerFlow()
+        self.spawning = PassengerSpawning()
+
+    def test_component_is_stateless(self):
+        self.assertEqual(PassengerSpawning.__slots__, ())
+        self.assertFalse(hasattr(self.spawning, "__dict__"))
+
+    def test_shape_types_and_spawn_probe_are_live_call_scoped_and_short_circuit(self):
+        first = FakeHost(self.flow, self.spawning)
+        first.stations = [
+            FakeStation("a", "circle", first.events),
+            FakeStation("b", "triangle", first.events),
+            FakeStation("c", "circle", first.events),
+        ]
+        second = FakeHost(self.flow, self.spawning)
+        second.stations = [FakeStation("x", "cross", second.events)]
+        self.assertEqual(
+            self.spawning.get_station_shape_types(first), ["circle", "triangle"]
+        )
+        self.assertEqual(self.spawning.get_station_shape_types(second), ["cross"])
+
+        calls = []
+
+        def due(station):
+            calls.append(station.name)
+            return station.name == "a"
+
+        first.should_spawn_passenger_at_station = due
+        self.assertTrue(self.spawning.is_passenger_spawn_time(first))
+        self.assertEqual(calls, ["a"])
+
+    def test_spawn_state_samples_once_and_preserves_existing_entries(self):
+        host = FakeHost(self.flow, self.spawning)
+        a = FakeStation("a", "a", host.events)
+        b = FakeStation("b", "b", host.events)
+        c = FakeStation("c", "c", host.events)
+        host.context.python_random.randint_values = [70, 130]
+        host.station_spawn_interval_steps = {a: 99}
+        host.station_steps_since_last_spawn = {c: 5}
+
+        self.spawning.initialize_station_spawning_state(host, [a, b, c])
+
+        self.assertEqual(host.station_spawn_interval_steps, {a: 99, b: 70, c: 130})
+        self.assertEqual(host.station_steps_since_last_spawn, {a: 99, b: 70, c: 5})
+        self.assertEqual(
+            [event for event in host.events if event[0] == "randint"],
+            [("randint", 70, 130), ("randint", 70, 130)],
+        )
+        host.steps = host.passenger_spawning_step
+        self.assertTrue(self.spawning.should_spawn_passenger_at_station(host, b))
+        host.steps = 0
+        host.station_steps_since_last_spawn[b] = 69
+        self.assertFalse(self.spawning.should_spawn_passenger_at_station(host, b))
+
+    def test_spawn_resolves_factories_and_values_per_due_station_and_resets_full(self):
+        host = FakeHost(self.flow, self.spawning)
+        a = FakeStation("a", "a", host.events)
+        b = FakeStation("b", "b", host.events, capacity=0)
+        c = FakeStation("c", "c", host.events)
+        host.stations = [a, b, c]
+        host.station_steps_since_last_spawn = {a: 10, b: 11, c: 12}
+        host.should_spawn_passenger_at_station = lambda station: station is not c
+        host.context.python_random.choice_values = ["b", "a"]
+        resolution = []
+        produced = []
+
+        def shape_factory(label):
+            def build(shape_type, color, size):
+                resolution.append(("shape", label, shape_type, color, size))
+                return FakeShape(shape_type)
+
+            return build
+
+        def passenger_factory(label):
+            def build(shape):
+                resolution.append(("passenger", label, shape.type))
+                passenger = FakePassenger(label, shape.type, host.events)
+                produced.append(passenger)
+                return passenger
+
+            return build
+
+        shape_factories = iter([shape_factory("one"), shape_factory("two")])
+        passenger_factories = iter([passenger_factory("one"), passenger_factory("two")])
+        colors = iter(["red", "blue"])
+        sizes = iter([1, 2])
+
+        def resolve(label, values):
+            resolution.append(("get", label))
+            return next(values)
+
+        self.spawning.spawn_passengers(
+            host,
+            get_shape_factory=lambda: resolve("shape", shape_factories),
+            get_passenger_factory=lambda: resolve("passenger", passenger_factories),
+            get_passenger_color=lambda: resolve("color", colors),
+            get_passenger_size=lambda: resolve("size", sizes),
+        )
+
+        self.assertEqual(
+            [item[:2] for item in resolution],
+            [
+                ("get", "shape"),
+                ("get", "color"),
+                ("get", "size"),
+                ("shape", "one"),
+                ("get", "passenger"),
+                ("passenger", "one"),
+                ("get", "shape"),
+                ("get", "color"),
+                ("get", "size"),
+                ("shape", "two"),
+                ("get", "passenger"),
+                ("passenger", "two"),
+            ],
+        )
+        self.assertEqual(a.passengers, [produced[0]])
+        self.assertEqual(host.passengers, [produced[0]])
+        self.assertEqual(b.passengers, [])
+        self.assertEqual(host.station_steps_since_last_spawn, {a: 0, b: 0, c: 12})
+
+    def test_spawn_failures_preserve_exact_partial_state_and_due_counter(self):
+        for failure in ("append", "counter"):
+            with self.subTest(failure=failure):
+                host = FakeHost(self.flow, self.spawning)
+                a = FakeStation("a", "a", host.events)
+                b = FakeStation("b", "b", host.events)
+                host.stations = [a, b]
+                host.should_spawn_passenger_at_station = lambda station: station is a
+                if failure == "append":
+                    host.passengers = RaisingAppendList()
+                    host.station_steps_since_last_spawn = {a: 10, b: 0}
+                    message = "append failed"
+                else:
+                    host.station_steps_since_last_spawn = RaisingCounterMap(
+                        {a: 10, b: 1}
+                    )
+                    message = "counter reset failed"
+
+                with self.assertRaisesRegex(RuntimeError, message):
+                    host.spawn_passengers()
+
+                self.assertEqual(len(a.passengers), 1)
+                self.assertEqual(host.station_steps_since_last_spawn[a], 10)
+                self.assertEqual(len(host.passengers), 0 if failure == "append" else 1)
+
+    def test_waiting_uses_inclusive_limit_finishes_live_scan_and_then_short_circuits(
+        self,
+    ):
+        host = FakeHost(self.flow, self.spawning)
+        station = FakeStation("station", "a", host.events)
+        one = FakePassenger("one", "b", host.events)
+        two = FakePassenger("two", "b", host.events)
+        later = FakePassenger("later", "b", host.events)
+        one.wait_ms, two.wait_ms, later.wait_ms = 90, 99, 0
+        station.passengers = [one, two, later]
+        host.stations = [station]
+
+        self.spawning.update_waiting_and_game_over(host, 10)
+
+        self.assertEqual((one.wait_ms, two.wait_ms, later.wait_ms), (100, 109, 10))
+        self.assertTrue(host.is_game_over)
+        self.spawning.update_waiting_and_game_over(host, 10)
+        self.assertEqual((one.wait_ms, two.wait_ms, later.wait_ms), (100, 109, 10))
+
+    def test_a_scheduled_tick_samples_only_when_unready_and_prunes_only_blips(self):
+        for ready in (True, False):
+            with self.subTest(ready=ready):
+                host = FakeHost(self.flow, self.spawning)
+                quiet = FakeStation("quiet", "a", host.events)
+                blipping = FakeStation("blipping", "b", host.events)
+                quiet.snap_blips, blipping.snap_blips = [], [(0, "red")]
+                host.stations = [quiet, blipping]
+                host.time_ms = 40
+                schedule = _Schedule(ready)
+
+                self.spawning.tick_stations(host, 3, schedule)
+
+                sampled = [event for event in host.events if event[0] == "randint"]
+                self.assertEqual(len(sampled), 0 if ready else 2)
+                self.assertEqual(
+                    [event for event in host.events if event[0] == "prune"],
+                    [("prune", "blipping", 40)],
+                )
+                self.assertEqual(schedule.advanced, [3])
+                self.assertEqual(
+                    host.station_steps_since_last_spawn.get(quiet),
+                    (None if ready else host.station_spawn_interval_steps[quiet]),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
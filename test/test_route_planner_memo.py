@@ -0,0 +1,137 @@
+import sys
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from test import route_planner_test_support as support
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+# isort: split
+
+from env import MiniMetroEnv
+from mediator import Mediator
+from recursive_checkpoint import canonical_checkpoint
+from route_indexes import RouteMemo
+from route_planner import RoutePlanner
+
+
+class TestRouteMemo(TestCase):
+    def setUp(self) -> None:
+        self.planner = RoutePlanner()
+        self.start = support.station("start")
+        self.near = support.station("near", "triangle")
+        self.far = support.station("far", "triangle")
+        self.nodes = {
+            station: support.node(station)
+            for station in (self.start, self.near, self.far)
+        }
+        self.routes = {
+            self.near: [self.nodes[self.start], self.nodes[self.near]],
+            self.far: [
+                self.nodes[self.start],
+                support.node(support.station("middle")),
+                self.nodes[self.far],
+            ],
+        }
+        self.search = Mock(side_effect=lambda _start, end: self.routes[end.station])
+
+    def best(self, destinations, outcomes):
+        return self.planner.find_best_node_path(
+            self.start,
+            destinations,
+            self.nodes,
+            find_node_path=self.search,
+            get_reduce_node_path=lambda: lambda node_path: node_path,
+            outcomes=outcomes,
+        )
+
+    def test_repeat_queries_reuse_outcomes_and_rank_the_live_order(self):
+        memo = RouteMemo()
+        first = self.best([self.far, self.near], memo.outcomes(self.start, "t", 1))
+        again = self.best([self.near, self.far], memo.outcomes(self.start, "t", 1))
+
+        self.assertEqual(first, self.routes[self.near])
+        self.assertEqual(again, first)
+        self.assertIsNot(again, first)
+        self.assertEqual(self.search.call_count, 2)
+        self.assertEqual((memo.hits, memo.misses), (2, 2))
+
+    def test_a_new_topology_version_drops_every_entry(self):
+        memo = RouteMemo()
+        self.best([self.near], memo.outcomes(self.start, "t", 1))
+        self.best([self.near], memo.outcomes(self.start, "t", 2))
+
+        self.assertEqual(self.search.call_count, 2)
+        self.assertEqual(len(memo), 1)
+
+    def test_least_recently_used_entries_are_evicted_past_capacity(self):
+        memo = RouteMemo(capacity=2)
+        first = memo.outcomes("a", "t", 1)
+        second = memo.outcomes("b", "t", 1)
+        self.assertIs(memo.outcomes("a", "t", 1), first)
+        memo.outcomes("c", "t", 1)
+
+        self.assertEqual(len(memo), 2)
+        self.assertIs(memo.outcomes("a", "t", 1), first)
+        self.assertIsNot(memo.outcomes("b", "t", 1), second)
+
+
+class TestMediatorRouteMemo(TestCase):
+    def test_memoized_planning_replays_a_seeded_game_exactly(self):
+        def play(env):
+            env.reset(seed=41)
+            env.mediator.unlocked_num_paths = env.mediator.num_paths
+            for stations, loop in (([0, 1, 2], False), ([2, 0, 1], True)):
+                action = {"type": "create_path", "stations": stations, "loop": loop}
+                self.assertTrue(env.step_legacy_auto_assignment(action)[3]["action_ok"])
+            checkpoints = []
+            for _ in range(300):
+                env.step(None, dt_ms=250)
+                checkpoints.append(canonical_checkpoint(env))
+            return checkpoints
+
+        env = MiniMetroEnv()
+        memoized = play(env)
+        with patch.object(Mediator, "_route_outcomes", return_value=None):
+            unmemoized = play(MiniMetroEnv())
+
+        self.assertGreater(env.mediator.route_memo_hits, 0)
+        self.assertGreater(env.mediator.route_memo_misses, 0)
+        self.assertEqual(memoized, unmemoized)
+
+    def test_path_edits_invalidate_memoized_routes(self):
+        mediator = Mediator(seed=5)
+        mediator.unlocked_num_paths = mediator.num_paths
+        path = mediator.create_path_from_station_indices([0, 1])
+        nodes = mediator._station_graph.view(mediator.stations, mediator.paths)
+        shape_type = mediator.stations[2].shape.type
+        outcomes = mediator._route_outcomes(mediator.stations[0], shape_type, nodes)
+
+        self.assertTrue(mediator.replace_path(path, [0, 1, 2], loop=False))
+        nodes = mediator._station_graph.view(mediator.stations, mediator.paths)
+
+        self.assertIsNot(
+            mediator._route_outcomes(mediator.stations[0], shape_type, nodes),
+            outcomes,
+        )
+        self.assertIsNone(
+            mediator._route_outcomes(mediator.stations[0], shape_type, {})
+        )
+
+    def test_a_rebound_reducer_is_not_served_routes_another_one_reduced(self):
+        mediator = Mediator(seed=5)
+        mediator.unlocked_num_paths = mediator.num_paths
+        mediator.create_path_from_station_indices([0, 1, 2])
+        nodes = mediator._station_graph.view(mediator.stations, mediator.paths)
+        shape_type = mediator.stations[2].shape.type
+        outcomes = mediator._route_outcomes(mediator.stations[0], shape_type, nodes)
+        self.assertIs(
+            mediator._route_outcomes(mediator.stations[0], shape_type, nodes),
+            outcomes,
+        )
+
+        mediator.skip_stations_on_same_path = Mock(side_effect=list)
+        rebound = mediator._route_outcomes(mediator.stations[0], shape_type, nodes)
+        self.assertIsNot(rebound, outcomes)
+        self.assertEqual(len(rebound), 0)
@@ -0,0 +1,120 @@
+import sys
+from itertools import product
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+# isort: split
+
+import mediator as mediator_module
+from config import station_color, station_shape_type_list, station_size
+from entity.passenger import Passenger
+from entity.path import Path as EntityPath
+from entity.station import Station
+from geometry.point import Point
+from mediator import Mediator
+from route_planner import RoutePlanner
+from travel_plan import TravelPlan
+from utils import get_shape_from_type
+
+
+def _station_row(seed: int) -> tuple[Mediator, list[Station]]:
+    mediator = Mediator(seed=seed)
+    stations = [
+        Station(
+            get_shape_from_type(shape_type, station_color, station_size),
+            Point(100 * index, 0),
+        )
+        for index, shape_type in enumerate(station_shape_type_list[:4] * 2)
+    ]
+    mediator.all_stations = stations
+    mediator.stations = stations
+    mediator.paths = []
+    mediator.passengers = []
+    mediator.travel_plans = {}
+    mediator.unlocked_num_paths = mediator.num_paths
+    return mediator, stations
+
+
+class TestPathIndex(TestCase):
+    def setUp(self) -> None:
+        self.mediator, self.stations = _station_row(6031)
+        self.planner = RoutePlanner()
+
+    def assert_matches_scan(self) -> None:
+        paths = self.mediator.paths
+        for station_a, station_b in product(self.stations, repeat=2):
+            self.assertIs(
+                self.mediator.find_shared_path(station_a, station_b),
+                self.planner.find_shared_path(paths, station_a, station_b),
+            )
+        for path in paths:
+            self.assertIs(self.mediator.get_path_by_id(path.id), path)
+
+    def test_lookups_follow_create_replace_and_remove(self):
+        first = self.mediator.create_path_from_station_indices([0, 1, 2], False)
+        second = self.mediator.create_path_from_station_indices([2, 3], False)
+        self.assert_matches_scan()
+
+        self.assertTrue(self.mediator.replace_path(first, [0, 1, 4], False))
+        self.assert_matches_scan()
+
+        self.mediator.remove_path(second)
+        self.assert_matches_scan()
+        self.assertIsNone(self.mediator.get_path_by_id(second.id))
+
+    def test_rolled_back_replace_restores_lookups(self):
+        target = self.mediator.create_path_from_station_indices([0, 1], False)
+        passenger = Passenger(self.stations[1].shape)
+        self.stations[0].add_passenger(passenger)
+        self.mediator.passengers.append(passenger)
+        self.mediator.travel_plans[passenger] = TravelPlan([])
+        self.assert_matches_scan()
+
+        with patch.object(
+            mediator_module, "bfs", side_effect=RuntimeError("route fault")
+        ):
+            with self.assertRaisesRegex(RuntimeError, "route fault"):
+                self.mediator.replace_path(target, [0, 3], False)
+
+        self.assertEqual(target.stations, self.stations[:2])
+        self.assert_matches_scan()
+
+    def test_lookups_follow_a_line_edited_in_place(self):
+        s0, s1, s2 = self.stations[:3]
+        path = EntityPath((12, 34, 56))
+        path.add_station(s0)
+        path.add_station(s1)
+        self.mediator.paths = [path]
+        self.assertIs(self.mediator.find_shared_path(s0, s1), path)
+
+        path.add_station(s2)
+
+        self.assertIs(self.mediator.find_shared_path(s0, s2), path)
+        self.assert_matches_scan()
+
+    def test_earliest_listed_shared_path_wins_after_reordering(self):
+        first = self.mediator.create_path_from_station_indices([0, 1], False)
+        second = self.mediator.create_path_from_station_indices([1, 0, 2], False)
+        self.assertIs(
+            self.mediator.find_shared_path(self.stations[0], self.stations[1]), first
+        )
+
+        self.mediator.paths = self.mediator.paths[::-1]
+
+        self.assertIs(
+            self.mediator.find_shared_path(self.stations[0], self.stations[1]), second
+        )
+        self.assert_matches_scan()
+
+    def test_renamed_path_ids_are_found(self):
+        path = self.mediator.create_path_from_station_indices([0, 1], False)
+        old_id = path.id
+        self.assertIs(self.mediator.get_path_by_id(old_id), path)
+
+        path.id = "renamed"
+
+        self.assertIs(self.mediator.get_path_by_id("renamed"), path)
+        self.assertIsNone(self.mediator.get_path_by_id(old_id))
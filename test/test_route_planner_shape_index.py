@@ -0,0 +1,91 @@
+import random
+import sys
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from test.route_planner_test_support import station
+from test.seeded_game_support import seeded_game
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+# isort: split
+
+from env import MiniMetroEnv
+from recursive_checkpoint import canonical_checkpoint
+from route_indexes import StationShapeIndex
+from route_planner import RoutePlanner
+
+
+class TestStationShapeIndex(TestCase):
+    def setUp(self) -> None:
+        self.planner = RoutePlanner()
+        self.index = StationShapeIndex()
+        self.stations = [
+            station("first-circle"),
+            station("triangle", "triangle"),
+            station("second-circle"),
+        ]
+
+    def assert_matches_filter(self, stations) -> None:
+        for shape_type in ("circle", "triangle", "square"):
+            self.assertEqual(
+                self.index.stations_for(stations, shape_type),
+                self.planner.get_stations_for_shape_type(stations, shape_type),
+            )
+
+    def test_groups_follow_the_station_list_and_are_fresh_copies(self):
+        self.assert_matches_filter(self.stations)
+        first = self.index.stations_for(self.stations, "circle")
+        first.clear()
+        self.assertEqual(len(self.index.stations_for(self.stations, "circle")), 2)
+
+        self.stations.append(station("third-circle"))
+        self.assert_matches_filter(self.stations)
+
+        rebound = self.stations[1:]
+        self.assert_matches_filter(rebound)
+
+    def test_shuffled_groups_draw_like_the_shuffled_filter(self):
+        stations = [
+            station(str(idx), ("circle", "triangle")[idx % 3 == 0]) for idx in range(20)
+        ]
+        indexed, filtered = random.Random(8), random.Random(8)
+        for _ in range(50):
+            for shape_type in ("circle", "triangle"):
+                expected = self.planner.get_stations_for_shape_type(
+                    stations, shape_type
+                )
+                filtered.shuffle(expected)
+                actual = self.index.stations_for(stations, shape_type)
+                indexed.shuffle(actual)
+                self.assertEqual(actual, expected)
+        self.assertEqual(indexed.getstate(), filtered.getstate())
+
+
+class TestMediatorStationShapeIndex(TestCase):
+    def test_seeded_game_with_unlocks_replays_the_filtered_lookup(self):
+        def play(env):
+            seeded_game(17, milestones=(1, 2, 4, 6), env=env)
+            checkpoints = []
+            for _ in range(300):
+                env.step(None, dt_ms=250)
+                checkpoints.append(canonical_checkpoint(env))
+            return checkpoints
+
+        env = MiniMetroEnv()
+        indexed = play(env)
+        self.assertGreater(
+            len(env.mediator.stations), env.mediator.initial_num_stations
+        )
+        planner = RoutePlanner()
+        with patch.object(
+            StationShapeIndex,
+            "stations_for",
+            lambda _index, stations, shape_type: planner.get_stations_for_shape_type(
+                stations, shape_type
+            ),
+        ):
+            filtered = play(MiniMetroEnv())
+
+        self.assertEqual(indexed, filtered)
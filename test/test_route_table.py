@@ -0,0 +1,151 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../scripts")
+
+from benchmark_support import synthetic_network
+
+import graph.route_table as route_table_module
+from env import MiniMetroEnv
+from graph.graph_algo import (
+    bfs,
+    build_station_nodes_dict,
+    least_transfer_route,
+    least_transfer_tree,
+    transfer_stops,
+)
+from graph.route_table import RouteTable
+from graph.station_graph import StationGraph
+from mediator import Mediator
+from recursive_checkpoint import canonical_checkpoint
+from route_planner import RoutePlanner
+
+
+def _stations(node_path):
+    return [node.station for node in node_path]
+
+
+class TestRouteTable(unittest.TestCase):
+    def setUp(self):
+        self.stations, self.paths = synthetic_network(40, 5, 8, seed=11)
+        self.graph = StationGraph(lambda: build_station_nodes_dict)
+        self.nodes = self.graph.view(self.stations, self.paths)
+        self.table = RouteTable(self.graph)
+
+    def test_node_path_matches_bfs_for_every_pair(self):
+        for start in self.nodes.values():
+            for end in self.nodes.values():
+                self.assertEqual(
+                    _stations(self.table.node_path(start, end)),
+                    _stations(bfs(start, end)),
+                )
+
+    def test_transfer_stops_match_the_compressed_bfs_route(self):
+        planner = RoutePlanner()
+        fallback = patch.object(
+            route_table_module,
+            "transfer_stops",
+            side_effect=AssertionError("tree routes are read off the tree"),
+        )
+        for start in self.nodes.values():
+            for end in self.nodes.values():
+                route = bfs(start, end)
+                if len(route) < 3:
+                    continue
+                expected = _stations(planner.skip_stations_on_same_path(list(route)))
+                self.assertEqual(_stations(transfer_stops(route)), expected)
+                with fallback:
+                    stops = self.table.transfer_stops(self.table.node_path(start, end))
+                self.assertEqual(_stations(stops), expected)
+
+    def test_one_tree_per_origin_until_the_topology_changes(self):
+        nodes = list(self.nodes.values())
+        for end in nodes:
+            self.table.node_path(nodes[0], end)
+        self.assertEqual((self.table.misses, self.table.hits), (1, len(nodes) - 1))
+
+        self.paths.pop()
+        nodes = self.graph.view(self.stations, self.paths)
+        start = nodes[self.stations[0]]
+        self.table.node_path(start, nodes[self.stations[1]])
+        self.assertEqual(self.table.misses, 2)
+
+    def test_foreign_nodes_are_answered_without_the_cache(self):
+        fresh = build_station_nodes_dict(self.stations, self.paths)
+        start, end = fresh[self.stations[0]], fresh[self.stations[-1]]
+
+        self.assertEqual(
+            _stations(self.table.node_path(start, end)), _stations(bfs(start, end))
+        )
+        self.assertEqual((self.table.misses, self.table.hits), (0, 0))
+
+    def test_seeded_game_plans_exactly_as_bfs_and_compression_did(self):
+        def play(env):
+            env.reset(seed=29)
+            env.mediator.unlocked_num_paths = env.mediator.num_paths
+            for stations, loop in (([0, 1, 2], False), ([2, 0, 1], True)):
+                action = {"type": "create_path", "stations": stations, "loop": loop}
+                self.assertTrue(env.step_legacy_auto_assignment(action)[3]["action_ok"])
+            checkpoints = []
+            for _ in range(400):
+                env.step(None, dt_ms=250)
+                checkpoints.append(canonical_checkpoint(env))
+            return checkpoints
+
+        env = MiniMetroEnv()
+        cached = play(env)
+        self.assertGreater(env.mediator.deliveries, 0)
+        self.assertGreater(env.mediator._route_table.hits, 0)
+        compress = RoutePlanner().skip_stations_on_same_path
+        with (
+            patch.object(RouteTable, "node_path", staticmethod(bfs)),
+            patch.object(RouteTable, "transfer_stops", staticmethod(compress)),
+        ):
+            pairwise = play(MiniMetroEnv())
+
+        self.assertEqual(cached, pairwise)
+
+    def test_least_transfer_routes_keep_the_hop_count_with_fewer_stops(self):
+        self.table.least_transfer = True
+        fewer = 0
+        for start in self.nodes.values():
+            for end in self.nodes.values():
+                route = self.table.node_path(start, end)
+                self.assertEqual(len(route), len(bfs(start, end)))
+                if len(route) < 3:
+                    continue
+                stops = self.table.transfer_stops(route)
+                self.assertEqual(stops, transfer_stops(route))
+                self.assertLessEqual(len(stops), len(transfer_stops(bfs(start, end))))
+                fewer += len(stops) < len(transfer_stops(bfs(start, end)))
+                for here, there in zip(stops, stops[1:]):
+                    self.assertFalse(here.paths.isdisjoint(there.paths))
+        self.assertGreater(fewer, 0)
+
+    def test_least_transfer_route_is_empty_when_unreachable(self):
+        line = self.paths[0].stations
+        nodes = build_station_nodes_dict(self.stations, self.paths[:1])
+        start = nodes[line[0]]
+        tree = least_transfer_tree(start)
+        self.assertEqual(least_transfer_route(tree, start), ([start], [start]))
+        off = next(nodes[station] for station in self.stations if station not in line)
+        self.assertEqual(least_transfer_route(tree, off), ([], []))
+        route, stops = least_transfer_route(tree, nodes[line[-1]])
+        self.assertEqual(len(route), len(bfs(start, nodes[line[-1]])))
+        self.assertEqual(_stations(stops), [line[0], line[-1]])
+
+    def test_the_mediator_flag_replans_and_survives_a_fork(self):
+        mediator = Mediator(seed=4)
+        self.assertFalse(mediator.least_transfer_routes)
+        version = mediator._station_graph.version
+        mediator.least_transfer_routes = True
+        self.assertTrue(mediator._route_table.least_transfer)
+        self.assertGreater(mediator._station_graph.version, version)
+        self.assertTrue(mediator.fork().least_transfer_routes)
+
+
+if __name__ == "__main__":
+    unittest.main()
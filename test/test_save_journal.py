@@ -0,0 +1,81 @@
+import copy
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from save_game import serialize_game
+from save_journal import SaveJournal, _apply, _diff
+from save_schema import canonical_save_bytes
+from test.seeded_game_support import played_env
+
+
+def _journaled(seed, ticks, interval):
+    env = played_env(seed)
+    journal = SaveJournal(keyframe_interval=interval)
+    saves = []
+    for tick in range(ticks):
+        if tick == ticks // 2:
+            env.step({"type": "remove_path", "path_index": 1}, dt_ms=0)
+        else:
+            env.step({"type": "noop"})
+        assert journal.record(env.mediator) == tick
+        saves.append(canonical_save_bytes(serialize_game(env.mediator)))
+    return env, journal, saves
+
+
+class TestSaveJournal(unittest.TestCase):
+    def test_every_recorded_tick_rebuilds_to_its_save(self):
+        env, journal, saves = _journaled(7501, 160, 40)
+        self.assertEqual(len(journal), len(saves))
+        for index, payload in enumerate(saves):
+            self.assertEqual(canonical_save_bytes(journal.document(index)), payload)
+        self.assertEqual(canonical_save_bytes(journal.document(-1)), saves[-1])
+
+    def test_deltas_are_a_fraction_of_full_saves(self):
+        env, journal, saves = _journaled(7502, 120, 60)
+        self.assertLess(journal.nbytes * 10, sum(map(len, saves)))
+
+    def test_a_restored_tick_saves_what_was_recorded(self):
+        env, journal, saves = _journaled(7503, 90, 30)
+        for index in (0, 31, 89):
+            restored = journal.restore(index)
+            self.assertEqual(
+                canonical_save_bytes(serialize_game(restored)), saves[index]
+            )
+
+    def test_record_lists_patch_by_identity(self):
+        old = {
+            "metros": [{"id": "a", "x": 1}, {"id": "b", "x": 2}, {"id": "c", "x": 3}],
+            "plans": {"p": 1, "q": 2},
+            "words": [0, 1, 2, 3],
+        }
+        for new in (
+            {
+                "metros": [{"id": "c", "x": 3}, {"id": "a", "x": 1.5}],
+                "plans": {"q": 2, "r": True},
+                "words": [0, 1, 2, 4],
+            },
+            {
+                "metros": [{"id": "a", "x": 1}, {"id": "c", "x": 3}, {"id": "d"}],
+                "plans": {"p": 1, "q": 2},
+                "words": [9, 9, 9, 3],
+            },
+        ):
+            delta = _diff(old, new)
+            patched = _apply(copy.deepcopy(old), delta)
+            self.assertEqual(patched, new)
+        self.assertIsNone(_diff(old, dict(old)))
+
+    def test_out_of_range_and_bad_intervals_are_refused(self):
+        for interval in (0, -1, 1.5, True):
+            with self.assertRaisesRegex(ValueError, "keyframe_interval"):
+                SaveJournal(keyframe_interval=interval)
+        journal = SaveJournal()
+        with self.assertRaises(IndexError):
+            journal.document(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import copy
+import json
+import os
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+import save_load  # noqa: E402
+import save_schema  # noqa: E402
+from save_game import save_game, serialize_game  # noqa: E402
+from save_load import deserialize_game, load_game  # noqa: E402
+from save_schema import _compiled_validator, seal_save, validate_save  # noqa: E402
+from test.seeded_game_support import played_env  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parents[1] / "scripts" / "fixtures"
+_REPLACEMENTS = (None, True, False, -1, 0, 1, 1.5, float("nan"), "", "x", [], {})
+
+
+def _documents():
+    documents = [
+        json.loads(path.read_text()) for path in sorted(FIXTURES.glob("save-*.json"))
+    ]
+    env = played_env(7701)
+    for _ in range(400):
+        env.step({"type": "noop"})
+    documents.append(serialize_game(env.mediator))
+    return documents
+
+
+def _locations(value, path=()):
+    yield path
+    if type(value) is dict:
+        for key, item in value.items():
+            yield from _locations(item, path + (key,))
+    elif type(value) is list:
+        for index, item in enumerate(value):
+            yield from _locations(item, path + (index,))
+
+
+def _mutated(document, path, rng):
+    mutant = copy.deepcopy(document)
+    parent = mutant
+    for step in path[:-1]:
+        parent = parent[step]
+    target = parent[path[-1]]
+    choice = rng.randrange(4)
+    if choice == 0 and type(target) is dict and target:
+        del target[rng.choice(list(target))]
+    elif choice == 1 and type(target) is list and target:
+        index = rng.randrange(len(target))
+        target.insert(index, copy.deepcopy(target[index]))
+    elif choice == 2 and type(target) is list and len(target) > 1:
+        target.reverse()
+    else:
+        parent[path[-1]] = rng.choice(_REPLACEMENTS)
+    return mutant
+
+
+def _outcome(validator, document):
+    try:
+        validator(document)
+    except ValueError as error:
+        return str(error)
+    return None
+
+
+class TestCompiledSaveValidation(unittest.TestCase):
+    def test_valid_documents_take_the_compiled_path(self):
+        for document in _documents():
+            self.assertTrue(_compiled_validator(document["schemaVersion"])(document))
+
+    def test_mutants_are_judged_and_worded_as_before(self):
+        rng = random.Random(7702)
+        for document in _documents():
+            locations = list(_locations(document))[1:]
+            for path in rng.sample(locations, min(300, len(locations))):
+                mutant = _mutated(document, path, rng)
+                expected = _outcome(save_schema._validate_interpreted, mutant)
+                self.assertEqual(_outcome(validate_save, mutant), expected, path)
+                if expected is not None:
+                    version = mutant.get("schemaVersion")
+                    if type(version) is int and version in range(1, 5):
+                        self.assertFalse(_compiled_validator(version)(mutant), path)
+
+    def test_values_the_coercion_rewrites_are_still_accepted(self):
+        document = copy.deepcopy(_documents()[0])
+        document["timeMs"] = float(document["timeMs"]) + 0.0
+        document["stations"][0]["position"] = tuple(document["stations"][0]["position"])
+        self.assertFalse(_compiled_validator(1)(document))
+        self.assertEqual(
+            _outcome(validate_save, document),
+            _outcome(save_schema._validate_interpreted, document),
+        )
+        document["timeMs"] = int(document["timeMs"])
+        validate_save(document)
+
+
+class TestTrustedSaveValidation(unittest.TestCase):
+    def test_a_matching_seal_skips_validation(self):
+        document = _documents()[-1]
+        seal = seal_save(document)
+        with (
+            mock.patch.object(
+                save_schema, "_validate_interpreted", side_effect=AssertionError
+            ),
+            mock.patch.object(
+                save_schema, "_compiled_validator", side_effect=AssertionError
+            ),
+        ):
+            validate_save(document, trusted=seal)
+            deserialize_game(document, trusted=seal)
+
+    def test_a_stale_or_foreign_seal_validates_in_full(self):
+        document = _documents()[-1]
+        seal = seal_save(document)
+        tampered = copy.deepcopy(document)
+        tampered["timeMs"] = -1
+        with self.assertRaisesRegex(ValueError, "^save timeMs must be nonnegative$"):
+            validate_save(tampered, trusted=seal)
+        with self.assertRaisesRegex(ValueError, "^save timeMs must be nonnegative$"):
+            validate_save(tampered, trusted=bytes(16))
+        with self.assertRaisesRegex(ValueError, "^save timeMs must be nonnegative$"):
+            seal_save(tampered)
+        validate_save(document, trusted=bytes(16))
+
+    def test_a_seal_covers_exact_types(self):
+        document = copy.deepcopy(_documents()[0])
+        seal = seal_save(document)
+        document["isGameOver"] = int(document["isGameOver"])
+        with self.assertRaisesRegex(ValueError, "^save isGameOver must be a boolean$"):
+            validate_save(document, trusted=seal)
+
+    def test_a_loaded_file_is_validated_once_and_never_sealed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = save_game(played_env(7702).mediator, Path(directory) / "save.json")
+            with (
+                mock.patch.object(
+                    save_load, "validate_save", wraps=validate_save
+                ) as validate,
+                mock.patch.object(save_schema, "_seal_of", side_effect=AssertionError),
+            ):
+                load_game(path)
+        validate.assert_called_once()
+        self.assertIsNone(validate.call_args.kwargs["trusted"])
+
+
+if __name__ == "__main__":
+    unittest.main()
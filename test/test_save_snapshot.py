@@ -0,0 +1,91 @@
+import json
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from recursive_checkpoint import canonical_checkpoint
+from save_game import serialize_game
+from save_schema import canonical_save_bytes
+from save_snapshot import (
+    decode_snapshot,
+    encode_snapshot,
+    restore_game,
+    snapshot_game,
+)
+from test.seeded_game_support import (
+    canonical_bytes,
+    played_env,
+    rewrapped,
+    saved_then_loaded,
+)
+
+FIXTURES = Path(__file__).resolve().parent.parent / "scripts" / "fixtures"
+V4_FIXTURES = ("save-v4-classic.json", "save-v4-river-pending.json")
+
+
+def _checkpoint(env):
+    return canonical_bytes(canonical_checkpoint(env))
+
+
+class TestSaveSnapshot(unittest.TestCase):
+    def test_fixtures_unpack_to_theircanonical_bytes(self):
+        for name in V4_FIXTURES:
+            payload = (FIXTURES / name).read_bytes()
+            document = json.loads(payload)
+            unpacked = decode_snapshot(encode_snapshot(document))
+            self.assertEqual(unpacked, document, name)
+            self.assertEqual(canonical_save_bytes(unpacked), payload, name)
+
+    def test_int_and_float_numbers_keep_their_type(self):
+        document = serialize_game(played_env(7311).mediator)
+        document["metros"][0]["position"] = [120, 40.5]
+        document["metros"][0]["speed"] = 0
+        document["paths"][0]["color"] = [255, 0.5, 10]
+        unpacked = decode_snapshot(encode_snapshot(document))
+        self.assertEqual(canonical_save_bytes(unpacked), canonical_save_bytes(document))
+        self.assertIs(type(unpacked["metros"][0]["speed"]), int)
+        self.assertIs(type(unpacked["metros"][0]["position"][1]), float)
+
+    def test_a_restored_snapshot_plays_on_like_a_loaded_save(self):
+        env = played_env(7312)
+        payload = snapshot_game(env.mediator)
+        self.assertLess(
+            len(payload), len(canonical_save_bytes(serialize_game(env.mediator)))
+        )
+        restored = rewrapped(env, restore_game(payload))
+        loaded = saved_then_loaded(env)
+        self.assertEqual(_checkpoint(restored), _checkpoint(loaded))
+        for _ in range(240):
+            for game in (env, restored, loaded):
+                game.step({"type": "noop"})
+        self.assertEqual(_checkpoint(restored), _checkpoint(loaded))
+        self.assertEqual(_checkpoint(restored), _checkpoint(env))
+
+    def test_malformed_payloads_fail_closed(self):
+        payload = snapshot_game(played_env(7313).mediator)
+        version_bumped = payload[:4] + (2).to_bytes(2, "little") + payload[6:]
+        for broken, message in (
+            (b"JSON" + payload[4:], "magic"),
+            (version_bumped, "format version 2"),
+            (payload[:-1], "length"),
+            (payload + b"\x00", "length"),
+            (payload[:10], "truncated"),
+        ):
+            with self.assertRaisesRegex(ValueError, message):
+                decode_snapshot(broken)
+        # A well-framed payload with a forged string still fails validation.
+        forged = payload.replace(b"rules-v1", b"rules-v9")
+        with self.assertRaisesRegex(ValueError, "rulesVersion"):
+            restore_game(forged)
+
+    def test_only_current_schema_documents_pack(self):
+        document = json.loads((FIXTURES / "save-v3-classic.json").read_bytes())
+        with self.assertRaisesRegex(ValueError, "schema v4"):
+            encode_snapshot(document)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -173,6 +173,29 @@ class SnapshotFidelityTest(unittest.TestCase):
             "delivery made before the snapshot",
         )
 
+    def test_a_forked_snapshot_plays_out_like_a_saved_one(self):
+        """Search snapshots by fork; a fork must roll out as a load would."""
+        env = SemanticMetroEnv()
+        env.reset(seed=9000)
+        _advance(env, 500)
+        document = serialize_game(env._mediator)
+        snapshot = env._mediator.fork()
+        at = env._decision
+
+        saved = [_rollout(env, document, at, 0, 1500)]
+        forked = [_rollout(env, snapshot, at, 0, 1500)]
+        for key in (4, 5):
+            saved.append(_rollout(env, reseeded(document, key), at, 0, 1500))
+            forked.append(_rollout(env, reseeded(snapshot, key), at, 0, 1500))
+        env.close()
+
+        self.assertEqual(
+            forked,
+            saved,
+            f"forked snapshots returned {forked} where the saved ones returned "
+            f"{saved}; the fork is not the game a load would rebuild",
+        )
+
 
 class PolicyImprovementTest(unittest.TestCase):
     def test_it_commits_to_its_highest_scoring_candidate(self):
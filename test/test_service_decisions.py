@@ -0,0 +1,133 @@
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from entity.passenger import Passenger
+from passenger_capacity import ServiceDecisions, peek_service_action
+from recursive_checkpoint import canonical_checkpoint
+from test.seeded_game_support import (
+    CROSSING_LINES,
+    EARLY_UNLOCKS,
+    seeded_game,
+    service_queries,
+)
+from travel_plan import TravelPlan, TravelPlanMap
+
+_UNCACHED = patch.object(ServiceDecisions, "_key", staticmethod(lambda *args: None))
+
+
+def _dwelling(mediator):
+    for _ in range(3000):
+        mediator.increment_time(16)
+        for path in mediator.paths:
+            for metro in path.metros:
+                if metro.current_station is not None:
+                    return metro, metro.current_station
+    raise AssertionError("no metro stopped at a station")
+
+
+class TestServiceDecisions(unittest.TestCase):
+    def test_seeded_games_match_with_the_cache_bypassed(self):
+        cached, expected = (
+            seeded_game(1, CROSSING_LINES, milestones=EARLY_UNLOCKS),
+            seeded_game(1, CROSSING_LINES, milestones=EARLY_UNLOCKS),
+        )
+        with _UNCACHED:
+            expected_checkpoints = []
+            for tick in range(2000):
+                expected.mediator.increment_time(16 * (1 + tick % 3))
+                expected_checkpoints.append(canonical_checkpoint(expected))
+        for tick in range(2000):
+            cached.mediator.increment_time(16 * (1 + tick % 3))
+            self.assertEqual(canonical_checkpoint(cached), expected_checkpoints[tick])
+        decisions = cached.mediator._service_decisions
+        self.assertGreater(decisions.hits, decisions.misses)
+
+    def test_cached_answers_match_a_fresh_peek(self):
+        env = seeded_game(5, CROSSING_LINES, milestones=EARLY_UNLOCKS)
+        mediator = env.mediator
+        for tick in range(1500):
+            mediator.increment_time(16 * (1 + tick % 3))
+            nodes = mediator._station_graph.view(mediator.stations, mediator.paths)
+            for metro, station in service_queries(mediator):
+                expected = peek_service_action(
+                    mediator,
+                    metro,
+                    station,
+                    nodes,
+                    has_constrained_plan=mediator._has_travel_plan_starting_with_path,
+                )
+                self.assertEqual(
+                    mediator.service_action_peek()(metro, station, nodes), expected
+                )
+        self.assertGreater(mediator._service_decisions.hits, 0)
+
+    def test_edits_to_what_the_peek_reads_are_seen(self):
+        mediator = seeded_game(2, milestones=EARLY_UNLOCKS).mediator
+        metro, station = _dwelling(mediator)
+        nodes = mediator._station_graph.view(mediator.stations, mediator.paths)
+        decisions = mediator._service_decisions = ServiceDecisions()
+        peek = mediator.service_action_peek()
+
+        def counts(*edits):
+            for edit in edits:
+                edit()
+                peek(metro, station, nodes)
+            return decisions.hits, decisions.misses
+
+        self.assertEqual(counts(lambda: None, lambda: None), (1, 1))
+        rider = Passenger(mediator.stations[-1].shape)
+        plan = TravelPlan([])
+        self.assertEqual(
+            counts(
+                lambda: station.add_passenger(rider),
+                lambda: mediator.travel_plans.__setitem__(rider, plan),
+                lambda: setattr(plan, "next_path", mediator.paths[0]),
+                lambda: setattr(mediator, "travel_plans", mediator.travel_plans),
+                lambda: None,
+            ),
+            (2, 5),
+        )
+
+        # Lists and maps that do not report their edits are never cached.
+        mediator.travel_plans = dict(mediator.travel_plans)
+        metro_passengers = metro.passengers
+        self.assertEqual(counts(lambda: None), (2, 5))
+        mediator.travel_plans = TravelPlanMap(mediator.travel_plans)
+        metro.passengers = list(metro_passengers)
+        self.assertEqual(counts(lambda: None), (2, 5))
+        metro.passengers = metro_passengers
+        mediator.travel_plans[rider] = SimpleNamespace(next_path=None, node_path=[])
+        self.assertIsNone(mediator.travel_plans.revision)
+        self.assertEqual(counts(lambda: None), (2, 5))
+
+    def test_another_games_plan_writes_keep_this_games_cache(self):
+        mediator = seeded_game(3, milestones=EARLY_UNLOCKS).mediator
+        metro, station = _dwelling(mediator)
+        nodes = mediator._station_graph.view(mediator.stations, mediator.paths)
+        decisions = mediator._service_decisions = ServiceDecisions()
+        peek = mediator.service_action_peek()
+        peek(metro, station, nodes)
+        revision = mediator.travel_plans.revision
+
+        other = mediator.fork()
+        for plan in other.travel_plans.values():
+            plan.next_station_idx = plan.next_station_idx
+        other.travel_plans[Passenger(station.shape)] = TravelPlan([])
+        loose = TravelPlan([])
+        loose.next_path = mediator.paths[0]
+        self.assertEqual(mediator.travel_plans.revision, revision)
+        peek(metro, station, nodes)
+        self.assertEqual((decisions.hits, decisions.misses), (1, 1))
+
+        plan = next(iter(mediator.travel_plans.values()))
+        plan.next_station_idx = plan.next_station_idx
+        self.assertNotEqual(mediator.travel_plans.revision, revision)
+
+
+if __name__ == "__main__":
+    unittest.main()
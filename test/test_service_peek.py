@@ -0,0 +1,94 @@
+import os
+import sys
+import unittest
+from collections import Counter
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from mediator import Mediator
+from passenger_capacity import pure_service_action, snapshot_service_action
+from recursive_checkpoint import canonical_checkpoint
+from test.seeded_game_support import (
+    CROSSING_LINES,
+    EARLY_UNLOCKS,
+    LINES,
+    seeded_game,
+    service_queries,
+)
+
+
+class TestServicePeek(unittest.TestCase):
+    def test_peek_answers_as_the_snapshot_oracle_and_touches_nothing(self):
+        seen = Counter()
+        for seed, lines in ((0, LINES), (4, CROSSING_LINES), (5, CROSSING_LINES)):
+            env = seeded_game(seed, lines, milestones=EARLY_UNLOCKS)
+            mediator = env.mediator
+            for tick in range(1500):
+                mediator.increment_time(16 * (1 + tick % 3))
+                nodes = mediator._station_graph.view(mediator.stations, mediator.paths)
+                before = canonical_checkpoint(env)
+                plans = [
+                    (plan.next_station, plan.next_path)
+                    for plan in mediator.travel_plans.values()
+                ]
+                for metro, station in service_queries(mediator):
+                    expected = snapshot_service_action(mediator, metro, station, nodes)
+                    actual = mediator.service_action_peek()(metro, station, nodes)
+                    self.assertEqual(expected is None, actual is None)
+                    if expected is not None:
+                        self.assertEqual(actual[0], expected[0])
+                        self.assertIs(actual[1], expected[1])
+                        seen[actual[0]] += 1
+                self.assertEqual(canonical_checkpoint(env), before)
+                self.assertEqual(
+                    [
+                        (plan.next_station, plan.next_path)
+                        for plan in mediator.travel_plans.values()
+                    ],
+                    plans,
+                )
+        self.assertEqual(set(seen), {"destination", "transfer", "board"})
+
+    def test_seeded_games_match_with_the_snapshot_oracle(self):
+        peeked, expected = (
+            seeded_game(1, CROSSING_LINES, milestones=EARLY_UNLOCKS),
+            seeded_game(1, CROSSING_LINES, milestones=EARLY_UNLOCKS),
+        )
+        with patch.object(Mediator, "service_action_peek", lambda _mediator: None):
+            expected_checkpoints = []
+            for tick in range(2000):
+                expected.mediator.increment_time(16 * (1 + tick % 3))
+                expected_checkpoints.append(canonical_checkpoint(expected))
+        for tick in range(2000):
+            peeked.mediator.increment_time(16 * (1 + tick % 3))
+            self.assertEqual(canonical_checkpoint(peeked), expected_checkpoints[tick])
+
+    def test_a_customised_hook_sends_queries_to_the_snapshot_oracle(self):
+        mediator = seeded_game(2, milestones=EARLY_UNLOCKS).mediator
+        for _ in range(600):
+            mediator.increment_time(16)
+        self.assertIsNotNone(mediator.service_action_peek())
+        metro, station = next(service_queries(mediator))
+        nodes = mediator._station_graph.view(mediator.stations, mediator.paths)
+        asked = []
+        mediator.get_unloading_candidates_for_metro = lambda *args: (
+            asked.append(args) or ([], [])
+        )
+
+        self.assertIsNone(mediator.service_action_peek())
+        pure_service_action(mediator, metro, station, nodes)
+        self.assertEqual(asked, [(metro, station)])
+
+        del mediator.get_unloading_candidates_for_metro
+        with patch.multiple(
+            Mediator,
+            get_unloading_candidates_for_metro=lambda *args: ([], []),
+            can_board_at_station=lambda *args: False,
+        ):
+            self.assertIsNone(mediator.service_action_peek())
+            self.assertIsNone(pure_service_action(mediator, metro, station, nodes))
+
+
+if __name__ == "__main__":
+    unittest.main()
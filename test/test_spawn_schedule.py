@@ -0,0 +1,182 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from entity.station import Station
+from mediator import Mediator
+from recursive_checkpoint import canonical_checkpoint
+from save_game import _spawn_timer_records, serialize_game
+from save_load import deserialize_game
+from spawn_schedule import SpawnCounters
+from test.seeded_game_support import EARLY_UNLOCKS, seeded_game
+
+
+def _play(seed, ticks, *, scan=False):
+    env = seeded_game(seed, milestones=EARLY_UNLOCKS)
+    mediator = env.mediator
+    checkpoints = []
+    with patch.object(
+        Mediator,
+        "_default_spawn_schedule",
+        (lambda _mediator: None) if scan else Mediator._default_spawn_schedule,
+    ):
+        for tick in range(ticks):
+            mediator.increment_time(16 * (1 + tick % 3))
+            checkpoints.append(canonical_checkpoint(env))
+    return env, checkpoints
+
+
+class TestSpawnSchedule(unittest.TestCase):
+    def test_seeded_games_match_the_station_scan(self):
+        for seed in (0, 4):
+            with self.subTest(seed=seed):
+                scheduled, expected = _play(seed, 3000), _play(seed, 3000, scan=True)
+                self.assertEqual(scheduled[1], expected[1])
+                self.assertEqual(
+                    scheduled[0].mediator.context.python_random.getstate(),
+                    expected[0].mediator.context.python_random.getstate(),
+                )
+                self.assertGreater(
+                    len(scheduled[0].mediator.stations),
+                    scheduled[0].mediator.initial_num_stations,
+                )
+
+    def test_only_due_stations_are_asked_once_the_schedule_is_live(self):
+        mediator = Mediator(seed=2)
+        mediator.increment_time(16)
+        asked = []
+        should_spawn = Mediator.should_spawn_passenger_at_station
+
+        def counted(host, station):
+            asked.append(station)
+            return should_spawn(host, station)
+
+        with patch.object(Mediator, "should_spawn_passenger_at_station", counted):
+            for _ in range(2000):
+                mediator.increment_time(16)
+
+        # A scan asks every station every tick; the schedule only the due ones.
+        self.assertGreater(len(asked), 0)
+        self.assertLess(len(asked), 2000 // 10)
+        self.assertTrue(all(station in mediator.stations for station in asked))
+
+    def test_in_place_edits_and_step_jumps_are_honoured(self):
+        mediator = Mediator(seed=3)
+        # Step 1 spawns everywhere; step 2 is past it.
+        mediator.increment_time(16)
+        mediator.increment_time(16)
+        first, second = mediator.stations[:2]
+        for station in mediator.stations:
+            mediator.station_steps_since_last_spawn[station] = 0
+            mediator.station_spawn_interval_steps[station] = 1_000_000
+        self.assertFalse(mediator.is_passenger_spawn_time())
+
+        mediator.station_steps_since_last_spawn[second] = 1_000_000
+        self.assertTrue(mediator.is_passenger_spawn_time())
+        mediator.station_spawn_interval_steps.pop(second)
+        mediator.initialize_station_spawning_state([second])
+        mediator.station_steps_since_last_spawn[second] = 0
+        self.assertFalse(mediator.is_passenger_spawn_time())
+
+        mediator.station_spawn_interval_steps[first] = 5
+        mediator.station_steps_since_last_spawn[first] = 0
+        mediator.steps += 10
+        self.assertFalse(mediator.is_passenger_spawn_time())
+        for _ in range(4):
+            mediator.increment_time(16)
+        self.assertEqual(len(first.passengers), 1)
+        mediator.increment_time(16)
+        self.assertEqual(mediator.station_steps_since_last_spawn[first], 0)
+        self.assertEqual(len(first.passengers), 2)
+
+        mediator.station_steps_since_last_spawn = {
+            station: 0 for station in mediator.stations
+        }
+        self.assertIsInstance(mediator.station_steps_since_last_spawn, SpawnCounters)
+        self.assertFalse(mediator.is_passenger_spawn_time())
+
+    def test_a_tick_moves_only_the_clock(self):
+        mediator = Mediator(seed=5)
+        mediator.increment_time(16)
+        mediator.increment_time(16)
+        for station in mediator.all_stations:
+            mediator.station_spawn_interval_steps[station] = 1_000_000
+        locked = mediator.all_stations[len(mediator.stations)]
+        before = dict(mediator.station_steps_since_last_spawn)
+        marks = dict(mediator._spawn_schedule.marks)
+        mediator.game_speed_multiplier = 2
+        for _ in range(50):
+            mediator.increment_time(16)
+
+        self.assertEqual(mediator._spawn_schedule.marks, marks)
+        for station in mediator.stations:
+            self.assertEqual(
+                mediator.station_steps_since_last_spawn[station],
+                before[station] + 100,
+            )
+        self.assertEqual(
+            mediator.station_steps_since_last_spawn[locked], before[locked]
+        )
+
+    def test_a_loaded_save_resumes_the_same_spawns(self):
+        mediator = Mediator(seed=6)
+        for _ in range(400):
+            mediator.increment_time(16)
+        loaded = deserialize_game(serialize_game(mediator))
+        for _ in range(1500):
+            mediator.increment_time(16)
+            loaded.increment_time(16)
+        for host in (mediator, loaded):
+            self.assertEqual(_spawn_timer_records(host), _spawn_timer_records(mediator))
+            self.assertEqual(
+                [len(station.passengers) for station in host.stations],
+                [len(station.passengers) for station in mediator.stations],
+            )
+        self.assertEqual(
+            loaded.context.python_random.getstate(),
+            mediator.context.python_random.getstate(),
+        )
+
+    def test_a_station_whose_step_comes_back_is_due_once(self):
+        mediator = Mediator(seed=7)
+        mediator.increment_time(16)
+        mediator.increment_time(16)
+        first = mediator.stations[0]
+        for station in mediator.stations:
+            mediator.station_spawn_interval_steps[station] = 1_000_000
+            mediator.station_steps_since_last_spawn[station] = 0
+        schedule = mediator._spawn_schedule
+        self.assertEqual(schedule.due_stations(), [])
+        for interval in (5, 6, 5):
+            mediator.station_spawn_interval_steps[first] = interval
+        schedule.advance(5)
+
+        self.assertEqual(schedule.due_stations(), [first])
+
+    def test_a_live_schedule_tick_prunes_only_the_stations_with_blips(self):
+        mediator = Mediator(seed=8)
+        mediator.increment_time(16)
+        blipping = mediator.stations[1]
+        blipping.start_snap_blip(mediator.time_ms, (1, 2, 3))
+        pruned = []
+        prune = Station.prune_visual_effects
+
+        def counted(station, now):
+            pruned.append(station)
+            prune(station, now)
+
+        with (
+            patch.object(Station, "prune_visual_effects", counted),
+            patch.object(Mediator, "initialize_station_spawning_state") as initialize,
+        ):
+            mediator.increment_time(16)
+
+        self.assertEqual(pruned, [blipping])
+        initialize.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../scripts")
+
+from state_archive import StateArchive  # noqa: E402
+
+from save_game import deserialize_game, serialize_game  # noqa: E402
+from save_schema import canonical_save_bytes  # noqa: E402
+from test.seeded_game_support import played_env  # noqa: E402
+
+
+def _documents(seed, count):
+    env = played_env(seed)
+    documents = []
+    for _ in range(count):
+        env.step({"type": "noop"})
+        documents.append(serialize_game(env.mediator))
+    return documents
+
+
+class TestStateArchive(unittest.TestCase):
+    def _archives(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        for archive in (
+            StateArchive(hot_states=2),
+            StateArchive(os.path.join(directory.name, "chunks"), hot_states=2),
+        ):
+            self.addCleanup(archive.close)
+            yield archive
+
+    def test_documents_come_back_with_their_canonical_bytes(self):
+        documents = _documents(7601, 6)
+        for archive in self._archives():
+            refs = [archive.put(document) for document in documents]
+            # Twice round, so the second pass reads evicted states back.
+            for _ in range(2):
+                for ref, document in zip(refs, documents):
+                    self.assertEqual(
+                        canonical_save_bytes(archive.get(ref)),
+                        canonical_save_bytes(document),
+                    )
+            self.assertGreater(archive.misses, len(documents))
+
+    def test_shared_chunks_and_states_are_stored_once(self):
+        first, second = _documents(7602, 2)
+        archive = StateArchive()
+        ref = archive.put(first)
+        chunks, stored = archive.chunk_count, archive.nbytes
+        self.assertEqual(archive.put(dict(first)), ref)
+        self.assertEqual((len(archive), archive.chunk_count), (1, chunks))
+        self.assertEqual(archive.nbytes, stored)
+        # A tick later the map identity, lines and rules have not changed.
+        archive.put(second)
+        self.assertEqual(len(archive), 2)
+        self.assertLess(archive.chunk_count, 2 * chunks)
+        self.assertLess(archive.nbytes, 2 * stored)
+
+    def test_the_hot_set_keeps_the_most_recently_used_states(self):
+        documents = _documents(7603, 3)
+        archive = StateArchive(hot_states=2)
+        refs = [archive.put(document) for document in documents]
+        archive.get(refs[0])
+        archive.get(refs[1])
+        archive.get(refs[0])
+        archive.get(refs[2])  # evicts refs[1], the least recently used
+        self.assertEqual((archive.hits, archive.misses), (1, 3))
+        self.assertIs(archive.get(refs[0]), archive.get(refs[0]))
+        archive.get(refs[1])
+        self.assertEqual(archive.misses, 4)
+
+    def test_an_archived_state_loads_as_the_saved_game(self):
+        env = played_env(7604)
+        archive = StateArchive()
+        ref = archive.put(serialize_game(env.mediator))
+        restored = deserialize_game(archive.get(ref))
+        self.assertEqual(
+            canonical_save_bytes(serialize_game(restored)),
+            canonical_save_bytes(serialize_game(env.mediator)),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
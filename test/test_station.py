@@ -1,7 +1,7 @@
 import os
 import sys
 import unittest
-from unittest.mock import MagicMock, create_autospec, patch
+from unittest.mock import MagicMock, call, create_autospec, patch
 
 sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
 
@@ -125,10 +125,10 @@ class TestStation(unittest.TestCase):
         original_positions = [Point(idx, -idx) for idx in range(len(passengers))]
         for passenger, original_position in zip(passengers, original_positions):
             passenger.position = original_position
-            passenger.draw = MagicMock()
             station.add_passenger(passenger)
 
-        station.draw(self.screen)
+        with patch.object(Passenger, "draw", autospec=True) as draw:
+            station.draw(self.screen)
 
         base_offset = Point(
             (-2 * passenger_size - passenger_display_buffer),
@@ -152,14 +152,20 @@ class TestStation(unittest.TestCase):
         self.assertEqual(
             [passenger.position for passenger in passengers], original_positions
         )
-        for passenger, display_position in zip(passengers, expected_positions):
-            passenger.draw.assert_called_once_with(
-                self.screen,
-                current_time_ms=None,
-                max_wait_time_ms=None,
-                display_position=display_position.to_tuple(),
-                reduced_motion=False,
-            )
+        self.assertEqual(
+            draw.call_args_list,
+            [
+                call(
+                    passenger,
+                    self.screen,
+                    current_time_ms=None,
+                    max_wait_time_ms=None,
+                    display_position=display_position.to_tuple(),
+                    reduced_motion=False,
+                )
+                for passenger, display_position in zip(passengers, expected_positions)
+            ],
+        )
 
         station.remove_passenger(passengers[0])
         self.assertNotIn(passengers[0], station.passengers)
@@ -176,10 +182,10 @@ class TestStation(unittest.TestCase):
         original_positions = [Point(idx, -idx) for idx in range(len(passengers))]
         for passenger, original_position in zip(passengers, original_positions):
             passenger.position = original_position
-            passenger.draw = MagicMock()
             metro.add_passenger(passenger)
 
-        metro.draw(self.screen)
+        with patch.object(Passenger, "draw", autospec=True) as draw:
+            metro.draw(self.screen)
 
         grid_cols = metro.passengers_per_row
         grid_rows = 2
@@ -193,6 +199,7 @@ class TestStation(unittest.TestCase):
         x_start = (-metro_width / 2) + x_gap + passenger_size
         y_start = (-metro_height / 2) + y_gap + passenger_size
 
+        expected_calls = []
         for idx, passenger in enumerate(passengers):
             col = idx % grid_cols
             row = idx // grid_cols
@@ -200,14 +207,18 @@ class TestStation(unittest.TestCase):
             y_offset = y_start + (row * y_step)
             expected_position = metro.position + Point(x_offset, y_offset).rotate(0)
             self.assertEqual(passenger.position, original_positions[idx])
-            passenger.draw.assert_called_once_with(
-                self.screen,
-                current_time_ms=None,
-                max_wait_time_ms=None,
-                rotation_degrees=0,
-                display_position=expected_position.to_tuple(),
-                reduced_motion=False,
+            expected_calls.append(
+                call(
+                    passenger,
+                    self.screen,
+                    current_time_ms=None,
+                    max_wait_time_ms=None,
+                    rotation_degrees=0,
+                    display_position=expected_position.to_tuple(),
+                    reduced_motion=False,
+                )
             )
+        self.assertEqual(draw.call_args_list, expected_calls)
 
     def test_metro_draw_rotates_passenger_grid_with_metro(self):
         metro = Metro()
@@ -215,10 +226,10 @@ class TestStation(unittest.TestCase):
         metro.shape.set_degrees(90)
         passenger = Passenger(Circle((0, 0, 0), 1))
         passenger.position = Point(7, 11)
-        passenger.draw = MagicMock()
         metro.add_passenger(passenger)
 
-        metro.draw(self.screen)
+        with patch.object(Passenger, "draw", autospec=True) as draw:
+            metro.draw(self.screen)
 
         grid_cols = metro.passengers_per_row
         grid_rows = 2
@@ -233,7 +244,8 @@ class TestStation(unittest.TestCase):
         y_offset = y_start
         expected_position = metro.position + Point(x_offset, y_offset).rotate(90)
         self.assertEqual(passenger.position, Point(7, 11))
-        passenger.draw.assert_called_once_with(
+        draw.assert_called_once_with(
+            passenger,
             self.screen,
             current_time_ms=None,
             max_wait_time_ms=None,
@@ -0,0 +1,121 @@
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from entity.passenger import Passenger
+from graph.graph_algo import build_station_nodes_dict
+from graph.station_graph import StationGraph
+from mediator import Mediator
+from save_game import capture_game
+
+
+def _shape(nodes):
+    return {
+        station: (
+            [neighbor.station for neighbor in node.neighbors],
+            {path.id for path in node.paths},
+        )
+        for station, node in nodes.items()
+    }
+
+
+class TestStationGraph(unittest.TestCase):
+    def setUp(self):
+        self.mediator = Mediator(seed=3)
+        self.mediator.unlocked_num_paths = self.mediator.num_paths
+        self.builder = MagicMock(side_effect=build_station_nodes_dict)
+        self.graph = StationGraph(lambda: self.builder)
+
+    def view(self):
+        return self.graph.view(self.mediator.stations, self.mediator.paths)
+
+    def assert_matches_fresh_build(self, nodes):
+        fresh = build_station_nodes_dict(self.mediator.stations, self.mediator.paths)
+        self.assertEqual(_shape(nodes), _shape(fresh))
+        for node in nodes.values():
+            for neighbor in node.neighbors:
+                self.assertIs(neighbor, nodes[neighbor.station])
+
+    def test_unchanged_topology_returns_the_same_graph_without_rebuilding(self):
+        self.mediator.create_path_from_station_indices([0, 1, 2])
+        first = self.view()
+        version = self.graph.version
+
+        self.assertIs(self.view(), first)
+        self.assertEqual(self.builder.call_count, 1)
+        self.assertEqual(self.graph.version, version)
+
+    def test_path_edits_and_unlocks_relink_in_place(self):
+        first = self.mediator.create_path_from_station_indices([0, 1, 2])
+        nodes = self.view()
+        second = self.mediator.create_path_from_station_indices([2, 0], loop=False)
+        self.assertIs(self.view(), nodes)
+        self.assert_matches_fresh_build(nodes)
+
+        self.assertTrue(self.mediator.replace_path(first, [1, 2, 0], loop=True))
+        self.assertIs(self.view(), nodes)
+        self.assert_matches_fresh_build(nodes)
+
+        self.mediator.remove_path(second)
+        self.assertIs(self.view(), nodes)
+        self.assert_matches_fresh_build(nodes)
+
+        self.mediator.stations = self.mediator.all_stations[
+            : len(self.mediator.stations) + 2
+        ]
+        self.assertIs(self.view(), nodes)
+        self.assert_matches_fresh_build(nodes)
+        self.assertEqual(self.builder.call_count, 1)
+
+    def test_reordered_paths_rebuild_to_keep_neighbor_order(self):
+        self.mediator.create_path_from_station_indices([0, 1])
+        self.mediator.create_path_from_station_indices([0, 2])
+        self.view()
+        version = self.graph.version
+
+        self.mediator.paths.reverse()
+        nodes = self.view()
+
+        self.assertEqual(self.builder.call_count, 2)
+        self.assertGreater(self.graph.version, version)
+        self.assert_matches_fresh_build(nodes)
+
+    def test_line_edits_leave_existing_plans_and_their_saved_path_ids(self):
+        mediator = self.mediator
+        mediator.stations = mediator.all_stations[:6]
+        mediator.create_path_from_station_indices([0, 1], loop=False)
+        origin, destination = mediator.stations[:2]
+        passenger = Passenger(destination.shape)
+        origin.add_passenger(passenger)
+        mediator.passengers.append(passenger)
+        mediator.find_travel_plan_for_passengers()
+        planned = capture_game(mediator)["travelPlans"]
+        self.assertTrue(planned)
+
+        mediator.create_path_from_station_indices([1, 0], loop=False)
+        mediator.find_travel_plan_for_passengers()
+
+        self.assertEqual(capture_game(mediator)["travelPlans"], planned)
+
+    def test_mediator_shares_one_graph_across_ticks(self):
+        self.mediator.create_path_from_station_indices([0, 1, 2])
+        self.mediator.increment_time(16)
+        nodes = self.mediator._station_graph.view(
+            self.mediator.stations, self.mediator.paths
+        )
+        self.mediator.increment_time(16)
+
+        self.assertIs(
+            self.mediator._station_graph.view(
+                self.mediator.stations, self.mediator.paths
+            ),
+            nodes,
+        )
+        self.assert_matches_fresh_build(nodes)
+
+
+if __name__ == "__main__":
+    unittest.main()
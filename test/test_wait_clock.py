@@ -0,0 +1,112 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)) + "/../src")
+
+from entity.holder import HolderPassengers
+from entity.metro import Metro
+from entity.passenger import Passenger
+from mediator import Mediator
+from recursive_checkpoint import canonical_checkpoint
+from test.seeded_game_support import EARLY_UNLOCKS, seeded_game
+
+
+def _play(seed, ticks, *, scan=False, max_wait_ms=12_000, threshold=4):
+    env = seeded_game(seed, milestones=EARLY_UNLOCKS)
+    mediator = env.mediator
+    if scan:
+        mediator._wait_clock = None
+    mediator.passenger_max_wait_time_ms = max_wait_ms
+    mediator.overdue_passenger_threshold = threshold
+    checkpoints = []
+    for tick in range(ticks):
+        mediator.increment_time(16 * (1 + tick % 3))
+        checkpoints.append(canonical_checkpoint(env))
+        if mediator.is_game_over:
+            break
+    return mediator, checkpoints
+
+
+def _waits(mediator):
+    return [
+        [passenger.wait_ms for passenger in station.passengers]
+        for station in mediator.stations
+    ]
+
+
+class TestWaitClock(unittest.TestCase):
+    def test_seeded_games_match_the_per_tick_scan(self):
+        for seed, max_wait_ms in ((0, 12_000), (4, 40_000)):
+            with self.subTest(seed=seed):
+                clocked, expected = (
+                    _play(seed, 4000, max_wait_ms=max_wait_ms),
+                    _play(seed, 4000, scan=True, max_wait_ms=max_wait_ms),
+                )
+                self.assertEqual(len(clocked[1]), len(expected[1]))
+                self.assertEqual(clocked[1], expected[1])
+                self.assertEqual(clocked[0].is_game_over, expected[0].is_game_over)
+                self.assertGreater(sum(map(len, _waits(clocked[0]))), 0)
+
+    def test_waits_freeze_on_board_and_resume_on_a_station(self):
+        mediator = Mediator(seed=1)
+        station = mediator.stations[0]
+        passenger = Passenger(mediator.stations[1].shape)
+        station.add_passenger(passenger)
+        for _ in range(3):
+            mediator.update_waiting_and_game_over(100)
+        self.assertEqual(passenger.wait_ms, 300)
+
+        metro = Metro()
+        station.move_passenger(passenger, metro)
+        mediator.update_waiting_and_game_over(100)
+        self.assertEqual(passenger.wait_ms, 300)
+
+        metro.move_passenger(passenger, mediator.stations[2])
+        passenger.wait_ms = 50
+        mediator.update_waiting_and_game_over(100)
+        self.assertEqual(passenger.wait_ms, 150)
+
+    def test_reassigned_and_directly_edited_lists_are_seen(self):
+        mediator = Mediator(seed=2)
+        first, second = mediator.stations[:2]
+        riders = [Passenger(second.shape) for _ in range(3)]
+        first.passengers = list(riders)
+        mediator.update_waiting_and_game_over(10)
+        self.assertNotIsInstance(first.passengers, HolderPassengers)
+
+        list.remove(first.passengers, riders[0])
+        second.passengers = HolderPassengers(holder=second)
+        list.append(second.passengers, riders[1])
+        first.passengers[:] = [riders[2]]
+        mediator.update_waiting_and_game_over(10)
+
+        self.assertEqual([rider.wait_ms for rider in riders], [10, 20, 20])
+        self.assertEqual(_waits(mediator)[:2], [[20], [20]])
+
+    def test_overdue_count_follows_boarding_and_limit_changes(self):
+        mediator = Mediator(seed=3)
+        mediator.overdue_passenger_threshold = 2
+        mediator.passenger_max_wait_time_ms = 100
+        station = mediator.stations[0]
+        riders = [Passenger(mediator.stations[1].shape) for _ in range(2)]
+        for rider in riders:
+            station.add_passenger(rider)
+        mediator.update_waiting_and_game_over(60)
+        riders[0].wait_ms = 0
+        mediator.update_waiting_and_game_over(60)
+        self.assertFalse(mediator.is_game_over)
+
+        station.move_passenger(riders[1], Metro())
+        mediator.passenger_max_wait_time_ms = 60
+        mediator.update_waiting_and_game_over(0)
+        self.assertFalse(mediator.is_game_over)
+
+        station.add_passenger(Passenger(mediator.stations[1].shape))
+        mediator.update_waiting_and_game_over(60)
+        self.assertTrue(mediator.is_game_over)
+        self.assertEqual(riders[0].wait_ms, 120)
+
+
+if __name__ == "__main__":
+    unittest.main()